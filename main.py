@@ -1,3 +1,4 @@
+import logging
 import os
 import sys
 
@@ -10,8 +11,14 @@ from common.infra.web.container import AppContainer
 container = AppContainer()
 container.init_resources()
 
-# app
-app = WebApp(container=container).app
+# logs
+logging.basicConfig(level=logging.INFO)
+
+# app, préchauffée en arrière-plan : gunicorn importe ce module dans chaque
+# worker (sans --preload), la sonde de disponibilité renvoie 503 jusque-là
+web_app = WebApp(container=container)
+web_app.start_warm_up()
+app = web_app.app
 
 if __name__ == "__main__":
     app.run()
@@ -0,0 +1,36 @@
+from http import HTTPStatus
+
+from dependency_injector.wiring import Provide, inject
+from flask import Response
+from flask_openapi3 import APIBlueprint, Tag  # type: ignore[attr-defined]
+
+from common.infra.web.container import AppContainer
+from common.infra.web.dtos.health_dtos import ReadinessResponse
+from common.infra.web.readiness import ReadinessState
+
+tag = Tag(name="Health", description="Sondes de santé du worker")
+
+router = APIBlueprint(
+    "/health",
+    __name__,
+    url_prefix="/health",
+    abp_tags=[tag],
+    doc_ui=True,
+)
+
+
+@router.get(
+    "/ready",
+    description="Indique si le worker a terminé son préchauffage (CoolProp, "
+    "moteurs de calcul, tables et caches) et peut recevoir du trafic. "
+    "Renvoie 503 tant que le préchauffage n'est pas terminé.",
+    responses={
+        HTTPStatus.OK: ReadinessResponse,
+        HTTPStatus.SERVICE_UNAVAILABLE: ReadinessResponse,
+    },
+)
+@inject
+def get_readiness(
+    readiness: ReadinessState = Provide[AppContainer.readiness],
+) -> Response:
+    return ReadinessResponse.from_state(readiness).to_response()
@@ -1,5 +1,6 @@
 from flask_openapi3 import APIBlueprint  # type: ignore[attr-defined]
 
+from common.infra.web.api.v1.health_routes import router as health_router
 from humid_air.infra.web.api.v1.humid_air_routes import router as humid_air_router
 from projects.infra.web.api.v1.project_routes import router as project_router
 from users.infra.web.api.v1.user_routes import router as user_router
@@ -12,6 +13,7 @@ routers = APIBlueprint(
 
 
 router_list = [
+    health_router,
     humid_air_router,
     user_router,
     project_router,
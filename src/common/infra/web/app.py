@@ -1,4 +1,7 @@
+import logging
+import time
 from http import HTTPStatus
+from threading import Thread
 
 from dependency_injector.wiring import Provide, inject
 from flask import Response, jsonify
@@ -11,6 +14,8 @@ from common.infra.web.api.v1.router import routers as routers_v1
 from common.infra.web.container import AppContainer
 from utils.class_object import singleton
 
+logger = logging.getLogger(__name__)
+
 
 @singleton
 class WebApp:
@@ -73,6 +78,55 @@ class WebApp:
         # routes
         self.app.register_api(routers_v1)
 
+    def start_warm_up(self) -> Thread:
+        """Lance le préchauffage dans un thread, sans bloquer le démarrage du worker
+
+        Le worker répond aussitôt et la sonde '/v1/health/ready' renvoie 503
+        jusqu'à la fin du préchauffage.
+
+        Returns:
+            Thread: Thread du préchauffage
+        """
+        thread = Thread(target=self.warm_up, name="warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def warm_up(self) -> None:
+        """Préchauffe les calculs puis déclare le worker prêt
+
+        La sonde '/v1/health/ready' renvoie 503 jusqu'à la fin du préchauffage.
+        Un échec est enregistré dans l'état de préparation, affiché par la
+        sonde, puis le préchauffage est relancé après WARM_UP_RETRY_DELAY
+        secondes, jusqu'à WARM_UP_ATTEMPTS tentatives ; au-delà, le worker
+        n'est pas déclaré prêt. Si WARM_UP_ON_STARTUP est désactivé, le worker
+        est déclaré prêt aussitôt.
+        """
+        readiness = self.container.readiness()
+        if not self.settings.WARM_UP_ON_STARTUP:
+            readiness.mark_ready()
+            return
+        for attempt in range(1, self.settings.WARM_UP_ATTEMPTS + 1):
+            try:
+                report = self.container.warm_up_humid_air().execute()
+                break
+            except Exception as e:
+                logger.exception(
+                    "Échec du préchauffage (tentative %d/%d)",
+                    attempt,
+                    self.settings.WARM_UP_ATTEMPTS,
+                )
+                final = attempt == self.settings.WARM_UP_ATTEMPTS
+                readiness.mark_attempt_failed(f"{type(e).__name__}: {e}", final)
+                if final:
+                    return
+                time.sleep(self.settings.WARM_UP_RETRY_DELAY)
+        for step in report.steps:
+            logger.info("Préchauffage %s : %.3f s", step.name, step.seconds)
+        logger.info("Préchauffage terminé en %.3f s", report.seconds)
+        readiness.mark_ready(
+            {f"humid_air.{step.name}": step.seconds for step in report.steps}
+        )
+
     def run(self: "WebApp") -> None:
         """Démarre l'application web
 
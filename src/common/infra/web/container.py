@@ -2,8 +2,72 @@ from dependency_injector import containers, providers
 
 from common.infra.data.sql_database import SQLDatabase
 from common.infra.data.sql_unit_of_work import SQLUnitOfWork
+from common.infra.web.readiness import ReadinessState
 from common.infra.web.settings import AppSettings
-from humid_air.app.usecases.get_ha_props import GetHumidAirPropertyUseCase
+from humid_air.app.usecases.compute_air_process import ComputeAirProcessUseCase
+from humid_air.app.usecases.compute_climate_analytics import (
+    ComputeClimateAnalyticsUseCase,
+)
+from humid_air.app.usecases.compute_thermal_comfort import (
+    ComputeThermalComfortUseCase,
+)
+from humid_air.app.usecases.get_comfort_zone import GetComfortZoneUseCase
+from humid_air.app.usecases.get_ha_props_approximate import (
+    GetApproximateHumidAirPropertyUseCase,
+)
+from humid_air.app.usecases.get_ha_props_batch import GetHumidAirPropertiesBatchUseCase
+from humid_air.app.usecases.get_ha_props_cache_statistics import (
+    GetHumidAirCacheStatisticsUseCase,
+)
+from humid_air.app.usecases.get_ha_props_cached import (
+    CachedGetHumidAirPropertyUseCase,
+    HumidAirCacheKey,
+)
+from humid_air.app.usecases.get_psychrometric_chart import (
+    GetPsychrometricChartUseCase,
+    PsychrometricChartCacheKey,
+)
+from humid_air.app.usecases.get_saturation_table import (
+    GetSaturationTableUseCase,
+    SaturationTableCacheKey,
+)
+from humid_air.app.usecases.process_weather_file import ProcessWeatherFileUseCase
+from humid_air.app.usecases.propagate_uncertainty import PropagateUncertaintyUseCase
+from humid_air.app.usecases.resolve_pressure import ResolvePressureUseCase
+from humid_air.app.usecases.solve_humid_air import SolveHumidAirUseCase
+from humid_air.app.usecases.stream_ha_props_batch import (
+    StreamHumidAirPropertiesBatchUseCase,
+)
+from humid_air.app.usecases.warm_up_humid_air import WarmUpHumidAirUseCase
+from humid_air.domain.entities.humid_air_entity import HumidAirOutputs
+from humid_air.domain.entities.psychrometric_chart_entity import (
+    PsychrometricChartEntity,
+)
+from humid_air.domain.entities.saturation_table_entity import SaturationTableEntity
+from humid_air.infra.services.climate_analytics import NumpyClimateAnalytics
+from humid_air.infra.services.coolprop_engine import CoolPropHumidAirEngine
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.hyland_wexler_input_converter import (
+    HylandWexlerInputConverter,
+)
+from humid_air.infra.services.inverse_solver import HylandWexlerInverseSolver
+from humid_air.infra.services.lookup_table_engine import LookupTableHumidAirEngine
+from humid_air.infra.services.process_pool_engine import ProcessPoolHumidAirEngine
+from humid_air.infra.services.project_site_pressure_provider import (
+    ProjectSitePressureProvider,
+)
+from humid_air.infra.services.psychrometric_chart import (
+    HylandWexlerPsychrometricChart,
+)
+from humid_air.infra.services.saturation_table import HylandWexlerSaturationTable
+from humid_air.infra.services.thermal_comfort import FangerThermalComfort
+from humid_air.infra.services.uncertainty_propagation import (
+    NumpyUncertaintyPropagator,
+)
+from humid_air.infra.services.weather_file_readers import (
+    CsvWeatherFileReader,
+    EpwWeatherFileReader,
+)
 from projects.app.usecases.add_project_member import AddProjectMemberUseCase
 from projects.app.usecases.create_project import CreateProjectUseCase
 from projects.app.usecases.delete_project import DeleteProjectUseCase
@@ -12,7 +76,9 @@ from projects.app.usecases.get_all_projects import GetAllProjectsUseCase
 from projects.app.usecases.get_project_by_id import GetProjectByIdUseCase
 from projects.app.usecases.get_project_members import GetProjectMembersUseCase
 from projects.app.usecases.get_user_projects import GetUserProjectsUseCase
+from projects.app.usecases.import_projects import ImportProjectsUseCase
 from projects.app.usecases.update_project import UpdateProjectUseCase
+from projects.app.usecases.update_project_members import UpdateProjectMembersUseCase
 from projects.infra.data.repositories.project_sqlrepo import ProjectSQLRepository
 from users.app.usecases.delete_user import DeleteUserByIdUsecase
 from users.app.usecases.get_all_users import GetAllUsersUsecase
@@ -22,6 +88,7 @@ from users.app.usecases.sign_up_user import UserSignUpUseCase
 from users.infra.data.repositories.user_sqlrepo import UserSQLRepository
 from users.infra.services.bcrypt_password_hasher import BcryptPasswordHasher
 from users.infra.services.jwt_token_service import JWTTokenService
+from utils.lru_cache import LRUCache
 
 
 class AppContainer(containers.DeclarativeContainer):
@@ -33,6 +100,7 @@ class AppContainer(containers.DeclarativeContainer):
 
     wiring_config = containers.WiringConfiguration(
         modules=[
+            "common.infra.web.api.v1.health_routes",
             "humid_air.infra.web.api.v1.humid_air_routes",
             "users.infra.web.api.v1.user_routes",
             "projects.infra.web.api.v1.project_routes",
@@ -40,6 +108,7 @@ class AppContainer(containers.DeclarativeContainer):
     )
 
     app_settings = providers.Singleton(AppSettings)
+    readiness = providers.Singleton(ReadinessState)
     # database
     database = providers.Singleton(SQLDatabase, settings=app_settings)
     database_session = providers.Factory(database.provided.get_session)
@@ -58,9 +127,149 @@ class AppContainer(containers.DeclarativeContainer):
 
     # === humid air module ===
     # repositories
+    site_pressure_provider = providers.Factory(
+        ProjectSitePressureProvider,
+        repository=providers.Factory(ProjectSQLRepository, unit_of_work=unit_of_work),
+    )
+    # services
+    humid_air_cache: providers.Singleton[
+        LRUCache[HumidAirCacheKey, HumidAirOutputs]
+    ] = providers.Singleton(
+        LRUCache,
+        max_size=app_settings.provided.HUMID_AIR_CACHE_SIZE,
+        ttl=app_settings.provided.HUMID_AIR_CACHE_TTL,
+    )
+    psychrometric_chart_cache: providers.Singleton[
+        LRUCache[PsychrometricChartCacheKey, PsychrometricChartEntity]
+    ] = providers.Singleton(
+        LRUCache, max_size=app_settings.provided.HUMID_AIR_CHART_CACHE_SIZE
+    )
+    psychrometric_chart = providers.Singleton(HylandWexlerPsychrometricChart)
+    saturation_table_cache: providers.Singleton[
+        LRUCache[SaturationTableCacheKey, SaturationTableEntity]
+    ] = providers.Singleton(
+        LRUCache, max_size=app_settings.provided.HUMID_AIR_SATURATION_TABLE_CACHE_SIZE
+    )
+    saturation_table = providers.Singleton(HylandWexlerSaturationTable)
+    humid_air_input_converter = providers.Singleton(HylandWexlerInputConverter)
+    coolprop_engine = providers.Singleton(CoolPropHumidAirEngine)
+    hyland_wexler_engine = providers.Singleton(HylandWexlerHumidAirEngine)
+    pooled_coolprop_engine = providers.Singleton(
+        ProcessPoolHumidAirEngine,
+        engine=coolprop_engine,
+        workers=app_settings.provided.HUMID_AIR_POOL_WORKERS,
+        chunk_size=app_settings.provided.HUMID_AIR_POOL_CHUNK_SIZE,
+    )
+    lookup_table_engine = providers.Singleton(
+        LookupTableHumidAirEngine,
+        source_name=app_settings.provided.HUMID_AIR_TABLE_SOURCE_ENGINE,
+        source_engine=providers.Selector(
+            app_settings.provided.HUMID_AIR_TABLE_SOURCE_ENGINE,
+            coolprop=pooled_coolprop_engine,
+            hyland_wexler=hyland_wexler_engine,
+        ),
+        path=app_settings.provided.HUMID_AIR_TABLE_PATH,
+        reference_name="coolprop",
+        reference_engine=pooled_coolprop_engine,
+    )
+    humid_air_engines = providers.Dict(
+        coolprop=pooled_coolprop_engine,
+        hyland_wexler=hyland_wexler_engine,
+        lookup_table=lookup_table_engine,
+    )
+    weather_file_readers = providers.Dict(
+        epw=providers.Singleton(EpwWeatherFileReader),
+        csv=providers.Singleton(CsvWeatherFileReader),
+    )
+    climate_analytics = providers.Singleton(NumpyClimateAnalytics)
+    thermal_comfort = providers.Singleton(FangerThermalComfort)
+    uncertainty_propagator = providers.Singleton(NumpyUncertaintyPropagator)
+    inverse_solver = providers.Singleton(HylandWexlerInverseSolver)
     # usecases
+    get_ha_props = providers.Factory(
+        CachedGetHumidAirPropertyUseCase,
+        cache=humid_air_cache,
+        decimals=app_settings.provided.HUMID_AIR_CACHE_DECIMALS,
+        converter=humid_air_input_converter,
+    )
+    get_psychrometric_chart = providers.Factory(
+        GetPsychrometricChartUseCase,
+        chart=psychrometric_chart,
+        cache=psychrometric_chart_cache,
+    )
+    get_saturation_table = providers.Factory(
+        GetSaturationTableUseCase,
+        table=saturation_table,
+        cache=saturation_table_cache,
+    )
+    get_ha_props_batch = providers.Factory(
+        GetHumidAirPropertiesBatchUseCase,
+        engines=humid_air_engines,
+        converter=humid_air_input_converter,
+    )
+    process_weather_file = providers.Factory(
+        ProcessWeatherFileUseCase,
+        readers=weather_file_readers,
+        batch_use_case=get_ha_props_batch,
+        chunk_size=app_settings.provided.HUMID_AIR_WEATHER_CHUNK_SIZE,
+    )
+    warm_up_humid_air = providers.Factory(
+        WarmUpHumidAirUseCase,
+        state_use_case=get_ha_props,
+        engines=humid_air_engines,
+        chart_use_case=get_psychrometric_chart,
+        saturation_table_use_case=get_saturation_table,
+    )
     humid_air_usecases = providers.Dict(
-        get_ha_props=providers.Factory(GetHumidAirPropertyUseCase)
+        get_ha_props=get_ha_props,
+        get_ha_props_approximate=providers.Factory(
+            GetApproximateHumidAirPropertyUseCase,
+            engine=lookup_table_engine,
+            fallback_engine=coolprop_engine,
+            converter=humid_air_input_converter,
+        ),
+        resolve_pressure=providers.Factory(
+            ResolvePressureUseCase, site_pressure_provider=site_pressure_provider
+        ),
+        get_cache_statistics=providers.Factory(
+            GetHumidAirCacheStatisticsUseCase, cache=humid_air_cache
+        ),
+        get_ha_props_batch=get_ha_props_batch,
+        stream_ha_props_batch=providers.Factory(
+            StreamHumidAirPropertiesBatchUseCase,
+            batch_use_case=get_ha_props_batch,
+            chunk_size=app_settings.provided.HUMID_AIR_BATCH_CHUNK_SIZE,
+        ),
+        get_psychrometric_chart=get_psychrometric_chart,
+        compute_air_process=providers.Factory(
+            ComputeAirProcessUseCase,
+            engines=humid_air_engines,
+            process_engine=hyland_wexler_engine,
+            converter=humid_air_input_converter,
+        ),
+        get_saturation_table=get_saturation_table,
+        compute_thermal_comfort=providers.Factory(
+            ComputeThermalComfortUseCase, comfort=thermal_comfort
+        ),
+        get_comfort_zone=providers.Factory(
+            GetComfortZoneUseCase, comfort=thermal_comfort
+        ),
+        propagate_uncertainty=providers.Factory(
+            PropagateUncertaintyUseCase,
+            engines=humid_air_engines,
+            propagator=uncertainty_propagator,
+        ),
+        solve_humid_air=providers.Factory(
+            SolveHumidAirUseCase,
+            solver=inverse_solver,
+            engine=hyland_wexler_engine,
+        ),
+        process_weather_file=process_weather_file,
+        compute_climate_analytics=providers.Factory(
+            ComputeClimateAnalyticsUseCase,
+            weather_use_case=process_weather_file,
+            analytics=climate_analytics,
+        ),
     )
 
     # === user module ===
@@ -117,4 +326,10 @@ class AppContainer(containers.DeclarativeContainer):
         get_user_projects=providers.Factory(
             GetUserProjectsUseCase, repository=project_repository
         ),
+        import_projects=providers.Factory(
+            ImportProjectsUseCase, repository=project_repository
+        ),
+        update_project_members=providers.Factory(
+            UpdateProjectMembersUseCase, repository=project_repository
+        ),
     )
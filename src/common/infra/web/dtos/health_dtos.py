@@ -0,0 +1,45 @@
+from http import HTTPStatus
+
+from flask import Response, jsonify, make_response
+from pydantic import BaseModel, Field
+
+from common.infra.web.readiness import ReadinessState
+
+
+class ReadinessResponse(BaseModel):
+    ready: bool = Field(..., description="Préchauffage terminé, worker prêt")
+    warm_up_seconds: float = Field(
+        default=0, description="Durée totale du préchauffage en [s]"
+    )
+    steps: dict[str, float] = Field(
+        default_factory=dict,
+        description="Durées des étapes du préchauffage en [s], par nom",
+    )
+    failed_attempts: int = Field(
+        default=0, description="Nombre de tentatives de préchauffage échouées"
+    )
+    error: str | None = Field(
+        default=None, description="Erreur de la dernière tentative échouée"
+    )
+    failed: bool = Field(
+        default=False,
+        description="Préchauffage abandonné après la dernière tentative, "
+        "le worker ne sera pas prêt",
+    )
+
+    @classmethod
+    def from_state(cls, state: ReadinessState) -> "ReadinessResponse":
+        return cls(
+            ready=state.ready,
+            warm_up_seconds=round(sum(state.steps.values()), 3),
+            steps={name: round(seconds, 3) for name, seconds in state.steps.items()},
+            failed_attempts=state.failed_attempts,
+            error=state.error,
+            failed=state.failed,
+        )
+
+    def to_response(self) -> Response:
+        return make_response(
+            jsonify(self.model_dump()),
+            HTTPStatus.OK if self.ready else HTTPStatus.SERVICE_UNAVAILABLE,
+        )
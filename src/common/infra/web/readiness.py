@@ -0,0 +1,45 @@
+from threading import Event
+
+
+class ReadinessState:
+    """État de préparation du worker, partagé par toutes les requêtes
+
+    Le worker n'est déclaré prêt qu'une fois le préchauffage terminé ; la
+    sonde de disponibilité renvoie une erreur jusque-là, pour que le
+    répartiteur de charge ne lui envoie pas de trafic. Les tentatives et la
+    dernière erreur du préchauffage sont conservées pour la sonde.
+    """
+
+    def __init__(self) -> None:
+        self._ready = Event()
+        self.steps: dict[str, float] = {}
+        self.failed_attempts = 0
+        self.error: str | None = None
+        self.failed = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def mark_ready(self, steps: dict[str, float] | None = None) -> None:
+        """Déclare le worker prêt
+
+        Args:
+            steps (dict[str, float] | None, optional): Durées des étapes du
+                préchauffage en [s], par nom
+        """
+        self.steps = dict(steps or {})
+        self.error = None
+        self.failed = False
+        self._ready.set()
+
+    def mark_attempt_failed(self, error: str, final: bool) -> None:
+        """Enregistre l'échec d'une tentative de préchauffage
+
+        Args:
+            error (str): Description de l'erreur
+            final (bool): Dernière tentative, le worker ne sera pas déclaré prêt
+        """
+        self.failed_attempts += 1
+        self.error = error
+        self.failed = final
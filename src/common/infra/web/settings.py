@@ -22,6 +22,22 @@ class AppSettings(BaseSettings):
         default="http://127.0.0.1:5000", description="URL du serveur"
     )
 
+    # startup
+    WARM_UP_ON_STARTUP: bool = Field(
+        default=True,
+        description="Préchauffer les calculs de l'air humide avant de déclarer le worker prêt",
+    )
+    WARM_UP_ATTEMPTS: int = Field(
+        default=3,
+        gt=0,
+        description="Nombre de tentatives de préchauffage avant de renoncer",
+    )
+    WARM_UP_RETRY_DELAY: float = Field(
+        default=5.0,
+        ge=0,
+        description="Attente en [s] entre deux tentatives de préchauffage",
+    )
+
     # database
     DATABASE_URL: str = Field(
         default="sqlite:///./test.db", description="URL de la base de données"
@@ -44,5 +60,61 @@ class AppSettings(BaseSettings):
         description="Durée d'expiration du token d'accès (None = permanent)",
     )
 
+    # humid air
+    HUMID_AIR_CACHE_SIZE: int = Field(
+        default=1024,
+        ge=0,
+        description="Nombre maximal d'états d'air humide en cache (0 = désactivé)",
+    )
+    HUMID_AIR_CACHE_TTL: float | None = Field(
+        default=3600,
+        gt=0,
+        description="Durée de vie d'un état d'air humide en cache en secondes (None = illimitée)",
+    )
+    HUMID_AIR_CACHE_DECIMALS: int = Field(
+        default=2,
+        ge=0,
+        description="Nombre de décimales des entrées utilisées comme clé du cache",
+    )
+    HUMID_AIR_CHART_CACHE_SIZE: int = Field(
+        default=64,
+        ge=0,
+        description="Nombre maximal de diagrammes psychrométriques en cache (0 = désactivé)",
+    )
+    HUMID_AIR_SATURATION_TABLE_CACHE_SIZE: int = Field(
+        default=64,
+        ge=0,
+        description="Nombre maximal de tables de saturation en cache (0 = désactivé)",
+    )
+    HUMID_AIR_TABLE_SOURCE_ENGINE: str = Field(
+        default="hyland_wexler",
+        pattern="^(coolprop|hyland_wexler)$",
+        description="Moteur utilisé pour calculer la table précalculée de l'air humide",
+    )
+    HUMID_AIR_TABLE_PATH: str | None = Field(
+        default=None,
+        description="Fichier .npz où enregistrer et recharger la table précalculée (None = en mémoire)",
+    )
+    HUMID_AIR_POOL_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        description="Nombre de processus calculant les lots CoolProp en parallèle (0 ou 1 = calcul dans le worker)",
+    )
+    HUMID_AIR_POOL_CHUNK_SIZE: int = Field(
+        default=500,
+        gt=0,
+        description="Nombre d'états par tranche envoyée à un processus du pool",
+    )
+    HUMID_AIR_BATCH_CHUNK_SIZE: int = Field(
+        default=1000,
+        gt=0,
+        description="Nombre d'états d'un lot rendu en NDJSON ou CSV calculés ensemble",
+    )
+    HUMID_AIR_WEATHER_CHUNK_SIZE: int = Field(
+        default=744,
+        gt=0,
+        description="Nombre d'heures d'un fichier météo calculées ensemble (744 = un mois)",
+    )
+
     # .env mapper
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
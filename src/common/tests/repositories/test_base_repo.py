@@ -1,8 +1,10 @@
 import os
 import unittest
-from typing import ClassVar
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, ClassVar
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 
 from common.infra.data.sql_database import SQLDatabase
 from common.infra.data.sql_unit_of_work import SQLUnitOfWork
@@ -49,6 +51,64 @@ class TestBaseRepository(unittest.TestCase):
             session.execute(text("DELETE FROM users"))
             session.commit()
 
+    @contextmanager
+    def count_queries(self) -> Iterator[list[str]]:
+        """Enregistre les requêtes SQL exécutées sur le moteur dans le bloc
+
+        Yields:
+            Iterator[list[str]]: Requêtes exécutées, complétée à la sortie du bloc
+        """
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            # (conn, cursor, statement, parameters, context, executemany)
+            statements.append(args[2])
+
+        event.listen(self.database.engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(self.database.engine, "before_cursor_execute", record)
+
+    @contextmanager
+    def foreign_keys(self) -> Iterator[None]:
+        """Active le contrôle des clés étrangères de SQLite dans le bloc
+
+        SQLite ne vérifie pas les clés étrangères par défaut, contrairement à
+        PostgreSQL. Les connexions du pool sont recréées à l'entrée et à la
+        sortie du bloc pour que le PRAGMA s'applique à chacune.
+
+        Yields:
+            Iterator[None]: Bloc exécuté avec les clés étrangères vérifiées
+        """
+
+        def enable(*args: Any) -> None:
+            # (dbapi_connection, connection_record)
+            cursor = args[0].cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+
+        event.listen(self.database.engine, "connect", enable)
+        self.database.engine.dispose()
+        try:
+            yield
+        finally:
+            event.remove(self.database.engine, "connect", enable)
+            self.database.engine.dispose()
+
+    def assertQueryCount(self, expected: int, statements: list[str]) -> None:
+        """Vérifie le nombre de requêtes SQL enregistrées par count_queries
+
+        Args:
+            expected (int): Nombre de requêtes attendu
+            statements (list[str]): Requêtes enregistrées
+        """
+        self.assertEqual(
+            expected,
+            len(statements),
+            msg="Requêtes exécutées :\n" + "\n".join(statements),
+        )
+
     @classmethod
     def tearDownClass(cls) -> None:
         """Nettoie la base après les tests."""
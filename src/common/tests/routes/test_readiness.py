@@ -0,0 +1,96 @@
+from http import HTTPStatus
+from threading import Event
+
+from dependency_injector import providers
+
+from common.tests.routes.test_base_api import TestBaseAPI
+from humid_air.domain.entities.warm_up_entity import (
+    WarmUpReportEntity,
+    WarmUpStepEntity,
+)
+
+
+class BlockingWarmUpUseCase:
+    def __init__(self) -> None:
+        self.release = Event()
+
+    def execute(self) -> WarmUpReportEntity:
+        self.release.wait(timeout=10)
+        return WarmUpReportEntity(
+            steps=[WarmUpStepEntity(name="get_ha_props", seconds=0.5)]
+        )
+
+
+class FailingWarmUpUseCase:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    def execute(self) -> WarmUpReportEntity:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("table illisible")
+        return WarmUpReportEntity(
+            steps=[WarmUpStepEntity(name="get_ha_props", seconds=0.5)]
+        )
+
+
+class TestReadinessRoutes(TestBaseAPI):
+    def setUp(self) -> None:
+        super().setUp()
+        self.container.readiness.reset()
+        settings = self.web_app_instance.settings
+        self.addCleanup(
+            setattr, settings, "WARM_UP_RETRY_DELAY", settings.WARM_UP_RETRY_DELAY
+        )
+        settings.WARM_UP_RETRY_DELAY = 0
+
+    def test_not_ready_during_background_warm_up(self) -> None:
+        use_case = BlockingWarmUpUseCase()
+        with self.container.warm_up_humid_air.override(providers.Object(use_case)):
+            thread = self.web_app_instance.start_warm_up()
+            response = self.client.get("/v1/health/ready")
+            self.assertEqual(response.status_code, HTTPStatus.SERVICE_UNAVAILABLE)
+
+            use_case.release.set()
+            thread.join(timeout=10)
+        response = self.client.get("/v1/health/ready")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.get_json()["warm_up_seconds"], 0.5)
+
+    def test_ready_only_after_warm_up(self) -> None:
+        response = self.client.get("/v1/health/ready")
+        self.assertEqual(response.status_code, HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertFalse(response.get_json()["ready"])
+
+        self.container.readiness().mark_ready({"humid_air.get_ha_props": 0.25})
+        response = self.client.get("/v1/health/ready")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertTrue(response_data["ready"])
+        self.assertEqual(response_data["warm_up_seconds"], 0.25)
+
+    def test_warm_up_is_retried_after_a_failure(self) -> None:
+        use_case = FailingWarmUpUseCase(failures=1)
+        with self.container.warm_up_humid_air.override(providers.Object(use_case)):
+            self.web_app_instance.warm_up()
+        self.assertEqual(use_case.calls, 2)
+        response = self.client.get("/v1/health/ready")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertEqual(response_data["failed_attempts"], 1)
+        self.assertIsNone(response_data["error"])
+
+    def test_warm_up_failure_is_reported(self) -> None:
+        use_case = FailingWarmUpUseCase(failures=10)
+        with self.container.warm_up_humid_air.override(providers.Object(use_case)):
+            self.web_app_instance.warm_up()
+        attempts = self.web_app_instance.settings.WARM_UP_ATTEMPTS
+        self.assertEqual(use_case.calls, attempts)
+        response = self.client.get("/v1/health/ready")
+        self.assertEqual(response.status_code, HTTPStatus.SERVICE_UNAVAILABLE)
+        response_data = response.get_json()
+        self.assertFalse(response_data["ready"])
+        self.assertTrue(response_data["failed"])
+        self.assertEqual(response_data["failed_attempts"], attempts)
+        self.assertEqual(response_data["error"], "RuntimeError: table illisible")
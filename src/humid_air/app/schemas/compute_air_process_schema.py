@@ -0,0 +1,88 @@
+from typing import Any
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from humid_air.app.schemas.get_ha_props_schema import (
+    check_input_pair,
+    parse_property_names,
+)
+from humid_air.domain.entities.air_process_entity import AirProcessKind
+from humid_air.domain.entities.humid_air_entity import (
+    HUMID_AIR_INPUT_NAMES,
+    HUMID_AIR_PROPERTY_NAMES,
+    HumidAirEngine,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+# paramètres requis par chaque transformation, l'un des groupes suffit
+AIR_PROCESS_PARAMETERS: dict[AirProcessKind, tuple[tuple[str, ...], ...]] = {
+    AirProcessKind.SENSIBLE: (("temp_dry_bulb",),),
+    AirProcessKind.COIL: (("apparatus_dew_point", "bypass_factor"),),
+    AirProcessKind.STEAM_HUMIDIFICATION: (("relative_humidity",), ("humidity_ratio",)),
+    AirProcessKind.ADIABATIC_HUMIDIFICATION: (
+        ("relative_humidity",),
+        ("humidity_ratio",),
+    ),
+}
+
+
+class AirStreamSchema(BaseModel):
+    mass_flow_rate: float
+    temp_dry_bulb: float | None = None
+    relative_humidity: float | None = None
+    temp_dew_point: float | None = None
+    temp_wet_bulb: float | None = None
+    humidity_ratio: float | None = None
+    enthalpy_per_humid_air: float | None = None
+
+    @model_validator(mode="after")
+    def check_inputs(self) -> "AirStreamSchema":
+        check_input_pair(set(self.inputs()))
+        return self
+
+    def inputs(self) -> dict[str, float]:
+        return {
+            name: value
+            for name in HUMID_AIR_INPUT_NAMES
+            if (value := getattr(self, name)) is not None
+        }
+
+
+class AirProcessStepSchema(BaseModel):
+    kind: AirProcessKind
+    temp_dry_bulb: float | None = None
+    relative_humidity: float | None = None
+    humidity_ratio: float | None = None
+    apparatus_dew_point: float | None = None
+    bypass_factor: float | None = None
+
+    @model_validator(mode="after")
+    def check_parameters(self) -> "AirProcessStepSchema":
+        if self.kind is AirProcessKind.MIXING:
+            raise ValueError(HumidAirSettings.process_mixing_step_message)
+        groups = AIR_PROCESS_PARAMETERS[self.kind]
+        given = [
+            group
+            for group in groups
+            if all(getattr(self, name) is not None for name in group)
+        ]
+        if len(given) != 1:
+            expected = " ou ".join(" et ".join(group) for group in groups)
+            raise ValueError(
+                f"{HumidAirSettings.process_step_parameters_message} "
+                f"'{self.kind.value}' : {expected}"
+            )
+        return self
+
+
+class ComputeAirProcessSchema(BaseModel):
+    pressure: float
+    streams: list[AirStreamSchema] = Field(..., min_length=1)
+    steps: list[AirProcessStepSchema] = []
+    engine: HumidAirEngine = HumidAirEngine.COOLPROP
+    fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def check_fields(cls, fields: Any) -> tuple[str, ...]:
+        return parse_property_names(fields)
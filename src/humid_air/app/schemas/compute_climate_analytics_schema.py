@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+from humid_air.domain.entities.humid_air_entity import HumidAirEngine
+from humid_air.domain.entities.weather_file_entity import WeatherFileFormat
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+
+class ComputeClimateAnalyticsSchema(BaseModel):
+    file_format: WeatherFileFormat
+    pressure: float
+    engine: HumidAirEngine = HumidAirEngine.HYLAND_WEXLER
+    bin_width: float = HumidAirSettings.analytics_bin_width_default_value
+    heating_base_temperature: float = (
+        HumidAirSettings.analytics_heating_base_default_value
+    )
+    cooling_base_temperature: float = (
+        HumidAirSettings.analytics_cooling_base_default_value
+    )
+    enthalpy_base: float = HumidAirSettings.analytics_enthalpy_base_default_value
@@ -0,0 +1,58 @@
+from typing import Any
+
+from pydantic import BaseModel, model_validator
+
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+# colonnes acceptant une valeur unique, commune à tous les états
+THERMAL_COMFORT_BROADCAST_NAMES: tuple[str, ...] = (
+    "mean_radiant_temperature",
+    "air_speed",
+    "metabolic_rate",
+    "clothing",
+    "prevailing_mean_outdoor_temperature",
+)
+
+
+class ComputeThermalComfortSchema(BaseModel):
+    temp_dry_bulb: list[float]
+    relative_humidity: list[float]
+    mean_radiant_temperature: list[float]
+    air_speed: list[float]
+    metabolic_rate: list[float]
+    clothing: list[float]
+    prevailing_mean_outdoor_temperature: list[float] | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def broadcast_scalars(cls, data: Any) -> Any:
+        """Étend les valeurs uniques à tous les états du lot
+
+        Sans température radiante moyenne, celle de chaque état est prise
+        égale à sa température sèche.
+        """
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+        size = len(data.get("temp_dry_bulb") or [])
+        if data.get("mean_radiant_temperature") is None:
+            data["mean_radiant_temperature"] = data.get("temp_dry_bulb")
+        for name in THERMAL_COMFORT_BROADCAST_NAMES:
+            if isinstance(data.get(name), int | float):
+                data[name] = [data[name]] * size
+        return data
+
+    @model_validator(mode="after")
+    def check_lengths(self) -> "ComputeThermalComfortSchema":
+        columns = [
+            self.relative_humidity,
+            self.mean_radiant_temperature,
+            self.air_speed,
+            self.metabolic_rate,
+            self.clothing,
+        ]
+        if self.prevailing_mean_outdoor_temperature is not None:
+            columns.append(self.prevailing_mean_outdoor_temperature)
+        if any(len(column) != len(self.temp_dry_bulb) for column in columns):
+            raise ValueError(HumidAirSettings.comfort_length_message)
+        return self
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class GetComfortZoneSchema(BaseModel):
+    pressure: float
+    clothing: float
+    metabolic_rate: float
+    air_speed: float
+    humidity_ratio_max: float
@@ -1,7 +1,129 @@
-from pydantic import BaseModel
+from typing import Any
+
+from pydantic import BaseModel, field_validator, model_validator
+
+from humid_air.domain.entities.humid_air_entity import (
+    HUMID_AIR_INPUT_NAMES,
+    HUMID_AIR_INPUT_PAIRS,
+    HUMID_AIR_PROPERTY_NAMES,
+    HumidAirEngine,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+
+def check_input_pair(names: set[str]) -> None:
+    """Vérifie que les entrées renseignées forment un couple indépendant
+
+    Args:
+        names (set[str]): Noms des entrées renseignées
+
+    Raises:
+        ValueError: Couple d'entrées non supporté
+    """
+    if frozenset(names) not in HUMID_AIR_INPUT_PAIRS:
+        raise ValueError(HumidAirSettings.input_pair_message)
+
+
+def parse_property_names(fields: Any) -> tuple[str, ...]:
+    """Normalise la sélection de propriétés demandée
+
+    Args:
+        fields (Any): None, noms séparés par des virgules ou liste de noms
+
+    Raises:
+        ValueError: Propriété inconnue
+
+    Returns:
+        tuple[str, ...]: Noms des propriétés, sans doublon, toutes si aucune sélection
+    """
+    if fields is None:
+        return HUMID_AIR_PROPERTY_NAMES
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    names = tuple(dict.fromkeys(name.strip() for name in fields if name.strip()))
+    if not names:
+        return HUMID_AIR_PROPERTY_NAMES
+    unknown = [name for name in names if name not in HUMID_AIR_PROPERTY_NAMES]
+    if unknown:
+        raise ValueError(
+            f"{HumidAirSettings.fields_unknown_message} : {', '.join(unknown)}"
+        )
+    return names
 
 
 class GetHumidAirPropertySchema(BaseModel):
     pressure: float
-    temp_dry_bulb: float
-    relative_humidity: float
+    temp_dry_bulb: float | None = None
+    relative_humidity: float | None = None
+    temp_dew_point: float | None = None
+    temp_wet_bulb: float | None = None
+    humidity_ratio: float | None = None
+    enthalpy_per_humid_air: float | None = None
+    fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def check_fields(cls, fields: Any) -> tuple[str, ...]:
+        return parse_property_names(fields)
+
+    @model_validator(mode="after")
+    def check_inputs(self) -> "GetHumidAirPropertySchema":
+        check_input_pair(set(self.inputs()))
+        return self
+
+    def inputs(self) -> dict[str, float]:
+        return {
+            name: value
+            for name in HUMID_AIR_INPUT_NAMES
+            if (value := getattr(self, name)) is not None
+        }
+
+
+class GetHumidAirPropertiesBatchSchema(BaseModel):
+    pressure: list[float]
+    temp_dry_bulb: list[float] | None = None
+    relative_humidity: list[float] | None = None
+    temp_dew_point: list[float] | None = None
+    temp_wet_bulb: list[float] | None = None
+    humidity_ratio: list[float] | None = None
+    enthalpy_per_humid_air: list[float] | None = None
+    engine: HumidAirEngine = HumidAirEngine.COOLPROP
+    fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def check_fields(cls, fields: Any) -> tuple[str, ...]:
+        return parse_property_names(fields)
+
+    @model_validator(mode="before")
+    @classmethod
+    def broadcast_pressure(cls, data: Any) -> Any:
+        """Étend une pression unique, résolue pour la requête, à tous les états"""
+        if isinstance(data, dict) and isinstance(data.get("pressure"), int | float):
+            size = next(
+                (
+                    len(data[name])
+                    for name in HUMID_AIR_INPUT_NAMES
+                    if data.get(name) is not None
+                ),
+                0,
+            )
+            data = {**data, "pressure": [data["pressure"]] * size}
+        return data
+
+    @model_validator(mode="after")
+    def check_inputs(self) -> "GetHumidAirPropertiesBatchSchema":
+        inputs = self.inputs()
+        check_input_pair(set(inputs))
+        if any(len(column) != len(self.pressure) for column in inputs.values()):
+            raise ValueError(
+                f"pressure, {' et '.join(inputs)} doivent avoir la même longueur"
+            )
+        return self
+
+    def inputs(self) -> dict[str, list[float]]:
+        return {
+            name: value
+            for name in HUMID_AIR_INPUT_NAMES
+            if (value := getattr(self, name)) is not None
+        }
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, model_validator
+
+
+class GetPsychrometricChartSchema(BaseModel):
+    pressure: float
+    temp_dry_bulb_min: float
+    temp_dry_bulb_max: float
+    humidity_ratio_max: float
+    resolution: int
+
+    @model_validator(mode="after")
+    def check_temperature_range(self) -> "GetPsychrometricChartSchema":
+        if self.temp_dry_bulb_min >= self.temp_dry_bulb_max:
+            raise ValueError(
+                "temp_dry_bulb_min doit être inférieure à temp_dry_bulb_max"
+            )
+        return self
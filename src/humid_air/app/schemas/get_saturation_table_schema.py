@@ -0,0 +1,23 @@
+from pydantic import BaseModel, model_validator
+
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+
+class GetSaturationTableSchema(BaseModel):
+    pressure: float
+    temp_dry_bulb_min: float
+    temp_dry_bulb_max: float
+    temp_dry_bulb_step: float
+
+    @model_validator(mode="after")
+    def check_temperature_range(self) -> "GetSaturationTableSchema":
+        if self.temp_dry_bulb_min >= self.temp_dry_bulb_max:
+            raise ValueError(
+                "temp_dry_bulb_min doit être inférieure à temp_dry_bulb_max"
+            )
+        rows = (
+            self.temp_dry_bulb_max - self.temp_dry_bulb_min
+        ) / self.temp_dry_bulb_step + 1
+        if rows > HumidAirSettings.saturation_table_max_rows:
+            raise ValueError(HumidAirSettings.saturation_table_rows_message)
+        return self
@@ -0,0 +1,22 @@
+from typing import Any
+
+from pydantic import BaseModel, field_validator
+
+from humid_air.app.schemas.get_ha_props_schema import parse_property_names
+from humid_air.domain.entities.humid_air_entity import (
+    HUMID_AIR_PROPERTY_NAMES,
+    HumidAirEngine,
+)
+from humid_air.domain.entities.weather_file_entity import WeatherFileFormat
+
+
+class ProcessWeatherFileSchema(BaseModel):
+    file_format: WeatherFileFormat
+    pressure: float
+    engine: HumidAirEngine = HumidAirEngine.HYLAND_WEXLER
+    fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def check_fields(cls, fields: Any) -> tuple[str, ...]:
+        return parse_property_names(fields)
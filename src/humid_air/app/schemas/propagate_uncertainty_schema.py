@@ -0,0 +1,58 @@
+from typing import Any
+
+from pydantic import BaseModel, field_validator, model_validator
+
+from humid_air.app.schemas.get_ha_props_schema import parse_property_names
+from humid_air.domain.entities.humid_air_entity import (
+    HUMID_AIR_PROPERTY_NAMES,
+    HumidAirEngine,
+)
+from humid_air.domain.entities.uncertainty_entity import UncertaintyMethod
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+
+class PropagateUncertaintySchema(BaseModel):
+    pressure: list[float]
+    temp_dry_bulb: list[float]
+    relative_humidity: list[float]
+    pressure_uncertainty: float = HumidAirSettings.uncertainty_pressure_default_value
+    temp_dry_bulb_uncertainty: float = HumidAirSettings.uncertainty_tdb_default_value
+    relative_humidity_uncertainty: float = HumidAirSettings.uncertainty_rh_default_value
+    method: UncertaintyMethod = UncertaintyMethod.FINITE_DIFFERENCE
+    samples: int = HumidAirSettings.uncertainty_samples_default_value
+    coverage: float = HumidAirSettings.uncertainty_coverage_default_value
+    seed: int | None = None
+    engine: HumidAirEngine = HumidAirEngine.HYLAND_WEXLER
+    fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def check_fields(cls, fields: Any) -> tuple[str, ...]:
+        return parse_property_names(fields)
+
+    @model_validator(mode="before")
+    @classmethod
+    def broadcast_pressure(cls, data: Any) -> Any:
+        """Étend une pression unique, résolue pour la requête, à tous les états"""
+        if isinstance(data, dict) and isinstance(data.get("pressure"), int | float):
+            size = len(data.get("temp_dry_bulb") or [])
+            data = {**data, "pressure": [data["pressure"]] * size}
+        return data
+
+    @model_validator(mode="after")
+    def check_inputs(self) -> "PropagateUncertaintySchema":
+        if not (
+            len(self.pressure) == len(self.temp_dry_bulb) == len(self.relative_humidity)
+        ):
+            raise ValueError(HumidAirSettings.uncertainty_length_message)
+        if len(self.pressure) * self.evaluations() > (
+            HumidAirSettings.uncertainty_max_evaluations
+        ):
+            raise ValueError(HumidAirSettings.uncertainty_evaluations_message)
+        return self
+
+    def evaluations(self) -> int:
+        """Nombre d'états calculés par état du lot, nominal compris"""
+        if self.method is UncertaintyMethod.MONTE_CARLO:
+            return 1 + self.samples
+        return 1 + 2 * 3
@@ -0,0 +1,10 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ResolvePressureSchema(BaseModel):
+    pressure: float | None = None
+    altitude: float | None = None
+    project_id: UUID | None = None
+    user_id: UUID | None = None
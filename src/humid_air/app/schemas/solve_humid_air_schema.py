@@ -0,0 +1,83 @@
+from typing import Any
+
+from pydantic import BaseModel, field_validator, model_validator
+
+from humid_air.app.schemas.get_ha_props_schema import parse_property_names
+from humid_air.domain.entities.humid_air_entity import HUMID_AIR_PROPERTY_NAMES
+from humid_air.domain.entities.solver_entity import SOLVER_TARGET_NAMES, SolverUnknown
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+# colonnes acceptant une valeur unique, commune à tous les états
+SOLVER_BROADCAST_NAMES: tuple[str, ...] = (
+    "pressure",
+    "temp_dry_bulb",
+    "relative_humidity",
+)
+
+
+class SolveHumidAirSchema(BaseModel):
+    pressure: list[float]
+    temp_dry_bulb: list[float] | None = None
+    relative_humidity: list[float] | None = None
+    target: str
+    target_values: list[float]
+    lower: float | None = None
+    upper: float | None = None
+    tolerance: float = HumidAirSettings.solver_tolerance_default_value
+    max_iterations: int = HumidAirSettings.solver_max_iterations_default_value
+    fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def check_fields(cls, fields: Any) -> tuple[str, ...]:
+        return parse_property_names(fields)
+
+    @field_validator("target")
+    @classmethod
+    def check_target(cls, target: str) -> str:
+        if target not in SOLVER_TARGET_NAMES:
+            raise ValueError(
+                f"{HumidAirSettings.solver_target_unknown_message} : {target}"
+            )
+        return target
+
+    @model_validator(mode="before")
+    @classmethod
+    def broadcast_scalars(cls, data: Any) -> Any:
+        """Étend les valeurs uniques à toutes les valeurs cibles"""
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+        size = len(data.get("target_values") or [])
+        for name in SOLVER_BROADCAST_NAMES:
+            if isinstance(data.get(name), int | float):
+                data[name] = [data[name]] * size
+        return data
+
+    @model_validator(mode="after")
+    def check_inputs(self) -> "SolveHumidAirSchema":
+        if (self.temp_dry_bulb is None) == (self.relative_humidity is None):
+            raise ValueError(HumidAirSettings.solver_fixed_input_message)
+        if not len(self.pressure) == len(self.fixed()) == len(self.target_values):
+            raise ValueError(HumidAirSettings.solver_length_message)
+        return self
+
+    @property
+    def unknown(self) -> SolverUnknown:
+        if self.temp_dry_bulb is None:
+            return SolverUnknown.TEMP_DRY_BULB
+        return SolverUnknown.RELATIVE_HUMIDITY
+
+    @property
+    def fixed_name(self) -> str:
+        if self.unknown is SolverUnknown.TEMP_DRY_BULB:
+            return SolverUnknown.RELATIVE_HUMIDITY.value
+        return SolverUnknown.TEMP_DRY_BULB.value
+
+    def fixed(self) -> list[float]:
+        """Colonne de l'entrée fixée"""
+        return (
+            self.temp_dry_bulb
+            if self.temp_dry_bulb is not None
+            else self.relative_humidity or []
+        )
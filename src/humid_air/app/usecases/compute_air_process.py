@@ -0,0 +1,336 @@
+from typing import NamedTuple
+
+from pydantic import ValidationError
+
+from humid_air.app.schemas.compute_air_process_schema import (
+    AirProcessStepSchema,
+    ComputeAirProcessSchema,
+)
+from humid_air.domain.entities.air_process_entity import (
+    AirProcessEntity,
+    AirProcessKind,
+    AirProcessStepEntity,
+)
+from humid_air.domain.entities.humid_air_entity import HumidAirEntity
+from humid_air.domain.exceptions.humid_air_exceptions import HumidAirValidationException
+from humid_air.domain.services.humid_air_engine_interface import (
+    HumidAirEngineInterface,
+)
+from humid_air.domain.services.humid_air_input_converter_interface import (
+    HumidAirInputConverterInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+# itérations et tolérance, en [kg eau/kg air sec], de la recherche d'un état
+# humidifié à humidité relative imposée
+HUMIDIFICATION_ITERATIONS = 10
+HUMIDIFICATION_TOLERANCE = 1e-7
+
+
+class _AirState(NamedTuple):
+    """État intermédiaire : entrées du moteur et grandeurs des bilans"""
+
+    temp_dry_bulb: float
+    relative_humidity: float
+    humidity_ratio: float
+    enthalpy: float  # par kg d'air sec
+
+
+class ComputeAirProcessUseCase:
+    """Cas d'utilisation pour enchaîner les transformations d'une centrale d'air
+
+    Les flux entrants sont mélangés, puis chaque transformation est appliquée
+    par bilans de masse et d'énergie sur l'humidité absolue et l'enthalpie
+    par kg d'air sec, évaluées avec le moteur rapide. Les propriétés de tous
+    les états sont ensuite calculées en un seul lot avec le moteur demandé.
+    """
+
+    def __init__(
+        self,
+        engines: dict[str, HumidAirEngineInterface],
+        process_engine: HumidAirEngineInterface,
+        converter: HumidAirInputConverterInterface,
+    ):
+        """Initialise le cas d'utilisation
+
+        Args:
+            engines (dict[str, HumidAirEngineInterface]): Moteurs de calcul disponibles, par nom
+            process_engine (HumidAirEngineInterface): Moteur des bilans intermédiaires
+            converter (HumidAirInputConverterInterface): Convertisseur des couples d'entrées
+        """
+        self.engines = engines
+        self.process_engine = process_engine
+        self.converter = converter
+
+    def execute(self, schema: ComputeAirProcessSchema) -> AirProcessEntity:
+        """Calcule les états de sortie et les puissances de chaque transformation
+
+        Args:
+            schema (ComputeAirProcessSchema): Flux entrants et transformations
+
+        Raises:
+            HumidAirValidationException: État hors des bornes de HumidAirEntity
+            ValueError: Entrées sans état correspondant ou transformation impossible
+
+        Returns:
+            AirProcessEntity: Flux entrants et transformations, dans l'ordre
+        """
+        pressure = schema.pressure
+        inlets = [self._state(pressure, stream.inputs()) for stream in schema.streams]
+        mass_flow_rate = sum(stream.mass_flow_rate for stream in schema.streams)
+
+        steps: list[tuple[AirProcessKind, float, float, _AirState]] = []
+        current = inlets[0]
+        if len(inlets) > 1:
+            humidity_ratio = (
+                sum(
+                    stream.mass_flow_rate * state.humidity_ratio
+                    for stream, state in zip(schema.streams, inlets, strict=True)
+                )
+                / mass_flow_rate
+            )
+            enthalpy = (
+                sum(
+                    stream.mass_flow_rate * state.enthalpy
+                    for stream, state in zip(schema.streams, inlets, strict=True)
+                )
+                / mass_flow_rate
+            )
+            current = self._state_from_enthalpy(
+                pressure, humidity_ratio, enthalpy, HumidAirSettings.process_fog_message
+            )
+            steps.append((AirProcessKind.MIXING, humidity_ratio, enthalpy, current))
+        for step in schema.steps:
+            outlet = self._apply(pressure, current, step)
+            steps.append((step.kind, current.humidity_ratio, current.enthalpy, outlet))
+            current = outlet
+
+        states = [*inlets, *(outlet for _, _, _, outlet in steps)]
+        batch = self.engines[schema.engine.value].compute(
+            [pressure] * len(states),
+            [state.temp_dry_bulb for state in states],
+            [state.relative_humidity for state in states],
+            fields=schema.fields,
+        )
+        if batch.errors:
+            raise ValueError(batch.errors[0].message)
+        properties = [
+            {name: column[index] for name, column in batch.properties.items()}
+            for index in range(len(states))
+        ]
+
+        return AirProcessEntity(
+            inlets=properties[: len(inlets)],
+            steps=[
+                self._step(
+                    kind, mass_flow_rate, humidity_ratio, enthalpy, outlet, props
+                )
+                for (kind, humidity_ratio, enthalpy, outlet), props in zip(
+                    steps, properties[len(inlets) :], strict=True
+                )
+            ],
+            max_errors=batch.max_errors,
+        )
+
+    def _apply(
+        self, pressure: float, inlet: _AirState, step: AirProcessStepSchema
+    ) -> _AirState:
+        """Calcule l'état de sortie d'une transformation"""
+        if step.kind is AirProcessKind.SENSIBLE:
+            return self._state(
+                pressure,
+                {
+                    "temp_dry_bulb": step.temp_dry_bulb or 0.0,
+                    "humidity_ratio": inlet.humidity_ratio,
+                },
+                HumidAirSettings.process_condensation_message,
+                humidity_ratio=inlet.humidity_ratio,
+            )
+        if step.kind is AirProcessKind.COIL:
+            return self._coil(
+                pressure,
+                inlet,
+                step.apparatus_dew_point or 0.0,
+                step.bypass_factor or 0.0,
+            )
+        water_enthalpy = (
+            HumidAirSettings.process_steam_enthalpy
+            if step.kind is AirProcessKind.STEAM_HUMIDIFICATION
+            else 0.0
+        )
+        return self._humidify(pressure, inlet, step, water_enthalpy)
+
+    def _coil(
+        self,
+        pressure: float,
+        inlet: _AirState,
+        apparatus_dew_point: float,
+        bypass_factor: float,
+    ) -> _AirState:
+        """Sortie de batterie : mélange de l'air bypassé et de l'air saturé au point de rosée de l'appareil
+
+        Une batterie dont le point de rosée d'appareil dépasse celui de l'air
+        reste sèche : l'humidité absolue est conservée.
+        """
+        apparatus = self._state(
+            pressure,
+            {"temp_dry_bulb": apparatus_dew_point, "relative_humidity": 100},
+        )
+        humidity_ratio = inlet.humidity_ratio
+        if apparatus.humidity_ratio < inlet.humidity_ratio:
+            humidity_ratio = (
+                bypass_factor * inlet.humidity_ratio
+                + (1 - bypass_factor) * apparatus.humidity_ratio
+            )
+        return self._state(
+            pressure,
+            {
+                "temp_dry_bulb": bypass_factor * inlet.temp_dry_bulb
+                + (1 - bypass_factor) * apparatus_dew_point,
+                "humidity_ratio": humidity_ratio,
+            },
+            humidity_ratio=humidity_ratio,
+        )
+
+    def _humidify(
+        self,
+        pressure: float,
+        inlet: _AirState,
+        step: AirProcessStepSchema,
+        water_enthalpy: float,
+    ) -> _AirState:
+        """Sortie d'humidificateur : l'enthalpie croît de celle de l'eau apportée
+
+        À humidité relative imposée, l'humidité absolue de sortie est obtenue
+        par substitutions successives sur le bilan d'énergie.
+        """
+        if step.humidity_ratio is not None:
+            if step.humidity_ratio < inlet.humidity_ratio:
+                raise ValueError(HumidAirSettings.process_dehumidification_message)
+            return self._state_from_enthalpy(
+                pressure,
+                step.humidity_ratio,
+                inlet.enthalpy
+                + (step.humidity_ratio - inlet.humidity_ratio) * water_enthalpy,
+            )
+
+        relative_humidity = step.relative_humidity or 0.0
+        if relative_humidity < inlet.relative_humidity:
+            raise ValueError(HumidAirSettings.process_dehumidification_message)
+        humidity_ratio = inlet.humidity_ratio
+        outlet = inlet
+        for _ in range(HUMIDIFICATION_ITERATIONS):
+            enthalpy = (
+                inlet.enthalpy
+                + (humidity_ratio - inlet.humidity_ratio) * water_enthalpy
+            )
+            outlet = self._state(
+                pressure,
+                {
+                    "relative_humidity": relative_humidity,
+                    "enthalpy_per_humid_air": enthalpy / (1 + humidity_ratio),
+                },
+                enthalpy=enthalpy,
+            )
+            if abs(outlet.humidity_ratio - humidity_ratio) < HUMIDIFICATION_TOLERANCE:
+                break
+            humidity_ratio = outlet.humidity_ratio
+        return outlet
+
+    def _state_from_enthalpy(
+        self,
+        pressure: float,
+        humidity_ratio: float,
+        enthalpy: float,
+        message: str = HumidAirSettings.input_impossible_message,
+    ) -> _AirState:
+        """État défini par son humidité absolue et son enthalpie par kg d'air sec"""
+        return self._state(
+            pressure,
+            {
+                "humidity_ratio": humidity_ratio,
+                "enthalpy_per_humid_air": enthalpy / (1 + humidity_ratio),
+            },
+            message,
+            humidity_ratio=humidity_ratio,
+            enthalpy=enthalpy,
+        )
+
+    def _state(
+        self,
+        pressure: float,
+        inputs: dict[str, float],
+        message: str = HumidAirSettings.input_impossible_message,
+        humidity_ratio: float | None = None,
+        enthalpy: float | None = None,
+    ) -> _AirState:
+        """Résout un état à partir de deux entrées indépendantes
+
+        L'humidité absolue et l'enthalpie fixées par les bilans sont conservées
+        telles quelles, seules les grandeurs manquantes sont évaluées par le
+        moteur : un mélange ou une transformation sensible n'introduit ainsi
+        aucun écart d'arrondi entre les deux modèles.
+
+        Raises:
+            HumidAirValidationException: État hors des bornes de HumidAirEntity
+            ValueError: Entrées sans état correspondant, avec le message fourni
+        """
+        if set(inputs) == {"temp_dry_bulb", "relative_humidity"}:
+            temp_dry_bulb: float | None = inputs["temp_dry_bulb"]
+            relative_humidity: float | None = inputs["relative_humidity"]
+        else:
+            (temp_dry_bulb,), (relative_humidity,) = (
+                self.converter.to_dry_bulb_and_relative_humidity(
+                    [pressure], {name: [value] for name, value in inputs.items()}
+                )
+            )
+        if temp_dry_bulb is None or relative_humidity is None:
+            raise ValueError(message)
+        try:
+            HumidAirEntity(
+                pressure=pressure,
+                temp_dry_bulb=temp_dry_bulb,
+                relative_humidity=relative_humidity,
+            )
+        except ValidationError as e:
+            raise HumidAirValidationException(e.errors())
+
+        if humidity_ratio is None or enthalpy is None:
+            computed = self.process_engine.compute(
+                [pressure],
+                [temp_dry_bulb],
+                [relative_humidity],
+                fields=("humidity_ratio", "enthalpy_per_humid_air"),
+            )
+            computed_humidity_ratio = computed.properties["humidity_ratio"][0]
+            computed_enthalpy = computed.properties["enthalpy_per_humid_air"][0]
+            if computed_humidity_ratio is None or computed_enthalpy is None:
+                raise ValueError(message)
+            if humidity_ratio is None:
+                humidity_ratio = computed_humidity_ratio
+            if enthalpy is None:
+                enthalpy = computed_enthalpy * (1 + computed_humidity_ratio)
+        return _AirState(temp_dry_bulb, relative_humidity, humidity_ratio, enthalpy)
+
+    def _step(
+        self,
+        kind: AirProcessKind,
+        mass_flow_rate: float,
+        humidity_ratio: float,
+        enthalpy: float,
+        outlet: _AirState,
+        properties: dict[str, float | None],
+    ) -> AirProcessStepEntity:
+        """Puissances d'une transformation à partir des grandeurs d'entrée"""
+        water_flow_rate = mass_flow_rate * (outlet.humidity_ratio - humidity_ratio)
+        total_load = mass_flow_rate * (outlet.enthalpy - enthalpy)
+        latent_load = water_flow_rate * HumidAirSettings.process_latent_heat
+        return AirProcessStepEntity(
+            kind=kind,
+            mass_flow_rate=mass_flow_rate,
+            outlet=properties,
+            sensible_load=round(total_load - latent_load, 1),
+            latent_load=round(latent_load, 1),
+            total_load=round(total_load, 1),
+            water_flow_rate=round(water_flow_rate, 8),
+        )
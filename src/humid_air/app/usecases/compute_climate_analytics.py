@@ -0,0 +1,69 @@
+from collections.abc import Iterable
+
+from humid_air.app.schemas.compute_climate_analytics_schema import (
+    ComputeClimateAnalyticsSchema,
+)
+from humid_air.app.schemas.process_weather_file_schema import ProcessWeatherFileSchema
+from humid_air.app.usecases.process_weather_file import ProcessWeatherFileUseCase
+from humid_air.domain.entities.climate_analytics_entity import ClimateAnalyticsEntity
+from humid_air.domain.services.climate_analytics_interface import (
+    ClimateAnalyticsInterface,
+)
+
+# propriétés nécessaires aux agrégats, seules calculées pour chaque heure
+CLIMATE_ANALYTICS_FIELDS = ("temp_dry_bulb", "temp_wet_bulb", "enthalpy_per_humid_air")
+
+
+class ComputeClimateAnalyticsUseCase:
+    """Cas d'utilisation pour agréger un fichier météo horaire
+
+    Le fichier est lu et calculé par tranches comme pour son enrichissement,
+    mais chaque tranche est aussitôt réduite : la réponse ne contient que les
+    tables agrégées, quelle que soit la longueur de la série.
+    """
+
+    def __init__(
+        self,
+        weather_use_case: ProcessWeatherFileUseCase,
+        analytics: ClimateAnalyticsInterface,
+    ):
+        """Initialise le cas d'utilisation
+
+        Args:
+            weather_use_case (ProcessWeatherFileUseCase): Lecture et calcul du fichier par tranches
+            analytics (ClimateAnalyticsInterface): Agrégation des tranches
+        """
+        self.weather_use_case = weather_use_case
+        self.analytics = analytics
+
+    def execute(
+        self, schema: ComputeClimateAnalyticsSchema, lines: Iterable[str]
+    ) -> ClimateAnalyticsEntity:
+        """Calcule les bins, degrés-jours et enthalpies-heures du fichier
+
+        Args:
+            schema (ComputeClimateAnalyticsSchema): Paramètres de l'analyse
+            lines (Iterable[str]): Lignes du fichier météo
+
+        Raises:
+            ValueError: En-tête invalide ou colonnes d'entrée non supportées
+
+        Returns:
+            ClimateAnalyticsEntity: Tables agrégées
+        """
+        chunks = self.weather_use_case.execute(
+            ProcessWeatherFileSchema(
+                file_format=schema.file_format,
+                pressure=schema.pressure,
+                engine=schema.engine,
+                fields=CLIMATE_ANALYTICS_FIELDS,
+            ),
+            lines,
+        )
+        return self.analytics.aggregate(
+            (chunk.batch for chunk in chunks),
+            bin_width=schema.bin_width,
+            heating_base_temperature=schema.heating_base_temperature,
+            cooling_base_temperature=schema.cooling_base_temperature,
+            enthalpy_base=schema.enthalpy_base,
+        )
@@ -0,0 +1,139 @@
+from typing import TypeVar
+
+from pydantic import ValidationError
+
+from humid_air.app.schemas.compute_thermal_comfort_schema import (
+    ComputeThermalComfortSchema,
+)
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchErrorEntity
+from humid_air.domain.entities.thermal_comfort_entity import (
+    ThermalComfortBatchEntity,
+    ThermalComfortStateEntity,
+)
+from humid_air.domain.exceptions.humid_air_exceptions import HumidAirValidationException
+from humid_air.domain.services.thermal_comfort_interface import (
+    ThermalComfortInterface,
+)
+
+T = TypeVar("T")
+
+
+def _scatter(values: list[T | None], indexes: list[int], size: int) -> list[T | None]:
+    """Replace les valeurs des états valides à leur index dans le lot"""
+    column: list[T | None] = [None] * size
+    for index, value in zip(indexes, values, strict=True):
+        column[index] = value
+    return column
+
+
+class ComputeThermalComfortUseCase:
+    """Cas d'utilisation pour évaluer le confort thermique d'un lot d'occupants
+
+    Chaque état est validé indépendamment sur le domaine du modèle PMV : un
+    état invalide est signalé dans les erreurs du lot sans interrompre
+    l'évaluation des autres, transmis en une fois au service de confort.
+    """
+
+    def __init__(self, comfort: ThermalComfortInterface):
+        """Initialise le cas d'utilisation
+
+        Args:
+            comfort (ThermalComfortInterface): Service d'évaluation du confort
+        """
+        self.comfort = comfort
+
+    def execute(self, schema: ComputeThermalComfortSchema) -> ThermalComfortBatchEntity:
+        """Évalue le PMV/PPD et, si demandé, le modèle adaptatif de chaque état
+
+        Args:
+            schema (ComputeThermalComfortSchema): Conditions du lot, en colonnes
+
+        Returns:
+            ThermalComfortBatchEntity: Indices de confort en colonnes et erreurs par état
+        """
+        states, indexes, errors = self._validate_states(schema)
+        outdoor = schema.prevailing_mean_outdoor_temperature
+        computed = self.comfort.evaluate(
+            temp_dry_bulb=[state.temp_dry_bulb for state in states],
+            mean_radiant_temperature=[
+                state.mean_radiant_temperature for state in states
+            ],
+            air_speed=[state.air_speed for state in states],
+            relative_humidity=[state.relative_humidity for state in states],
+            metabolic_rate=[state.metabolic_rate for state in states],
+            clothing=[state.clothing for state in states],
+            prevailing_mean_outdoor_temperature=(
+                None if outdoor is None else [outdoor[index] for index in indexes]
+            ),
+        )
+
+        size = len(schema.temp_dry_bulb)
+        return ThermalComfortBatchEntity(
+            pmv=_scatter(computed.pmv, indexes, size),
+            ppd=_scatter(computed.ppd, indexes, size),
+            operative_temperature=_scatter(
+                computed.operative_temperature, indexes, size
+            ),
+            adaptive_comfort_temperature=(
+                None
+                if computed.adaptive_comfort_temperature is None
+                else _scatter(computed.adaptive_comfort_temperature, indexes, size)
+            ),
+            adaptive_acceptable_80=(
+                None
+                if computed.adaptive_acceptable_80 is None
+                else _scatter(computed.adaptive_acceptable_80, indexes, size)
+            ),
+            adaptive_acceptable_90=(
+                None
+                if computed.adaptive_acceptable_90 is None
+                else _scatter(computed.adaptive_acceptable_90, indexes, size)
+            ),
+            errors=errors,
+        )
+
+    def _validate_states(
+        self, schema: ComputeThermalComfortSchema
+    ) -> tuple[
+        list[ThermalComfortStateEntity], list[int], list[HumidAirBatchErrorEntity]
+    ]:
+        """Valide chaque état du lot avec les bornes de ThermalComfortStateEntity
+
+        Args:
+            schema (ComputeThermalComfortSchema): Conditions du lot, en colonnes
+
+        Returns:
+            tuple[list[ThermalComfortStateEntity], list[int], list[HumidAirBatchErrorEntity]]:
+                États valides, leurs index dans le lot et erreurs
+        """
+        states: list[ThermalComfortStateEntity] = []
+        indexes: list[int] = []
+        errors: list[HumidAirBatchErrorEntity] = []
+        rows = zip(
+            schema.temp_dry_bulb,
+            schema.mean_radiant_temperature,
+            schema.air_speed,
+            schema.relative_humidity,
+            schema.metabolic_rate,
+            schema.clothing,
+            strict=True,
+        )
+        for index, (tdb, tr, speed, rh, met, clo) in enumerate(rows):
+            try:
+                states.append(
+                    ThermalComfortStateEntity(
+                        temp_dry_bulb=tdb,
+                        mean_radiant_temperature=tr,
+                        air_speed=speed,
+                        relative_humidity=rh,
+                        metabolic_rate=met,
+                        clothing=clo,
+                    )
+                )
+                indexes.append(index)
+            except ValidationError as e:
+                errors.extend(
+                    HumidAirBatchErrorEntity(index=index, **error)
+                    for error in HumidAirValidationException(e.errors()).errors
+                )
+        return states, indexes, errors
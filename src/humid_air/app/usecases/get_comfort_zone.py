@@ -0,0 +1,34 @@
+from humid_air.app.schemas.get_comfort_zone_schema import GetComfortZoneSchema
+from humid_air.domain.entities.thermal_comfort_entity import ComfortZoneEntity
+from humid_air.domain.services.thermal_comfort_interface import (
+    ThermalComfortInterface,
+)
+
+
+class GetComfortZoneUseCase:
+    """Cas d'utilisation pour tracer une zone de confort sur le diagramme"""
+
+    def __init__(self, comfort: ThermalComfortInterface):
+        """Initialise le cas d'utilisation
+
+        Args:
+            comfort (ThermalComfortInterface): Service d'évaluation du confort
+        """
+        self.comfort = comfort
+
+    def execute(self, schema: GetComfortZoneSchema) -> ComfortZoneEntity:
+        """Calcule le polygone de la zone de confort PMV de -0,5 à +0,5
+
+        Args:
+            schema (GetComfortZoneSchema): Tenue, activité et vitesse d'air
+
+        Returns:
+            ComfortZoneEntity: Polygone fermé dans le plan du diagramme
+        """
+        return self.comfort.comfort_zone(
+            pressure=schema.pressure,
+            clothing=schema.clothing,
+            metabolic_rate=schema.metabolic_rate,
+            air_speed=schema.air_speed,
+            humidity_ratio_max=schema.humidity_ratio_max,
+        )
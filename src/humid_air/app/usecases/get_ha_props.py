@@ -3,15 +3,62 @@ from pydantic import ValidationError
 from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertySchema
 from humid_air.domain.entities.humid_air_entity import HumidAirEntity
 from humid_air.domain.exceptions.humid_air_exceptions import HumidAirValidationException
+from humid_air.domain.services.humid_air_input_converter_interface import (
+    HumidAirInputConverterInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+
+def resolve_dry_bulb_and_relative_humidity(
+    schema: GetHumidAirPropertySchema,
+    converter: HumidAirInputConverterInterface | None,
+) -> tuple[float, float]:
+    """Ramène les entrées d'un état au couple température sèche et humidité relative
+
+    Les valeurs converties sont arrondies à
+    HumidAirSettings.converted_input_decimals, comme dans les lots.
+
+    Args:
+        schema (GetHumidAirPropertySchema): Entrées de l'état d'air humide
+        converter (HumidAirInputConverterInterface | None): Convertisseur des autres couples
+
+    Raises:
+        ValueError: Couple non convertible ou entrées sans état correspondant
+
+    Returns:
+        tuple[float, float]: Température sèche en [°C] et humidité relative en [%]
+    """
+    if schema.temp_dry_bulb is not None and schema.relative_humidity is not None:
+        return schema.temp_dry_bulb, schema.relative_humidity
+    if converter is None:
+        raise ValueError(HumidAirSettings.input_pair_message)
+    (temp_dry_bulb,), (relative_humidity,) = (
+        converter.to_dry_bulb_and_relative_humidity(
+            [schema.pressure],
+            {name: [value] for name, value in schema.inputs().items()},
+        )
+    )
+    if temp_dry_bulb is None or relative_humidity is None:
+        raise ValueError(HumidAirSettings.input_impossible_message)
+    return (
+        round(temp_dry_bulb, HumidAirSettings.converted_input_decimals),
+        round(relative_humidity, HumidAirSettings.converted_input_decimals),
+    )
 
 
 class GetHumidAirPropertyUseCase:
+    def __init__(self, converter: HumidAirInputConverterInterface | None = None):
+        self.converter = converter
+
     def execute(self, schema: GetHumidAirPropertySchema) -> HumidAirEntity:
+        temp_dry_bulb, relative_humidity = resolve_dry_bulb_and_relative_humidity(
+            schema, self.converter
+        )
         try:
             return HumidAirEntity(
                 pressure=schema.pressure,
-                temp_dry_bulb=schema.temp_dry_bulb,
-                relative_humidity=schema.relative_humidity,
+                temp_dry_bulb=temp_dry_bulb,
+                relative_humidity=relative_humidity,
             )
         except ValidationError as e:
             raise HumidAirValidationException(e.errors())
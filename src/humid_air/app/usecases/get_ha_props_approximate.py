@@ -0,0 +1,73 @@
+from pydantic import ValidationError
+
+from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertySchema
+from humid_air.app.usecases.get_ha_props import resolve_dry_bulb_and_relative_humidity
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchEntity
+from humid_air.domain.entities.humid_air_entity import HumidAirEntity
+from humid_air.domain.exceptions.humid_air_exceptions import HumidAirValidationException
+from humid_air.domain.services.humid_air_engine_interface import (
+    HumidAirEngineInterface,
+)
+from humid_air.domain.services.humid_air_input_converter_interface import (
+    HumidAirInputConverterInterface,
+)
+
+
+class GetApproximateHumidAirPropertyUseCase:
+    """Cas d'utilisation pour récupérer les propriétés approchées de l'air humide
+
+    L'état est calculé par un moteur approché (table précalculée), qui déclare
+    ses erreurs maximales. Un état que ce moteur ne couvre pas est calculé par
+    le moteur de repli, sans erreur déclarée.
+    """
+
+    def __init__(
+        self,
+        engine: HumidAirEngineInterface,
+        fallback_engine: HumidAirEngineInterface,
+        converter: HumidAirInputConverterInterface | None = None,
+    ):
+        """Initialise le cas d'utilisation
+
+        Args:
+            engine (HumidAirEngineInterface): Moteur approché
+            fallback_engine (HumidAirEngineInterface): Moteur utilisé hors du domaine du moteur approché
+            converter (HumidAirInputConverterInterface | None, optional): Convertisseur
+                des couples d'entrées autres que température sèche et humidité relative
+        """
+        self.engine = engine
+        self.fallback_engine = fallback_engine
+        self.converter = converter
+
+    def execute(self, schema: GetHumidAirPropertySchema) -> HumidAirBatchEntity:
+        """Exécute le calcul approché d'un état d'air humide
+
+        Args:
+            schema (GetHumidAirPropertySchema): Entrées de l'état d'air humide
+
+        Raises:
+            HumidAirValidationException: Exception de validation
+            ValueError: Entrées sans état correspondant ou état non calculable par le moteur de repli
+
+        Returns:
+            HumidAirBatchEntity: Propriétés demandées de l'état, en colonnes d'un élément
+        """
+        temp_dry_bulb, relative_humidity = resolve_dry_bulb_and_relative_humidity(
+            schema, self.converter
+        )
+        try:
+            HumidAirEntity(
+                pressure=schema.pressure,
+                temp_dry_bulb=temp_dry_bulb,
+                relative_humidity=relative_humidity,
+            )
+        except ValidationError as e:
+            raise HumidAirValidationException(e.errors())
+
+        state = ([schema.pressure], [temp_dry_bulb], [relative_humidity])
+        result = self.engine.compute(*state, fields=schema.fields)
+        if result.errors:
+            result = self.fallback_engine.compute(*state, fields=schema.fields)
+        if result.errors:
+            raise ValueError(result.errors[0].message)
+        return result
@@ -0,0 +1,192 @@
+from pydantic import ValidationError
+
+from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertiesBatchSchema
+from humid_air.domain.entities.humid_air_batch_entity import (
+    HumidAirBatchEntity,
+    HumidAirBatchErrorEntity,
+)
+from humid_air.domain.entities.humid_air_entity import HumidAirEntity
+from humid_air.domain.exceptions.humid_air_exceptions import HumidAirValidationException
+from humid_air.domain.services.humid_air_engine_interface import (
+    HumidAirEngineInterface,
+)
+from humid_air.domain.services.humid_air_input_converter_interface import (
+    HumidAirInputConverterInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+
+class GetHumidAirPropertiesBatchUseCase:
+    """Cas d'utilisation pour calculer les propriétés d'un lot d'états d'air humide
+
+    Chaque état est validé indépendamment : un état invalide est signalé dans
+    les erreurs du lot sans interrompre le calcul des autres, et garde ses
+    entrées valides. Les états valides sont transmis en une fois au moteur de
+    calcul demandé, qui ne calcule que les propriétés sélectionnées.
+    """
+
+    def __init__(
+        self,
+        engines: dict[str, HumidAirEngineInterface],
+        converter: HumidAirInputConverterInterface | None = None,
+    ):
+        """Initialise le cas d'utilisation
+
+        Args:
+            engines (dict[str, HumidAirEngineInterface]): Moteurs de calcul disponibles, par nom
+            converter (HumidAirInputConverterInterface | None, optional): Convertisseur
+                des couples d'entrées autres que température sèche et humidité relative
+        """
+        self.engines = engines
+        self.converter = converter
+
+    def execute(self, schema: GetHumidAirPropertiesBatchSchema) -> HumidAirBatchEntity:
+        """Exécute le calcul des propriétés pour chaque état du lot
+
+        Args:
+            schema (GetHumidAirPropertiesBatchSchema): Entrées du lot, en colonnes
+
+        Raises:
+            ValueError: Couple d'entrées non convertible
+
+        Returns:
+            HumidAirBatchEntity: Propriétés en colonnes et erreurs par état
+        """
+        temp_dry_bulb, relative_humidity = self._resolve_inputs(schema)
+        valid_states, errors = self._validate_states(
+            schema.pressure, temp_dry_bulb, relative_humidity
+        )
+        valid_indexes = [index for index, _, _, _ in valid_states]
+        engine = self.engines[schema.engine.value]
+        computed = engine.compute(
+            pressure=[state[1] for state in valid_states],
+            temp_dry_bulb=[state[2] for state in valid_states],
+            relative_humidity=[state[3] for state in valid_states],
+            fields=schema.fields,
+        )
+        errors.extend(
+            HumidAirBatchErrorEntity(
+                index=valid_indexes[error.index],
+                field=error.field,
+                message=error.message,
+            )
+            for error in computed.errors
+        )
+        errors.sort(key=lambda error: error.index)
+
+        size = len(schema.pressure)
+        inputs: dict[str, list[float] | list[float | None]] = {
+            "pressure": schema.pressure,
+            "temp_dry_bulb": temp_dry_bulb,
+            "relative_humidity": relative_humidity,
+        }
+        invalid_inputs = {(error.index, error.field) for error in errors}
+        columns: dict[str, list[float | None]] = {}
+        for name in schema.fields:
+            column: list[float | None] = [None] * size
+            for position, value in zip(
+                valid_indexes, computed.properties[name], strict=True
+            ):
+                column[position] = value
+            if name in inputs:
+                # les états en erreur gardent leurs entrées valides
+                for index, value in enumerate(inputs[name]):
+                    if column[index] is None and (index, name) not in invalid_inputs:
+                        column[index] = value
+            columns[name] = column
+
+        return HumidAirBatchEntity(
+            properties=columns, errors=errors, max_errors=computed.max_errors
+        )
+
+    def _resolve_inputs(
+        self, schema: GetHumidAirPropertiesBatchSchema
+    ) -> tuple[list[float | None], list[float | None]]:
+        """Ramène les entrées du lot aux températures sèches et humidités relatives
+
+        Args:
+            schema (GetHumidAirPropertiesBatchSchema): Entrées du lot, en colonnes
+
+        Raises:
+            ValueError: Couple d'entrées non convertible
+
+        Returns:
+            tuple[list[float | None], list[float | None]]: Températures sèches et
+                humidités relatives, arrondies comme pour un état seul, None pour
+                les états sans correspondance
+        """
+        if schema.temp_dry_bulb is not None and schema.relative_humidity is not None:
+            return list(schema.temp_dry_bulb), list(schema.relative_humidity)
+        if self.converter is None:
+            raise ValueError(HumidAirSettings.input_pair_message)
+        temp_dry_bulb, relative_humidity = (
+            self.converter.to_dry_bulb_and_relative_humidity(
+                schema.pressure, schema.inputs()
+            )
+        )
+        decimals = HumidAirSettings.converted_input_decimals
+        return (
+            [
+                None if value is None else round(value, decimals)
+                for value in temp_dry_bulb
+            ],
+            [
+                None if value is None else round(value, decimals)
+                for value in relative_humidity
+            ],
+        )
+
+    def _validate_states(
+        self,
+        pressure: list[float],
+        temp_dry_bulb: list[float | None],
+        relative_humidity: list[float | None],
+    ) -> tuple[list[tuple[int, float, float, float]], list[HumidAirBatchErrorEntity]]:
+        """Valide chaque état du lot avec les bornes de HumidAirEntity
+
+        Args:
+            pressure (list[float]): Pressions absolues en [Pa]
+            temp_dry_bulb (list[float | None]): Températures sèches en [°C]
+            relative_humidity (list[float | None]): Humidités relatives en [%]
+
+        Returns:
+            tuple[list[tuple[int, float, float, float]], list[HumidAirBatchErrorEntity]]:
+                États valides (index, pression, température sèche, humidité relative) et erreurs
+        """
+        valid_states: list[tuple[int, float, float, float]] = []
+        errors: list[HumidAirBatchErrorEntity] = []
+        states = zip(pressure, temp_dry_bulb, relative_humidity, strict=True)
+        for index, (
+            state_pressure,
+            state_temp_dry_bulb,
+            state_relative_humidity,
+        ) in enumerate(states):
+            if state_temp_dry_bulb is None or state_relative_humidity is None:
+                errors.append(
+                    HumidAirBatchErrorEntity(
+                        index=index,
+                        field="state",
+                        message=HumidAirSettings.input_impossible_message,
+                    )
+                )
+                continue
+            try:
+                HumidAirEntity(
+                    pressure=state_pressure,
+                    temp_dry_bulb=state_temp_dry_bulb,
+                    relative_humidity=state_relative_humidity,
+                )
+                valid_states.append(
+                    (
+                        index,
+                        state_pressure,
+                        state_temp_dry_bulb,
+                        state_relative_humidity,
+                    )
+                )
+            except ValidationError as e:
+                errors.extend(
+                    HumidAirBatchErrorEntity(index=index, **error)
+                    for error in HumidAirValidationException(e.errors()).errors
+                )
+        return valid_states, errors
@@ -0,0 +1,23 @@
+from humid_air.app.usecases.get_ha_props_cached import HumidAirCacheKey
+from humid_air.domain.entities.humid_air_entity import HumidAirOutputs
+from utils.lru_cache import LRUCache, LRUCacheStatistics
+
+
+class GetHumidAirCacheStatisticsUseCase:
+    """Cas d'utilisation pour consulter les compteurs du cache d'air humide"""
+
+    def __init__(self, cache: LRUCache[HumidAirCacheKey, HumidAirOutputs]):
+        """Initialise le cas d'utilisation
+
+        Args:
+            cache (LRUCache[HumidAirCacheKey, HumidAirOutputs]): Cache des sorties résolues
+        """
+        self.cache = cache
+
+    def execute(self) -> LRUCacheStatistics:
+        """Retourne les compteurs du cache
+
+        Returns:
+            LRUCacheStatistics: Succès, échecs, évictions et taille du cache
+        """
+        return self.cache.statistics
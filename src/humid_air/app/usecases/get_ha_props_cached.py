@@ -0,0 +1,76 @@
+from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertySchema
+from humid_air.app.usecases.get_ha_props import (
+    GetHumidAirPropertyUseCase,
+    resolve_dry_bulb_and_relative_humidity,
+)
+from humid_air.domain.entities.humid_air_entity import (
+    HumidAirEntity,
+    HumidAirOutputs,
+)
+from humid_air.domain.services.humid_air_input_converter_interface import (
+    HumidAirInputConverterInterface,
+)
+from utils.lru_cache import LRUCache
+
+HumidAirCacheKey = tuple[float, float, float]
+
+
+class CachedGetHumidAirPropertyUseCase(GetHumidAirPropertyUseCase):
+    """Cas d'utilisation pour récupérer les propriétés de l'air humide avec cache
+
+    Les entrées sont d'abord ramenées au couple température sèche et humidité
+    relative, arrondies au nombre de décimales configuré pour former la clé :
+    deux requêtes proches partagent les mêmes propriétés. Le cache conserve
+    les sorties de pyfluids toutes résolues, en lecture seule, et chaque
+    réponse garde les entrées de sa requête.
+    """
+
+    def __init__(
+        self,
+        cache: LRUCache[HumidAirCacheKey, HumidAirOutputs],
+        decimals: int,
+        converter: HumidAirInputConverterInterface | None = None,
+    ):
+        """Initialise le cas d'utilisation avec cache
+
+        Args:
+            cache (LRUCache[HumidAirCacheKey, HumidAirOutputs]): Cache des sorties
+                résolues
+            decimals (int): Nombre de décimales des entrées utilisées comme clé
+            converter (HumidAirInputConverterInterface | None, optional): Convertisseur
+                des couples d'entrées autres que température sèche et humidité relative
+        """
+        super().__init__(converter)
+        self.cache = cache
+        self.decimals = decimals
+
+    def execute(self, schema: GetHumidAirPropertySchema) -> HumidAirEntity:
+        """Retourne l'état avec les propriétés en cache ou calculées
+
+        Args:
+            schema (GetHumidAirPropertySchema): Entrées de l'état d'air humide
+
+        Raises:
+            HumidAirValidationException: Exception de validation
+            ValueError: Entrées sans état correspondant
+
+        Returns:
+            HumidAirEntity: État d'air humide aux entrées de la requête
+        """
+        temp_dry_bulb, relative_humidity = resolve_dry_bulb_and_relative_humidity(
+            schema, self.converter
+        )
+        state = super().execute(
+            GetHumidAirPropertySchema(
+                pressure=schema.pressure,
+                temp_dry_bulb=temp_dry_bulb,
+                relative_humidity=relative_humidity,
+            )
+        )
+        # l'arrondi ne sert qu'à la clé : l'état garde les entrées demandées
+        key: HumidAirCacheKey = (
+            round(schema.pressure, self.decimals),
+            round(temp_dry_bulb, self.decimals),
+            round(relative_humidity, self.decimals),
+        )
+        return state.with_outputs(self.cache.get_or_compute(key, state.resolve_outputs))
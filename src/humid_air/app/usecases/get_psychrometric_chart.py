@@ -0,0 +1,62 @@
+from humid_air.app.schemas.get_psychrometric_chart_schema import (
+    GetPsychrometricChartSchema,
+)
+from humid_air.domain.entities.psychrometric_chart_entity import (
+    PsychrometricChartEntity,
+)
+from humid_air.domain.services.psychrometric_chart_interface import (
+    PsychrometricChartInterface,
+)
+from utils.lru_cache import LRUCache
+
+PsychrometricChartCacheKey = tuple[float, float, float, float, int]
+
+
+class GetPsychrometricChartUseCase:
+    """Cas d'utilisation pour générer un diagramme psychrométrique
+
+    La géométrie est calculée en une fois par le générateur, puis mise en
+    cache par pression, plage de températures, humidité absolue maximale et
+    résolution.
+    """
+
+    def __init__(
+        self,
+        chart: PsychrometricChartInterface,
+        cache: LRUCache[PsychrometricChartCacheKey, PsychrometricChartEntity],
+    ):
+        """Initialise le cas d'utilisation
+
+        Args:
+            chart (PsychrometricChartInterface): Générateur de diagrammes
+            cache (LRUCache[PsychrometricChartCacheKey, PsychrometricChartEntity]): Cache des diagrammes
+        """
+        self.chart = chart
+        self.cache = cache
+
+    def execute(self, schema: GetPsychrometricChartSchema) -> PsychrometricChartEntity:
+        """Retourne le diagramme en cache ou le calcule
+
+        Args:
+            schema (GetPsychrometricChartSchema): Paramètres du diagramme
+
+        Returns:
+            PsychrometricChartEntity: Polylignes du diagramme
+        """
+        key: PsychrometricChartCacheKey = (
+            schema.pressure,
+            schema.temp_dry_bulb_min,
+            schema.temp_dry_bulb_max,
+            schema.humidity_ratio_max,
+            schema.resolution,
+        )
+        return self.cache.get_or_compute(
+            key,
+            lambda: self.chart.build(
+                pressure=schema.pressure,
+                temp_dry_bulb_min=schema.temp_dry_bulb_min,
+                temp_dry_bulb_max=schema.temp_dry_bulb_max,
+                humidity_ratio_max=schema.humidity_ratio_max,
+                resolution=schema.resolution,
+            ),
+        )
@@ -0,0 +1,55 @@
+from humid_air.app.schemas.get_saturation_table_schema import GetSaturationTableSchema
+from humid_air.domain.entities.saturation_table_entity import SaturationTableEntity
+from humid_air.domain.services.saturation_table_interface import (
+    SaturationTableInterface,
+)
+from utils.lru_cache import LRUCache
+
+SaturationTableCacheKey = tuple[float, float, float, float]
+
+
+class GetSaturationTableUseCase:
+    """Cas d'utilisation pour générer une table de saturation
+
+    La table est calculée en une fois par le générateur, puis mise en cache
+    par pression, plage et pas de température.
+    """
+
+    def __init__(
+        self,
+        table: SaturationTableInterface,
+        cache: LRUCache[SaturationTableCacheKey, SaturationTableEntity],
+    ):
+        """Initialise le cas d'utilisation
+
+        Args:
+            table (SaturationTableInterface): Générateur de tables
+            cache (LRUCache[SaturationTableCacheKey, SaturationTableEntity]): Cache des tables
+        """
+        self.table = table
+        self.cache = cache
+
+    def execute(self, schema: GetSaturationTableSchema) -> SaturationTableEntity:
+        """Retourne la table en cache ou la calcule
+
+        Args:
+            schema (GetSaturationTableSchema): Paramètres de la table
+
+        Returns:
+            SaturationTableEntity: Propriétés de l'air saturé
+        """
+        key: SaturationTableCacheKey = (
+            schema.pressure,
+            schema.temp_dry_bulb_min,
+            schema.temp_dry_bulb_max,
+            schema.temp_dry_bulb_step,
+        )
+        return self.cache.get_or_compute(
+            key,
+            lambda: self.table.build(
+                pressure=schema.pressure,
+                temp_dry_bulb_min=schema.temp_dry_bulb_min,
+                temp_dry_bulb_max=schema.temp_dry_bulb_max,
+                temp_dry_bulb_step=schema.temp_dry_bulb_step,
+            ),
+        )
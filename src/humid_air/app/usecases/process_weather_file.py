@@ -0,0 +1,84 @@
+from collections.abc import Iterable, Iterator
+
+from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertiesBatchSchema
+from humid_air.app.schemas.process_weather_file_schema import ProcessWeatherFileSchema
+from humid_air.app.usecases.get_ha_props_batch import GetHumidAirPropertiesBatchUseCase
+from humid_air.domain.entities.weather_file_entity import WeatherResultsEntity
+from humid_air.domain.services.weather_file_reader_interface import (
+    WeatherFileReaderInterface,
+)
+
+
+class ProcessWeatherFileUseCase:
+    """Cas d'utilisation pour enrichir un fichier météo horaire
+
+    Le fichier est lu par tranches ; chaque tranche est calculée en une fois
+    comme un lot, puis rendue avant la lecture de la suivante. La mémoire
+    utilisée dépend de la taille des tranches, pas de celle du fichier. Les
+    enregistrements aux entrées manquantes ou illisibles portent l'erreur de
+    lecture à la place de l'erreur de calcul.
+    """
+
+    def __init__(
+        self,
+        readers: dict[str, WeatherFileReaderInterface],
+        batch_use_case: GetHumidAirPropertiesBatchUseCase,
+        chunk_size: int,
+    ):
+        """Initialise le cas d'utilisation
+
+        Args:
+            readers (dict[str, WeatherFileReaderInterface]): Lecteurs disponibles, par format
+            batch_use_case (GetHumidAirPropertiesBatchUseCase): Calcul d'un lot d'états
+            chunk_size (int): Nombre d'enregistrements calculés ensemble
+        """
+        self.readers = readers
+        self.batch_use_case = batch_use_case
+        self.chunk_size = chunk_size
+
+    def execute(
+        self, schema: ProcessWeatherFileSchema, lines: Iterable[str]
+    ) -> Iterator[WeatherResultsEntity]:
+        """Calcule les propriétés de chaque enregistrement, tranche par tranche
+
+        Args:
+            schema (ProcessWeatherFileSchema): Paramètres du traitement
+            lines (Iterable[str]): Lignes du fichier météo
+
+        Raises:
+            ValueError: En-tête invalide ou colonnes d'entrée non supportées,
+                levée à la lecture de la première tranche
+
+        Returns:
+            Iterator[WeatherResultsEntity]: Tranches enrichies, dans l'ordre du fichier
+        """
+        reader = self.readers[schema.file_format.value]
+        for records in reader.read(lines, schema.pressure, self.chunk_size):
+            batch = self.batch_use_case.execute(
+                GetHumidAirPropertiesBatchSchema(
+                    pressure=records.pressure,
+                    **records.inputs,
+                    engine=schema.engine,
+                    fields=schema.fields,
+                )
+            )
+            if records.errors:
+                unreadable = {error.index for error in records.errors}
+                batch = batch.model_copy(
+                    update={
+                        "errors": sorted(
+                            [
+                                *records.errors,
+                                *(
+                                    error
+                                    for error in batch.errors
+                                    if error.index not in unreadable
+                                ),
+                            ],
+                            key=lambda error: error.index,
+                        )
+                    }
+                )
+            yield WeatherResultsEntity(
+                start=records.start, labels=records.labels, batch=batch
+            )
@@ -0,0 +1,136 @@
+from pydantic import ValidationError
+
+from humid_air.app.schemas.propagate_uncertainty_schema import (
+    PropagateUncertaintySchema,
+)
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchErrorEntity
+from humid_air.domain.entities.humid_air_entity import HumidAirEntity
+from humid_air.domain.entities.uncertainty_entity import (
+    HumidAirUncertaintyEntity,
+    PropertyUncertaintyEntity,
+)
+from humid_air.domain.exceptions.humid_air_exceptions import HumidAirValidationException
+from humid_air.domain.services.humid_air_engine_interface import (
+    HumidAirEngineInterface,
+)
+from humid_air.domain.services.uncertainty_propagator_interface import (
+    UncertaintyPropagatorInterface,
+)
+
+
+def _scatter(
+    values: list[float | None], indexes: list[int], size: int
+) -> list[float | None]:
+    """Replace les valeurs des états valides à leur index dans le lot"""
+    column: list[float | None] = [None] * size
+    for index, value in zip(indexes, values, strict=True):
+        column[index] = value
+    return column
+
+
+class PropagateUncertaintyUseCase:
+    """Cas d'utilisation pour propager les incertitudes des capteurs aux propriétés
+
+    Chaque état nominal est validé indépendamment : un état invalide est
+    signalé dans les erreurs du lot sans interrompre la propagation des
+    autres. Les états valides et leurs perturbations sont calculés en une
+    fois par le moteur demandé, le client n'envoyant qu'une requête.
+    """
+
+    def __init__(
+        self,
+        engines: dict[str, HumidAirEngineInterface],
+        propagator: UncertaintyPropagatorInterface,
+    ):
+        """Initialise le cas d'utilisation
+
+        Args:
+            engines (dict[str, HumidAirEngineInterface]): Moteurs de calcul disponibles, par nom
+            propagator (UncertaintyPropagatorInterface): Service de propagation
+        """
+        self.engines = engines
+        self.propagator = propagator
+
+    def execute(self, schema: PropagateUncertaintySchema) -> HumidAirUncertaintyEntity:
+        """Exécute la propagation des incertitudes pour chaque état du lot
+
+        Args:
+            schema (PropagateUncertaintySchema): États nominaux, en colonnes, et
+                incertitudes types des entrées
+
+        Returns:
+            HumidAirUncertaintyEntity: Statistiques par propriété et erreurs par état
+        """
+        indexes, errors = self._validate_states(schema)
+        computed = self.propagator.propagate(
+            engine=self.engines[schema.engine.value],
+            pressure=[schema.pressure[index] for index in indexes],
+            temp_dry_bulb=[schema.temp_dry_bulb[index] for index in indexes],
+            relative_humidity=[schema.relative_humidity[index] for index in indexes],
+            pressure_uncertainty=schema.pressure_uncertainty,
+            temp_dry_bulb_uncertainty=schema.temp_dry_bulb_uncertainty,
+            relative_humidity_uncertainty=schema.relative_humidity_uncertainty,
+            method=schema.method,
+            samples=schema.samples,
+            coverage=schema.coverage,
+            seed=schema.seed,
+            fields=schema.fields,
+        )
+        errors.extend(
+            HumidAirBatchErrorEntity(
+                index=indexes[error.index], field=error.field, message=error.message
+            )
+            for error in computed.errors
+        )
+        errors.sort(key=lambda error: error.index)
+
+        size = len(schema.pressure)
+        return HumidAirUncertaintyEntity(
+            method=computed.method,
+            coverage=computed.coverage,
+            properties={
+                name: PropertyUncertaintyEntity(
+                    nominal=_scatter(statistics.nominal, indexes, size),
+                    mean=_scatter(statistics.mean, indexes, size),
+                    standard_deviation=_scatter(
+                        statistics.standard_deviation, indexes, size
+                    ),
+                    lower=_scatter(statistics.lower, indexes, size),
+                    upper=_scatter(statistics.upper, indexes, size),
+                )
+                for name, statistics in computed.properties.items()
+            },
+            errors=errors,
+        )
+
+    def _validate_states(
+        self, schema: PropagateUncertaintySchema
+    ) -> tuple[list[int], list[HumidAirBatchErrorEntity]]:
+        """Valide chaque état nominal du lot avec les bornes de HumidAirEntity
+
+        Args:
+            schema (PropagateUncertaintySchema): États nominaux, en colonnes
+
+        Returns:
+            tuple[list[int], list[HumidAirBatchErrorEntity]]: Index des états
+                valides et erreurs
+        """
+        indexes: list[int] = []
+        errors: list[HumidAirBatchErrorEntity] = []
+        states = zip(
+            schema.pressure, schema.temp_dry_bulb, schema.relative_humidity, strict=True
+        )
+        for index, (pressure, temp_dry_bulb, relative_humidity) in enumerate(states):
+            try:
+                HumidAirEntity(
+                    pressure=pressure,
+                    temp_dry_bulb=temp_dry_bulb,
+                    relative_humidity=relative_humidity,
+                )
+                indexes.append(index)
+            except ValidationError as e:
+                errors.extend(
+                    HumidAirBatchErrorEntity(index=index, **error)
+                    for error in HumidAirValidationException(e.errors()).errors
+                )
+        return indexes, errors
@@ -0,0 +1,72 @@
+import math
+
+from humid_air.app.schemas.resolve_pressure_schema import ResolvePressureSchema
+from humid_air.domain.services.site_pressure_provider_interface import (
+    SitePressureProviderInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+# atmosphère standard, ASHRAE Fundamentals (2017) chapitre 1, équation 3
+STANDARD_ATMOSPHERE_LAPSE = 2.25577e-5
+STANDARD_ATMOSPHERE_EXPONENT = 5.2559
+
+
+def standard_atmosphere_pressure(altitude: float) -> float:
+    """Pression de l'atmosphère standard à une altitude donnée
+
+    Args:
+        altitude (float): Altitude en [m]
+
+    Returns:
+        float: Pression absolue en [Pa]
+    """
+    return HumidAirSettings.pressure_default_value * math.pow(
+        1 - STANDARD_ATMOSPHERE_LAPSE * altitude, STANDARD_ATMOSPHERE_EXPONENT
+    )
+
+
+class ResolvePressureUseCase:
+    """Cas d'utilisation pour déterminer la pression d'une requête
+
+    La pression est résolue une seule fois par requête, puis appliquée à tous
+    ses états : pression explicite, sinon atmosphère standard à l'altitude
+    donnée, sinon pression du site du projet, réservée à ses membres, sinon
+    pression au niveau de la mer.
+    """
+
+    def __init__(self, site_pressure_provider: SitePressureProviderInterface):
+        """Initialise le cas d'utilisation
+
+        Args:
+            site_pressure_provider (SitePressureProviderInterface): Fournisseur des pressions de site
+        """
+        self.site_pressure_provider = site_pressure_provider
+
+    def execute(self, schema: ResolvePressureSchema) -> float:
+        """Détermine la pression à appliquer aux états de la requête
+
+        Args:
+            schema (ResolvePressureSchema): Pression, altitude, projet et
+                utilisateur authentifié de la requête
+
+        Raises:
+            ValueError: Utilisateur non authentifié, projet inexistant, dont
+                l'utilisateur n'est pas membre ou sans pression de site
+
+        Returns:
+            float: Pression absolue en [Pa]
+        """
+        if schema.pressure is not None:
+            return schema.pressure
+        if schema.altitude is not None:
+            return standard_atmosphere_pressure(schema.altitude)
+        if schema.project_id is not None:
+            if schema.user_id is None:
+                raise ValueError(HumidAirSettings.site_pressure_unauthenticated_message)
+            site_pressure = self.site_pressure_provider.get_site_pressure(
+                schema.project_id, schema.user_id
+            )
+            if site_pressure is None:
+                raise ValueError(HumidAirSettings.site_pressure_missing_message)
+            return site_pressure
+        return HumidAirSettings.pressure_default_value
@@ -0,0 +1,176 @@
+from pydantic import ValidationError
+
+from humid_air.app.schemas.solve_humid_air_schema import SolveHumidAirSchema
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchErrorEntity
+from humid_air.domain.entities.solver_entity import (
+    HumidAirSolutionEntity,
+    InverseSolutionEntity,
+    SolverStateEntity,
+    SolverStatisticsEntity,
+    SolverUnknown,
+)
+from humid_air.domain.exceptions.humid_air_exceptions import HumidAirValidationException
+from humid_air.domain.services.humid_air_engine_interface import (
+    HumidAirEngineInterface,
+)
+from humid_air.domain.services.inverse_solver_interface import (
+    InverseSolverInterface,
+)
+
+
+class SolveHumidAirUseCase:
+    """Cas d'utilisation pour trouver les états atteignant une propriété cible
+
+    Pour chaque valeur cible, l'entrée manquante (température sèche ou
+    humidité relative) est recherchée à entrée fixée, en une passe vectorisée
+    pour tout le lot. Les propriétés des états trouvés sont ensuite calculées
+    en une fois par le moteur. Un état invalide ou sans solution est signalé
+    dans les erreurs du lot sans interrompre la résolution des autres.
+    """
+
+    def __init__(self, solver: InverseSolverInterface, engine: HumidAirEngineInterface):
+        """Initialise le cas d'utilisation
+
+        Args:
+            solver (InverseSolverInterface): Solveur inverse
+            engine (HumidAirEngineInterface): Moteur de calcul des propriétés des
+                états trouvés
+        """
+        self.solver = solver
+        self.engine = engine
+
+    def execute(self, schema: SolveHumidAirSchema) -> HumidAirSolutionEntity:
+        """Exécute la résolution pour chaque valeur cible du lot
+
+        Args:
+            schema (SolveHumidAirSchema): Entrée fixée, propriété et valeurs cibles
+
+        Returns:
+            HumidAirSolutionEntity: États trouvés, convergence et erreurs par état
+        """
+        fixed = schema.fixed()
+        indexes, errors = self._validate_states(schema)
+        solution = self.solver.solve(
+            pressure=[schema.pressure[index] for index in indexes],
+            fixed=[fixed[index] for index in indexes],
+            unknown=schema.unknown,
+            target_name=schema.target,
+            target=[schema.target_values[index] for index in indexes],
+            lower=schema.lower,
+            upper=schema.upper,
+            tolerance=schema.tolerance,
+            max_iterations=schema.max_iterations,
+        )
+        errors.extend(
+            error.model_copy(update={"index": indexes[error.index]})
+            for error in solution.errors
+        )
+
+        solved = [
+            (index, value)
+            for index, value in zip(indexes, solution.values, strict=True)
+            if value is not None
+        ]
+        solved_indexes = [index for index, _ in solved]
+        unknown_values = [value for _, value in solved]
+        fixed_values = [fixed[index] for index in solved_indexes]
+        computed = self.engine.compute(
+            pressure=[schema.pressure[index] for index in solved_indexes],
+            temp_dry_bulb=(
+                unknown_values
+                if schema.unknown is SolverUnknown.TEMP_DRY_BULB
+                else fixed_values
+            ),
+            relative_humidity=(
+                fixed_values
+                if schema.unknown is SolverUnknown.TEMP_DRY_BULB
+                else unknown_values
+            ),
+            fields=schema.fields,
+        )
+        errors.extend(
+            error.model_copy(update={"index": solved_indexes[error.index]})
+            for error in computed.errors
+        )
+        errors.sort(key=lambda error: error.index)
+
+        size = len(schema.pressure)
+        properties: dict[str, list[float | None]] = {}
+        for name, values in computed.properties.items():
+            column: list[float | None] = [None] * size
+            for index, value in zip(solved_indexes, values, strict=True):
+                column[index] = value
+            properties[name] = column
+        residuals: list[float | None] = [None] * size
+        iterations = [0] * size
+        converged = [False] * size
+        for position, index in enumerate(indexes):
+            residuals[index] = solution.residuals[position]
+            iterations[index] = solution.iterations[position]
+            converged[index] = solution.converged[position]
+
+        return HumidAirSolutionEntity(
+            unknown=schema.unknown,
+            target=schema.target,
+            properties=properties,
+            residuals=residuals,
+            iterations=iterations,
+            converged=converged,
+            statistics=self._statistics(size, solution),
+            errors=errors,
+        )
+
+    def _validate_states(
+        self, schema: SolveHumidAirSchema
+    ) -> tuple[list[int], list[HumidAirBatchErrorEntity]]:
+        """Valide la pression et l'entrée fixée de chaque état avec SolverStateEntity
+
+        Args:
+            schema (SolveHumidAirSchema): Entrée fixée, propriété et valeurs cibles
+
+        Returns:
+            tuple[list[int], list[HumidAirBatchErrorEntity]]: Index des états
+                valides et erreurs
+        """
+        indexes: list[int] = []
+        errors: list[HumidAirBatchErrorEntity] = []
+        for index, (pressure, value) in enumerate(
+            zip(schema.pressure, schema.fixed(), strict=True)
+        ):
+            try:
+                SolverStateEntity.model_validate(
+                    {"pressure": pressure, schema.fixed_name: value}
+                )
+                indexes.append(index)
+            except ValidationError as e:
+                errors.extend(
+                    HumidAirBatchErrorEntity(index=index, **error)
+                    for error in HumidAirValidationException(e.errors()).errors
+                )
+        return indexes, errors
+
+    def _statistics(
+        self, size: int, solution: InverseSolutionEntity
+    ) -> SolverStatisticsEntity:
+        """Résume la convergence des états résolus
+
+        Args:
+            size (int): États du lot
+            solution (InverseSolutionEntity): Résultat brut du solveur
+
+        Returns:
+            SolverStatisticsEntity: Statistiques de convergence du lot
+        """
+        iterations = [
+            count
+            for count, value in zip(solution.iterations, solution.values, strict=True)
+            if value is not None
+        ]
+        residuals = [abs(value) for value in solution.residuals if value is not None]
+        return SolverStatisticsEntity(
+            states=size,
+            converged=sum(solution.converged),
+            mean_iterations=sum(iterations) / len(iterations) if iterations else 0,
+            max_iterations=max(iterations, default=0),
+            max_residual=max(residuals, default=None),
+        )
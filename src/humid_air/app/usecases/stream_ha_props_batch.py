@@ -0,0 +1,54 @@
+from collections.abc import Iterator
+
+from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertiesBatchSchema
+from humid_air.app.usecases.get_ha_props_batch import GetHumidAirPropertiesBatchUseCase
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchChunkEntity
+
+
+class StreamHumidAirPropertiesBatchUseCase:
+    """Cas d'utilisation pour calculer un lot d'états par tranches
+
+    Chaque tranche est calculée en une fois comme un lot, puis rendue avant le
+    calcul de la suivante : la réponse commence dès la première tranche et la
+    mémoire des résultats dépend de la taille des tranches, pas de celle du lot.
+    """
+
+    def __init__(
+        self, batch_use_case: GetHumidAirPropertiesBatchUseCase, chunk_size: int
+    ):
+        """Initialise le cas d'utilisation
+
+        Args:
+            batch_use_case (GetHumidAirPropertiesBatchUseCase): Calcul d'un lot d'états
+            chunk_size (int): Nombre d'états calculés ensemble
+        """
+        self.batch_use_case = batch_use_case
+        self.chunk_size = chunk_size
+
+    def execute(
+        self, schema: GetHumidAirPropertiesBatchSchema
+    ) -> Iterator[HumidAirBatchChunkEntity]:
+        """Calcule les propriétés du lot, tranche par tranche
+
+        Args:
+            schema (GetHumidAirPropertiesBatchSchema): Entrées du lot, en colonnes
+
+        Raises:
+            ValueError: Couple d'entrées non convertible, levée au calcul de la
+                première tranche
+
+        Returns:
+            Iterator[HumidAirBatchChunkEntity]: Tranches calculées, dans l'ordre du lot
+        """
+        inputs = schema.inputs()
+        for start in range(0, len(schema.pressure), self.chunk_size):
+            stop = start + self.chunk_size
+            chunk = schema.model_copy(
+                update={
+                    "pressure": schema.pressure[start:stop],
+                    **{name: column[start:stop] for name, column in inputs.items()},
+                }
+            )
+            yield HumidAirBatchChunkEntity(
+                start=start, batch=self.batch_use_case.execute(chunk)
+            )
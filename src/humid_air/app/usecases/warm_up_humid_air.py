@@ -0,0 +1,123 @@
+import time
+from collections.abc import Callable
+from functools import partial
+
+from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertySchema
+from humid_air.app.schemas.get_psychrometric_chart_schema import (
+    GetPsychrometricChartSchema,
+)
+from humid_air.app.schemas.get_saturation_table_schema import (
+    GetSaturationTableSchema,
+)
+from humid_air.app.usecases.get_ha_props import GetHumidAirPropertyUseCase
+from humid_air.app.usecases.get_psychrometric_chart import (
+    GetPsychrometricChartUseCase,
+)
+from humid_air.app.usecases.get_saturation_table import GetSaturationTableUseCase
+from humid_air.domain.entities.warm_up_entity import (
+    WarmUpReportEntity,
+    WarmUpStepEntity,
+)
+from humid_air.domain.services.humid_air_engine_interface import (
+    HumidAirEngineInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+# état de référence calculé par chaque étape
+WARM_UP_PRESSURE = HumidAirSettings.pressure_default_value
+WARM_UP_TEMP_DRY_BULB = 20.0
+WARM_UP_RELATIVE_HUMIDITY = 50.0
+
+
+class WarmUpHumidAirUseCase:
+    """Cas d'utilisation pour préchauffer les calculs de l'air humide
+
+    CoolProp, les moteurs de lots, la table précalculée et le pool de
+    processus s'initialisent au premier calcul. Chaque moteur est préchauffé
+    (table calculée, processus du pool démarrés) puis calcule un état de
+    référence, et les diagramme et table de saturation par défaut sont placés
+    en cache, pour que la première requête d'un worker ne paie pas ces
+    initialisations.
+    """
+
+    def __init__(
+        self,
+        state_use_case: GetHumidAirPropertyUseCase,
+        engines: dict[str, HumidAirEngineInterface],
+        chart_use_case: GetPsychrometricChartUseCase,
+        saturation_table_use_case: GetSaturationTableUseCase,
+    ):
+        """Initialise le cas d'utilisation
+
+        Args:
+            state_use_case (GetHumidAirPropertyUseCase): Calcul d'un état isolé
+            engines (dict[str, HumidAirEngineInterface]): Moteurs de lots, par nom
+            chart_use_case (GetPsychrometricChartUseCase): Diagrammes en cache
+            saturation_table_use_case (GetSaturationTableUseCase): Tables en cache
+        """
+        self.state_use_case = state_use_case
+        self.engines = engines
+        self.chart_use_case = chart_use_case
+        self.saturation_table_use_case = saturation_table_use_case
+
+    def execute(self) -> WarmUpReportEntity:
+        """Exécute les étapes du préchauffage en les chronométrant
+
+        Returns:
+            WarmUpReportEntity: Durée de chaque étape
+        """
+        steps: list[tuple[str, Callable[[], object]]] = [
+            ("get_ha_props", self._compute_state),
+            *(
+                (f"engine_{name}", partial(self._compute_batch, engine))
+                for name, engine in self.engines.items()
+            ),
+            ("psychrometric_chart", self._build_chart),
+            ("saturation_table", self._build_saturation_table),
+        ]
+        report = WarmUpReportEntity(steps=[])
+        for name, step in steps:
+            start = time.perf_counter()
+            step()
+            report.steps.append(
+                WarmUpStepEntity(name=name, seconds=time.perf_counter() - start)
+            )
+        return report
+
+    def _compute_state(self) -> object:
+        return self.state_use_case.execute(
+            GetHumidAirPropertySchema(
+                pressure=WARM_UP_PRESSURE,
+                temp_dry_bulb=WARM_UP_TEMP_DRY_BULB,
+                relative_humidity=WARM_UP_RELATIVE_HUMIDITY,
+            )
+        ).get_properties()
+
+    def _compute_batch(self, engine: HumidAirEngineInterface) -> object:
+        engine.warm_up()
+        return engine.compute(
+            pressure=[WARM_UP_PRESSURE],
+            temp_dry_bulb=[WARM_UP_TEMP_DRY_BULB],
+            relative_humidity=[WARM_UP_RELATIVE_HUMIDITY],
+        )
+
+    def _build_chart(self) -> object:
+        return self.chart_use_case.execute(
+            GetPsychrometricChartSchema(
+                pressure=HumidAirSettings.pressure_default_value,
+                temp_dry_bulb_min=HumidAirSettings.chart_tdb_min_default_value,
+                temp_dry_bulb_max=HumidAirSettings.chart_tdb_max_default_value,
+                humidity_ratio_max=HumidAirSettings.chart_humidity_ratio_max_default_value,
+                resolution=HumidAirSettings.chart_resolution_default_value,
+            )
+        )
+
+    def _build_saturation_table(self) -> object:
+        return self.saturation_table_use_case.execute(
+            GetSaturationTableSchema(
+                pressure=HumidAirSettings.pressure_default_value,
+                temp_dry_bulb_min=HumidAirSettings.saturation_table_tdb_min_default_value,
+                temp_dry_bulb_max=HumidAirSettings.saturation_table_tdb_max_default_value,
+                temp_dry_bulb_step=HumidAirSettings.saturation_table_step_default_value,
+            )
+        )
@@ -0,0 +1,239 @@
+"""Mesure le coût du chemin de calcul de l'air humide, de l'entité à la route
+
+Usage (depuis la racine du dépôt) :
+
+    PYTHONPATH=src python -m humid_air.benchmarks.bench_humid_air --output bench.json
+    PYTHONPATH=src python -m humid_air.benchmarks.bench_humid_air --compare bench.json
+
+Chaque mesure est répétée et calibrée comme avec timeit : le résultat JSON
+donne, par cas, le meilleur temps et le temps médian d'un appel, le débit en
+états par seconde, ainsi que le commit et l'environnement de la mesure. Avec
+'--compare', les médianes sont rapportées à celles d'un fichier précédent et
+le code de sortie vaut 1 si un cas ralentit au-delà du seuil.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from collections.abc import Callable
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any
+
+import numpy as np
+
+from common.infra.web.app import WebApp
+from common.infra.web.container import AppContainer
+from common.infra.web.settings import AppSettings
+from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertiesBatchSchema
+from humid_air.app.usecases.get_ha_props_batch import (
+    GetHumidAirPropertiesBatchUseCase,
+)
+from humid_air.domain.entities.humid_air_entity import HumidAirEngine, HumidAirEntity
+from humid_air.infra.services.coolprop_engine import CoolPropHumidAirEngine
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.web.dtos.humid_air_dtos import GetHumidAirPropertyResponse
+
+STATE = {"pressure": 101325.0, "temp_dry_bulb": 25.0, "relative_humidity": 50.0}
+
+
+def measure(
+    name: str, func: Callable[[], object], repeat: int, states: int = 1
+) -> dict[str, Any]:
+    """Chronomètre un appel, calibré pour durer au moins 0,2 s par répétition
+
+    Args:
+        name (str): Nom du cas
+        func (Callable[[], object]): Appel mesuré
+        repeat (int): Nombre de répétitions
+        states (int, optional): États calculés par appel
+
+    Returns:
+        dict[str, Any]: Meilleur temps et temps médian d'un appel en [s], débit
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    timings = [total / number for total in timer.repeat(repeat, number)]
+    median = statistics.median(timings)
+    return {
+        "name": name,
+        "states": states,
+        "number": number,
+        "repeat": repeat,
+        "best": min(timings),
+        "median": median,
+        "states_per_second": round(states / median),
+    }
+
+
+def single_state_cases(repeat: int) -> list[dict[str, Any]]:
+    """Mesure un état isolé : propriétés de l'entité puis réponse complète
+
+    Une nouvelle entité est créée à chaque appel, pyfluids mémorisant les
+    propriétés d'un état déjà résolu.
+    """
+    return [
+        measure(
+            "entity_properties",
+            lambda: HumidAirEntity(**STATE).get_properties(),
+            repeat,
+        ),
+        measure(
+            "property_response",
+            lambda: GetHumidAirPropertyResponse.from_use_case_result(
+                HumidAirEntity(**STATE)
+            ),
+            repeat,
+        ),
+    ]
+
+
+def route_case(repeat: int) -> dict[str, Any]:
+    """Mesure 'get_ha_props' de bout en bout avec le client de test Flask
+
+    Le cache des états est désactivé pour mesurer le calcul, pas la lecture
+    du cache.
+    """
+    container = AppContainer()
+    container.app_settings.override(
+        AppSettings(DATABASE_URL="sqlite:///:memory:", HUMID_AIR_CACHE_SIZE=0)
+    )
+    client = WebApp(container=container).app.test_client()
+
+    def call() -> None:
+        response = client.get("/v1/humid_air/get_ha_props", query_string=STATE)
+        if response.status_code != 200:
+            raise RuntimeError(response.get_data(as_text=True))
+
+    return measure("get_ha_props_route", call, repeat)
+
+
+def batch_cases(
+    sizes: list[int], engines: list[HumidAirEngine], repeat: int
+) -> list[dict[str, Any]]:
+    """Mesure le débit du calcul par lots, par moteur et par taille de lot
+
+    Args:
+        sizes (list[int]): Nombres d'états par lot
+        engines (list[HumidAirEngine]): Moteurs mesurés
+        repeat (int): Nombre de répétitions
+
+    Returns:
+        list[dict[str, Any]]: Mesures par moteur et par taille
+    """
+    use_case = GetHumidAirPropertiesBatchUseCase(
+        engines={
+            HumidAirEngine.COOLPROP.value: CoolPropHumidAirEngine(),
+            HumidAirEngine.HYLAND_WEXLER.value: HylandWexlerHumidAirEngine(),
+        }
+    )
+    rng = np.random.default_rng(0)
+    results: list[dict[str, Any]] = []
+    for size in sizes:
+        schema = GetHumidAirPropertiesBatchSchema(
+            pressure=rng.uniform(80000, 110000, size).tolist(),
+            temp_dry_bulb=rng.uniform(-20, 50, size).tolist(),
+            relative_humidity=rng.uniform(5, 95, size).tolist(),
+        )
+        for engine in engines:
+            request = schema.model_copy(update={"engine": engine})
+            results.append(
+                measure(
+                    f"batch_{engine.value}_{size}",
+                    partial(use_case.execute, request),
+                    repeat,
+                    states=size,
+                )
+            )
+    return results
+
+
+def metadata() -> dict[str, str | None]:
+    """Identifie le commit et l'environnement de la mesure"""
+    try:
+        commit: str | None = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Rapporte chaque médiane à celle d'une mesure précédente
+
+    Args:
+        results (list[dict[str, Any]]): Mesures courantes
+        baseline (dict[str, Any]): Contenu d'un fichier JSON précédent
+        threshold (float): Rapport au-delà duquel un cas est une régression
+
+    Returns:
+        list[str]: Noms des cas en régression
+    """
+    previous = {case["name"]: case for case in baseline["results"]}
+    regressions: list[str] = []
+    for case in results:
+        reference = previous.get(case["name"])
+        if reference is None:
+            continue
+        ratio = case["median"] / reference["median"]
+        flag = ""
+        if ratio > threshold:
+            regressions.append(case["name"])
+            flag = "  <- régression"
+        print(f"{case['name']:<32} x{ratio:.2f}{flag}", file=sys.stderr)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10000])
+    parser.add_argument(
+        "--engines",
+        type=HumidAirEngine,
+        nargs="+",
+        default=[HumidAirEngine.COOLPROP, HumidAirEngine.HYLAND_WEXLER],
+        choices=[HumidAirEngine.COOLPROP, HumidAirEngine.HYLAND_WEXLER],
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    parser.add_argument("--compare", help="Fichier JSON d'une mesure précédente")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    arguments = parser.parse_args()
+
+    results = [
+        *single_state_cases(arguments.repeat),
+        route_case(arguments.repeat),
+        *batch_cases(arguments.sizes, arguments.engines, arguments.repeat),
+    ]
+    report = json.dumps({"metadata": metadata(), "results": results}, indent=2)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+
+    if arguments.compare:
+        with open(arguments.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if compare(results, baseline, arguments.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Mesure la mise à l'échelle du moteur CoolProp réparti sur un pool de processus
+
+Usage (depuis la racine du dépôt) :
+
+    PYTHONPATH=src python -m humid_air.benchmarks.bench_process_pool --workers 1 2 4 8
+
+Le résultat JSON donne, pour chaque nombre de processus, la durée du lot,
+le débit et l'accélération par rapport au calcul sur place, avec le nombre
+de cœurs disponibles : l'accélération est bornée par ce nombre.
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from humid_air.infra.services.coolprop_engine import CoolPropHumidAirEngine
+from humid_air.infra.services.process_pool_engine import ProcessPoolHumidAirEngine
+
+
+def run(states: int, workers: list[int], chunk_size: int) -> list[dict[str, float]]:
+    """Calcule le même lot avec chaque nombre de processus
+
+    Args:
+        states (int): Nombre d'états du lot
+        workers (list[int]): Nombres de processus à mesurer
+        chunk_size (int): Nombre d'états par tranche
+
+    Returns:
+        list[dict[str, float]]: Durée, débit et accélération par nombre de processus
+    """
+    rng = np.random.default_rng(0)
+    pressure = rng.uniform(80000, 110000, states).tolist()
+    temp_dry_bulb = rng.uniform(-20, 50, states).tolist()
+    relative_humidity = rng.uniform(5, 95, states).tolist()
+
+    results: list[dict[str, float]] = []
+    for count in workers:
+        engine = ProcessPoolHumidAirEngine(
+            CoolPropHumidAirEngine(), workers=count, chunk_size=chunk_size
+        )
+        # démarrage des processus hors mesure
+        engine.warm_up()
+        start = time.perf_counter()
+        engine.compute(pressure, temp_dry_bulb, relative_humidity)
+        seconds = time.perf_counter() - start
+        engine.shutdown()
+        results.append(
+            {
+                "workers": count,
+                "seconds": round(seconds, 3),
+                "states_per_second": round(states / seconds),
+                "speedup": round(results[0]["seconds"] / seconds, 2)
+                if results
+                else 1.0,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--states", type=int, default=4000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=500)
+    arguments = parser.parse_args()
+    print(
+        json.dumps(
+            {
+                "cpu_count": os.cpu_count(),
+                "results": run(
+                    arguments.states, arguments.workers, arguments.chunk_size
+                ),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class AirProcessKind(str, Enum):
+    """Transformation d'une centrale de traitement d'air
+
+    Attributs:
+        MIXING (str): Mélange adiabatique de plusieurs flux
+        SENSIBLE (str): Chauffage ou refroidissement à humidité absolue constante
+        COIL (str): Batterie froide, point de rosée de l'appareil et facteur de bypass
+        STEAM_HUMIDIFICATION (str): Humidification par injection de vapeur
+        ADIABATIC_HUMIDIFICATION (str): Humidification adiabatique (enthalpie constante)
+    """
+
+    MIXING = "mixing"
+    SENSIBLE = "sensible"
+    COIL = "coil"
+    STEAM_HUMIDIFICATION = "steam_humidification"
+    ADIABATIC_HUMIDIFICATION = "adiabatic_humidification"
+
+
+class AirProcessStepEntity(BaseModel):
+    """État de sortie et puissances d'une transformation
+
+    Les puissances sont positives lorsqu'elles sont apportées à l'air et le
+    débit d'eau est positif pour une humidification, négatif pour une
+    condensation.
+
+    Attributs:
+        kind (AirProcessKind): Transformation
+        mass_flow_rate (float): Débit d'air sec en [kg/s]
+        outlet (dict[str, float | None]): Propriétés de l'état de sortie
+        sensible_load (float): Puissance sensible en [W]
+        latent_load (float): Puissance latente en [W]
+        total_load (float): Puissance totale en [W]
+        water_flow_rate (float): Débit d'eau échangé en [kg/s]
+    """
+
+    kind: AirProcessKind
+    mass_flow_rate: float
+    outlet: dict[str, float | None]
+    sensible_load: float
+    latent_load: float
+    total_load: float
+    water_flow_rate: float
+
+
+class AirProcessEntity(BaseModel):
+    """Enchaînement de transformations d'une centrale de traitement d'air
+
+    Attributs:
+        inlets (list[dict[str, float | None]]): Propriétés des flux entrants
+        steps (list[AirProcessStepEntity]): Transformations, dans l'ordre
+        max_errors (dict[str, float] | None): Erreurs absolues maximales déclarées
+            par un moteur approché, par propriété
+    """
+
+    inlets: list[dict[str, float | None]]
+    steps: list[AirProcessStepEntity]
+    max_errors: dict[str, float] | None = None
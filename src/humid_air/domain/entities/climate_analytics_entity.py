@@ -0,0 +1,42 @@
+from pydantic import BaseModel
+
+
+class ClimateBinEntity(BaseModel):
+    """Classe de température sèche d'une analyse par bins
+
+    Attributs:
+        temp_dry_bulb_min (float): Borne inférieure, incluse, en [°C]
+        temp_dry_bulb_max (float): Borne supérieure, exclue, en [°C]
+        hours (int): Nombre d'heures dans la classe
+        mean_coincident_wet_bulb (float): Température humide moyenne coïncidente en [°C]
+    """
+
+    temp_dry_bulb_min: float
+    temp_dry_bulb_max: float
+    hours: int
+    mean_coincident_wet_bulb: float
+
+
+class ClimateAnalyticsEntity(BaseModel):
+    """Agrégats énergétiques d'une série climatique horaire
+
+    Les degrés-jours et les enthalpies-heures sont cumulés heure par heure
+    par rapport aux bases demandées.
+
+    Attributs:
+        hours (int): Nombre d'heures valides agrégées
+        invalid_hours (int): Nombre d'heures ignorées (données manquantes ou invalides)
+        bins (list[ClimateBinEntity]): Classes non vides, par température croissante
+        heating_degree_days (float): Degrés-jours de chauffage en [K.j]
+        cooling_degree_days (float): Degrés-jours de refroidissement en [K.j]
+        heating_enthalpy_hours (float): Enthalpies-heures sous la base en [J.h/kg]
+        cooling_enthalpy_hours (float): Enthalpies-heures au-dessus de la base en [J.h/kg]
+    """
+
+    hours: int
+    invalid_hours: int
+    bins: list[ClimateBinEntity]
+    heating_degree_days: float
+    cooling_degree_days: float
+    heating_enthalpy_hours: float
+    cooling_enthalpy_hours: float
@@ -0,0 +1,61 @@
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class HumidAirBatchErrorEntity(BaseModel):
+    """Erreur de calcul d'un état d'air humide dans un lot
+
+    Attributs:
+        index (int): Index de l'état dans le lot
+        field (str): Champ en erreur
+        message (str): Message d'erreur
+    """
+
+    index: int
+    field: str
+    message: str
+
+
+class HumidAirBatchEntity(BaseModel):
+    """Propriétés d'un lot d'états d'air humide, stockées en colonnes
+
+    Chaque colonne contient une valeur par état du lot, ou None si l'état
+    est en erreur.
+
+    Attributs:
+        properties (dict[str, list[float | None]]): Colonnes de propriétés
+        errors (list[HumidAirBatchErrorEntity]): Erreurs par état
+        max_errors (dict[str, float] | None): Erreurs absolues maximales déclarées
+            par un moteur approché, par propriété
+    """
+
+    properties: dict[str, list[float | None]]
+    errors: list[HumidAirBatchErrorEntity] = Field(default_factory=list)
+    max_errors: dict[str, float] | None = None
+
+
+class HumidAirBatchOutputFormat(str, Enum):
+    """Format de sortie d'un lot d'états d'air humide
+
+    Attributs:
+        JSON (str): Document JSON en colonnes, construit en une fois
+        NDJSON (str): Un objet JSON par état et par ligne, rendu par tranches
+        CSV (str): CSV avec en-tête, rendu par tranches
+    """
+
+    JSON = "json"
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class HumidAirBatchChunkEntity(BaseModel):
+    """Tranche consécutive d'un lot d'états d'air humide
+
+    Attributs:
+        start (int): Index du premier état de la tranche dans le lot
+        batch (HumidAirBatchEntity): Propriétés et erreurs, indexées dans la tranche
+    """
+
+    start: int
+    batch: HumidAirBatchEntity
@@ -1,4 +1,7 @@
-from pydantic import BaseModel, Field
+from enum import Enum
+from types import MappingProxyType
+
+from pydantic import BaseModel, Field, PrivateAttr
 from pyfluids import HumidAir, InputHumidAir  #  type: ignore[import-untyped]
 
 from humid_air.domain.settings.humid_air_settings import (
@@ -6,6 +9,137 @@ from humid_air.domain.settings.humid_air_settings import (
 )
 
 
+class HumidAirEngine(str, Enum):
+    """Moteur de calcul des propriétés de l'air humide
+
+    Attributs:
+        COOLPROP (str): CoolProp via pyfluids, état par état
+        HYLAND_WEXLER (str): Corrélations ASHRAE vectorisées avec NumPy
+        LOOKUP_TABLE (str): Interpolation dans une table précalculée
+    """
+
+    COOLPROP = "coolprop"
+    HYLAND_WEXLER = "hyland_wexler"
+    LOOKUP_TABLE = "lookup_table"
+
+
+HUMID_AIR_PROPERTY_NAMES: tuple[str, ...] = (
+    "pressure",
+    "temp_dry_bulb",
+    "relative_humidity",
+    "partial_pressure_of_water_vapor",
+    "humidity_ratio",
+    "temp_dew_point",
+    "temp_wet_bulb",
+    "enthalpy_per_humid_air",
+    "specific_heat_per_unit_humid_air",
+    "entropy_per_unit_humid_air",
+    "specific_volume_per_unit_humid_air",
+    "density_per_unit_humid_air",
+    "thermal_conductivity",
+    "dynamic_viscosity",
+    "kinematic_viscosity_per_unit_humid_air",
+    "prandtl_number",
+    "compressibility_factor",
+)
+
+# entrées acceptées pour définir un état, en plus de la pression
+HUMID_AIR_INPUT_NAMES: tuple[str, ...] = (
+    "temp_dry_bulb",
+    "relative_humidity",
+    "temp_dew_point",
+    "temp_wet_bulb",
+    "humidity_ratio",
+    "enthalpy_per_humid_air",
+)
+
+# couples d'entrées indépendants : le point de rosée et l'humidité absolue
+# fixent tous deux la pression de vapeur, l'enthalpie et la température
+# humide sont quasiment liées
+HUMID_AIR_INPUT_PAIRS: frozenset[frozenset[str]] = frozenset(
+    frozenset((first, second))
+    for index, first in enumerate(HUMID_AIR_INPUT_NAMES)
+    for second in HUMID_AIR_INPUT_NAMES[index + 1 :]
+) - {
+    frozenset(("temp_dew_point", "humidity_ratio")),
+    frozenset(("temp_wet_bulb", "enthalpy_per_humid_air")),
+}
+
+# arrondis appliqués par les propriétés de HumidAirEntity
+HUMID_AIR_PROPERTY_DECIMALS: dict[str, int] = {
+    "partial_pressure_of_water_vapor": 2,
+    "humidity_ratio": 6,
+    "temp_dew_point": 2,
+    "temp_wet_bulb": 2,
+    "enthalpy_per_humid_air": 0,
+    "specific_heat_per_unit_humid_air": 2,
+    "entropy_per_unit_humid_air": 2,
+    "specific_volume_per_unit_humid_air": 3,
+    "density_per_unit_humid_air": 3,
+    "thermal_conductivity": 4,
+    "dynamic_viscosity": 8,
+    "kinematic_viscosity_per_unit_humid_air": 8,
+    "prandtl_number": 2,
+    "compressibility_factor": 4,
+}
+
+# attributs de pyfluids.HumidAir lus, sans arrondi, par les propriétés calculées
+HUMID_AIR_PYFLUIDS_ATTRIBUTES: dict[str, str] = {
+    "partial_pressure_of_water_vapor": "partial_pressure",
+    "humidity_ratio": "humidity",
+    "temp_dew_point": "dew_temperature",
+    "temp_wet_bulb": "wet_bulb_temperature",
+    "enthalpy_per_humid_air": "enthalpy",
+    "specific_heat_per_unit_humid_air": "specific_heat",
+    "entropy_per_unit_humid_air": "entropy",
+    "specific_volume_per_unit_humid_air": "specific_volume",
+    "density_per_unit_humid_air": "density",
+    "thermal_conductivity": "conductivity",
+    "dynamic_viscosity": "dynamic_viscosity",
+    "kinematic_viscosity_per_unit_humid_air": "kinematic_viscosity",
+    "prandtl_number": "prandtl",
+    "compressibility_factor": "compressibility",
+}
+
+
+class HumidAirOutputs:
+    """Sorties de pyfluids résolues d'avance, en lecture seule
+
+    Se lit comme pyfluids.HumidAir, qui calcule et mémorise chaque sortie à
+    sa première lecture ; ces sorties figées peuvent donc être partagées entre
+    threads. L'échec d'une sortie est conservé et relevé à sa lecture.
+    """
+
+    __slots__ = ("_values",)
+    _values: MappingProxyType[str, float | ValueError]
+
+    def __init__(self, humid_air: HumidAir):
+        """Résout toutes les sorties lues par HumidAirEntity
+
+        Args:
+            humid_air (HumidAir): État d'air humide de pyfluids
+        """
+        values: dict[str, float | ValueError] = {}
+        for attribute in HUMID_AIR_PYFLUIDS_ATTRIBUTES.values():
+            try:
+                values[attribute] = getattr(humid_air, attribute)
+            except ValueError as e:
+                values[attribute] = e
+        object.__setattr__(self, "_values", MappingProxyType(values))
+
+    def __getattr__(self, name: str) -> float:
+        try:
+            value = self._values[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        if isinstance(value, ValueError):
+            raise ValueError(str(value))
+        return value
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} est en lecture seule")
+
+
 class HumidAirEntity(BaseModel):
     pressure: float = Field(
         default=HumidAirSettings.pressure_default_value,
@@ -23,12 +157,67 @@ class HumidAirEntity(BaseModel):
         le=HumidAirSettings.rh_le,
     )
 
+    _humid_air: HumidAir | None = PrivateAttr(default=None)
+
     def _get_humid_air_instance(self) -> HumidAir:
-        return HumidAir().with_state(
-            InputHumidAir.pressure(self.pressure),
-            InputHumidAir.temperature(self.temp_dry_bulb),
-            InputHumidAir.relative_humidity(self.relative_humidity),
-        )
+        """Retourne l'état d'air humide, résolu une seule fois au premier accès.
+
+        Returns:
+            HumidAir: État d'air humide partagé par toutes les propriétés
+        """
+        if self._humid_air is None:
+            self._humid_air = HumidAir().with_state(
+                InputHumidAir.pressure(self.pressure),
+                InputHumidAir.temperature(self.temp_dry_bulb),
+                InputHumidAir.relative_humidity(self.relative_humidity),
+            )
+        return self._humid_air
+
+    def resolve_outputs(self) -> HumidAirOutputs:
+        """Résout toutes les sorties de pyfluids de l'état
+
+        Returns:
+            HumidAirOutputs: Sorties figées, partageables entre threads
+        """
+        return HumidAirOutputs(self._get_humid_air_instance())
+
+    def with_outputs(self, outputs: HumidAirOutputs) -> "HumidAirEntity":
+        """Lit les propriétés dans des sorties déjà résolues
+
+        Args:
+            outputs (HumidAirOutputs): Sorties d'un état identique ou voisin
+
+        Returns:
+            HumidAirEntity: L'entité, qui ne recalcule plus rien
+        """
+        self._humid_air = outputs
+        return self
+
+    def get_properties(
+        self, names: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES, rounded: bool = True
+    ) -> dict[str, float]:
+        """Retourne les propriétés demandées de l'air humide
+
+        Seules les propriétés demandées sont calculées ; pyfluids mémorise
+        chaque sortie, un second appel ne recalcule rien.
+
+        Args:
+            names (tuple[str, ...], optional): Noms des propriétés, toutes par défaut
+            rounded (bool, optional): Arrondir comme les propriétés de l'entité,
+                sinon valeurs brutes de pyfluids. Defaults to True.
+
+        Returns:
+            dict[str, float]: Propriétés indexées par leur nom
+        """
+        if rounded:
+            return {name: getattr(self, name) for name in names}
+        humid_air = self._get_humid_air_instance()
+        return {
+            name: getattr(humid_air, HUMID_AIR_PYFLUIDS_ATTRIBUTES[name])
+            if name in HUMID_AIR_PYFLUIDS_ATTRIBUTES
+            else getattr(self, name)
+            for name in names
+        }
 
     @property
     def partial_pressure_of_water_vapor(self) -> HumidAir:
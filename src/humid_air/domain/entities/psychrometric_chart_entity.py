@@ -0,0 +1,65 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class PsychrometricChartLineKind(str, Enum):
+    """Famille d'une ligne du diagramme psychrométrique
+
+    Attributs:
+        RELATIVE_HUMIDITY (str): Humidité relative constante, en [%]
+        ENTHALPY (str): Enthalpie constante, en [J/kg air sec]
+        TEMP_WET_BULB (str): Température humide constante, en [°C]
+        SPECIFIC_VOLUME (str): Volume spécifique constant, en [m³/kg air sec]
+    """
+
+    RELATIVE_HUMIDITY = "relative_humidity"
+    ENTHALPY = "enthalpy"
+    TEMP_WET_BULB = "temp_wet_bulb"
+    SPECIFIC_VOLUME = "specific_volume"
+
+
+class PsychrometricChartFormat(str, Enum):
+    """Format de sortie du diagramme psychrométrique
+
+    Attributs:
+        JSON (str): Polylignes en JSON
+        SVG (str): Image SVG
+    """
+
+    JSON = "json"
+    SVG = "svg"
+
+
+class PsychrometricChartLineEntity(BaseModel):
+    """Polyligne d'une grandeur constante du diagramme psychrométrique
+
+    Attributs:
+        kind (PsychrometricChartLineKind): Grandeur constante le long de la ligne
+        value (float): Valeur de la grandeur
+        temp_dry_bulb (list[float]): Abscisses, températures sèches en [°C]
+        humidity_ratio (list[float]): Ordonnées, humidités absolues en [kg eau/kg air sec]
+    """
+
+    kind: PsychrometricChartLineKind
+    value: float
+    temp_dry_bulb: list[float]
+    humidity_ratio: list[float]
+
+
+class PsychrometricChartEntity(BaseModel):
+    """Géométrie d'un diagramme psychrométrique à une pression donnée
+
+    Attributs:
+        pressure (float): Pression absolue en [Pa]
+        temp_dry_bulb_min (float): Température sèche minimale en [°C]
+        temp_dry_bulb_max (float): Température sèche maximale en [°C]
+        humidity_ratio_max (float): Humidité absolue maximale en [kg eau/kg air sec]
+        lines (list[PsychrometricChartLineEntity]): Polylignes du diagramme
+    """
+
+    pressure: float
+    temp_dry_bulb_min: float
+    temp_dry_bulb_max: float
+    humidity_ratio_max: float
+    lines: list[PsychrometricChartLineEntity]
@@ -0,0 +1,40 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class SaturationTableFormat(str, Enum):
+    """Format de sortie de la table de saturation
+
+    Attributs:
+        JSON (str): Colonnes en JSON
+        CSV (str): Une ligne par température, pour un tableur
+    """
+
+    JSON = "json"
+    CSV = "csv"
+
+
+class SaturationTableEntity(BaseModel):
+    """Propriétés de l'air saturé à une pression donnée, en colonnes
+
+    Les grandeurs massiques sont rapportées au kg d'air sec, comme dans le
+    tableau 2 du chapitre 1 de l'ASHRAE Fundamentals. Une température dont la
+    pression de saturation atteint la pression totale n'a pas d'état saturé :
+    ses valeurs sont None.
+
+    Attributs:
+        pressure (float): Pression absolue en [Pa]
+        temp_dry_bulb (list[float]): Températures en [°C]
+        saturation_pressure (list[float | None]): Pressions de saturation en [Pa]
+        humidity_ratio (list[float | None]): Humidités absolues à saturation en [kg eau/kg air sec]
+        enthalpy (list[float | None]): Enthalpies à saturation en [J/kg air sec]
+        specific_volume (list[float | None]): Volumes spécifiques à saturation en [m³/kg air sec]
+    """
+
+    pressure: float
+    temp_dry_bulb: list[float]
+    saturation_pressure: list[float | None]
+    humidity_ratio: list[float | None]
+    enthalpy: list[float | None]
+    specific_volume: list[float | None]
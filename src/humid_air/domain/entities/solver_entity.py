@@ -0,0 +1,117 @@
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchErrorEntity
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+# propriétés monotones en température sèche (humidité relative fixée) et en
+# humidité relative (température sèche fixée), cibles possibles du solveur
+SOLVER_TARGET_NAMES: tuple[str, ...] = (
+    "partial_pressure_of_water_vapor",
+    "humidity_ratio",
+    "temp_dew_point",
+    "temp_wet_bulb",
+    "enthalpy_per_humid_air",
+    "specific_volume_per_unit_humid_air",
+    "density_per_unit_humid_air",
+)
+
+
+class SolverUnknown(str, Enum):
+    """Entrée recherchée par le solveur inverse, l'autre étant fixée
+
+    Attributs:
+        TEMP_DRY_BULB (str): Température sèche en [°C], humidité relative fixée
+        RELATIVE_HUMIDITY (str): Humidité relative en [%], température sèche fixée
+    """
+
+    TEMP_DRY_BULB = "temp_dry_bulb"
+    RELATIVE_HUMIDITY = "relative_humidity"
+
+
+class SolverStateEntity(BaseModel):
+    """Pression et entrée fixée d'un état, bornées au domaine du moteur hyland_wexler
+
+    Attributs:
+        pressure (float): Pression absolue en [Pa]
+        temp_dry_bulb (float | None): Température sèche fixée en [°C]
+        relative_humidity (float | None): Humidité relative fixée en [%]
+    """
+
+    pressure: float = Field(
+        ge=HumidAirSettings.hyland_wexler_pressure_ge,
+        le=HumidAirSettings.hyland_wexler_pressure_le,
+    )
+    temp_dry_bulb: float | None = Field(
+        default=None,
+        ge=HumidAirSettings.hyland_wexler_tdb_ge,
+        le=HumidAirSettings.hyland_wexler_tdb_le,
+    )
+    relative_humidity: float | None = Field(
+        default=None, ge=HumidAirSettings.rh_ge, le=HumidAirSettings.rh_le
+    )
+
+
+class InverseSolutionEntity(BaseModel):
+    """Résultat brut du solveur inverse pour un lot d'états, en colonnes
+
+    Attributs:
+        values (list[float | None]): Entrées recherchées, None sans solution encadrée
+        residuals (list[float | None]): Écarts entre la propriété obtenue et la cible
+        iterations (list[int]): Itérations effectuées par état
+        converged (list[bool]): États dont la tolérance est atteinte
+        errors (list[HumidAirBatchErrorEntity]): Erreurs par état
+    """
+
+    values: list[float | None]
+    residuals: list[float | None]
+    iterations: list[int]
+    converged: list[bool]
+    errors: list[HumidAirBatchErrorEntity] = Field(default_factory=list)
+
+
+class SolverStatisticsEntity(BaseModel):
+    """Statistiques de convergence d'un lot
+
+    Attributs:
+        states (int): États du lot
+        converged (int): États dont la tolérance est atteinte
+        mean_iterations (float): Itérations moyennes des états résolus
+        max_iterations (int): Itérations maximales
+        max_residual (float | None): Plus grand écart absolu à la cible
+    """
+
+    states: int
+    converged: int
+    mean_iterations: float
+    max_iterations: int
+    max_residual: float | None
+
+
+class HumidAirSolutionEntity(BaseModel):
+    """États d'air humide atteignant une propriété cible
+
+    Chaque colonne contient une valeur par état du lot, ou None si l'état
+    est en erreur.
+
+    Attributs:
+        unknown (SolverUnknown): Entrée recherchée
+        target (str): Propriété cible
+        properties (dict[str, list[float | None]]): Propriétés des états trouvés,
+            entrées comprises
+        residuals (list[float | None]): Écarts entre la propriété obtenue et la cible
+        iterations (list[int]): Itérations effectuées par état
+        converged (list[bool]): États dont la tolérance est atteinte
+        statistics (SolverStatisticsEntity): Statistiques de convergence du lot
+        errors (list[HumidAirBatchErrorEntity]): Erreurs par état
+    """
+
+    unknown: SolverUnknown
+    target: str
+    properties: dict[str, list[float | None]]
+    residuals: list[float | None]
+    iterations: list[int]
+    converged: list[bool]
+    statistics: SolverStatisticsEntity
+    errors: list[HumidAirBatchErrorEntity] = Field(default_factory=list)
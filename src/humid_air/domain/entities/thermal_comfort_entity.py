@@ -0,0 +1,88 @@
+from pydantic import BaseModel, Field
+
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchErrorEntity
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+
+class ThermalComfortStateEntity(BaseModel):
+    """Conditions d'un occupant, bornées au domaine de validité du modèle PMV
+
+    Attributs:
+        temp_dry_bulb (float): Température sèche de l'air en [°C]
+        mean_radiant_temperature (float): Température radiante moyenne en [°C]
+        air_speed (float): Vitesse relative de l'air en [m/s]
+        relative_humidity (float): Humidité relative de l'air en [%]
+        metabolic_rate (float): Métabolisme en [met]
+        clothing (float): Isolation vestimentaire en [clo]
+    """
+
+    temp_dry_bulb: float = Field(
+        ge=HumidAirSettings.comfort_tdb_ge, le=HumidAirSettings.comfort_tdb_le
+    )
+    mean_radiant_temperature: float = Field(
+        ge=HumidAirSettings.comfort_tr_ge, le=HumidAirSettings.comfort_tr_le
+    )
+    air_speed: float = Field(
+        ge=HumidAirSettings.comfort_air_speed_ge,
+        le=HumidAirSettings.comfort_air_speed_le,
+    )
+    relative_humidity: float = Field(
+        ge=HumidAirSettings.rh_ge, le=HumidAirSettings.rh_le
+    )
+    metabolic_rate: float = Field(
+        ge=HumidAirSettings.comfort_met_ge, le=HumidAirSettings.comfort_met_le
+    )
+    clothing: float = Field(
+        ge=HumidAirSettings.comfort_clo_ge, le=HumidAirSettings.comfort_clo_le
+    )
+
+
+class ThermalComfortBatchEntity(BaseModel):
+    """Indices de confort d'un lot d'occupants, stockés en colonnes
+
+    Chaque colonne contient une valeur par état du lot, ou None si l'état
+    est en erreur. Les colonnes du modèle adaptatif ne sont renseignées que
+    si les températures extérieures moyennes prédominantes sont fournies.
+
+    Attributs:
+        pmv (list[float | None]): Votes moyens prévisibles
+        ppd (list[float | None]): Pourcentages prévisibles d'insatisfaits en [%]
+        operative_temperature (list[float | None]): Températures opératives en [°C]
+        adaptive_comfort_temperature (list[float | None] | None): Températures de
+            confort du modèle adaptatif en [°C]
+        adaptive_acceptable_80 (list[bool | None] | None): États dans la zone
+            d'acceptabilité à 80 %
+        adaptive_acceptable_90 (list[bool | None] | None): États dans la zone
+            d'acceptabilité à 90 %
+        errors (list[HumidAirBatchErrorEntity]): Erreurs par état
+    """
+
+    pmv: list[float | None]
+    ppd: list[float | None]
+    operative_temperature: list[float | None]
+    adaptive_comfort_temperature: list[float | None] | None = None
+    adaptive_acceptable_80: list[bool | None] | None = None
+    adaptive_acceptable_90: list[bool | None] | None = None
+    errors: list[HumidAirBatchErrorEntity] = Field(default_factory=list)
+
+
+class ComfortZoneEntity(BaseModel):
+    """Zone de confort PMV de -0,5 à +0,5 pour le diagramme psychrométrique
+
+    Attributs:
+        pressure (float): Pression absolue en [Pa]
+        clothing (float): Isolation vestimentaire en [clo]
+        metabolic_rate (float): Métabolisme en [met]
+        air_speed (float): Vitesse relative de l'air en [m/s]
+        temp_dry_bulb (list[float]): Abscisses du polygone fermé, températures
+            opératives en [°C]
+        humidity_ratio (list[float]): Ordonnées du polygone fermé, humidités
+            absolues en [kg eau/kg air sec]
+    """
+
+    pressure: float
+    clothing: float
+    metabolic_rate: float
+    air_speed: float
+    temp_dry_bulb: list[float]
+    humidity_ratio: list[float]
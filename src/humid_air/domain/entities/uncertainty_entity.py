@@ -0,0 +1,56 @@
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchErrorEntity
+
+
+class UncertaintyMethod(str, Enum):
+    """Méthode de propagation des incertitudes d'entrée
+
+    Attributs:
+        FINITE_DIFFERENCE (str): Propagation linéaire (GUM), sensibilités par
+            différences finies centrées, moyenne égale à la valeur nominale
+        MONTE_CARLO (str): Tirages gaussiens des entrées (GUM supplément 1),
+            moyenne, écart type et quantiles des tirages
+    """
+
+    FINITE_DIFFERENCE = "finite_difference"
+    MONTE_CARLO = "monte_carlo"
+
+
+class PropertyUncertaintyEntity(BaseModel):
+    """Statistiques d'une propriété pour chaque état d'un lot, en colonnes
+
+    Attributs:
+        nominal (list[float | None]): Valeurs aux entrées nominales
+        mean (list[float | None]): Moyennes
+        standard_deviation (list[float | None]): Incertitudes types (écarts types)
+        lower (list[float | None]): Bornes inférieures de l'intervalle élargi
+        upper (list[float | None]): Bornes supérieures de l'intervalle élargi
+    """
+
+    nominal: list[float | None]
+    mean: list[float | None]
+    standard_deviation: list[float | None]
+    lower: list[float | None]
+    upper: list[float | None]
+
+
+class HumidAirUncertaintyEntity(BaseModel):
+    """Incertitudes des propriétés d'un lot d'états d'air humide
+
+    Chaque colonne contient une valeur par état du lot, ou None si l'état
+    est en erreur ou si la propriété n'est pas disponible.
+
+    Attributs:
+        method (UncertaintyMethod): Méthode de propagation
+        coverage (float): Probabilité de couverture de l'intervalle [lower, upper]
+        properties (dict[str, PropertyUncertaintyEntity]): Statistiques par propriété
+        errors (list[HumidAirBatchErrorEntity]): Erreurs par état
+    """
+
+    method: UncertaintyMethod
+    coverage: float
+    properties: dict[str, PropertyUncertaintyEntity]
+    errors: list[HumidAirBatchErrorEntity] = Field(default_factory=list)
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+
+
+class WarmUpStepEntity(BaseModel):
+    """Étape du préchauffage des calculs de l'air humide
+
+    Attributs:
+        name (str): Nom de l'étape
+        seconds (float): Durée de l'étape en [s]
+    """
+
+    name: str
+    seconds: float
+
+
+class WarmUpReportEntity(BaseModel):
+    """Bilan du préchauffage des calculs de l'air humide
+
+    Attributs:
+        steps (list[WarmUpStepEntity]): Étapes, dans l'ordre d'exécution
+    """
+
+    steps: list[WarmUpStepEntity]
+
+    @property
+    def seconds(self) -> float:
+        return sum(step.seconds for step in self.steps)
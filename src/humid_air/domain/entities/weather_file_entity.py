@@ -0,0 +1,68 @@
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from humid_air.domain.entities.humid_air_batch_entity import (
+    HumidAirBatchEntity,
+    HumidAirBatchErrorEntity,
+)
+
+
+class WeatherFileFormat(str, Enum):
+    """Format d'un fichier météo horaire
+
+    Attributs:
+        EPW (str): EnergyPlus Weather, 8 lignes d'en-tête puis une ligne par heure
+        CSV (str): CSV avec en-tête, deux colonnes d'entrée et pression optionnelle
+    """
+
+    EPW = "epw"
+    CSV = "csv"
+
+
+class WeatherOutputFormat(str, Enum):
+    """Format de sortie des enregistrements enrichis
+
+    Attributs:
+        CSV (str): CSV avec en-tête
+        NDJSON (str): Un objet JSON par ligne
+    """
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class WeatherRecordsEntity(BaseModel):
+    """Tranche d'enregistrements lue dans un fichier météo, en colonnes
+
+    Les entrées manquantes ou illisibles sont remplacées par NaN et signalées
+    dans errors, avec leur colonne et leur ligne dans le fichier.
+
+    Attributs:
+        start (int): Index du premier enregistrement de la tranche dans le fichier
+        labels (dict[str, list[str]]): Colonnes recopiées telles quelles en sortie
+        pressure (list[float]): Pressions absolues en [Pa]
+        inputs (dict[str, list[float]]): Deux entrées indépendantes, par nom
+        errors (list[HumidAirBatchErrorEntity]): Entrées manquantes ou illisibles,
+            indexées dans la tranche
+    """
+
+    start: int
+    labels: dict[str, list[str]]
+    pressure: list[float]
+    inputs: dict[str, list[float]]
+    errors: list[HumidAirBatchErrorEntity] = Field(default_factory=list)
+
+
+class WeatherResultsEntity(BaseModel):
+    """Tranche d'enregistrements enrichis des propriétés de l'air humide
+
+    Attributs:
+        start (int): Index du premier enregistrement de la tranche dans le fichier
+        labels (dict[str, list[str]]): Colonnes recopiées du fichier
+        batch (HumidAirBatchEntity): Propriétés et erreurs, indexées dans la tranche
+    """
+
+    start: int
+    labels: dict[str, list[str]]
+    batch: HumidAirBatchEntity
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+from humid_air.domain.entities.climate_analytics_entity import ClimateAnalyticsEntity
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchEntity
+
+
+class ClimateAnalyticsInterface(ABC):
+    """Interface pour l'agrégation énergétique de séries climatiques horaires"""
+
+    @abstractmethod
+    def aggregate(
+        self,
+        batches: Iterable[HumidAirBatchEntity],
+        bin_width: float,
+        heating_base_temperature: float,
+        cooling_base_temperature: float,
+        enthalpy_base: float,
+    ) -> ClimateAnalyticsEntity:
+        """Agrège des lots d'heures consécutives en une seule passe
+
+        Args:
+            batches (Iterable[HumidAirBatchEntity]): Lots horaires avec température
+                sèche, température humide et enthalpie
+            bin_width (float): Largeur des classes de température sèche en [K]
+            heating_base_temperature (float): Base des degrés-jours de chauffage en [°C]
+            cooling_base_temperature (float): Base des degrés-jours de refroidissement en [°C]
+            enthalpy_base (float): Base des enthalpies-heures en [J/kg]
+
+        Returns:
+            ClimateAnalyticsEntity: Tables agrégées
+        """
+        pass
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchEntity
+from humid_air.domain.entities.humid_air_entity import HUMID_AIR_PROPERTY_NAMES
+
+
+class HumidAirEngineInterface(ABC):
+    """Interface pour les moteurs de calcul de l'air humide
+
+    Un moteur calcule en une fois les propriétés d'un lot d'états dont les
+    entrées ont déjà été validées par HumidAirEntity.
+    """
+
+    @abstractmethod
+    def compute(
+        self,
+        pressure: list[float],
+        temp_dry_bulb: list[float],
+        relative_humidity: list[float],
+        fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES,
+        rounded: bool = True,
+    ) -> HumidAirBatchEntity:
+        """Calcule les propriétés d'un lot d'états d'air humide
+
+        Args:
+            pressure (list[float]): Pressions absolues en [Pa]
+            temp_dry_bulb (list[float]): Températures sèches en [°C]
+            relative_humidity (list[float]): Humidités relatives en [%]
+            fields (tuple[str, ...], optional): Propriétés à calculer, toutes par défaut
+            rounded (bool, optional): Arrondir selon HUMID_AIR_PROPERTY_DECIMALS,
+                sinon valeurs brutes du moteur. Defaults to True.
+
+        Returns:
+            HumidAirBatchEntity: Propriétés demandées en colonnes et erreurs par état
+        """
+        pass
+
+    def warm_up(self) -> None:
+        """Initialise les ressources du moteur avant la première requête
+
+        Sans effet par défaut ; les moteurs à initialisation coûteuse (table,
+        pool de processus) la redéfinissent.
+        """
+        return None
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+
+class HumidAirInputConverterInterface(ABC):
+    """Interface pour la conversion des couples d'entrées de l'air humide
+
+    Un convertisseur ramène un couple d'entrées quelconque (parmi
+    HUMID_AIR_INPUT_PAIRS) au couple température sèche et humidité relative
+    utilisé par HumidAirEntity et par les moteurs de calcul.
+    """
+
+    @abstractmethod
+    def to_dry_bulb_and_relative_humidity(
+        self, pressure: list[float], inputs: dict[str, list[float]]
+    ) -> tuple[list[float | None], list[float | None]]:
+        """Convertit un lot d'états en températures sèches et humidités relatives
+
+        Args:
+            pressure (list[float]): Pressions absolues en [Pa]
+            inputs (dict[str, list[float]]): Deux entrées, en colonnes, indexées par leur nom
+
+        Returns:
+            tuple[list[float | None], list[float | None]]: Températures sèches en [°C]
+                et humidités relatives en [%], None si les entrées ne
+                correspondent à aucun état
+        """
+        pass
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+
+from humid_air.domain.entities.solver_entity import (
+    InverseSolutionEntity,
+    SolverUnknown,
+)
+
+
+class InverseSolverInterface(ABC):
+    """Interface pour la recherche de l'entrée manquante atteignant une propriété cible"""
+
+    @abstractmethod
+    def solve(
+        self,
+        pressure: list[float],
+        fixed: list[float],
+        unknown: SolverUnknown,
+        target_name: str,
+        target: list[float],
+        lower: float | None,
+        upper: float | None,
+        tolerance: float,
+        max_iterations: int,
+    ) -> InverseSolutionEntity:
+        """Résout en une passe vectorisée l'entrée manquante de chaque état
+
+        Args:
+            pressure (list[float]): Pressions absolues en [Pa]
+            fixed (list[float]): Entrée fixée, humidités relatives en [%] ou
+                températures sèches en [°C] selon l'entrée recherchée
+            unknown (SolverUnknown): Entrée recherchée
+            target_name (str): Propriété cible
+            target (list[float]): Valeurs cibles
+            lower (float | None): Borne inférieure de recherche, domaine du moteur par défaut
+            upper (float | None): Borne supérieure de recherche, domaine du moteur par défaut
+            tolerance (float): Largeur d'encadrement visée, dans l'unité de l'entrée recherchée
+            max_iterations (int): Itérations maximales
+
+        Returns:
+            InverseSolutionEntity: Entrées trouvées et convergence par état
+        """
+        pass
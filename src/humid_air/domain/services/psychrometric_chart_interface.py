@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+
+from humid_air.domain.entities.psychrometric_chart_entity import (
+    PsychrometricChartEntity,
+)
+
+
+class PsychrometricChartInterface(ABC):
+    """Interface pour les générateurs de diagrammes psychrométriques"""
+
+    @abstractmethod
+    def build(
+        self,
+        pressure: float,
+        temp_dry_bulb_min: float,
+        temp_dry_bulb_max: float,
+        humidity_ratio_max: float,
+        resolution: int,
+    ) -> PsychrometricChartEntity:
+        """Calcule la géométrie complète d'un diagramme psychrométrique
+
+        Args:
+            pressure (float): Pression absolue en [Pa]
+            temp_dry_bulb_min (float): Température sèche minimale en [°C]
+            temp_dry_bulb_max (float): Température sèche maximale en [°C]
+            humidity_ratio_max (float): Humidité absolue maximale en [kg eau/kg air sec]
+            resolution (int): Nombre de points par ligne
+
+        Returns:
+            PsychrometricChartEntity: Polylignes du diagramme
+        """
+        pass
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+from humid_air.domain.entities.saturation_table_entity import SaturationTableEntity
+
+
+class SaturationTableInterface(ABC):
+    """Interface pour les générateurs de tables de saturation"""
+
+    @abstractmethod
+    def build(
+        self,
+        pressure: float,
+        temp_dry_bulb_min: float,
+        temp_dry_bulb_max: float,
+        temp_dry_bulb_step: float,
+    ) -> SaturationTableEntity:
+        """Calcule la table de saturation sur une plage de températures
+
+        Args:
+            pressure (float): Pression absolue en [Pa]
+            temp_dry_bulb_min (float): Première température en [°C]
+            temp_dry_bulb_max (float): Dernière température, incluse si atteinte par le pas, en [°C]
+            temp_dry_bulb_step (float): Pas de température en [K]
+
+        Returns:
+            SaturationTableEntity: Propriétés de l'air saturé, une ligne par température
+        """
+        pass
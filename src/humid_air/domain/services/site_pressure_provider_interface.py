@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class SitePressureProviderInterface(ABC):
+    """Interface pour la pression atmosphérique d'un site
+
+    Un fournisseur renvoie la pression enregistrée pour le site d'un projet,
+    utilisée par défaut pour les états d'air humide qui lui sont rattachés.
+    """
+
+    @abstractmethod
+    def get_site_pressure(self, project_id: UUID, user_id: UUID) -> float | None:
+        """Récupère la pression du site d'un projet dont l'utilisateur est membre
+
+        Args:
+            project_id (UUID): Identifiant du projet
+            user_id (UUID): Identifiant de l'utilisateur authentifié
+
+        Raises:
+            ValueError: Projet inexistant ou utilisateur non membre, sans distinction
+
+        Returns:
+            float | None: Pression absolue du site en [Pa], None si elle n'est pas renseignée
+        """
+        pass
@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+
+from humid_air.domain.entities.thermal_comfort_entity import (
+    ComfortZoneEntity,
+    ThermalComfortBatchEntity,
+)
+
+
+class ThermalComfortInterface(ABC):
+    """Interface pour l'évaluation du confort thermique (ASHRAE 55, ISO 7730)"""
+
+    @abstractmethod
+    def evaluate(
+        self,
+        temp_dry_bulb: list[float],
+        mean_radiant_temperature: list[float],
+        air_speed: list[float],
+        relative_humidity: list[float],
+        metabolic_rate: list[float],
+        clothing: list[float],
+        prevailing_mean_outdoor_temperature: list[float] | None = None,
+    ) -> ThermalComfortBatchEntity:
+        """Évalue en une passe les indices de confort d'un lot d'états valides
+
+        Args:
+            temp_dry_bulb (list[float]): Températures sèches en [°C]
+            mean_radiant_temperature (list[float]): Températures radiantes moyennes en [°C]
+            air_speed (list[float]): Vitesses relatives de l'air en [m/s]
+            relative_humidity (list[float]): Humidités relatives en [%]
+            metabolic_rate (list[float]): Métabolismes en [met]
+            clothing (list[float]): Isolations vestimentaires en [clo]
+            prevailing_mean_outdoor_temperature (list[float] | None, optional):
+                Températures extérieures moyennes prédominantes en [°C] pour le
+                modèle adaptatif
+
+        Returns:
+            ThermalComfortBatchEntity: Indices de confort en colonnes
+        """
+        pass
+
+    @abstractmethod
+    def comfort_zone(
+        self,
+        pressure: float,
+        clothing: float,
+        metabolic_rate: float,
+        air_speed: float,
+        humidity_ratio_max: float,
+    ) -> ComfortZoneEntity:
+        """Calcule le polygone de la zone de confort PMV de -0,5 à +0,5
+
+        Args:
+            pressure (float): Pression absolue en [Pa]
+            clothing (float): Isolation vestimentaire en [clo]
+            metabolic_rate (float): Métabolisme en [met]
+            air_speed (float): Vitesse relative de l'air en [m/s]
+            humidity_ratio_max (float): Humidité absolue du haut de la zone
+                en [kg eau/kg air sec]
+
+        Returns:
+            ComfortZoneEntity: Polygone fermé dans le plan du diagramme psychrométrique
+        """
+        pass
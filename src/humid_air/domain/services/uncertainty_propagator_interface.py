@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+
+from humid_air.domain.entities.uncertainty_entity import (
+    HumidAirUncertaintyEntity,
+    UncertaintyMethod,
+)
+from humid_air.domain.services.humid_air_engine_interface import (
+    HumidAirEngineInterface,
+)
+
+
+class UncertaintyPropagatorInterface(ABC):
+    """Interface pour la propagation des incertitudes d'entrée aux propriétés"""
+
+    @abstractmethod
+    def propagate(
+        self,
+        engine: HumidAirEngineInterface,
+        pressure: list[float],
+        temp_dry_bulb: list[float],
+        relative_humidity: list[float],
+        pressure_uncertainty: float,
+        temp_dry_bulb_uncertainty: float,
+        relative_humidity_uncertainty: float,
+        method: UncertaintyMethod,
+        samples: int,
+        coverage: float,
+        seed: int | None,
+        fields: tuple[str, ...],
+    ) -> HumidAirUncertaintyEntity:
+        """Propage les incertitudes types des entrées d'un lot d'états valides
+
+        Les états perturbés de tout le lot sont calculés en un seul appel au
+        moteur.
+
+        Args:
+            engine (HumidAirEngineInterface): Moteur de calcul
+            pressure (list[float]): Pressions absolues en [Pa]
+            temp_dry_bulb (list[float]): Températures sèches en [°C]
+            relative_humidity (list[float]): Humidités relatives en [%]
+            pressure_uncertainty (float): Incertitude type de la pression en [Pa]
+            temp_dry_bulb_uncertainty (float): Incertitude type de la température
+                sèche en [K]
+            relative_humidity_uncertainty (float): Incertitude type de l'humidité
+                relative en [%]
+            method (UncertaintyMethod): Méthode de propagation
+            samples (int): Nombre de tirages par état pour Monte-Carlo
+            coverage (float): Probabilité de couverture de l'intervalle élargi
+            seed (int | None): Graine des tirages, None pour des tirages non reproductibles
+            fields (tuple[str, ...]): Propriétés à calculer
+
+        Returns:
+            HumidAirUncertaintyEntity: Statistiques par propriété, en colonnes
+        """
+        pass
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+
+from humid_air.domain.entities.weather_file_entity import WeatherRecordsEntity
+
+
+class WeatherFileReaderInterface(ABC):
+    """Interface pour les lecteurs de fichiers météo horaires
+
+    Un lecteur parcourt le fichier ligne à ligne et produit des tranches de
+    taille bornée : le fichier n'est jamais chargé entièrement en mémoire.
+    """
+
+    @abstractmethod
+    def read(
+        self, lines: Iterable[str], pressure: float, chunk_size: int
+    ) -> Iterator[WeatherRecordsEntity]:
+        """Lit les enregistrements d'un fichier météo par tranches
+
+        Args:
+            lines (Iterable[str]): Lignes du fichier
+            pressure (float): Pression absolue en [Pa] utilisée si le fichier n'en fournit pas
+            chunk_size (int): Nombre maximal d'enregistrements par tranche
+
+        Raises:
+            ValueError: En-tête du fichier invalide
+
+        Returns:
+            Iterator[WeatherRecordsEntity]: Tranches d'enregistrements
+        """
+        pass
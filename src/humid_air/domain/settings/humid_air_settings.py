@@ -8,6 +8,33 @@ class HumidAirSettings:
     pressure_ge: PositiveInt = 10
     pressure_le: PositiveFloat = 1e7
 
+    # site pressure
+    request_pressure_description: str = (
+        "Pression absolue de l'air en [Pa] ; à défaut, déduite de 'altitude' "
+        "(atmosphère standard), puis de la pression de site du projet "
+        "'project_id', puis 101325 Pa"
+    )
+    altitude_description: str = (
+        "Altitude du site en [m], convertie en pression par l'atmosphère "
+        "standard lorsque la pression n'est pas fournie"
+    )
+    altitude_ge: int = -500
+    altitude_le: int = 11000
+    project_id_description: str = (
+        "Identifiant du projet dont la pression de site est utilisée lorsque "
+        "ni la pression ni l'altitude ne sont fournies ; exige un jeton JWT "
+        "d'un membre du projet"
+    )
+    site_pressure_missing_message: str = (
+        "Le projet n'a pas de pression de site renseignée"
+    )
+    site_pressure_unauthenticated_message: str = (
+        "Authentification requise pour utiliser la pression de site d'un projet"
+    )
+    site_pressure_project_unavailable_message: str = (
+        "Projet introuvable ou dont l'utilisateur n'est pas membre"
+    )
+
     # dry-bulb temperature
     tdb_description: str = "Température sèche de l'air en [°C]"
     tdb_ge: NegativeInt = -143
@@ -18,6 +45,35 @@ class HumidAirSettings:
     rh_ge: PositiveInt = 0
     rh_le: PositiveInt = 100
 
+    # alternative inputs
+    input_pair_message: str = (
+        "Deux entrées indépendantes sont requises parmi temp_dry_bulb, "
+        "relative_humidity, temp_dew_point, temp_wet_bulb, humidity_ratio et "
+        "enthalpy_per_humid_air (hors temp_dew_point + humidity_ratio et "
+        "temp_wet_bulb + enthalpy_per_humid_air)"
+    )
+    input_impossible_message: str = (
+        "Les entrées ne correspondent à aucun état d'air humide"
+    )
+    # décimales de la température sèche et de l'humidité relative converties
+    converted_input_decimals: int = 2
+    temp_dew_point_input_description: str = (
+        "Température du point de rosée de l'air en [°C]"
+    )
+    temp_wet_bulb_input_description: str = "Température bulbe humide de l'air en [°C]"
+    humidity_ratio_input_description: str = (
+        "Humidité absolue de l'air [kg eau/kg air sec]"
+    )
+    enthalpy_input_description: str = "Enthalpie par kg d'air humide [J/kg]"
+    batch_tdp_description: str = (
+        "Liste des températures de point de rosée de l'air en [°C]"
+    )
+    batch_twb_description: str = "Liste des températures bulbe humide de l'air en [°C]"
+    batch_humidity_ratio_description: str = (
+        "Liste des humidités absolues de l'air [kg eau/kg air sec]"
+    )
+    batch_enthalpy_description: str = "Liste des enthalpies par kg d'air humide [J/kg]"
+
     # Autres descriptions des propriétés de HumidAir
     partial_pressure_of_water_vapor: str = "Pression de vapeur saturante en [Pa]"
     humidity_ratio_description: str = "Humidité absolue de l'air [kg eau/kg air sec]"
@@ -41,3 +97,479 @@ class HumidAirSettings:
     )
     prandtl_number_description: str = "Nombre de Prandlt"
     compressibility_factor_description: str = "Facteur de compressibilité [Z=pv/RT]"
+
+    # property selection
+    fields_description: str = (
+        "Propriétés à calculer et à renvoyer, séparées par des virgules "
+        "(toutes par défaut)"
+    )
+    batch_fields_description: str = (
+        "Liste des propriétés à calculer et à renvoyer (toutes par défaut)"
+    )
+    fields_unknown_message: str = "Propriétés inconnues"
+
+    # batch
+    batch_max_length: PositiveInt = 20000
+    batch_pressure_description: str = (
+        "Liste des pressions absolues de l'air en [Pa] ; à défaut, une pression "
+        "unique déduite de 'altitude' ou de 'project_id' comme pour 'get_ha_props'"
+    )
+    batch_tdb_description: str = "Liste des températures sèches de l'air en [°C]"
+    batch_rh_description: str = "Liste des humidités relatives de l'air en [%]"
+    batch_errors_description: str = (
+        "Erreurs de calcul par état, repérées par leur index dans la requête"
+    )
+    batch_error_index_description: str = "Index de l'état dans la requête"
+    batch_error_field_description: str = "Champ en erreur"
+    batch_error_message_description: str = "Message d'erreur"
+    batch_output_format_description: str = (
+        "Format de sortie : 'json' (document en colonnes), 'ndjson' (un objet JSON "
+        "par état et par ligne) ou 'csv', ces deux derniers rendus au fil du calcul"
+    )
+    stream_index_column: str = "index"
+    stream_errors_column: str = "errors"
+
+    # engines
+    engine_description: str = (
+        "Moteur de calcul : 'coolprop' (ASHRAE RP-1485, toutes les propriétés), "
+        "'hyland_wexler' (ASHRAE Fundamentals, vectorisé, propriétés psychrométriques seules) "
+        "ou 'lookup_table' (interpolation dans une table précalculée, erreurs maximales "
+        "face à CoolProp dans 'max_errors')"
+    )
+    hyland_wexler_tdb_ge: int = -60
+    hyland_wexler_tdb_le: int = 90
+    hyland_wexler_pressure_ge: int = 50000
+    hyland_wexler_pressure_le: int = 200000
+    hyland_wexler_out_of_range_message: str = (
+        "État hors du domaine de validité du moteur hyland_wexler "
+        "(température sèche entre -60 et 90 °C et sous l'ébullition, pression "
+        "entre 50 et 200 kPa, pression de vapeur inférieure à la pression)"
+    )
+    lookup_table_pressure_ge: int = 60000
+    lookup_table_pressure_le: int = 110000
+    lookup_table_pressure_step: int = 5000
+    lookup_table_tdb_ge: int = -40
+    lookup_table_tdb_le: int = 60
+    lookup_table_tdb_step: float = 0.5
+    lookup_table_rh_ge: int = 0
+    lookup_table_rh_le: int = 100
+    lookup_table_rh_step: float = 2.5
+    lookup_table_reference_stride: int = 5
+    lookup_table_error_margin: float = 2.0
+    lookup_table_out_of_range_message: str = (
+        "État hors de la table précalculée "
+        "(pression entre 60 et 110 kPa, température sèche entre -40 et 60 °C)"
+    )
+    lookup_table_not_interpolable_message: str = (
+        "État non interpolable dans la table précalculée "
+        "(propriété indisponible à un nœud voisin)"
+    )
+    # délai de démarrage de tous les processus du pool, en [s]
+    process_pool_warm_up_timeout: float = 120.0
+    approximate_description: str = (
+        "Interpole les propriétés dans une table précalculée (plus rapide, "
+        "erreurs maximales dans 'max_errors', propriétés de transport indisponibles)"
+    )
+    max_errors_description: str = (
+        "Erreurs absolues maximales déclarées par propriété pour un moteur approché, "
+        "absentes pour un calcul exact"
+    )
+
+    # psychrometric chart
+    chart_tdb_ge: int = -60
+    chart_tdb_le: int = 100
+    chart_tdb_min_default_value: float = -10
+    chart_tdb_max_default_value: float = 50
+    chart_tdb_min_description: str = "Température sèche minimale du diagramme en [°C]"
+    chart_tdb_max_description: str = "Température sèche maximale du diagramme en [°C]"
+    chart_humidity_ratio_max_default_value: float = 0.03
+    chart_humidity_ratio_max_le: float = 0.2
+    chart_humidity_ratio_max_description: str = (
+        "Humidité absolue maximale du diagramme [kg eau/kg air sec]"
+    )
+    chart_resolution_default_value: int = 50
+    chart_resolution_ge: int = 2
+    chart_resolution_le: int = 500
+    chart_resolution_description: str = "Nombre de points par ligne du diagramme"
+    chart_format_description: str = (
+        "Format de sortie : 'json' (polylignes) ou 'svg' (image)"
+    )
+    chart_relative_humidity_step: float = 10
+    chart_enthalpy_step: float = 10000
+    chart_temp_wet_bulb_step: float = 5
+    chart_specific_volume_step: float = 0.05
+    chart_lines_description: str = (
+        "Polylignes à grandeur constante : humidité relative [%], enthalpie "
+        "[J/kg air sec], température humide [°C] et volume spécifique [m³/kg air sec]"
+    )
+    chart_line_kind_description: str = "Grandeur constante le long de la ligne"
+    chart_line_value_description: str = "Valeur de la grandeur constante"
+    chart_line_tdb_description: str = "Abscisses, températures sèches en [°C]"
+    chart_line_humidity_ratio_description: str = (
+        "Ordonnées, humidités absolues [kg eau/kg air sec]"
+    )
+
+    # saturation table
+    saturation_table_tdb_min_default_value: float = -60
+    saturation_table_tdb_max_default_value: float = 90
+    saturation_table_step_default_value: float = 1
+    saturation_table_step_le: float = 50
+    saturation_table_max_rows: int = 10001
+    saturation_table_rows_message: str = (
+        "La table de saturation est limitée à 10001 lignes : augmenter le pas "
+        "ou réduire la plage de températures"
+    )
+    saturation_table_tdb_min_description: str = (
+        "Première température de la table en [°C]"
+    )
+    saturation_table_tdb_max_description: str = (
+        "Dernière température de la table en [°C]"
+    )
+    saturation_table_step_description: str = "Pas de température de la table en [K]"
+    saturation_table_format_description: str = (
+        "Format de sortie : 'json' (colonnes) ou 'csv' (une ligne par température)"
+    )
+    saturation_table_tdb_description: str = "Températures en [°C]"
+    saturation_table_pws_description: str = (
+        "Pressions de vapeur saturante en [Pa], sur glace sous 0 °C"
+    )
+    saturation_table_humidity_ratio_description: str = (
+        "Humidités absolues à saturation [kg eau/kg air sec]"
+    )
+    saturation_table_enthalpy_description: str = (
+        "Enthalpies à saturation par kg d'air sec [J/kg air sec]"
+    )
+    saturation_table_specific_volume_description: str = (
+        "Volumes spécifiques à saturation par kg d'air sec [m³/kg air sec]"
+    )
+
+    # thermal comfort
+    comfort_tdb_ge: float = 10
+    comfort_tdb_le: float = 30
+    comfort_tr_ge: float = 10
+    comfort_tr_le: float = 40
+    comfort_air_speed_ge: float = 0
+    comfort_air_speed_le: float = 1
+    comfort_met_ge: float = 0.8
+    comfort_met_le: float = 4
+    comfort_clo_ge: float = 0
+    comfort_clo_le: float = 2
+    comfort_air_speed_default_value: float = 0.1
+    comfort_met_default_value: float = 1.1
+    comfort_clo_default_value: float = 0.5
+    comfort_tdb_description: str = (
+        "Liste des températures sèches de l'air en [°C], entre 10 et 30 °C"
+    )
+    comfort_rh_description: str = "Liste des humidités relatives de l'air en [%]"
+    comfort_tr_description: str = (
+        "Températures radiantes moyennes en [°C], entre 10 et 40 °C "
+        "(liste ou valeur unique, température sèche par défaut)"
+    )
+    comfort_air_speed_description: str = (
+        "Vitesses relatives de l'air en [m/s], entre 0 et 1 m/s (liste ou valeur "
+        "unique) ; l'effet rafraîchissant des vitesses élevées n'est pas ajouté"
+    )
+    comfort_met_description: str = (
+        "Métabolismes en [met], entre 0,8 et 4 (liste ou valeur unique)"
+    )
+    comfort_clo_description: str = (
+        "Isolations vestimentaires en [clo], entre 0 et 2 (liste ou valeur unique)"
+    )
+    comfort_prevailing_description: str = (
+        "Températures extérieures moyennes prédominantes en [°C] pour le modèle "
+        "adaptatif (liste ou valeur unique, modèle adaptatif omis si absent)"
+    )
+    comfort_pmv_description: str = "Votes moyens prévisibles PMV (ISO 7730, ASHRAE 55)"
+    comfort_ppd_description: str = "Pourcentages prévisibles d'insatisfaits PPD en [%]"
+    comfort_operative_temperature_description: str = (
+        "Températures opératives en [°C] (ASHRAE 55, annexe A)"
+    )
+    comfort_adaptive_temperature_description: str = (
+        "Températures de confort du modèle adaptatif en [°C], None hors de la plage "
+        "de températures extérieures 10 à 33,5 °C"
+    )
+    comfort_adaptive_80_description: str = (
+        "Température opérative dans la zone d'acceptabilité à 80 % du modèle adaptatif"
+    )
+    comfort_adaptive_90_description: str = (
+        "Température opérative dans la zone d'acceptabilité à 90 % du modèle adaptatif"
+    )
+    comfort_length_message: str = (
+        "Les colonnes de la requête de confort doivent avoir la même longueur"
+    )
+    comfort_zone_humidity_ratio_max_default_value: float = 0.012
+    comfort_zone_humidity_ratio_max_description: str = (
+        "Humidité absolue du haut de la zone de confort en [kg eau/kg air sec]"
+    )
+    comfort_zone_clo_description: str = "Isolation vestimentaire en [clo]"
+    comfort_zone_met_description: str = "Métabolisme en [met]"
+    comfort_zone_air_speed_description: str = "Vitesse relative de l'air en [m/s]"
+    comfort_zone_tdb_description: str = (
+        "Abscisses du polygone fermé, températures opératives en [°C]"
+    )
+    comfort_zone_humidity_ratio_description: str = (
+        "Ordonnées du polygone fermé, humidités absolues en [kg eau/kg air sec]"
+    )
+
+    # uncertainty
+    uncertainty_tdb_default_value: float = 0.2
+    uncertainty_tdb_le: float = 10
+    uncertainty_rh_default_value: float = 2
+    uncertainty_rh_le: float = 20
+    uncertainty_pressure_default_value: float = 0
+    uncertainty_pressure_le: float = 10000
+    uncertainty_samples_default_value: int = 200
+    uncertainty_samples_ge: int = 10
+    uncertainty_samples_le: int = 10000
+    uncertainty_coverage_default_value: float = 0.95
+    uncertainty_coverage_ge: float = 0.5
+    uncertainty_coverage_le: float = 0.999
+    uncertainty_max_evaluations: int = 500000
+    uncertainty_evaluations_message: str = (
+        "La propagation est limitée à 500000 états calculés (états du lot "
+        "multipliés par les tirages plus un) : réduire le lot ou 'samples'"
+    )
+    uncertainty_length_message: str = (
+        "pressure, temp_dry_bulb et relative_humidity doivent avoir la même longueur"
+    )
+    uncertainty_tdb_description: str = (
+        "Incertitude type de la température sèche en [K], appliquée à tous les états"
+    )
+    uncertainty_rh_description: str = (
+        "Incertitude type de l'humidité relative en [%], appliquée à tous les états"
+    )
+    uncertainty_pressure_description: str = (
+        "Incertitude type de la pression en [Pa], appliquée à tous les états"
+    )
+    uncertainty_method_description: str = (
+        "Méthode : 'finite_difference' (propagation linéaire, sensibilités par "
+        "différences finies centrées) ou 'monte_carlo' (tirages gaussiens des entrées)"
+    )
+    uncertainty_samples_description: str = (
+        "Nombre de tirages par état pour 'monte_carlo'"
+    )
+    uncertainty_coverage_description: str = (
+        "Probabilité de couverture de l'intervalle [lower, upper]"
+    )
+    uncertainty_seed_description: str = (
+        "Graine des tirages 'monte_carlo', pour des résultats reproductibles"
+    )
+    uncertainty_engine_description: str = (
+        "Moteur de calcul, 'hyland_wexler' par défaut pour calculer tous les "
+        "états perturbés en une passe vectorisée"
+    )
+    uncertainty_properties_description: str = (
+        "Statistiques par propriété, une valeur par état : valeur nominale, "
+        "moyenne, incertitude type et bornes de l'intervalle élargi"
+    )
+    uncertainty_nominal_description: str = "Valeurs aux entrées nominales"
+    uncertainty_mean_description: str = (
+        "Moyennes (valeurs nominales pour 'finite_difference')"
+    )
+    uncertainty_standard_deviation_description: str = (
+        "Incertitudes types (écarts types)"
+    )
+    uncertainty_lower_description: str = "Bornes inférieures de l'intervalle élargi"
+    uncertainty_upper_description: str = "Bornes supérieures de l'intervalle élargi"
+
+    # inverse solver
+    solver_tolerance_default_value: float = 1e-6
+    solver_tolerance_ge: float = 1e-9
+    solver_tolerance_le: float = 1
+    solver_max_iterations_default_value: int = 100
+    solver_max_iterations_le: int = 500
+    solver_rh_lower_default_value: float = 1e-3
+    solver_fixed_input_message: str = (
+        "Une seule entrée fixée est requise : temp_dry_bulb pour rechercher "
+        "relative_humidity, ou relative_humidity pour rechercher temp_dry_bulb"
+    )
+    solver_length_message: str = (
+        "L'entrée fixée, la pression et target_values doivent avoir la même longueur"
+    )
+    solver_target_unknown_message: str = "Propriété cible non supportée par le solveur"
+    solver_not_bracketed_message: str = (
+        "Cible non encadrée : aucune valeur de l'entrée recherchée entre les bornes "
+        "ne l'atteint"
+    )
+    solver_tdb_description: str = (
+        "Températures sèches fixées en [°C] (liste ou valeur unique) : l'humidité "
+        "relative est alors recherchée"
+    )
+    solver_rh_description: str = (
+        "Humidités relatives fixées en [%] (liste ou valeur unique) : la "
+        "température sèche est alors recherchée"
+    )
+    solver_target_description: str = (
+        "Propriété cible : partial_pressure_of_water_vapor, humidity_ratio, "
+        "temp_dew_point, temp_wet_bulb, enthalpy_per_humid_air, "
+        "specific_volume_per_unit_humid_air ou density_per_unit_humid_air"
+    )
+    solver_target_values_description: str = (
+        "Valeurs cibles de la propriété, une par état, dans l'unité de la propriété"
+    )
+    solver_lower_description: str = (
+        "Borne inférieure de recherche de l'entrée manquante (domaine du moteur "
+        "hyland_wexler par défaut)"
+    )
+    solver_upper_description: str = (
+        "Borne supérieure de recherche de l'entrée manquante (domaine du moteur "
+        "hyland_wexler, limité à la saturation à la pression, par défaut)"
+    )
+    solver_tolerance_description: str = (
+        "Largeur d'encadrement visée, dans l'unité de l'entrée recherchée"
+    )
+    solver_max_iterations_description: str = "Nombre maximal d'itérations par état"
+    solver_unknown_description: str = "Entrée recherchée"
+    solver_properties_description: str = (
+        "Propriétés des états trouvés, entrées comprises, None sans solution"
+    )
+    solver_residuals_description: str = (
+        "Écarts entre la propriété obtenue et la cible, dans l'unité de la propriété"
+    )
+    solver_iterations_description: str = "Itérations effectuées par état"
+    solver_converged_description: str = "États dont la tolérance est atteinte"
+    solver_statistics_description: str = "Statistiques de convergence du lot"
+    solver_states_description: str = "Nombre d'états du lot"
+    solver_converged_count_description: str = "Nombre d'états convergés"
+    solver_mean_iterations_description: str = (
+        "Nombre moyen d'itérations des états résolus"
+    )
+    solver_max_iterations_count_description: str = "Nombre maximal d'itérations"
+    solver_max_residual_description: str = "Plus grand écart absolu à la cible"
+
+    # air process
+    process_max_streams: int = 20
+    process_max_steps: int = 20
+    process_steam_enthalpy: float = 2676000
+    process_latent_heat: float = 2501000
+    process_streams_description: str = (
+        "Flux entrants, définis par deux entrées indépendantes comme pour "
+        "'get_ha_props' ; plusieurs flux sont d'abord mélangés"
+    )
+    process_steps_description: str = "Transformations appliquées dans l'ordre"
+    process_mass_flow_rate_description: str = "Débit d'air sec en [kg/s]"
+    process_kind_description: str = (
+        "Transformation : 'sensible' (température sèche de sortie), 'coil' "
+        "(apparatus_dew_point et bypass_factor), 'steam_humidification' ou "
+        "'adiabatic_humidification' (humidité relative ou absolue de sortie)"
+    )
+    process_tdb_description: str = "Température sèche de sortie en [°C]"
+    process_rh_description: str = "Humidité relative de sortie en [%]"
+    process_humidity_ratio_description: str = (
+        "Humidité absolue de sortie [kg eau/kg air sec]"
+    )
+    process_adp_description: str = (
+        "Point de rosée de l'appareil (température de surface de la batterie) en [°C]"
+    )
+    process_bypass_factor_description: str = (
+        "Facteur de bypass de la batterie, fraction d'air non traité"
+    )
+    process_inlets_description: str = "Propriétés des flux entrants"
+    process_outlet_description: str = "Propriétés de l'état de sortie"
+    process_sensible_load_description: str = (
+        "Puissance sensible apportée à l'air en [W] (négative pour un refroidissement)"
+    )
+    process_latent_load_description: str = "Puissance latente apportée à l'air en [W] (négative pour une déshumidification)"
+    process_total_load_description: str = "Puissance totale apportée à l'air en [W]"
+    process_water_flow_rate_description: str = (
+        "Débit d'eau en [kg/s], positif pour une humidification, négatif pour "
+        "les condensats"
+    )
+    process_step_parameters_message: str = "Paramètres requis pour la transformation"
+    process_mixing_step_message: str = (
+        "Le mélange s'applique aux flux entrants ('streams'), pas aux transformations"
+    )
+    process_condensation_message: str = (
+        "Refroidissement sous le point de rosée : utiliser une transformation 'coil'"
+    )
+    process_fog_message: str = "Le mélange est sursaturé (brouillard)"
+    process_dehumidification_message: str = (
+        "Une humidification ne peut pas réduire l'humidité"
+    )
+
+    # weather file
+    weather_file_description: str = "Fichier météo horaire (EPW ou CSV)"
+    weather_file_format_description: str = (
+        "Format du fichier : 'epw' (EnergyPlus Weather) ou 'csv' (en-tête avec "
+        "deux colonnes d'entrée parmi celles de 'get_ha_props' et 'pressure' optionnelle)"
+    )
+    weather_output_format_description: str = (
+        "Format de sortie : 'csv' ou 'ndjson' (un objet JSON par heure)"
+    )
+    weather_pressure_description: str = (
+        "Pression absolue en [Pa] utilisée lorsque le fichier n'en fournit pas ; "
+        "à défaut, déduite de 'altitude' ou de 'project_id' comme pour 'get_ha_props'"
+    )
+    weather_epw_header_lines: int = 8
+    weather_epw_invalid_message: str = (
+        "Fichier EPW invalide : la première ligne doit commencer par LOCATION"
+    )
+    weather_csv_empty_message: str = (
+        "Fichier CSV vide : une ligne d'en-tête est requise"
+    )
+    weather_csv_missing_inputs_message: str = (
+        "Fichier CSV invalide : l'en-tête doit nommer deux colonnes d'entrée "
+        "indépendantes parmi celles de 'get_ha_props'"
+    )
+    weather_invalid_value_message: str = (
+        "Valeur manquante ou invalide dans la colonne {column} à la ligne {row}"
+    )
+
+    # climate analytics
+    analytics_bin_width_default_value: float = 2
+    analytics_bin_width_le: float = 20
+    analytics_bin_width_description: str = (
+        "Largeur des classes de température sèche en [K]"
+    )
+    analytics_heating_base_default_value: float = 18
+    analytics_heating_base_description: str = (
+        "Température de base des degrés-jours de chauffage en [°C]"
+    )
+    analytics_cooling_base_default_value: float = 18
+    analytics_cooling_base_description: str = (
+        "Température de base des degrés-jours de refroidissement en [°C]"
+    )
+    analytics_enthalpy_base_default_value: float = 47500
+    analytics_enthalpy_base_description: str = (
+        "Enthalpie de base des enthalpies-heures en [J/kg] "
+        "(air intérieur à 24 °C et 50 % par défaut)"
+    )
+    analytics_hours_description: str = "Nombre d'heures valides agrégées"
+    analytics_invalid_hours_description: str = (
+        "Nombre d'heures ignorées (données manquantes ou hors domaine)"
+    )
+    analytics_bins_description: str = (
+        "Heures par classe de température sèche et température humide moyenne "
+        "coïncidente, classes non vides par température croissante"
+    )
+    analytics_bin_tdb_min_description: str = (
+        "Borne inférieure (incluse) de la classe en [°C]"
+    )
+    analytics_bin_tdb_max_description: str = (
+        "Borne supérieure (exclue) de la classe en [°C]"
+    )
+    analytics_bin_hours_description: str = "Nombre d'heures dans la classe"
+    analytics_bin_mcwb_description: str = (
+        "Température humide moyenne coïncidente en [°C]"
+    )
+    analytics_heating_degree_days_description: str = (
+        "Degrés-jours de chauffage, cumulés heure par heure, en [K.j]"
+    )
+    analytics_cooling_degree_days_description: str = (
+        "Degrés-jours de refroidissement, cumulés heure par heure, en [K.j]"
+    )
+    analytics_heating_enthalpy_hours_description: str = (
+        "Enthalpies-heures sous l'enthalpie de base en [J.h/kg]"
+    )
+    analytics_cooling_enthalpy_hours_description: str = (
+        "Enthalpies-heures au-dessus de l'enthalpie de base en [J.h/kg]"
+    )
+
+    # cache
+    cache_hits_description: str = "Nombre de requêtes servies par le cache"
+    cache_misses_description: str = "Nombre de requêtes absentes ou expirées du cache"
+    cache_evictions_description: str = (
+        "Nombre d'états retirés du cache pour libérer de la place"
+    )
+    cache_size_description: str = "Nombre d'états présents dans le cache"
+    cache_max_size_description: str = "Nombre maximal d'états dans le cache"
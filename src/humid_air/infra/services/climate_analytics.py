@@ -0,0 +1,114 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from humid_air.domain.entities.climate_analytics_entity import (
+    ClimateAnalyticsEntity,
+    ClimateBinEntity,
+)
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchEntity
+from humid_air.domain.services.climate_analytics_interface import (
+    ClimateAnalyticsInterface,
+)
+from humid_air.infra.services.hyland_wexler_engine import FloatArray
+
+HOURS_PER_DAY = 24
+TEMPERATURE_DECIMALS = 2
+AGGREGATE_DECIMALS = 1
+
+
+def _column(batch: HumidAirBatchEntity, name: str) -> FloatArray:
+    """Colonne d'un lot en tableau NumPy, NaN pour les états en erreur"""
+    return np.asarray(batch.properties[name], dtype=np.float64)
+
+
+class NumpyClimateAnalytics(ClimateAnalyticsInterface):
+    """Agrégation vectorisée de séries climatiques horaires
+
+    Chaque lot est réduit en une passe NumPy (écarts aux bases, classement
+    par np.unique) puis cumulé : seuls les totaux et les compteurs des
+    classes sont conservés entre deux lots.
+
+    Args:
+        ClimateAnalyticsInterface (ClimateAnalyticsInterface): Interface d'agrégation
+    """
+
+    def aggregate(
+        self,
+        batches: Iterable[HumidAirBatchEntity],
+        bin_width: float,
+        heating_base_temperature: float,
+        cooling_base_temperature: float,
+        enthalpy_base: float,
+    ) -> ClimateAnalyticsEntity:
+        hours = invalid_hours = 0
+        heating_degree_hours = cooling_degree_hours = 0.0
+        heating_enthalpy_hours = cooling_enthalpy_hours = 0.0
+        bin_hours: dict[int, int] = {}
+        bin_wet_bulb_sums: dict[int, float] = {}
+
+        for batch in batches:
+            temp_dry_bulb = _column(batch, "temp_dry_bulb")
+            temp_wet_bulb = _column(batch, "temp_wet_bulb")
+            enthalpy = _column(batch, "enthalpy_per_humid_air")
+            valid = (
+                np.isfinite(temp_dry_bulb)
+                & np.isfinite(temp_wet_bulb)
+                & np.isfinite(enthalpy)
+            )
+            invalid_hours += int(valid.size - np.count_nonzero(valid))
+            temp_dry_bulb = temp_dry_bulb[valid]
+            temp_wet_bulb = temp_wet_bulb[valid]
+            enthalpy = enthalpy[valid]
+            hours += temp_dry_bulb.size
+
+            heating_degree_hours += float(
+                np.maximum(heating_base_temperature - temp_dry_bulb, 0).sum()
+            )
+            cooling_degree_hours += float(
+                np.maximum(temp_dry_bulb - cooling_base_temperature, 0).sum()
+            )
+            heating_enthalpy_hours += float(
+                np.maximum(enthalpy_base - enthalpy, 0).sum()
+            )
+            cooling_enthalpy_hours += float(
+                np.maximum(enthalpy - enthalpy_base, 0).sum()
+            )
+
+            keys, inverse, counts = np.unique(
+                np.floor(temp_dry_bulb / bin_width).astype(np.int64),
+                return_inverse=True,
+                return_counts=True,
+            )
+            wet_bulb_sums = np.bincount(inverse, weights=temp_wet_bulb)
+            for key, count, wet_bulb_sum in zip(
+                keys.tolist(), counts.tolist(), wet_bulb_sums.tolist(), strict=True
+            ):
+                bin_hours[key] = bin_hours.get(key, 0) + count
+                bin_wet_bulb_sums[key] = bin_wet_bulb_sums.get(key, 0.0) + wet_bulb_sum
+
+        return ClimateAnalyticsEntity(
+            hours=hours,
+            invalid_hours=invalid_hours,
+            bins=[
+                ClimateBinEntity(
+                    temp_dry_bulb_min=round(key * bin_width, TEMPERATURE_DECIMALS),
+                    temp_dry_bulb_max=round(
+                        (key + 1) * bin_width, TEMPERATURE_DECIMALS
+                    ),
+                    hours=bin_hours[key],
+                    mean_coincident_wet_bulb=round(
+                        bin_wet_bulb_sums[key] / bin_hours[key], TEMPERATURE_DECIMALS
+                    ),
+                )
+                for key in sorted(bin_hours)
+            ],
+            heating_degree_days=round(
+                heating_degree_hours / HOURS_PER_DAY, AGGREGATE_DECIMALS
+            ),
+            cooling_degree_days=round(
+                cooling_degree_hours / HOURS_PER_DAY, AGGREGATE_DECIMALS
+            ),
+            heating_enthalpy_hours=round(heating_enthalpy_hours, AGGREGATE_DECIMALS),
+            cooling_enthalpy_hours=round(cooling_enthalpy_hours, AGGREGATE_DECIMALS),
+        )
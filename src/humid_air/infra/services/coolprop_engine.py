@@ -0,0 +1,66 @@
+from humid_air.domain.entities.humid_air_batch_entity import (
+    HumidAirBatchEntity,
+    HumidAirBatchErrorEntity,
+)
+from humid_air.domain.entities.humid_air_entity import (
+    HUMID_AIR_PROPERTY_NAMES,
+    HumidAirEntity,
+)
+from humid_air.domain.services.humid_air_engine_interface import (
+    HumidAirEngineInterface,
+)
+
+
+class CoolPropHumidAirEngine(HumidAirEngineInterface):
+    """Moteur de calcul de l'air humide avec CoolProp (ASHRAE RP-1485)
+
+    Résout chaque état avec pyfluids via HumidAirEntity. C'est le moteur de
+    référence : toutes les propriétés sont disponibles.
+
+    Args:
+        HumidAirEngineInterface (HumidAirEngineInterface): Interface des moteurs de calcul
+    """
+
+    def compute(
+        self,
+        pressure: list[float],
+        temp_dry_bulb: list[float],
+        relative_humidity: list[float],
+        fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES,
+        rounded: bool = True,
+    ) -> HumidAirBatchEntity:
+        """Calcule les propriétés d'un lot d'états, état par état
+
+        Args:
+            pressure (list[float]): Pressions absolues en [Pa]
+            temp_dry_bulb (list[float]): Températures sèches en [°C]
+            relative_humidity (list[float]): Humidités relatives en [%]
+            fields (tuple[str, ...], optional): Propriétés à calculer, toutes par défaut
+            rounded (bool, optional): Arrondir selon HUMID_AIR_PROPERTY_DECIMALS,
+                sinon valeurs brutes du moteur. Defaults to True.
+
+        Returns:
+            HumidAirBatchEntity: Propriétés demandées en colonnes et erreurs par état
+        """
+        columns: dict[str, list[float | None]] = {name: [] for name in fields}
+        errors: list[HumidAirBatchErrorEntity] = []
+        states = zip(pressure, temp_dry_bulb, relative_humidity, strict=True)
+        for index, (state_pressure, state_tdb, state_rh) in enumerate(states):
+            try:
+                properties: dict[str, float | None] = dict(
+                    HumidAirEntity(
+                        pressure=state_pressure,
+                        temp_dry_bulb=state_tdb,
+                        relative_humidity=state_rh,
+                    ).get_properties(fields, rounded=rounded)
+                )
+            except ValueError as e:
+                errors.append(
+                    HumidAirBatchErrorEntity(index=index, field="state", message=str(e))
+                )
+                properties = dict.fromkeys(fields)
+
+            for name, column in columns.items():
+                column.append(properties[name])
+
+        return HumidAirBatchEntity(properties=columns, errors=errors)
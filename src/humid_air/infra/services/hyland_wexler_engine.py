@@ -0,0 +1,396 @@
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+from humid_air.domain.entities.humid_air_batch_entity import (
+    HumidAirBatchEntity,
+    HumidAirBatchErrorEntity,
+)
+from humid_air.domain.entities.humid_air_entity import (
+    HUMID_AIR_PROPERTY_DECIMALS,
+    HUMID_AIR_PROPERTY_NAMES,
+)
+from humid_air.domain.services.humid_air_engine_interface import (
+    HumidAirEngineInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+FloatArray = npt.NDArray[np.float64]
+
+# ASHRAE Fundamentals (2017), chapitre 1, éq. 5 (glace) et éq. 6 (eau liquide)
+ICE_COEFFICIENTS = (
+    -5.6745359e03,
+    6.3925247e00,
+    -9.6778430e-03,
+    6.2215701e-07,
+    2.0747825e-09,
+    -9.4840240e-13,
+    4.1635019e00,
+)
+WATER_COEFFICIENTS = (
+    -5.8002206e03,
+    1.3914993e00,
+    -4.8640239e-02,
+    4.1764768e-05,
+    -1.4452093e-08,
+    0.0,
+    6.5459673e00,
+)
+TRIPLE_POINT_TEMPERATURE = 273.15  # [K]
+MOLAR_MASS_RATIO = 0.621945  # Mw / Mda [-]
+DRY_AIR_GAS_CONSTANT = 287.042  # [J/kg.K]
+NEWTON_ITERATIONS = 30
+NEWTON_TOLERANCE = 1e-10  # [K]
+BISECTION_ITERATIONS = 50
+CORRELATION_TDB_MIN = -100.0  # borne basse des corrélations de saturation [°C]
+CORRELATION_TDB_MAX = 200.0  # borne haute des corrélations de saturation [°C]
+
+
+class HylandWexlerHumidAirEngine(HumidAirEngineInterface):
+    """Moteur de calcul vectorisé de l'air humide (ASHRAE, Hyland-Wexler)
+
+    Applique les relations des gaz parfaits d'ASHRAE Fundamentals (chapitre 1)
+    avec la pression de saturation de Hyland-Wexler, sur des tableaux NumPy.
+    Seules les propriétés psychrométriques sont calculées : les propriétés de
+    transport, l'entropie, la capacité thermique et le facteur de
+    compressibilité restent à None.
+
+    Les états hors du domaine validé face à CoolProp, de -60 à 90 °C et de 50
+    à 200 kPa sous la température d'ébullition de l'eau, sont signalés en
+    erreur. Écarts maximaux sur ce domaine : 1,5 % sur la pression partielle,
+    l'humidité absolue, le volume spécifique et la masse volumique,
+    300 J/kg + 0,7 % sur l'enthalpie, 0,15 K sur les températures de rosée et
+    de bulbe humide. À moins de 1 K de 0 °C, où les équations 33 et 35
+    d'ASHRAE se recouvrent, la température humide peut s'écarter de 1 K.
+
+    Args:
+        HumidAirEngineInterface (HumidAirEngineInterface): Interface des moteurs de calcul
+    """
+
+    def compute(
+        self,
+        pressure: list[float],
+        temp_dry_bulb: list[float],
+        relative_humidity: list[float],
+        fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES,
+        rounded: bool = True,
+    ) -> HumidAirBatchEntity:
+        """Calcule les propriétés d'un lot d'états en une passe vectorisée
+
+        Les températures de rosée et de bulbe humide, résolues itérativement,
+        ne sont calculées que si elles sont demandées.
+
+        Args:
+            pressure (list[float]): Pressions absolues en [Pa]
+            temp_dry_bulb (list[float]): Températures sèches en [°C]
+            relative_humidity (list[float]): Humidités relatives en [%]
+            fields (tuple[str, ...], optional): Propriétés à calculer, toutes par défaut
+            rounded (bool, optional): Arrondir selon HUMID_AIR_PROPERTY_DECIMALS,
+                sinon valeurs brutes du moteur. Defaults to True.
+
+        Returns:
+            HumidAirBatchEntity: Propriétés demandées en colonnes et erreurs par état
+        """
+        p = np.asarray(pressure, dtype=np.float64)
+        t = np.asarray(temp_dry_bulb, dtype=np.float64)
+        rh = np.asarray(relative_humidity, dtype=np.float64)
+
+        in_range = (
+            (t >= HumidAirSettings.hyland_wexler_tdb_ge)
+            & (t <= HumidAirSettings.hyland_wexler_tdb_le)
+            & (p >= HumidAirSettings.hyland_wexler_pressure_ge)
+            & (p <= HumidAirSettings.hyland_wexler_pressure_le)
+        )
+        # au-delà de l'ébullition à la pression de l'état, la température
+        # humide n'est plus encadrée
+        in_range &= t < dew_point_temperature(np.where(in_range, p, 101325.0))
+        t_valid = np.where(in_range, t, 20.0)
+        pw = rh / 100 * saturation_pressure(t_valid + TRIPLE_POINT_TEMPERATURE)
+        in_range &= pw < p
+        pw = np.where(in_range, pw, 0.0)
+
+        computed = psychrometric_properties(p, t_valid, pw, fields)
+        computed.update(pressure=p, temp_dry_bulb=t, relative_humidity=rh)
+        return HumidAirBatchEntity(
+            properties=self._to_columns(computed, in_range, fields, rounded),
+            errors=[
+                HumidAirBatchErrorEntity(
+                    index=int(index),
+                    field="state",
+                    message=HumidAirSettings.hyland_wexler_out_of_range_message,
+                )
+                for index in np.flatnonzero(~in_range)
+            ],
+        )
+
+    def _to_columns(
+        self,
+        computed: dict[str, FloatArray],
+        in_range: npt.NDArray[np.bool_],
+        fields: tuple[str, ...],
+        rounded: bool = True,
+    ) -> dict[str, list[float | None]]:
+        """Arrondit les résultats et les convertit en colonnes JSON
+
+        Args:
+            computed (dict[str, FloatArray]): Propriétés calculées
+            in_range (npt.NDArray[np.bool_]): Masque des états valides
+            fields (tuple[str, ...]): Propriétés demandées
+            rounded (bool, optional): Arrondir selon HUMID_AIR_PROPERTY_DECIMALS.
+                Defaults to True.
+
+        Returns:
+            dict[str, list[float | None]]: Colonnes, None pour les valeurs indisponibles
+        """
+        size = len(in_range)
+        columns: dict[str, list[float | None]] = {}
+        for name in fields:
+            if name not in computed:
+                columns[name] = [None] * size
+                continue
+            values = computed[name]
+            if rounded:
+                values = np.round(values, HUMID_AIR_PROPERTY_DECIMALS.get(name, 15))
+            available = in_range & np.isfinite(values)
+            columns[name] = [
+                float(value) if ok else None
+                for value, ok in zip(values.tolist(), available.tolist(), strict=True)
+            ]
+        return columns
+
+
+def psychrometric_properties(
+    pressure: FloatArray,
+    temp_dry_bulb: FloatArray,
+    partial_pressure: FloatArray,
+    fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES,
+) -> dict[str, FloatArray]:
+    """Propriétés psychrométriques d'états dont la pression partielle est connue
+
+    Les températures de rosée et de bulbe humide, résolues itérativement,
+    ne sont calculées que si elles sont demandées. Les valeurs ne sont ni
+    arrondies ni contrôlées : un état hors domaine donne des valeurs non finies.
+
+    Args:
+        pressure (FloatArray): Pressions absolues en [Pa]
+        temp_dry_bulb (FloatArray): Températures sèches en [°C]
+        partial_pressure (FloatArray): Pressions partielles de vapeur en [Pa]
+        fields (tuple[str, ...], optional): Propriétés demandées, toutes par défaut
+
+    Returns:
+        dict[str, FloatArray]: Propriétés par nom, hors pression et entrées
+    """
+    w = MOLAR_MASS_RATIO * partial_pressure / (pressure - partial_pressure)
+    specific_volume = (
+        DRY_AIR_GAS_CONSTANT
+        * (temp_dry_bulb + TRIPLE_POINT_TEMPERATURE)
+        * (1 + 1.607858 * w)
+        / pressure
+        / (1 + w)
+    )
+    computed: dict[str, FloatArray] = {
+        "partial_pressure_of_water_vapor": partial_pressure,
+        "humidity_ratio": w,
+        "enthalpy_per_humid_air": moist_air_enthalpy(temp_dry_bulb, w) / (1 + w),
+        "specific_volume_per_unit_humid_air": specific_volume,
+        "density_per_unit_humid_air": 1 / specific_volume,
+    }
+    if "temp_dew_point" in fields or "temp_wet_bulb" in fields:
+        temp_dew_point = dew_point_temperature(partial_pressure)
+        computed["temp_dew_point"] = temp_dew_point
+        if "temp_wet_bulb" in fields:
+            computed["temp_wet_bulb"] = wet_bulb_temperature(
+                pressure, temp_dry_bulb, w, temp_dew_point
+            )
+    return computed
+
+
+def _log_saturation_pressure(
+    temperature: FloatArray, coefficients: tuple[float, ...]
+) -> FloatArray:
+    c1, c2, c3, c4, c5, c6, c7 = coefficients
+    t = temperature
+    return c1 / t + c2 + c3 * t + c4 * t**2 + c5 * t**3 + c6 * t**4 + c7 * np.log(t)
+
+
+def _log_saturation_pressure_derivative(
+    temperature: FloatArray, coefficients: tuple[float, ...]
+) -> FloatArray:
+    c1, _, c3, c4, c5, c6, c7 = coefficients
+    t = temperature
+    return -c1 / t**2 + c3 + 2 * c4 * t + 3 * c5 * t**2 + 4 * c6 * t**3 + c7 / t
+
+
+def saturation_pressure(temperature: FloatArray) -> FloatArray:
+    """Pression de saturation de Hyland-Wexler, sur glace sous 0 °C
+
+    Args:
+        temperature (FloatArray): Températures en [K]
+
+    Returns:
+        FloatArray: Pressions de saturation en [Pa]
+    """
+    over_ice = _log_saturation_pressure(temperature, ICE_COEFFICIENTS)
+    over_water = _log_saturation_pressure(temperature, WATER_COEFFICIENTS)
+    return np.exp(
+        np.where(temperature < TRIPLE_POINT_TEMPERATURE, over_ice, over_water)
+    )
+
+
+def moist_air_enthalpy(
+    temp_dry_bulb: FloatArray, humidity_ratio: FloatArray
+) -> FloatArray:
+    """Enthalpie de l'air humide par kg d'air sec (ASHRAE éq. 32)
+
+    Args:
+        temp_dry_bulb (FloatArray): Températures sèches en [°C]
+        humidity_ratio (FloatArray): Humidités absolues en [kg eau/kg air sec]
+
+    Returns:
+        FloatArray: Enthalpies en [J/kg air sec]
+    """
+    return 1000 * (
+        1.006 * temp_dry_bulb + humidity_ratio * (2501 + 1.86 * temp_dry_bulb)
+    )
+
+
+def dew_point_temperature(partial_pressure: FloatArray) -> FloatArray:
+    """Inverse la pression de saturation par la méthode de Newton
+
+    Sous le point triple, la température retournée est le point de givre,
+    comme pour CoolProp.
+
+    Args:
+        partial_pressure (FloatArray): Pressions partielles de vapeur en [Pa]
+
+    Returns:
+        FloatArray: Températures de rosée en [°C], NaN pour un air sec
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        target = np.log(partial_pressure)
+        triple_point = np.log(saturation_pressure(np.array([TRIPLE_POINT_TEMPERATURE])))
+        over_ice = target < triple_point
+        temperature = np.full_like(partial_pressure, TRIPLE_POINT_TEMPERATURE)
+        for _ in range(NEWTON_ITERATIONS):
+            residual = (
+                np.where(
+                    over_ice,
+                    _log_saturation_pressure(temperature, ICE_COEFFICIENTS),
+                    _log_saturation_pressure(temperature, WATER_COEFFICIENTS),
+                )
+                - target
+            )
+            slope = np.where(
+                over_ice,
+                _log_saturation_pressure_derivative(temperature, ICE_COEFFICIENTS),
+                _log_saturation_pressure_derivative(temperature, WATER_COEFFICIENTS),
+            )
+            step = residual / slope
+            temperature = temperature - step
+            if not np.any(np.abs(step) > NEWTON_TOLERANCE):
+                break
+        return np.where(
+            np.isfinite(target), temperature - TRIPLE_POINT_TEMPERATURE, np.nan
+        )
+
+
+def wet_bulb_humidity_ratio(
+    pressure: FloatArray,
+    temp_dry_bulb: FloatArray,
+    temp_wet_bulb: FloatArray,
+    enhancement_factor: FloatArray | float = 1.0,
+) -> FloatArray:
+    """Humidité absolue correspondant à une température humide (ASHRAE éq. 33 et 35)
+
+    Args:
+        pressure (FloatArray): Pressions absolues en [Pa]
+        temp_dry_bulb (FloatArray): Températures sèches en [°C]
+        temp_wet_bulb (FloatArray): Températures humides en [°C]
+        enhancement_factor (FloatArray | float, optional): Facteur d'augmentation
+            appliqué à la pression de saturation (1 pour les gaz parfaits)
+
+    Returns:
+        FloatArray: Humidités absolues en [kg eau/kg air sec]
+    """
+    pws = enhancement_factor * saturation_pressure(
+        temp_wet_bulb + TRIPLE_POINT_TEMPERATURE
+    )
+    ws = MOLAR_MASS_RATIO * pws / (pressure - pws)
+    cooling = 1.006 * (temp_dry_bulb - temp_wet_bulb)
+    over_water = ((2501 - 2.326 * temp_wet_bulb) * ws - cooling) / (
+        2501 + 1.86 * temp_dry_bulb - 4.186 * temp_wet_bulb
+    )
+    over_ice = ((2830 - 0.24 * temp_wet_bulb) * ws - cooling) / (
+        2830 + 1.86 * temp_dry_bulb - 2.1 * temp_wet_bulb
+    )
+    return np.where(temp_wet_bulb >= 0, over_water, over_ice)
+
+
+def wet_bulb_temperature(
+    pressure: FloatArray,
+    temp_dry_bulb: FloatArray,
+    humidity_ratio: FloatArray,
+    temp_dew_point: FloatArray,
+) -> FloatArray:
+    """Résout la température humide par dichotomie entre rosée et sèche
+
+    La borne haute est aussi limitée à la température d'ébullition à la
+    pression de l'état : au-delà, l'air ne peut plus être saturé et
+    l'humidité absolue de saturation n'est plus définie. Les équations 33 et
+    35 ne se raccordent pas à 0 °C : lorsque les deux branches admettent une
+    solution, celle sur glace est retenue.
+
+    Args:
+        pressure (FloatArray): Pressions absolues en [Pa]
+        temp_dry_bulb (FloatArray): Températures sèches en [°C]
+        humidity_ratio (FloatArray): Humidités absolues en [kg eau/kg air sec]
+        temp_dew_point (FloatArray): Températures de rosée en [°C]
+
+    Returns:
+        FloatArray: Températures humides en [°C]
+    """
+    lower: FloatArray = np.where(
+        np.isfinite(temp_dew_point),
+        temp_dew_point,
+        CORRELATION_TDB_MIN,
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        upper: FloatArray = np.fmin(temp_dry_bulb, dew_point_temperature(pressure))
+        below_ice_junction = humidity_ratio <= wet_bulb_humidity_ratio(
+            pressure, temp_dry_bulb, np.full_like(temp_dry_bulb, -0.0 - 1e-12)
+        )
+        upper = np.where(below_ice_junction, np.fmin(upper, 0.0), upper)
+        for _ in range(BISECTION_ITERATIONS):
+            middle = (lower + upper) / 2
+            too_humid = (
+                wet_bulb_humidity_ratio(pressure, temp_dry_bulb, middle)
+                > humidity_ratio
+            )
+            upper = np.where(too_humid, middle, upper)
+            lower = np.where(too_humid, lower, middle)
+    return (lower + upper) / 2
+
+
+def bisect_decreasing(
+    func: Callable[[FloatArray], FloatArray], lower: FloatArray, upper: FloatArray
+) -> FloatArray:
+    """Racine d'une fonction décroissante, bornée à l'intervalle [lower, upper]
+
+    Args:
+        func (Callable[[FloatArray], FloatArray]): Fonction décroissante, vectorisée
+        lower (FloatArray): Bornes inférieures
+        upper (FloatArray): Bornes supérieures
+
+    Returns:
+        FloatArray: Racines, ou borne de l'intervalle si la fonction n'y change pas de signe
+    """
+    lower = lower.astype(np.float64)
+    upper = upper.astype(np.float64)
+    with np.errstate(invalid="ignore", over="ignore"):
+        for _ in range(BISECTION_ITERATIONS):
+            middle = (lower + upper) / 2
+            positive = func(middle) > 0
+            lower = np.where(positive, middle, lower)
+            upper = np.where(positive, upper, middle)
+    return (lower + upper) / 2
@@ -0,0 +1,344 @@
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+from humid_air.domain.services.humid_air_input_converter_interface import (
+    HumidAirInputConverterInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+from humid_air.infra.services.hyland_wexler_engine import (
+    MOLAR_MASS_RATIO,
+    TRIPLE_POINT_TEMPERATURE,
+    FloatArray,
+    dew_point_temperature,
+    saturation_pressure,
+    wet_bulb_humidity_ratio,
+)
+
+# tolérance sur l'humidité relative d'un état saturé, en [%], à hauteur de la
+# précision de la conversion
+SATURATION_TOLERANCE = 0.5
+# résidu maximal d'une résolution itérative, en [kg eau/kg air sec]
+RESIDUAL_TOLERANCE = 1e-9
+REGULA_FALSI_ITERATIONS = 30
+BOILING_MARGIN = 0.9
+
+
+class HylandWexlerInputConverter(HumidAirInputConverterInterface):
+    """Convertisseur vectorisé des couples d'entrées (ASHRAE, Hyland-Wexler)
+
+    Les relations d'ASHRAE Fundamentals (chapitre 1) sont inversées
+    directement dès que la température sèche ou l'humidité absolue est connue.
+    Seuls les couples humidité relative + température humide et humidité
+    relative + enthalpie sont résolus itérativement (fausse position de type
+    Illinois), en une passe sur tout le lot.
+
+    Le facteur d'augmentation de Buck (1996) est appliqué à la pression de
+    saturation, comme dans CoolProp. Face à CoolProp, l'état converti est
+    décalé au plus de 0,25 K en température sèche et de 0,4 % en humidité
+    relative. Seule l'enthalpie aux basses températures, où l'humidité
+    absolue est très faible, donne une humidité relative moins précise.
+
+    Args:
+        HumidAirInputConverterInterface (HumidAirInputConverterInterface): Interface des convertisseurs
+    """
+
+    def to_dry_bulb_and_relative_humidity(
+        self, pressure: list[float], inputs: dict[str, list[float]]
+    ) -> tuple[list[float | None], list[float | None]]:
+        """Convertit un lot d'états en températures sèches et humidités relatives
+
+        Args:
+            pressure (list[float]): Pressions absolues en [Pa]
+            inputs (dict[str, list[float]]): Deux entrées, en colonnes, indexées par leur nom
+
+        Returns:
+            tuple[list[float | None], list[float | None]]: Températures sèches en [°C]
+                et humidités relatives en [%], None si les entrées ne
+                correspondent à aucun état
+        """
+        p = np.asarray(pressure, dtype=np.float64)
+        values = {
+            name: np.asarray(column, dtype=np.float64)
+            for name, column in inputs.items()
+        }
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            temp_dry_bulb, relative_humidity = self._convert(p, values)
+            valid = (
+                np.isfinite(temp_dry_bulb)
+                & np.isfinite(relative_humidity)
+                & (relative_humidity >= HumidAirSettings.rh_ge)
+                & (relative_humidity <= HumidAirSettings.rh_le + SATURATION_TOLERANCE)
+            )
+        relative_humidity = np.minimum(relative_humidity, HumidAirSettings.rh_le)
+        return (
+            [
+                value if ok else None
+                for value, ok in zip(
+                    temp_dry_bulb.tolist(), valid.tolist(), strict=True
+                )
+            ],
+            [
+                value if ok else None
+                for value, ok in zip(
+                    relative_humidity.tolist(), valid.tolist(), strict=True
+                )
+            ],
+        )
+
+    def _convert(
+        self, pressure: FloatArray, values: dict[str, FloatArray]
+    ) -> tuple[FloatArray, FloatArray]:
+        """Résout la température sèche puis l'humidité relative
+
+        Args:
+            pressure (FloatArray): Pressions absolues en [Pa]
+            values (dict[str, FloatArray]): Deux entrées indexées par leur nom
+
+        Returns:
+            tuple[FloatArray, FloatArray]: Températures sèches et humidités relatives, NaN si impossibles
+        """
+        if "temp_dry_bulb" in values:
+            temp_dry_bulb = values["temp_dry_bulb"]
+            if "relative_humidity" in values:
+                return temp_dry_bulb, values["relative_humidity"]
+            (name,) = set(values) - {"temp_dry_bulb"}
+            humidity_ratio = self._humidity_ratio_at(
+                pressure, temp_dry_bulb, name, values[name]
+            )
+            return temp_dry_bulb, _relative_humidity(
+                pressure, temp_dry_bulb, humidity_ratio
+            )
+
+        if "humidity_ratio" in values or "temp_dew_point" in values:
+            humidity_ratio = (
+                values["humidity_ratio"]
+                if "humidity_ratio" in values
+                else _saturation_humidity_ratio(pressure, values["temp_dew_point"])
+            )
+            temp_dry_bulb = self._dry_bulb_at(pressure, humidity_ratio, values)
+            return temp_dry_bulb, values.get(
+                "relative_humidity",
+                _relative_humidity(pressure, temp_dry_bulb, humidity_ratio),
+            )
+
+        relative_humidity = values["relative_humidity"]
+        if "temp_wet_bulb" in values:
+            temp_wet_bulb = values["temp_wet_bulb"]
+            lower = temp_wet_bulb
+
+            def residual(t: FloatArray) -> FloatArray:
+                return wet_bulb_humidity_ratio(
+                    pressure,
+                    t,
+                    temp_wet_bulb,
+                    _enhancement_factor(pressure, temp_wet_bulb),
+                ) - _humidity_ratio(pressure, t, relative_humidity)
+
+        else:
+            enthalpy = values["enthalpy_per_humid_air"]
+            lower = np.full_like(pressure, HumidAirSettings.hyland_wexler_tdb_ge)
+
+            def residual(t: FloatArray) -> FloatArray:
+                return _enthalpy_humidity_ratio(t, enthalpy) - _humidity_ratio(
+                    pressure, t, relative_humidity
+                )
+
+        # borne haute sous l'ébullition à cette humidité relative, pour un
+        # résidu fini
+        upper = np.fmin(
+            HumidAirSettings.hyland_wexler_tdb_le,
+            dew_point_temperature(BOILING_MARGIN * pressure * 100 / relative_humidity),
+        )
+        temp_dry_bulb, converged = _regula_falsi(residual, lower, upper)
+        return np.where(converged, temp_dry_bulb, np.nan), relative_humidity
+
+    def _humidity_ratio_at(
+        self,
+        pressure: FloatArray,
+        temp_dry_bulb: FloatArray,
+        name: str,
+        value: FloatArray,
+    ) -> FloatArray:
+        """Humidité absolue à température sèche connue (ASHRAE éq. 22, 32, 33 et 35)
+
+        Args:
+            pressure (FloatArray): Pressions absolues en [Pa]
+            temp_dry_bulb (FloatArray): Températures sèches en [°C]
+            name (str): Nom de la seconde entrée
+            value (FloatArray): Valeurs de la seconde entrée
+
+        Returns:
+            FloatArray: Humidités absolues en [kg eau/kg air sec]
+        """
+        if name == "humidity_ratio":
+            return value
+        if name == "temp_dew_point":
+            return _saturation_humidity_ratio(pressure, value)
+        if name == "temp_wet_bulb":
+            return wet_bulb_humidity_ratio(
+                pressure, temp_dry_bulb, value, _enhancement_factor(pressure, value)
+            )
+        return _enthalpy_humidity_ratio(temp_dry_bulb, value)
+
+    def _dry_bulb_at(
+        self,
+        pressure: FloatArray,
+        humidity_ratio: FloatArray,
+        values: dict[str, FloatArray],
+    ) -> FloatArray:
+        """Température sèche à humidité absolue connue, par inversion directe
+
+        Les températures hors du domaine du moteur de Hyland-Wexler, dans
+        lequel reste l'entité d'air humide, sont rejetées (NaN).
+
+        Args:
+            pressure (FloatArray): Pressions absolues en [Pa]
+            humidity_ratio (FloatArray): Humidités absolues en [kg eau/kg air sec]
+            values (dict[str, FloatArray]): Deux entrées indexées par leur nom
+
+        Returns:
+            FloatArray: Températures sèches en [°C], NaN hors du domaine
+        """
+        with np.errstate(invalid="ignore"):
+            temp_dry_bulb = self._invert_dry_bulb(pressure, humidity_ratio, values)
+            # hors du domaine du moteur, comme la borne des résolutions itératives
+            in_domain = (temp_dry_bulb >= HumidAirSettings.hyland_wexler_tdb_ge) & (
+                temp_dry_bulb <= HumidAirSettings.hyland_wexler_tdb_le
+            )
+        return np.where(in_domain, temp_dry_bulb, np.nan)
+
+    def _invert_dry_bulb(
+        self,
+        pressure: FloatArray,
+        humidity_ratio: FloatArray,
+        values: dict[str, FloatArray],
+    ) -> FloatArray:
+        """Inversion directe des relations d'ASHRAE en température sèche
+
+        Args:
+            pressure (FloatArray): Pressions absolues en [Pa]
+            humidity_ratio (FloatArray): Humidités absolues en [kg eau/kg air sec]
+            values (dict[str, FloatArray]): Deux entrées indexées par leur nom
+
+        Returns:
+            FloatArray: Températures sèches en [°C], sans limite de domaine
+        """
+        w = humidity_ratio
+        if "relative_humidity" in values:
+            # f.pws(t) = pw / hr : inversion de la pression de saturation,
+            # avec le facteur d'augmentation réévalué à la température trouvée
+            saturated = (
+                _partial_pressure(pressure, w) * 100 / values["relative_humidity"]
+            )
+            temp_dry_bulb = dew_point_temperature(saturated)
+            return dew_point_temperature(
+                saturated / _enhancement_factor(pressure, temp_dry_bulb)
+            )
+        if "temp_wet_bulb" in values:
+            # ASHRAE éq. 33 (eau) et 35 (glace), linéaires en température sèche
+            twb = values["temp_wet_bulb"]
+            ws = _saturation_humidity_ratio(pressure, twb)
+            over_water = (
+                (2501 - 2.326 * twb) * ws + 1.006 * twb - w * (2501 - 4.186 * twb)
+            )
+            over_ice = (2830 - 0.24 * twb) * ws + 1.006 * twb - w * (2830 - 2.1 * twb)
+            return np.where(twb >= 0, over_water, over_ice) / (1.006 + 1.86 * w)
+        # ASHRAE éq. 32, enthalpie par kg d'air humide ramenée au kg d'air sec
+        enthalpy = values["enthalpy_per_humid_air"] * (1 + w) / 1000
+        return (enthalpy - 2501 * w) / (1.006 + 1.86 * w)
+
+
+def _enhancement_factor(pressure: FloatArray, temperature: FloatArray) -> FloatArray:
+    """Facteur d'augmentation de la pression de saturation (Buck, 1996)"""
+    pressure_hpa = pressure / 100
+    over_water = 1 + 1e-4 * (7.2 + pressure_hpa * (0.0320 + 5.9e-6 * temperature**2))
+    over_ice = 1 + 1e-4 * (2.2 + pressure_hpa * (0.0383 + 6.4e-6 * temperature**2))
+    return np.where(temperature >= 0, over_water, over_ice)
+
+
+def _partial_pressure(pressure: FloatArray, humidity_ratio: FloatArray) -> FloatArray:
+    """Pression partielle de vapeur d'une humidité absolue (ASHRAE éq. 20)"""
+    return pressure * humidity_ratio / (MOLAR_MASS_RATIO + humidity_ratio)
+
+
+def _humidity_ratio(
+    pressure: FloatArray, temp_dry_bulb: FloatArray, relative_humidity: FloatArray
+) -> FloatArray:
+    """Humidité absolue à humidité relative donnée, infinie au-delà de l'ébullition"""
+    partial_pressure = (
+        relative_humidity
+        / 100
+        * _enhancement_factor(pressure, temp_dry_bulb)
+        * saturation_pressure(temp_dry_bulb + TRIPLE_POINT_TEMPERATURE)
+    )
+    return np.where(
+        partial_pressure < pressure,
+        MOLAR_MASS_RATIO * partial_pressure / (pressure - partial_pressure),
+        np.inf,
+    )
+
+
+def _saturation_humidity_ratio(
+    pressure: FloatArray, temperature: FloatArray
+) -> FloatArray:
+    """Humidité absolue à saturation, ou d'un point de rosée"""
+    return _humidity_ratio(pressure, temperature, np.full_like(temperature, 100.0))
+
+
+def _relative_humidity(
+    pressure: FloatArray, temp_dry_bulb: FloatArray, humidity_ratio: FloatArray
+) -> FloatArray:
+    """Humidité relative en [%] d'un état défini par son humidité absolue"""
+    return (
+        100
+        * _partial_pressure(pressure, humidity_ratio)
+        / _enhancement_factor(pressure, temp_dry_bulb)
+        / saturation_pressure(temp_dry_bulb + TRIPLE_POINT_TEMPERATURE)
+    )
+
+
+def _enthalpy_humidity_ratio(
+    temp_dry_bulb: FloatArray, enthalpy_per_humid_air: FloatArray
+) -> FloatArray:
+    """Humidité absolue à enthalpie par kg d'air humide constante (ASHRAE éq. 32)"""
+    return (enthalpy_per_humid_air - 1006 * temp_dry_bulb) / (
+        2501000 + 1860 * temp_dry_bulb - enthalpy_per_humid_air
+    )
+
+
+def _regula_falsi(
+    func: Callable[[FloatArray], FloatArray], lower: FloatArray, upper: FloatArray
+) -> tuple[FloatArray, npt.NDArray[np.bool_]]:
+    """Racine d'une fonction décroissante par fausse position (Illinois)
+
+    Args:
+        func (Callable[[FloatArray], FloatArray]): Fonction décroissante, vectorisée
+        lower (FloatArray): Bornes inférieures
+        upper (FloatArray): Bornes supérieures
+
+    Returns:
+        tuple[FloatArray, npt.NDArray[np.bool_]]: Racines et masque des résolutions convergées
+    """
+    f_lower = func(lower)
+    f_upper = func(upper)
+    bracketed = (f_lower >= 0) & (f_upper <= 0)
+    side = np.zeros_like(lower)
+    root = lower
+    f_root = f_lower
+    for _ in range(REGULA_FALSI_ITERATIONS):
+        root = (lower * f_upper - upper * f_lower) / (f_upper - f_lower)
+        f_root = func(root)
+        if np.all(~bracketed | (np.abs(f_root) < RESIDUAL_TOLERANCE)):
+            break
+        positive = f_root > 0
+        # Illinois : la borne conservée deux fois de suite voit son poids réduit
+        f_upper = np.where(positive & (side > 0), f_upper / 2, f_upper)
+        f_lower = np.where(~positive & (side < 0), f_lower / 2, f_lower)
+        lower = np.where(positive, root, lower)
+        f_lower = np.where(positive, f_root, f_lower)
+        upper = np.where(positive, upper, root)
+        f_upper = np.where(positive, f_upper, f_root)
+        side = np.where(positive, 1.0, -1.0)
+    return root, bracketed & (np.abs(f_root) < RESIDUAL_TOLERANCE)
@@ -0,0 +1,214 @@
+import numpy as np
+import numpy.typing as npt
+
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchErrorEntity
+from humid_air.domain.entities.solver_entity import (
+    InverseSolutionEntity,
+    SolverUnknown,
+)
+from humid_air.domain.services.inverse_solver_interface import (
+    InverseSolverInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+from humid_air.infra.services.hyland_wexler_engine import (
+    TRIPLE_POINT_TEMPERATURE,
+    FloatArray,
+    dew_point_temperature,
+    psychrometric_properties,
+    saturation_pressure,
+)
+
+# marge sous la saturation à la pression totale pour la borne supérieure
+SATURATION_MARGIN = 1e-9
+
+
+def _to_optional(values: FloatArray) -> list[float | None]:
+    """Convertit un tableau en colonne, None pour les valeurs non finies"""
+    return [float(value) if np.isfinite(value) else None for value in values]
+
+
+class HylandWexlerInverseSolver(InverseSolverInterface):
+    """Solveur inverse vectorisé sur les relations de Hyland-Wexler
+
+    Chaque état conserve un intervalle qui encadre la racine, resserré par la
+    méthode de la fausse position modifiée (Illinois) : une extrémité conservée
+    deux fois de suite voit son résidu divisé par deux, pour une convergence
+    superlinéaire sans perdre l'encadrement. Le milieu (dichotomie) remplace le
+    point de fausse position lorsqu'il sort de l'intervalle ou n'est pas fini,
+    et lorsque les deux itérations précédentes n'ont pas divisé l'intervalle
+    par deux : le nombre d'itérations reste borné par trois fois celui de la
+    dichotomie. Les propriétés cibles sont calculées sans arrondi, en une passe
+    par itération pour les seuls états non convergés.
+    """
+
+    def solve(
+        self,
+        pressure: list[float],
+        fixed: list[float],
+        unknown: SolverUnknown,
+        target_name: str,
+        target: list[float],
+        lower: float | None,
+        upper: float | None,
+        tolerance: float,
+        max_iterations: int,
+    ) -> InverseSolutionEntity:
+        p = np.asarray(pressure, dtype=np.float64)
+        fixed_values = np.asarray(fixed, dtype=np.float64)
+        goal = np.asarray(target, dtype=np.float64)
+        size = p.size
+
+        def residual(
+            index: npt.NDArray[np.intp], unknown_values: FloatArray
+        ) -> FloatArray:
+            return (
+                self._target_property(
+                    p[index], fixed_values[index], unknown_values, unknown, target_name
+                )
+                - goal[index]
+            )
+
+        everything = np.arange(size)
+        low, high = self._bounds(p, fixed_values, unknown, lower, upper)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            f_low = residual(everything, low)
+            f_high = residual(everything, high)
+        bracketed = (
+            (low <= high)
+            & np.isfinite(f_low)
+            & np.isfinite(f_high)
+            & (np.sign(f_low) * np.sign(f_high) <= 0)
+        )
+
+        values = np.full(size, np.nan)
+        residuals = np.full(size, np.nan)
+        iterations = np.zeros(size, dtype=np.int64)
+        converged = np.zeros(size, dtype=np.bool_)
+        for bound, f_bound in ((low, f_low), (high, f_high)):
+            on_bound = bracketed & ~converged & (f_bound == 0)
+            values[on_bound] = bound[on_bound]
+            residuals[on_bound] = 0.0
+            converged |= on_bound
+
+        # extrémité conservée à l'itération précédente : -1 basse, +1 haute
+        retained = np.zeros(size, dtype=np.int8)
+        # largeurs de l'intervalle avant les deux itérations précédentes
+        previous_width = np.full(size, np.inf)
+        older_width = np.full(size, np.inf)
+        active = bracketed & ~converged
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            for _ in range(max_iterations):
+                index = np.flatnonzero(active)
+                if index.size == 0:
+                    break
+                a, b = low[index], high[index]
+                fa, fb = f_low[index], f_high[index]
+                x = (a * fb - b * fa) / (fb - fa)
+                stalled = b - a > older_width[index] / 2
+                older_width[index] = previous_width[index]
+                previous_width[index] = b - a
+                x = np.where((x > a) & (x < b) & ~stalled, x, (a + b) / 2)
+                fx = residual(index, x)
+                iterations[index] += 1
+                values[index] = x
+                residuals[index] = fx
+
+                keep_high = np.sign(fx) == np.sign(fa)
+                previous = retained[index]
+                fb = np.where(keep_high & (previous == 1), fb / 2, fb)
+                fa = np.where(~keep_high & (previous == -1), fa / 2, fa)
+                low[index] = np.where(keep_high, x, a)
+                f_low[index] = np.where(keep_high, fx, fa)
+                high[index] = np.where(keep_high, b, x)
+                f_high[index] = np.where(keep_high, fb, fx)
+                retained[index] = np.where(keep_high, 1, -1)
+
+                done = (fx == 0) | (high[index] - low[index] <= tolerance)
+                converged[index] = done
+                active[index] = ~done
+
+        return InverseSolutionEntity(
+            values=_to_optional(np.where(bracketed, values, np.nan)),
+            residuals=_to_optional(np.where(bracketed, residuals, np.nan)),
+            iterations=iterations.tolist(),
+            converged=converged.tolist(),
+            errors=[
+                HumidAirBatchErrorEntity(
+                    index=int(index),
+                    field="target",
+                    message=HumidAirSettings.solver_not_bracketed_message,
+                )
+                for index in np.flatnonzero(~bracketed)
+            ],
+        )
+
+    def _bounds(
+        self,
+        pressure: FloatArray,
+        fixed: FloatArray,
+        unknown: SolverUnknown,
+        lower: float | None,
+        upper: float | None,
+    ) -> tuple[FloatArray, FloatArray]:
+        """Bornes de recherche par état, limitées au domaine du moteur
+
+        La borne supérieure est abaissée sous l'état où la pression de vapeur
+        atteindrait la pression totale.
+
+        Returns:
+            tuple[FloatArray, FloatArray]: Bornes inférieures et supérieures
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            domain: tuple[float, float]
+            if unknown is SolverUnknown.TEMP_DRY_BULB:
+                domain = (
+                    HumidAirSettings.hyland_wexler_tdb_ge,
+                    HumidAirSettings.hyland_wexler_tdb_le,
+                )
+                # température où rh × pws(t) = p
+                boiling = dew_point_temperature(
+                    pressure * (1 - SATURATION_MARGIN) * 100 / fixed
+                )
+                limit = np.where(np.isfinite(boiling), boiling, domain[1])
+            else:
+                domain = (
+                    HumidAirSettings.solver_rh_lower_default_value,
+                    HumidAirSettings.rh_le,
+                )
+                limit = (
+                    100
+                    * pressure
+                    * (1 - SATURATION_MARGIN)
+                    / saturation_pressure(fixed + TRIPLE_POINT_TEMPERATURE)
+                )
+        low = np.full(
+            pressure.shape,
+            max(domain[0], -np.inf if lower is None else lower),
+            dtype=np.float64,
+        )
+        high = np.minimum(
+            min(domain[1], np.inf if upper is None else upper), limit
+        ).astype(np.float64)
+        return low, high
+
+    def _target_property(
+        self,
+        pressure: FloatArray,
+        fixed: FloatArray,
+        unknown_values: FloatArray,
+        unknown: SolverUnknown,
+        target_name: str,
+    ) -> FloatArray:
+        """Propriété cible des états définis par l'entrée fixée et l'entrée essayée"""
+        if unknown is SolverUnknown.TEMP_DRY_BULB:
+            temp_dry_bulb, relative_humidity = unknown_values, fixed
+        else:
+            temp_dry_bulb, relative_humidity = fixed, unknown_values
+        partial_pressure = (
+            relative_humidity
+            / 100
+            * saturation_pressure(temp_dry_bulb + TRIPLE_POINT_TEMPERATURE)
+        )
+        return psychrometric_properties(
+            pressure, temp_dry_bulb, partial_pressure, (target_name,)
+        )[target_name]
@@ -0,0 +1,617 @@
+import itertools
+import os
+from threading import Lock
+
+import numpy as np
+import numpy.typing as npt
+
+from humid_air.domain.entities.humid_air_batch_entity import (
+    HumidAirBatchEntity,
+    HumidAirBatchErrorEntity,
+)
+from humid_air.domain.entities.humid_air_entity import (
+    HUMID_AIR_PROPERTY_DECIMALS,
+    HUMID_AIR_PROPERTY_NAMES,
+)
+from humid_air.domain.services.humid_air_engine_interface import (
+    HumidAirEngineInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+FloatArray = npt.NDArray[np.float64]
+
+INPUT_NAMES = ("pressure", "temp_dry_bulb", "relative_humidity")
+
+
+def _axis(start: float, stop: float, step: float) -> FloatArray:
+    return np.linspace(start, stop, int(round((stop - start) / step)) + 1)
+
+
+def default_axes() -> tuple[FloatArray, FloatArray, FloatArray]:
+    """Axes de la grille définis dans HumidAirSettings
+
+    Returns:
+        tuple[FloatArray, FloatArray, FloatArray]: Axes pression, température sèche, humidité relative
+    """
+    return (
+        _axis(
+            HumidAirSettings.lookup_table_pressure_ge,
+            HumidAirSettings.lookup_table_pressure_le,
+            HumidAirSettings.lookup_table_pressure_step,
+        ),
+        _axis(
+            HumidAirSettings.lookup_table_tdb_ge,
+            HumidAirSettings.lookup_table_tdb_le,
+            HumidAirSettings.lookup_table_tdb_step,
+        ),
+        _axis(
+            HumidAirSettings.lookup_table_rh_ge,
+            HumidAirSettings.lookup_table_rh_le,
+            HumidAirSettings.lookup_table_rh_step,
+        ),
+    )
+
+
+class HumidAirLookupTable:
+    """Table précalculée des propriétés de l'air humide
+
+    Les propriétés sont stockées sur une grille (pression, température sèche,
+    humidité relative) et interpolées de façon trilinéaire. L'erreur maximale
+    de chaque propriété est estimée à la construction, maille par maille :
+    erreur d'interpolation au centre de la maille par rapport au moteur
+    source, augmentée de l'écart du moteur source au moteur de référence sur
+    le bloc de nœuds contenant la maille.
+
+    Args:
+        source (str): Nom du moteur ayant calculé la table
+        axes (tuple[FloatArray, FloatArray, FloatArray]): Axes de la grille
+        values (dict[str, FloatArray]): Propriétés aux nœuds, NaN si indisponibles
+        cell_errors (dict[str, FloatArray]): Erreurs absolues maximales estimées
+            par maille
+        reference (str): Nom du moteur de référence des erreurs
+    """
+
+    def __init__(
+        self,
+        source: str,
+        axes: tuple[FloatArray, FloatArray, FloatArray],
+        values: dict[str, FloatArray],
+        cell_errors: dict[str, FloatArray],
+        reference: str,
+    ) -> None:
+        """Initialise la table
+
+        Args:
+            source (str): Nom du moteur ayant calculé la table
+            axes (tuple[FloatArray, FloatArray, FloatArray]): Axes de la grille
+            values (dict[str, FloatArray]): Propriétés aux nœuds, NaN si indisponibles
+            cell_errors (dict[str, FloatArray]): Erreurs absolues maximales
+                estimées par maille
+            reference (str): Nom du moteur de référence des erreurs
+        """
+        self.source = source
+        self.reference = reference
+        self.axes = axes
+        self.values = values
+        self.cell_errors = cell_errors
+        # propriétés empilées pour interpoler toutes les colonnes en une passe
+        self._names = [name for name in values if name not in INPUT_NAMES]
+        self._stacked = np.stack([values[name] for name in self._names], axis=-1)
+
+    @classmethod
+    def build(
+        cls,
+        source: str,
+        engine: HumidAirEngineInterface,
+        axes: tuple[FloatArray, FloatArray, FloatArray],
+        reference: str | None = None,
+        reference_engine: HumidAirEngineInterface | None = None,
+    ) -> "HumidAirLookupTable":
+        """Calcule la table avec un moteur source et estime son erreur
+
+        L'erreur d'interpolation est mesurée au milieu des arêtes de chaque
+        maille.
+        L'écart du moteur source au moteur de référence est mesuré aux nœuds
+        pris tous les HumidAirSettings.lookup_table_reference_stride sur chaque
+        axe, extrémités comprises ; son maximum sur les nœuds de chaque bloc
+        et des blocs voisins est ajouté à l'erreur des mailles du bloc. Les
+        deux termes sont multipliés par HumidAirSettings.lookup_table_error_margin,
+        ces mesures ponctuelles pouvant sous-estimer le maximum. Dans les
+        mailles où la température humide passe 0 °C, son erreur est au moins
+        l'écart entre les coins de la maille.
+
+        Args:
+            source (str): Nom du moteur source
+            engine (HumidAirEngineInterface): Moteur source
+            axes (tuple[FloatArray, FloatArray, FloatArray]): Axes de la grille
+            reference (str | None, optional): Nom du moteur de référence,
+                le moteur source par défaut. Defaults to None.
+            reference_engine (HumidAirEngineInterface | None, optional): Moteur
+                de référence, ignoré s'il s'agit du moteur source. Defaults to None.
+
+        Returns:
+            HumidAirLookupTable: Table calculée
+        """
+        if reference is None or reference_engine is None:
+            reference = source
+        table = cls(
+            source=source,
+            axes=axes,
+            values=_compute_grid(engine, axes),
+            cell_errors={},
+            reference=reference,
+        )
+        # l'interpolation trilinéaire reproduit les termes croisés : son erreur
+        # est la somme des erreurs d'interpolation linéaire le long de chaque axe
+        for dimension, axis in enumerate(axes):
+            edges = list(axes)
+            edges[dimension] = _cell_centers(axis)
+            expected = _compute_grid(engine, (edges[0], edges[1], edges[2]))
+            mesh = np.meshgrid(*edges, indexing="ij")
+            interpolated = table.interpolate(*(array.ravel() for array in mesh))
+            for name, values in expected.items():
+                if name in INPUT_NAMES:
+                    continue
+                error = np.abs(interpolated[name].reshape(values.shape) - values)
+                # maximum sur les quatre arêtes de la maille parallèles à l'axe
+                for index in range(len(axes)):
+                    if index != dimension:
+                        error = np.fmax(
+                            error.take(range(error.shape[index] - 1), axis=index),
+                            error.take(range(1, error.shape[index]), axis=index),
+                        )
+                table.cell_errors[name] = (
+                    table.cell_errors.get(name, 0.0)
+                    + HumidAirSettings.lookup_table_error_margin * error
+                )
+        # saut de la température humide entre les branches glace et liquide :
+        # l'erreur peut atteindre l'écart entre les coins de la maille
+        corners = _cell_corners(table.values["temp_wet_bulb"])
+        lowest = np.min(corners, axis=0)
+        highest = np.max(corners, axis=0)
+        jump = (lowest < 0) & (highest > 0)
+        wet_bulb_error = table.cell_errors["temp_wet_bulb"]
+        wet_bulb_error[jump] = np.fmax(wet_bulb_error[jump], (highest - lowest)[jump])
+        if reference != source and reference_engine is not None:
+            table._add_model_errors(reference_engine)
+        return table
+
+    def _add_model_errors(self, reference_engine: HumidAirEngineInterface) -> None:
+        """Ajoute aux erreurs d'interpolation l'écart du moteur source à la référence
+
+        Args:
+            reference_engine (HumidAirEngineInterface): Moteur de référence
+        """
+        nodes = tuple(
+            np.unique(
+                np.append(
+                    np.arange(
+                        0, len(axis), HumidAirSettings.lookup_table_reference_stride
+                    ),
+                    len(axis) - 1,
+                )
+            )
+            for axis in self.axes
+        )
+        expected = _compute_grid(
+            reference_engine,
+            (self.axes[0][nodes[0]], self.axes[1][nodes[1]], self.axes[2][nodes[2]]),
+        )
+        # bloc de nœuds de référence contenant chaque maille, par axe
+        blocks = np.ix_(
+            *(
+                np.clip(
+                    np.searchsorted(axis_nodes, np.arange(len(axis) - 1), side="right")
+                    - 1,
+                    0,
+                    len(axis_nodes) - 2,
+                )
+                for axis, axis_nodes in zip(self.axes, nodes, strict=True)
+            )
+        )
+        for name, error in self.cell_errors.items():
+            if name not in expected:
+                continue
+            model_error = np.abs(self.values[name][np.ix_(*nodes)] - expected[name])
+            # nœuds du bloc et de ses voisins : l'écart au modèle de référence
+            # varie entre deux nœuds de référence
+            padded = np.pad(model_error, 1, constant_values=np.nan)
+            block_error = np.full(tuple(size - 1 for size in model_error.shape), np.nan)
+            for corner in itertools.product(range(4), repeat=3):
+                block_error = np.fmax(
+                    block_error,
+                    padded[
+                        tuple(
+                            slice(offset, size - 1 + offset)
+                            for offset, size in zip(
+                                corner, model_error.shape, strict=True
+                            )
+                        )
+                    ],
+                )
+            self.cell_errors[name] = (
+                error + HumidAirSettings.lookup_table_error_margin * block_error[blocks]
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "HumidAirLookupTable":
+        """Charge une table enregistrée au format NumPy
+
+        Args:
+            path (str): Chemin du fichier .npz
+
+        Returns:
+            HumidAirLookupTable: Table chargée
+        """
+        with np.load(path) as archive:
+            return cls(
+                source=str(archive["source"]),
+                # tables enregistrées avant la référence : erreurs face à la source
+                reference=str(
+                    archive["reference"]
+                    if "reference" in archive
+                    else archive["source"]
+                ),
+                axes=(
+                    archive["pressure"],
+                    archive["temp_dry_bulb"],
+                    archive["relative_humidity"],
+                ),
+                values={
+                    name: archive[f"value_{name}"]
+                    for name in HUMID_AIR_PROPERTY_NAMES
+                    if f"value_{name}" in archive
+                },
+                cell_errors={
+                    name: archive[f"error_{name}"]
+                    for name in HUMID_AIR_PROPERTY_NAMES
+                    if f"error_{name}" in archive
+                },
+            )
+
+    def save(self, path: str) -> None:
+        """Enregistre la table au format NumPy compressé
+
+        Args:
+            path (str): Chemin du fichier .npz
+        """
+        pressure, temp_dry_bulb, relative_humidity = self.axes
+        arrays: dict[str, npt.NDArray[np.generic]] = {
+            "source": np.array(self.source),
+            "reference": np.array(self.reference),
+            "pressure": pressure,
+            "temp_dry_bulb": temp_dry_bulb,
+            "relative_humidity": relative_humidity,
+        }
+        arrays.update({f"value_{name}": grid for name, grid in self.values.items()})
+        arrays.update(
+            {f"error_{name}": error for name, error in self.cell_errors.items()}
+        )
+        with open(path, "wb") as file:
+            np.savez_compressed(file, **arrays)  # type: ignore[arg-type]
+
+    def matches(
+        self,
+        source: str,
+        axes: tuple[FloatArray, FloatArray, FloatArray],
+        reference: str | None = None,
+    ) -> bool:
+        """Vérifie que la table correspond aux moteurs et à la grille attendus
+
+        Args:
+            source (str): Nom du moteur source attendu
+            axes (tuple[FloatArray, FloatArray, FloatArray]): Axes attendus
+            reference (str | None, optional): Nom du moteur de référence attendu,
+                le moteur source par défaut. Defaults to None.
+
+        Returns:
+            bool: True si la table peut être réutilisée
+        """
+        expected_reference = source if reference is None else reference
+        cells = tuple(len(axis) - 1 for axis in axes)
+        return (
+            self.source == source
+            and self.reference == expected_reference
+            and all(
+                current.shape == expected.shape and np.allclose(current, expected)
+                for current, expected in zip(self.axes, axes, strict=True)
+            )
+            # tables enregistrées avec une erreur maximale unique
+            and all(error.shape == cells for error in self.cell_errors.values())
+        )
+
+    def errors(
+        self,
+        pressure: FloatArray,
+        temp_dry_bulb: FloatArray,
+        relative_humidity: FloatArray,
+    ) -> dict[str, FloatArray]:
+        """Erreurs absolues maximales estimées de la maille contenant chaque état
+
+        Args:
+            pressure (FloatArray): Pressions absolues en [Pa], dans la grille
+            temp_dry_bulb (FloatArray): Températures sèches en [°C], dans la grille
+            relative_humidity (FloatArray): Humidités relatives en [%], dans la grille
+
+        Returns:
+            dict[str, FloatArray]: Erreurs par propriété, NaN si indisponibles
+        """
+        cells = tuple(
+            _locate(axis, values)[0]
+            for axis, values in zip(
+                self.axes, (pressure, temp_dry_bulb, relative_humidity), strict=True
+            )
+        )
+        return {name: error[cells] for name, error in self.cell_errors.items()}
+
+    def contains(
+        self,
+        pressure: FloatArray,
+        temp_dry_bulb: FloatArray,
+        relative_humidity: FloatArray,
+    ) -> npt.NDArray[np.bool_]:
+        """Indique les états couverts par la grille
+
+        Args:
+            pressure (FloatArray): Pressions absolues en [Pa]
+            temp_dry_bulb (FloatArray): Températures sèches en [°C]
+            relative_humidity (FloatArray): Humidités relatives en [%]
+
+        Returns:
+            npt.NDArray[np.bool_]: Masque des états couverts
+        """
+        inside = np.ones(pressure.shape, dtype=bool)
+        for axis, values in zip(
+            self.axes, (pressure, temp_dry_bulb, relative_humidity), strict=True
+        ):
+            inside &= (values >= axis[0]) & (values <= axis[-1])
+        return inside
+
+    def interpolate(
+        self,
+        pressure: FloatArray,
+        temp_dry_bulb: FloatArray,
+        relative_humidity: FloatArray,
+    ) -> dict[str, FloatArray]:
+        """Interpole toutes les propriétés de façon trilinéaire
+
+        Args:
+            pressure (FloatArray): Pressions absolues en [Pa], dans la grille
+            temp_dry_bulb (FloatArray): Températures sèches en [°C], dans la grille
+            relative_humidity (FloatArray): Humidités relatives en [%], dans la grille
+
+        Returns:
+            dict[str, FloatArray]: Propriétés interpolées
+        """
+        (p_index, p_fraction), (t_index, t_fraction), (rh_index, rh_fraction) = (
+            _locate(axis, values)
+            for axis, values in zip(
+                self.axes, (pressure, temp_dry_bulb, relative_humidity), strict=True
+            )
+        )
+        total = np.zeros((len(pressure), len(self._names)))
+        for p_upper in (0, 1):
+            p_weight = p_fraction if p_upper else 1 - p_fraction
+            for t_upper in (0, 1):
+                t_weight = t_fraction if t_upper else 1 - t_fraction
+                for rh_upper in (0, 1):
+                    rh_weight = rh_fraction if rh_upper else 1 - rh_fraction
+                    corner = self._stacked[
+                        p_index + p_upper, t_index + t_upper, rh_index + rh_upper
+                    ]
+                    total += (p_weight * t_weight * rh_weight)[:, None] * corner
+
+        result: dict[str, FloatArray] = {
+            "pressure": pressure,
+            "temp_dry_bulb": temp_dry_bulb,
+            "relative_humidity": relative_humidity,
+        }
+        for position, name in enumerate(self._names):
+            result[name] = total[:, position]
+        return result
+
+
+class LookupTableHumidAirEngine(HumidAirEngineInterface):
+    """Moteur de calcul approché par table précalculée
+
+    La table est calculée avec le moteur source au premier appel (ou par
+    warm_up), puis enregistrée sur disque si un chemin est fourni ; un fichier
+    existant et compatible est rechargé sans calcul. Les états hors de la
+    grille, ou dont une propriété demandée s'interpole entre des nœuds sans
+    valeur, sont signalés en erreur. Les erreurs maximales déclarées sont
+    celles des mailles des états calculés, mesurées face au moteur de
+    référence s'il est fourni.
+
+    Args:
+        source_name (str): Nom du moteur source
+        source_engine (HumidAirEngineInterface): Moteur utilisé pour calculer la table
+        path (str | None): Fichier .npz de la table (None = pas de persistance)
+        reference_name (str | None): Nom du moteur de référence des erreurs
+        reference_engine (HumidAirEngineInterface | None): Moteur de référence des erreurs
+    """
+
+    def __init__(
+        self,
+        source_name: str,
+        source_engine: HumidAirEngineInterface,
+        path: str | None = None,
+        reference_name: str | None = None,
+        reference_engine: HumidAirEngineInterface | None = None,
+    ) -> None:
+        """Initialise le moteur sans calculer la table
+
+        Args:
+            source_name (str): Nom du moteur source
+            source_engine (HumidAirEngineInterface): Moteur utilisé pour calculer la table
+            path (str | None): Fichier .npz de la table (None = pas de persistance)
+            reference_name (str | None, optional): Nom du moteur de référence des
+                erreurs, le moteur source par défaut. Defaults to None.
+            reference_engine (HumidAirEngineInterface | None, optional): Moteur de
+                référence des erreurs. Defaults to None.
+        """
+        self.source_name = source_name
+        self.source_engine = source_engine
+        self.path = path
+        self.reference_name = (
+            reference_name
+            if reference_name is not None and reference_engine is not None
+            else source_name
+        )
+        self.reference_engine = reference_engine
+        self._table: HumidAirLookupTable | None = None
+        self._lock = Lock()
+
+    @property
+    def table(self) -> HumidAirLookupTable:
+        """Table chargée ou calculée au premier accès
+
+        Returns:
+            HumidAirLookupTable: Table des propriétés
+        """
+        if self._table is None:
+            with self._lock:
+                if self._table is None:
+                    self._table = self._load_or_build()
+        return self._table
+
+    def warm_up(self) -> None:
+        """Charge ou calcule la table sans attendre la première requête"""
+        self.source_engine.warm_up()
+        _ = self.table
+
+    def compute(
+        self,
+        pressure: list[float],
+        temp_dry_bulb: list[float],
+        relative_humidity: list[float],
+        fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES,
+        rounded: bool = True,
+    ) -> HumidAirBatchEntity:
+        """Interpole les propriétés d'un lot d'états dans la table
+
+        Args:
+            pressure (list[float]): Pressions absolues en [Pa]
+            temp_dry_bulb (list[float]): Températures sèches en [°C]
+            relative_humidity (list[float]): Humidités relatives en [%]
+            fields (tuple[str, ...], optional): Propriétés à renvoyer, toutes par défaut
+            rounded (bool, optional): Arrondir selon HUMID_AIR_PROPERTY_DECIMALS,
+                sinon valeurs brutes du moteur. Defaults to True.
+
+        Returns:
+            HumidAirBatchEntity: Propriétés, erreurs par état et erreurs maximales
+                déclarées sur les états calculés
+        """
+        table = self.table
+        p = np.asarray(pressure, dtype=np.float64)
+        t = np.asarray(temp_dry_bulb, dtype=np.float64)
+        rh = np.asarray(relative_humidity, dtype=np.float64)
+        inside = table.contains(p, t, rh)
+        states = (
+            np.where(inside, p, table.axes[0][0]),
+            np.where(inside, t, table.axes[1][0]),
+            np.where(inside, rh, table.axes[2][0]),
+        )
+        interpolated = table.interpolate(*states)
+        interpolable = inside.copy()
+        for name in fields:
+            if name in interpolated and name not in INPUT_NAMES:
+                interpolable &= np.isfinite(interpolated[name])
+
+        columns: dict[str, list[float | None]] = {}
+        for name in fields:
+            if name not in interpolated:
+                columns[name] = [None] * len(p)
+                continue
+            values = np.where(interpolable, interpolated[name], np.nan)
+            if rounded:
+                values = np.round(values, HUMID_AIR_PROPERTY_DECIMALS.get(name, 15))
+            columns[name] = [
+                value if np.isfinite(value) else None for value in values.tolist()
+            ]
+
+        return HumidAirBatchEntity(
+            properties=columns,
+            errors=[
+                HumidAirBatchErrorEntity(
+                    index=int(index),
+                    field="state",
+                    message=(
+                        HumidAirSettings.lookup_table_not_interpolable_message
+                        if inside[index]
+                        else HumidAirSettings.lookup_table_out_of_range_message
+                    ),
+                )
+                for index in np.flatnonzero(~interpolable)
+            ],
+            max_errors={
+                name: float(np.nanmax(error[interpolable]))
+                for name, error in table.errors(*states).items()
+                if name in fields and np.any(np.isfinite(error[interpolable]))
+            },
+        )
+
+    def _load_or_build(self) -> HumidAirLookupTable:
+        axes = default_axes()
+        if self.path is not None and os.path.exists(self.path):
+            table = HumidAirLookupTable.load(self.path)
+            if table.matches(self.source_name, axes, self.reference_name):
+                return table
+        table = HumidAirLookupTable.build(
+            self.source_name,
+            self.source_engine,
+            axes,
+            self.reference_name,
+            self.reference_engine,
+        )
+        if self.path is not None:
+            table.save(self.path)
+        return table
+
+
+def _cell_centers(axis: FloatArray) -> FloatArray:
+    """Centres des mailles d'un axe"""
+    return (axis[:-1] + axis[1:]) / 2
+
+
+def _cell_corners(values: FloatArray) -> FloatArray:
+    """Valeurs aux huit coins de chaque maille, empilées sur le premier axe"""
+    return np.stack(
+        [
+            values[
+                tuple(
+                    slice(offset, size - 1 + offset)
+                    for offset, size in zip(corner, values.shape, strict=True)
+                )
+            ]
+            for corner in itertools.product((0, 1), repeat=3)
+        ]
+    )
+
+
+def _locate(
+    axis: FloatArray, values: FloatArray
+) -> tuple[npt.NDArray[np.intp], FloatArray]:
+    """Maille contenant chaque valeur et position relative dans la maille"""
+    index = np.clip(np.searchsorted(axis, values, side="right") - 1, 0, len(axis) - 2)
+    fraction = (values - axis[index]) / (axis[index + 1] - axis[index])
+    return index, fraction
+
+
+def _compute_grid(
+    engine: HumidAirEngineInterface, axes: tuple[FloatArray, FloatArray, FloatArray]
+) -> dict[str, FloatArray]:
+    """Calcule les propriétés à chaque nœud d'une grille"""
+    mesh = np.meshgrid(*axes, indexing="ij")
+    pressure, temp_dry_bulb, relative_humidity = (
+        array.ravel().tolist() for array in mesh
+    )
+    batch = engine.compute(pressure, temp_dry_bulb, relative_humidity, rounded=False)
+    shape = mesh[0].shape
+    grid: dict[str, FloatArray] = {}
+    for name, column in batch.properties.items():
+        values = np.array(
+            [np.nan if value is None else value for value in column], dtype=np.float64
+        ).reshape(shape)
+        if np.any(np.isfinite(values)):
+            grid[name] = values
+    return grid
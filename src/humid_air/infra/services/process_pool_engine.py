@@ -0,0 +1,194 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.synchronize import Barrier
+from threading import Lock
+
+from humid_air.domain.entities.humid_air_batch_entity import (
+    HumidAirBatchEntity,
+    HumidAirBatchErrorEntity,
+)
+from humid_air.domain.entities.humid_air_entity import HUMID_AIR_PROPERTY_NAMES
+from humid_air.domain.services.humid_air_engine_interface import (
+    HumidAirEngineInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+# barrière du préchauffage, héritée par chaque processus à son démarrage
+_warm_up_barrier: Barrier | None = None
+
+
+def _initialize_process(barrier: Barrier) -> None:
+    """Mémorise la barrière du préchauffage dans un processus du pool"""
+    global _warm_up_barrier
+    _warm_up_barrier = barrier
+
+
+def _compute_shard(
+    engine: HumidAirEngineInterface,
+    pressure: list[float],
+    temp_dry_bulb: list[float],
+    relative_humidity: list[float],
+    fields: tuple[str, ...],
+    rounded: bool,
+) -> HumidAirBatchEntity:
+    """Calcule une tranche du lot dans un processus du pool"""
+    return engine.compute(
+        pressure, temp_dry_bulb, relative_humidity, fields=fields, rounded=rounded
+    )
+
+
+def _warm_up_process(engine: HumidAirEngineInterface) -> int:
+    """Initialise le moteur puis attend les autres processus à la barrière
+
+    Une tâche bloquée à la barrière occupe son processus : les tâches qui la
+    franchissent ensemble s'exécutent toutes dans des processus distincts.
+    """
+    engine.warm_up()
+    engine.compute([101325.0], [20.0], [50.0])
+    if _warm_up_barrier is not None:
+        _warm_up_barrier.wait(HumidAirSettings.process_pool_warm_up_timeout)
+    return os.getpid()
+
+
+class ProcessPoolHumidAirEngine(HumidAirEngineInterface):
+    """Moteur qui répartit les lots d'un autre moteur entre plusieurs processus
+
+    CoolProp garde le GIL pendant chaque calcul : un gros lot bloque le
+    worker. Ce moteur découpe le lot en tranches de chunk_size états,
+    calculées en parallèle par un pool de processus créé au premier lot,
+    puis recolle les colonnes et réindexe les erreurs. Les lots plus petits
+    qu'une tranche, ou un pool d'un seul processus, sont calculés sur place.
+
+    Le moteur enveloppé doit être sérialisable (pickle) ; les processus sont
+    démarrés en mode 'spawn', sûr dans un serveur multithread.
+
+    Args:
+        HumidAirEngineInterface (HumidAirEngineInterface): Interface des moteurs de calcul
+    """
+
+    def __init__(
+        self, engine: HumidAirEngineInterface, workers: int, chunk_size: int
+    ) -> None:
+        """Initialise le moteur sans démarrer de processus
+
+        Args:
+            engine (HumidAirEngineInterface): Moteur exécuté dans chaque processus
+            workers (int): Nombre de processus du pool (0 ou 1 = calcul sur place)
+            chunk_size (int): Nombre d'états par tranche
+        """
+        self.engine = engine
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+        self.process_ids: frozenset[int] = frozenset()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Pool de processus, démarré au premier accès
+
+        Returns:
+            ProcessPoolExecutor: Pool partagé par tous les lots
+        """
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    context = multiprocessing.get_context("spawn")
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=context,
+                        initializer=_initialize_process,
+                        initargs=(context.Barrier(self.workers),),
+                    )
+        return self._executor
+
+    def warm_up(self) -> None:
+        """Démarre tous les processus du pool et y initialise le moteur enveloppé
+
+        Une tâche par processus calcule un état puis attend les autres à une
+        barrière de workers participants : aucune ne se termine avant que
+        toutes occupent chacune un processus, tous les processus sont donc
+        démarrés. Un lot réel ne paie alors ni le démarrage des processus ni
+        l'import du moteur. Les identifiants des processus sont conservés
+        dans process_ids.
+
+        Raises:
+            BrokenBarrierError: Processus non démarrés dans le délai
+                HumidAirSettings.process_pool_warm_up_timeout
+        """
+        self.engine.warm_up()
+        if self.workers <= 1:
+            return
+        futures = [
+            self.executor.submit(_warm_up_process, self.engine)
+            for _ in range(self.workers)
+        ]
+        self.process_ids = frozenset(future.result() for future in futures)
+
+    def shutdown(self) -> None:
+        """Arrête le pool de processus s'il a été démarré"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def compute(
+        self,
+        pressure: list[float],
+        temp_dry_bulb: list[float],
+        relative_humidity: list[float],
+        fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES,
+        rounded: bool = True,
+    ) -> HumidAirBatchEntity:
+        """Calcule les propriétés d'un lot, réparti en tranches entre les processus
+
+        Args:
+            pressure (list[float]): Pressions absolues en [Pa]
+            temp_dry_bulb (list[float]): Températures sèches en [°C]
+            relative_humidity (list[float]): Humidités relatives en [%]
+            fields (tuple[str, ...], optional): Propriétés à calculer, toutes par défaut
+            rounded (bool, optional): Arrondir selon HUMID_AIR_PROPERTY_DECIMALS,
+                sinon valeurs brutes du moteur. Defaults to True.
+
+        Returns:
+            HumidAirBatchEntity: Propriétés demandées en colonnes et erreurs par état
+        """
+        size = len(pressure)
+        if self.workers <= 1 or size <= self.chunk_size:
+            return self.engine.compute(
+                pressure,
+                temp_dry_bulb,
+                relative_humidity,
+                fields=fields,
+                rounded=rounded,
+            )
+
+        starts = range(0, size, self.chunk_size)
+        futures = [
+            self.executor.submit(
+                _compute_shard,
+                self.engine,
+                pressure[start : start + self.chunk_size],
+                temp_dry_bulb[start : start + self.chunk_size],
+                relative_humidity[start : start + self.chunk_size],
+                fields,
+                rounded,
+            )
+            for start in starts
+        ]
+        columns: dict[str, list[float | None]] = {name: [] for name in fields}
+        errors: list[HumidAirBatchErrorEntity] = []
+        max_errors: dict[str, float] | None = None
+        for start, future in zip(starts, futures, strict=True):
+            shard = future.result()
+            for name, column in columns.items():
+                column.extend(shard.properties[name])
+            errors.extend(
+                error.model_copy(update={"index": start + error.index})
+                for error in shard.errors
+            )
+            max_errors = shard.max_errors
+        return HumidAirBatchEntity(
+            properties=columns, errors=errors, max_errors=max_errors
+        )
@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from humid_air.domain.services.site_pressure_provider_interface import (
+    SitePressureProviderInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+from projects.app.repositories.project_interface import ProjectRepositoryInterface
+from projects.domain.exceptions.project_exceptions import ProjectDBException
+
+
+class ProjectSitePressureProvider(SitePressureProviderInterface):
+    """Pression de site lue dans le repository des projets"""
+
+    def __init__(self, repository: ProjectRepositoryInterface):
+        """Initialise le fournisseur
+
+        Args:
+            repository (ProjectRepositoryInterface): Repository des projets
+        """
+        self.repository = repository
+
+    def get_site_pressure(self, project_id: UUID, user_id: UUID) -> float | None:
+        try:
+            projects = self.repository.get_user_projects(user_id)
+        except ProjectDBException as e:
+            raise ValueError(e.message)
+        for project in projects:
+            if project.id == project_id:
+                return project.site_pressure
+        raise ValueError(HumidAirSettings.site_pressure_project_unavailable_message)
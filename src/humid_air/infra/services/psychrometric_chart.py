@@ -0,0 +1,312 @@
+from collections.abc import Callable
+
+import numpy as np
+
+from humid_air.domain.entities.psychrometric_chart_entity import (
+    PsychrometricChartEntity,
+    PsychrometricChartLineEntity,
+    PsychrometricChartLineKind,
+)
+from humid_air.domain.services.psychrometric_chart_interface import (
+    PsychrometricChartInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+from humid_air.infra.services.hyland_wexler_engine import (
+    CORRELATION_TDB_MAX,
+    CORRELATION_TDB_MIN,
+    DRY_AIR_GAS_CONSTANT,
+    MOLAR_MASS_RATIO,
+    TRIPLE_POINT_TEMPERATURE,
+    FloatArray,
+    bisect_decreasing,
+    saturation_pressure,
+    wet_bulb_humidity_ratio,
+)
+
+TEMP_DRY_BULB_DECIMALS = 3
+HUMIDITY_RATIO_DECIMALS = 6
+
+
+class HylandWexlerPsychrometricChart(PsychrometricChartInterface):
+    """Générateur vectorisé de diagrammes psychrométriques (ASHRAE, Hyland-Wexler)
+
+    Chaque famille de lignes (humidité relative, enthalpie, température
+    humide, volume spécifique) est calculée en une passe NumPy : les
+    extrémités des lignes sont résolues par dichotomie sur la courbe de
+    saturation et sur les bords du diagramme, puis chaque ligne est
+    échantillonnée régulièrement en température sèche. L'enthalpie et le
+    volume spécifique sont rapportés au kg d'air sec, comme sur les
+    diagrammes ASHRAE.
+
+    Args:
+        PsychrometricChartInterface (PsychrometricChartInterface): Interface des générateurs de diagrammes
+    """
+
+    def build(
+        self,
+        pressure: float,
+        temp_dry_bulb_min: float,
+        temp_dry_bulb_max: float,
+        humidity_ratio_max: float,
+        resolution: int,
+    ) -> PsychrometricChartEntity:
+        """Calcule la géométrie complète d'un diagramme psychrométrique
+
+        Args:
+            pressure (float): Pression absolue en [Pa]
+            temp_dry_bulb_min (float): Température sèche minimale en [°C]
+            temp_dry_bulb_max (float): Température sèche maximale en [°C]
+            humidity_ratio_max (float): Humidité absolue maximale en [kg eau/kg air sec]
+            resolution (int): Nombre de points par ligne
+
+        Returns:
+            PsychrometricChartEntity: Polylignes du diagramme
+        """
+        frame = _ChartFrame(
+            pressure, temp_dry_bulb_min, temp_dry_bulb_max, humidity_ratio_max
+        )
+        lines = [
+            *self._relative_humidity_lines(frame, resolution),
+            *self._decreasing_lines(
+                frame,
+                resolution,
+                PsychrometricChartLineKind.ENTHALPY,
+                frame.values(
+                    frame.enthalpy(temp_dry_bulb_min, 0.0),
+                    frame.enthalpy(temp_dry_bulb_max, humidity_ratio_max),
+                    HumidAirSettings.chart_enthalpy_step,
+                ),
+                frame.enthalpy_line,
+            ),
+            *self._decreasing_lines(
+                frame,
+                resolution,
+                PsychrometricChartLineKind.TEMP_WET_BULB,
+                frame.values(
+                    temp_dry_bulb_min,
+                    temp_dry_bulb_max,
+                    HumidAirSettings.chart_temp_wet_bulb_step,
+                ),
+                frame.wet_bulb_line,
+            ),
+            *self._decreasing_lines(
+                frame,
+                resolution,
+                PsychrometricChartLineKind.SPECIFIC_VOLUME,
+                frame.values(
+                    frame.specific_volume(temp_dry_bulb_min, 0.0),
+                    frame.specific_volume(temp_dry_bulb_max, humidity_ratio_max),
+                    HumidAirSettings.chart_specific_volume_step,
+                ),
+                frame.specific_volume_line,
+            ),
+        ]
+        return PsychrometricChartEntity(
+            pressure=pressure,
+            temp_dry_bulb_min=temp_dry_bulb_min,
+            temp_dry_bulb_max=temp_dry_bulb_max,
+            humidity_ratio_max=humidity_ratio_max,
+            lines=lines,
+        )
+
+    def _relative_humidity_lines(
+        self, frame: "_ChartFrame", resolution: int
+    ) -> list[PsychrometricChartLineEntity]:
+        """Lignes d'humidité relative constante, croissantes en température sèche
+
+        Args:
+            frame (_ChartFrame): Cadre du diagramme
+            resolution (int): Nombre de points par ligne
+
+        Returns:
+            list[PsychrometricChartLineEntity]: Polylignes, de la plus sèche à la saturation
+        """
+        values = np.arange(
+            HumidAirSettings.chart_relative_humidity_step,
+            100 + HumidAirSettings.chart_relative_humidity_step / 2,
+            HumidAirSettings.chart_relative_humidity_step,
+        )
+        start = np.full_like(values, frame.temp_dry_bulb_min)
+        end = bisect_decreasing(
+            lambda t: (
+                frame.humidity_ratio_max - frame.relative_humidity_line(t, values)
+            ),
+            start,
+            np.full_like(values, frame.temp_dry_bulb_max),
+        )
+        return _sample(
+            PsychrometricChartLineKind.RELATIVE_HUMIDITY,
+            values,
+            start,
+            end,
+            resolution,
+            frame.relative_humidity_line,
+        )
+
+    def _decreasing_lines(
+        self,
+        frame: "_ChartFrame",
+        resolution: int,
+        kind: PsychrometricChartLineKind,
+        values: FloatArray,
+        line: Callable[[FloatArray, FloatArray], FloatArray],
+    ) -> list[PsychrometricChartLineEntity]:
+        """Lignes décroissantes en température sèche, de la saturation à l'air sec
+
+        Args:
+            frame (_ChartFrame): Cadre du diagramme
+            resolution (int): Nombre de points par ligne
+            kind (PsychrometricChartLineKind): Famille des lignes
+            values (FloatArray): Valeurs constantes des lignes
+            line (Callable[[FloatArray, FloatArray], FloatArray]): Humidité absolue
+                d'une ligne en fonction de la température sèche
+
+        Returns:
+            list[PsychrometricChartLineEntity]: Polylignes de la famille
+        """
+        lower = (
+            values
+            if kind is PsychrometricChartLineKind.TEMP_WET_BULB
+            else np.full_like(values, CORRELATION_TDB_MIN)
+        )
+        upper = np.full_like(values, CORRELATION_TDB_MAX)
+        saturated = bisect_decreasing(
+            lambda t: line(t, values) - frame.saturation_humidity_ratio(t),
+            lower,
+            upper,
+        )
+        top = bisect_decreasing(
+            lambda t: line(t, values) - frame.humidity_ratio_max, lower, upper
+        )
+        dry = bisect_decreasing(lambda t: line(t, values), lower, upper)
+        start = np.maximum(np.maximum(saturated, top), frame.temp_dry_bulb_min)
+        end = np.minimum(dry, frame.temp_dry_bulb_max)
+        return _sample(kind, values, start, end, resolution, line)
+
+
+class _ChartFrame:
+    """Cadre d'un diagramme et relations ASHRAE (chapitre 1) à sa pression"""
+
+    def __init__(
+        self,
+        pressure: float,
+        temp_dry_bulb_min: float,
+        temp_dry_bulb_max: float,
+        humidity_ratio_max: float,
+    ) -> None:
+        self.pressure = pressure
+        self.temp_dry_bulb_min = temp_dry_bulb_min
+        self.temp_dry_bulb_max = temp_dry_bulb_max
+        self.humidity_ratio_max = humidity_ratio_max
+
+    @staticmethod
+    def values(low: float, high: float, step: float) -> FloatArray:
+        """Multiples de step compris entre low et high"""
+        return np.arange(np.ceil(low / step), np.floor(high / step) + 1) * step
+
+    def saturation_humidity_ratio(self, temp_dry_bulb: FloatArray) -> FloatArray:
+        """Humidité absolue à saturation, infinie au-delà de l'ébullition"""
+        return self.relative_humidity_line(
+            temp_dry_bulb, np.full_like(temp_dry_bulb, 100.0)
+        )
+
+    def relative_humidity_line(
+        self, temp_dry_bulb: FloatArray, relative_humidity: FloatArray
+    ) -> FloatArray:
+        """Humidité absolue à humidité relative constante (ASHRAE éq. 20 et 22)"""
+        pw = (
+            relative_humidity
+            / 100
+            * saturation_pressure(temp_dry_bulb + TRIPLE_POINT_TEMPERATURE)
+        )
+        with np.errstate(divide="ignore"):
+            return np.where(
+                pw < self.pressure,
+                MOLAR_MASS_RATIO * pw / (self.pressure - pw),
+                np.inf,
+            )
+
+    def enthalpy(self, temp_dry_bulb: float, humidity_ratio: float) -> float:
+        """Enthalpie par kg d'air sec (ASHRAE éq. 32)"""
+        return 1000 * (
+            1.006 * temp_dry_bulb + humidity_ratio * (2501 + 1.86 * temp_dry_bulb)
+        )
+
+    def enthalpy_line(
+        self, temp_dry_bulb: FloatArray, enthalpy: FloatArray
+    ) -> FloatArray:
+        """Humidité absolue à enthalpie constante (ASHRAE éq. 32)"""
+        return (enthalpy / 1000 - 1.006 * temp_dry_bulb) / (2501 + 1.86 * temp_dry_bulb)
+
+    def wet_bulb_line(
+        self, temp_dry_bulb: FloatArray, temp_wet_bulb: FloatArray
+    ) -> FloatArray:
+        """Humidité absolue à température humide constante (ASHRAE éq. 33 et 35)"""
+        return wet_bulb_humidity_ratio(
+            np.full_like(temp_dry_bulb, self.pressure), temp_dry_bulb, temp_wet_bulb
+        )
+
+    def specific_volume(self, temp_dry_bulb: float, humidity_ratio: float) -> float:
+        """Volume spécifique par kg d'air sec (ASHRAE éq. 28)"""
+        return (
+            DRY_AIR_GAS_CONSTANT
+            * (temp_dry_bulb + TRIPLE_POINT_TEMPERATURE)
+            * (1 + 1.607858 * humidity_ratio)
+            / self.pressure
+        )
+
+    def specific_volume_line(
+        self, temp_dry_bulb: FloatArray, specific_volume: FloatArray
+    ) -> FloatArray:
+        """Humidité absolue à volume spécifique constant (ASHRAE éq. 28)"""
+        return (
+            specific_volume
+            * self.pressure
+            / (DRY_AIR_GAS_CONSTANT * (temp_dry_bulb + TRIPLE_POINT_TEMPERATURE))
+            - 1
+        ) / 1.607858
+
+
+def _sample(
+    kind: PsychrometricChartLineKind,
+    values: FloatArray,
+    start: FloatArray,
+    end: FloatArray,
+    resolution: int,
+    line: Callable[[FloatArray, FloatArray], FloatArray],
+) -> list[PsychrometricChartLineEntity]:
+    """Échantillonne les lignes d'une famille entre leurs extrémités
+
+    Les points non finis, au-delà de l'ébullition à la pression du diagramme,
+    sont retirés et les lignes de moins de deux points ne sont pas tracées.
+
+    Args:
+        kind (PsychrometricChartLineKind): Famille des lignes
+        values (FloatArray): Valeurs constantes des lignes
+        start (FloatArray): Températures sèches de début
+        end (FloatArray): Températures sèches de fin
+        resolution (int): Nombre de points par ligne
+        line (Callable[[FloatArray, FloatArray], FloatArray]): Humidité absolue
+            d'une ligne en fonction de la température sèche
+
+    Returns:
+        list[PsychrometricChartLineEntity]: Polylignes tracées de la famille
+    """
+    visible = end > start
+    values, start, end = values[visible], start[visible], end[visible]
+    fractions = np.linspace(0.0, 1.0, resolution)
+    temp_dry_bulb = start[:, None] + (end - start)[:, None] * fractions[None, :]
+    humidity_ratio = np.clip(line(temp_dry_bulb, values[:, None]), 0.0, None)
+    temp_dry_bulb = np.round(temp_dry_bulb, TEMP_DRY_BULB_DECIMALS)
+    humidity_ratio = np.round(humidity_ratio, HUMIDITY_RATIO_DECIMALS)
+    finite = np.isfinite(humidity_ratio)
+    return [
+        PsychrometricChartLineEntity(
+            kind=kind,
+            value=round(float(value), 6),
+            temp_dry_bulb=temp_dry_bulb[index][finite[index]].tolist(),
+            humidity_ratio=humidity_ratio[index][finite[index]].tolist(),
+        )
+        for index, value in enumerate(values)
+        if np.count_nonzero(finite[index]) >= 2
+    ]
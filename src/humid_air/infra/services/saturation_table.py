@@ -0,0 +1,88 @@
+import numpy as np
+import numpy.typing as npt
+
+from humid_air.domain.entities.saturation_table_entity import SaturationTableEntity
+from humid_air.domain.services.saturation_table_interface import (
+    SaturationTableInterface,
+)
+from humid_air.infra.services.hyland_wexler_engine import (
+    DRY_AIR_GAS_CONSTANT,
+    MOLAR_MASS_RATIO,
+    TRIPLE_POINT_TEMPERATURE,
+    FloatArray,
+    moist_air_enthalpy,
+    saturation_pressure,
+)
+
+# décimales des colonnes, proches de celles du tableau ASHRAE
+SATURATION_TABLE_DECIMALS: dict[str, int] = {
+    "temp_dry_bulb": 6,
+    "saturation_pressure": 3,
+    "humidity_ratio": 7,
+    "enthalpy": 1,
+    "specific_volume": 5,
+}
+
+
+def _column(
+    values: FloatArray, valid: npt.NDArray[np.bool_], name: str
+) -> list[float | None]:
+    """Colonne arrondie, None pour les températures sans état saturé"""
+    rounded = np.round(values, SATURATION_TABLE_DECIMALS[name])
+    return [
+        float(value) if ok else None
+        for value, ok in zip(rounded.tolist(), valid.tolist(), strict=True)
+    ]
+
+
+class HylandWexlerSaturationTable(SaturationTableInterface):
+    """Générateur vectorisé de tables de saturation (ASHRAE, Hyland-Wexler)
+
+    Toutes les lignes sont calculées en une passe NumPy : pression de
+    saturation sur glace sous 0 °C et sur eau au-dessus, puis humidité
+    absolue, enthalpie et volume spécifique à saturation (ASHRAE éq. 23,
+    32 et 28).
+
+    Args:
+        SaturationTableInterface (SaturationTableInterface): Interface des générateurs de tables
+    """
+
+    def build(
+        self,
+        pressure: float,
+        temp_dry_bulb_min: float,
+        temp_dry_bulb_max: float,
+        temp_dry_bulb_step: float,
+    ) -> SaturationTableEntity:
+        count = int(
+            np.floor(
+                (temp_dry_bulb_max - temp_dry_bulb_min) / temp_dry_bulb_step + 1e-9
+            )
+        )
+        temp_dry_bulb: FloatArray = temp_dry_bulb_min + temp_dry_bulb_step * np.arange(
+            count + 1, dtype=np.float64
+        )
+        vapor_pressure = saturation_pressure(temp_dry_bulb + TRIPLE_POINT_TEMPERATURE)
+        valid = vapor_pressure < pressure
+        with np.errstate(divide="ignore", invalid="ignore"):
+            humidity_ratio = (
+                MOLAR_MASS_RATIO * vapor_pressure / (pressure - vapor_pressure)
+            )
+        specific_volume = (
+            DRY_AIR_GAS_CONSTANT
+            * (temp_dry_bulb + TRIPLE_POINT_TEMPERATURE)
+            * (1 + 1.607858 * humidity_ratio)
+            / pressure
+        )
+        return SaturationTableEntity(
+            pressure=pressure,
+            temp_dry_bulb=np.round(
+                temp_dry_bulb, SATURATION_TABLE_DECIMALS["temp_dry_bulb"]
+            ).tolist(),
+            saturation_pressure=_column(vapor_pressure, valid, "saturation_pressure"),
+            humidity_ratio=_column(humidity_ratio, valid, "humidity_ratio"),
+            enthalpy=_column(
+                moist_air_enthalpy(temp_dry_bulb, humidity_ratio), valid, "enthalpy"
+            ),
+            specific_volume=_column(specific_volume, valid, "specific_volume"),
+        )
@@ -0,0 +1,272 @@
+import numpy as np
+import numpy.typing as npt
+
+from humid_air.domain.entities.thermal_comfort_entity import (
+    ComfortZoneEntity,
+    ThermalComfortBatchEntity,
+)
+from humid_air.domain.services.thermal_comfort_interface import (
+    ThermalComfortInterface,
+)
+from humid_air.infra.services.hyland_wexler_engine import (
+    MOLAR_MASS_RATIO,
+    TRIPLE_POINT_TEMPERATURE,
+    FloatArray,
+    bisect_decreasing,
+    saturation_pressure,
+)
+
+MET = 58.15  # [W/m²]
+# zéro absolu arrondi du programme de référence des normes, en [K]
+PMV_KELVIN_OFFSET = 273.0
+CLO = 0.155  # [m².K/W]
+CLOTHING_ITERATIONS = 150
+CLOTHING_TOLERANCE = 1.5e-4
+# bornes de température opérative explorées pour la zone de confort, en [°C]
+COMFORT_ZONE_TEMPERATURE_BOUNDS = (0.0, 50.0)
+COMFORT_ZONE_POINTS = 7
+PMV_LIMIT = 0.5
+# modèle adaptatif d'ASHRAE 55 (§ 5.4)
+ADAPTIVE_SLOPE = 0.31
+ADAPTIVE_INTERCEPT = 17.8
+ADAPTIVE_OUTDOOR_BOUNDS = (10.0, 33.5)
+ADAPTIVE_LIMIT_80 = 3.5
+ADAPTIVE_LIMIT_90 = 2.5
+PMV_DECIMALS = 2
+PPD_DECIMALS = 1
+TEMPERATURE_DECIMALS = 2
+HUMIDITY_RATIO_DECIMALS = 6
+
+
+def predicted_mean_vote(
+    temp_dry_bulb: FloatArray,
+    mean_radiant_temperature: FloatArray,
+    air_speed: FloatArray,
+    vapor_pressure: FloatArray,
+    metabolic_rate: FloatArray,
+    clothing: FloatArray,
+) -> FloatArray:
+    """Vote moyen prévisible de Fanger (ISO 7730 annexe D, ASHRAE 55 annexe B)
+
+    La température de surface des vêtements est résolue par le point fixe de
+    la norme, itéré simultanément sur tous les états jusqu'à convergence du
+    plus lent.
+
+    Args:
+        temp_dry_bulb (FloatArray): Températures sèches en [°C]
+        mean_radiant_temperature (FloatArray): Températures radiantes moyennes en [°C]
+        air_speed (FloatArray): Vitesses relatives de l'air en [m/s]
+        vapor_pressure (FloatArray): Pressions partielles de vapeur en [Pa]
+        metabolic_rate (FloatArray): Métabolismes en [met]
+        clothing (FloatArray): Isolations vestimentaires en [clo]
+
+    Returns:
+        FloatArray: Votes moyens prévisibles
+    """
+    metabolism = metabolic_rate * MET
+    insulation = clothing * CLO
+    clothing_factor = np.where(
+        insulation <= 0.078, 1 + 1.29 * insulation, 1.05 + 0.645 * insulation
+    )
+    forced_convection = 12.1 * np.sqrt(air_speed)
+    air_temperature = temp_dry_bulb + PMV_KELVIN_OFFSET
+    radiant_temperature = mean_radiant_temperature + PMV_KELVIN_OFFSET
+
+    p1 = insulation * clothing_factor
+    p2 = p1 * 3.96
+    p3 = p1 * 100
+    p4 = p1 * air_temperature
+    p5 = 308.7 - 0.028 * metabolism + p2 * (radiant_temperature / 100) ** 4
+    surface_temperature = air_temperature + (35.5 - temp_dry_bulb) / (
+        3.5 * insulation + 0.1
+    )
+    current = surface_temperature / 100
+    previous = surface_temperature / 50
+    convection = forced_convection
+    for _ in range(CLOTHING_ITERATIONS):
+        previous = (previous + current) / 2
+        convection = np.maximum(
+            forced_convection,
+            2.38 * np.abs(100 * previous - air_temperature) ** 0.25,
+        )
+        current = (p5 + p4 * convection - p2 * previous**4) / (100 + p3 * convection)
+        if not np.any(np.abs(current - previous) > CLOTHING_TOLERANCE):
+            break
+    clothing_temperature = 100 * current - PMV_KELVIN_OFFSET
+
+    skin_diffusion = 3.05e-3 * (5733 - 6.99 * metabolism - vapor_pressure)
+    sweating = np.where(metabolism > MET, 0.42 * (metabolism - MET), 0.0)
+    latent_respiration = 1.7e-5 * metabolism * (5867 - vapor_pressure)
+    dry_respiration = 0.0014 * metabolism * (34 - temp_dry_bulb)
+    radiation = 3.96 * clothing_factor * (current**4 - (radiant_temperature / 100) ** 4)
+    convection_loss = (
+        clothing_factor * convection * (clothing_temperature - temp_dry_bulb)
+    )
+    sensitivity = 0.303 * np.exp(-0.036 * metabolism) + 0.028
+    return sensitivity * (
+        metabolism
+        - skin_diffusion
+        - sweating
+        - latent_respiration
+        - dry_respiration
+        - radiation
+        - convection_loss
+    )
+
+
+def predicted_percentage_dissatisfied(pmv: FloatArray) -> FloatArray:
+    """Pourcentage prévisible d'insatisfaits (ISO 7730 éq. 5)
+
+    Args:
+        pmv (FloatArray): Votes moyens prévisibles
+
+    Returns:
+        FloatArray: Pourcentages d'insatisfaits en [%]
+    """
+    return 100 - 95 * np.exp(-0.03353 * pmv**4 - 0.2179 * pmv**2)
+
+
+def operative_temperature(
+    temp_dry_bulb: FloatArray,
+    mean_radiant_temperature: FloatArray,
+    air_speed: FloatArray,
+) -> FloatArray:
+    """Température opérative pondérée selon la vitesse d'air (ASHRAE 55 annexe A)
+
+    Args:
+        temp_dry_bulb (FloatArray): Températures sèches en [°C]
+        mean_radiant_temperature (FloatArray): Températures radiantes moyennes en [°C]
+        air_speed (FloatArray): Vitesses relatives de l'air en [m/s]
+
+    Returns:
+        FloatArray: Températures opératives en [°C]
+    """
+    weight = np.select([air_speed < 0.2, air_speed < 0.6], [0.5, 0.6], default=0.7)
+    return weight * temp_dry_bulb + (1 - weight) * mean_radiant_temperature
+
+
+def _column(values: FloatArray, decimals: int) -> list[float | None]:
+    return [float(value) for value in np.round(values, decimals).tolist()]
+
+
+def _flags(
+    values: npt.NDArray[np.bool_], applicable: npt.NDArray[np.bool_]
+) -> list[bool | None]:
+    return [
+        bool(value) if ok else None
+        for value, ok in zip(values.tolist(), applicable.tolist(), strict=True)
+    ]
+
+
+class FangerThermalComfort(ThermalComfortInterface):
+    """Évaluation vectorisée du confort thermique (ISO 7730, ASHRAE 55)
+
+    Le PMV/PPD de Fanger est calculé en une passe NumPy sur tout le lot,
+    avec la pression de vapeur de Hyland-Wexler ; le modèle adaptatif
+    d'ASHRAE 55 compare la température opérative à la température de
+    confort déduite de la température extérieure moyenne prédominante.
+    L'effet rafraîchissant des vitesses d'air élevées (modèle SET) n'est
+    pas appliqué.
+
+    Args:
+        ThermalComfortInterface (ThermalComfortInterface): Interface d'évaluation du confort
+    """
+
+    def evaluate(
+        self,
+        temp_dry_bulb: list[float],
+        mean_radiant_temperature: list[float],
+        air_speed: list[float],
+        relative_humidity: list[float],
+        metabolic_rate: list[float],
+        clothing: list[float],
+        prevailing_mean_outdoor_temperature: list[float] | None = None,
+    ) -> ThermalComfortBatchEntity:
+        tdb = np.asarray(temp_dry_bulb, dtype=np.float64)
+        tr = np.asarray(mean_radiant_temperature, dtype=np.float64)
+        speed = np.asarray(air_speed, dtype=np.float64)
+        vapor_pressure = (
+            np.asarray(relative_humidity, dtype=np.float64)
+            / 100
+            * saturation_pressure(tdb + TRIPLE_POINT_TEMPERATURE)
+        )
+        pmv = predicted_mean_vote(
+            tdb,
+            tr,
+            speed,
+            vapor_pressure,
+            np.asarray(metabolic_rate, dtype=np.float64),
+            np.asarray(clothing, dtype=np.float64),
+        )
+        operative = operative_temperature(tdb, tr, speed)
+        batch = ThermalComfortBatchEntity(
+            pmv=_column(pmv, PMV_DECIMALS),
+            ppd=_column(predicted_percentage_dissatisfied(pmv), PPD_DECIMALS),
+            operative_temperature=_column(operative, TEMPERATURE_DECIMALS),
+        )
+        if prevailing_mean_outdoor_temperature is None:
+            return batch
+
+        outdoor = np.asarray(prevailing_mean_outdoor_temperature, dtype=np.float64)
+        applicable = (outdoor >= ADAPTIVE_OUTDOOR_BOUNDS[0]) & (
+            outdoor <= ADAPTIVE_OUTDOOR_BOUNDS[1]
+        )
+        comfort = ADAPTIVE_SLOPE * outdoor + ADAPTIVE_INTERCEPT
+        deviation = np.abs(operative - comfort)
+        batch.adaptive_comfort_temperature = [
+            float(value) if ok else None
+            for value, ok in zip(
+                np.round(comfort, TEMPERATURE_DECIMALS).tolist(),
+                applicable.tolist(),
+                strict=True,
+            )
+        ]
+        batch.adaptive_acceptable_80 = _flags(
+            deviation <= ADAPTIVE_LIMIT_80, applicable
+        )
+        batch.adaptive_acceptable_90 = _flags(
+            deviation <= ADAPTIVE_LIMIT_90, applicable
+        )
+        return batch
+
+    def comfort_zone(
+        self,
+        pressure: float,
+        clothing: float,
+        metabolic_rate: float,
+        air_speed: float,
+        humidity_ratio_max: float,
+    ) -> ComfortZoneEntity:
+        # les bords froid (PMV -0,5) et chaud (PMV +0,5) sont résolus ensemble,
+        # à température radiante égale à la température de l'air
+        humidity_ratio = np.linspace(0, humidity_ratio_max, COMFORT_ZONE_POINTS)
+        ratios = np.concatenate([humidity_ratio, humidity_ratio[::-1]])
+        targets = np.repeat([-PMV_LIMIT, PMV_LIMIT], COMFORT_ZONE_POINTS)
+        vapor_pressure = pressure * ratios / (MOLAR_MASS_RATIO + ratios)
+        size = ratios.size
+
+        def excess(temperature: FloatArray) -> FloatArray:
+            return targets - predicted_mean_vote(
+                temperature,
+                temperature,
+                np.full(size, air_speed),
+                vapor_pressure,
+                np.full(size, metabolic_rate),
+                np.full(size, clothing),
+            )
+
+        temperature = bisect_decreasing(
+            excess,
+            np.full(size, COMFORT_ZONE_TEMPERATURE_BOUNDS[0]),
+            np.full(size, COMFORT_ZONE_TEMPERATURE_BOUNDS[1]),
+        )
+        temperature = np.append(temperature, temperature[0])
+        ratios = np.append(ratios, ratios[0])
+        return ComfortZoneEntity(
+            pressure=pressure,
+            clothing=clothing,
+            metabolic_rate=metabolic_rate,
+            air_speed=air_speed,
+            temp_dry_bulb=np.round(temperature, TEMPERATURE_DECIMALS).tolist(),
+            humidity_ratio=np.round(ratios, HUMIDITY_RATIO_DECIMALS).tolist(),
+        )
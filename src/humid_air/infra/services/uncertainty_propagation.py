@@ -0,0 +1,224 @@
+import warnings
+from statistics import NormalDist
+
+import numpy as np
+
+from humid_air.domain.entities.humid_air_entity import HUMID_AIR_PROPERTY_DECIMALS
+from humid_air.domain.entities.uncertainty_entity import (
+    HumidAirUncertaintyEntity,
+    PropertyUncertaintyEntity,
+    UncertaintyMethod,
+)
+from humid_air.domain.services.humid_air_engine_interface import (
+    HumidAirEngineInterface,
+)
+from humid_air.domain.services.uncertainty_propagator_interface import (
+    UncertaintyPropagatorInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+from humid_air.infra.services.hyland_wexler_engine import FloatArray
+
+# position des entrées dans les tableaux (entrée, état)
+PRESSURE, TEMP_DRY_BULB, RELATIVE_HUMIDITY = range(3)
+# décimales ajoutées à celles de la propriété pour les statistiques
+UNCERTAINTY_EXTRA_DECIMALS = 2
+
+
+def _column(values: FloatArray, name: str) -> list[float | None]:
+    """Convertit une statistique en colonne, None pour les valeurs non finies"""
+    rounded = np.round(
+        values, HUMID_AIR_PROPERTY_DECIMALS.get(name, 15) + UNCERTAINTY_EXTRA_DECIMALS
+    )
+    return [float(value) if np.isfinite(value) else None for value in rounded]
+
+
+class NumpyUncertaintyPropagator(UncertaintyPropagatorInterface):
+    """Propagation vectorisée des incertitudes d'entrée avec numpy
+
+    Les états nominaux et perturbés du lot sont empilés dans un tableau
+    (ligne, état), la ligne 0 portant les états nominaux, puis calculés en un
+    seul appel au moteur, sans arrondi : un écart de l'ordre de l'arrondi
+    des propriétés fausserait les pentes et les tirages. Seules les
+    statistiques sont arrondies. Les humidités relatives perturbées sont ramenées
+    entre 0 et 100 %. Un état perturbé en erreur est ignoré des statistiques ;
+    seules les erreurs des états nominaux sont renvoyées.
+    """
+
+    def propagate(
+        self,
+        engine: HumidAirEngineInterface,
+        pressure: list[float],
+        temp_dry_bulb: list[float],
+        relative_humidity: list[float],
+        pressure_uncertainty: float,
+        temp_dry_bulb_uncertainty: float,
+        relative_humidity_uncertainty: float,
+        method: UncertaintyMethod,
+        samples: int,
+        coverage: float,
+        seed: int | None,
+        fields: tuple[str, ...],
+    ) -> HumidAirUncertaintyEntity:
+        if not pressure:
+            empty = PropertyUncertaintyEntity(
+                nominal=[], mean=[], standard_deviation=[], lower=[], upper=[]
+            )
+            return HumidAirUncertaintyEntity(
+                method=method,
+                coverage=coverage,
+                properties={name: empty.model_copy(deep=True) for name in fields},
+            )
+        nominal = np.array(
+            [pressure, temp_dry_bulb, relative_humidity], dtype=np.float64
+        ).reshape(3, -1)
+        uncertainties = np.array(
+            [
+                pressure_uncertainty,
+                temp_dry_bulb_uncertainty,
+                relative_humidity_uncertainty,
+            ],
+            dtype=np.float64,
+        )
+        perturbed = [index for index in range(3) if uncertainties[index] > 0]
+        if method is UncertaintyMethod.FINITE_DIFFERENCE:
+            inputs = self._finite_difference_inputs(nominal, uncertainties, perturbed)
+        else:
+            inputs = self._monte_carlo_inputs(nominal, uncertainties, samples, seed)
+        inputs[:, RELATIVE_HUMIDITY] = np.clip(
+            inputs[:, RELATIVE_HUMIDITY], HumidAirSettings.rh_ge, HumidAirSettings.rh_le
+        )
+
+        rows, _, size = inputs.shape
+        computed = engine.compute(
+            pressure=inputs[:, PRESSURE].ravel().tolist(),
+            temp_dry_bulb=inputs[:, TEMP_DRY_BULB].ravel().tolist(),
+            relative_humidity=inputs[:, RELATIVE_HUMIDITY].ravel().tolist(),
+            fields=fields,
+            rounded=False,
+        )
+
+        properties: dict[str, PropertyUncertaintyEntity] = {}
+        for name in fields:
+            values = np.array(
+                [
+                    np.nan if value is None else value
+                    for value in computed.properties[name]
+                ],
+                dtype=np.float64,
+            ).reshape(rows, size)
+            if method is UncertaintyMethod.FINITE_DIFFERENCE:
+                mean, deviation, lower, upper = self._linear_statistics(
+                    values, inputs, uncertainties, perturbed, coverage
+                )
+            else:
+                mean, deviation, lower, upper = self._sample_statistics(
+                    values, coverage
+                )
+            properties[name] = PropertyUncertaintyEntity(
+                nominal=_column(values[0], name),
+                mean=_column(mean, name),
+                standard_deviation=_column(deviation, name),
+                lower=_column(lower, name),
+                upper=_column(upper, name),
+            )
+
+        return HumidAirUncertaintyEntity(
+            method=method,
+            coverage=coverage,
+            properties=properties,
+            errors=[error for error in computed.errors if error.index < size],
+        )
+
+    def _finite_difference_inputs(
+        self, nominal: FloatArray, uncertainties: FloatArray, perturbed: list[int]
+    ) -> FloatArray:
+        """Empile l'état nominal puis, par entrée incertaine, les états à +u et -u
+
+        Returns:
+            FloatArray: Entrées de forme (1 + 2 × entrées incertaines, 3, états)
+        """
+        inputs = np.repeat(nominal[np.newaxis], 1 + 2 * len(perturbed), axis=0)
+        for position, index in enumerate(perturbed):
+            inputs[1 + 2 * position, index] += uncertainties[index]
+            inputs[2 + 2 * position, index] -= uncertainties[index]
+        return inputs
+
+    def _monte_carlo_inputs(
+        self,
+        nominal: FloatArray,
+        uncertainties: FloatArray,
+        samples: int,
+        seed: int | None,
+    ) -> FloatArray:
+        """Empile l'état nominal puis des tirages gaussiens indépendants des entrées
+
+        Returns:
+            FloatArray: Entrées de forme (1 + tirages, 3, états)
+        """
+        rng = np.random.default_rng(seed)
+        draws = nominal + rng.standard_normal(
+            (samples, *nominal.shape)
+        ) * uncertainties.reshape(3, 1)
+        return np.concatenate([nominal[np.newaxis], draws])
+
+    def _linear_statistics(
+        self,
+        values: FloatArray,
+        inputs: FloatArray,
+        uncertainties: FloatArray,
+        perturbed: list[int],
+        coverage: float,
+    ) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+        """Combine les sensibilités par différences finies centrées (loi de propagation)
+
+        La pente est prise sur les entrées effectivement calculées, ce qui
+        rend la différence décentrée près des bornes de l'humidité relative.
+        L'intervalle élargi est symétrique, de facteur gaussien pour la
+        couverture demandée.
+
+        Returns:
+            tuple[FloatArray, FloatArray, FloatArray, FloatArray]: Moyennes,
+                écarts types, bornes inférieures et supérieures
+        """
+        variance = np.zeros(values.shape[1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for position, index in enumerate(perturbed):
+                plus, minus = 1 + 2 * position, 2 + 2 * position
+                slope = (values[plus] - values[minus]) / (
+                    inputs[plus, index] - inputs[minus, index]
+                )
+                variance += (slope * uncertainties[index]) ** 2
+        deviation = np.where(np.isfinite(values[0]), np.sqrt(variance), np.nan)
+        factor = NormalDist().inv_cdf((1 + coverage) / 2)
+        return (
+            values[0],
+            deviation,
+            values[0] - factor * deviation,
+            values[0] + factor * deviation,
+        )
+
+    def _sample_statistics(
+        self, values: FloatArray, coverage: float
+    ) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+        """Résume les tirages Monte-Carlo, quantiles pour l'intervalle élargi
+
+        Un état dont la valeur nominale n'est pas calculable n'a pas de
+        statistiques.
+
+        Returns:
+            tuple[FloatArray, FloatArray, FloatArray, FloatArray]: Moyennes,
+                écarts types, bornes inférieures et supérieures
+        """
+        draws = np.where(np.isfinite(values[0]), values[1:], np.nan)
+        with warnings.catch_warnings():
+            # états dont aucun tirage n'est calculable
+            warnings.simplefilter("ignore", RuntimeWarning)
+            lower, upper = np.nanquantile(
+                draws, [(1 - coverage) / 2, (1 + coverage) / 2], axis=0
+            )
+            return (
+                np.nanmean(draws, axis=0),
+                np.nanstd(draws, axis=0, ddof=1),
+                lower,
+                upper,
+            )
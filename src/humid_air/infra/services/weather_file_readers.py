@@ -0,0 +1,227 @@
+import csv
+import math
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchErrorEntity
+from humid_air.domain.entities.humid_air_entity import (
+    HUMID_AIR_INPUT_NAMES,
+    HUMID_AIR_INPUT_PAIRS,
+)
+from humid_air.domain.entities.weather_file_entity import WeatherRecordsEntity
+from humid_air.domain.services.weather_file_reader_interface import (
+    WeatherFileReaderInterface,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+# colonnes d'un enregistrement EPW (EnergyPlus Auxiliary Programs, Weather
+# Converter) et valeurs signalant une donnée manquante
+EPW_LABELS: tuple[tuple[str, int], ...] = (
+    ("year", 0),
+    ("month", 1),
+    ("day", 2),
+    ("hour", 3),
+    ("minute", 4),
+)
+EPW_TEMP_DRY_BULB = 6
+EPW_RELATIVE_HUMIDITY = 8
+EPW_PRESSURE = 9
+EPW_MISSING_TEMP_DRY_BULB = 99.9
+EPW_MISSING_RELATIVE_HUMIDITY = 999
+EPW_MISSING_PRESSURE = 999999
+
+
+def _to_float(value: str | None) -> float:
+    """Convertit une valeur texte, NaN si elle est absente ou illisible"""
+    try:
+        return float(value) if value is not None else math.nan
+    except ValueError:
+        return math.nan
+
+
+def _or_default(value: float, default: float) -> float:
+    """Remplace une valeur manquante par la valeur par défaut"""
+    return value if math.isfinite(value) else default
+
+
+def _invalid_values(
+    inputs: dict[str, list[float]], line_numbers: list[int]
+) -> list[HumidAirBatchErrorEntity]:
+    """Signale chaque entrée manquante ou illisible avec sa colonne et sa ligne
+
+    Args:
+        inputs (dict[str, list[float]]): Entrées de la tranche, NaN si invalides
+        line_numbers (list[int]): Ligne de chaque enregistrement dans le fichier
+
+    Returns:
+        list[HumidAirBatchErrorEntity]: Erreurs indexées dans la tranche
+    """
+    return sorted(
+        (
+            HumidAirBatchErrorEntity(
+                index=index,
+                field=name,
+                message=HumidAirSettings.weather_invalid_value_message.format(
+                    column=name, row=line_numbers[index]
+                ),
+            )
+            for name, values in inputs.items()
+            for index, value in enumerate(values)
+            if not math.isfinite(value)
+        ),
+        key=lambda error: error.index,
+    )
+
+
+class EpwWeatherFileReader(WeatherFileReaderInterface):
+    """Lecteur de fichiers EnergyPlus Weather (EPW)
+
+    Les 8 lignes d'en-tête sont ignorées après vérification de la première.
+    Chaque enregistrement fournit la température sèche, l'humidité relative
+    et la pression ; une pression manquante est remplacée par la pression
+    par défaut, une entrée manquante ou illisible est signalée en erreur.
+
+    Args:
+        WeatherFileReaderInterface (WeatherFileReaderInterface): Interface des lecteurs
+    """
+
+    def read(
+        self, lines: Iterable[str], pressure: float, chunk_size: int
+    ) -> Iterator[WeatherRecordsEntity]:
+        """Lit les enregistrements EPW par tranches
+
+        Args:
+            lines (Iterable[str]): Lignes du fichier
+            pressure (float): Pression absolue en [Pa] utilisée si elle est manquante
+            chunk_size (int): Nombre maximal d'enregistrements par tranche
+
+        Raises:
+            ValueError: Première ligne différente de LOCATION
+
+        Returns:
+            Iterator[WeatherRecordsEntity]: Tranches d'enregistrements
+        """
+        rows = csv.reader(lines)
+        header = list(islice(rows, HumidAirSettings.weather_epw_header_lines))
+        if not header or not header[0] or header[0][0].strip() != "LOCATION":
+            raise ValueError(HumidAirSettings.weather_epw_invalid_message)
+
+        start = 0
+        chunk: list[tuple[int, list[str]]] = []
+        for row in rows:
+            if not row:
+                continue
+            chunk.append((rows.line_num, row))
+            if len(chunk) == chunk_size:
+                yield self._to_records(start, chunk, pressure)
+                start += len(chunk)
+                chunk = []
+        if chunk:
+            yield self._to_records(start, chunk, pressure)
+
+    def _to_records(
+        self, start: int, rows: list[tuple[int, list[str]]], pressure: float
+    ) -> WeatherRecordsEntity:
+        def column(index: int) -> list[str | None]:
+            return [row[index] if index < len(row) else None for _, row in rows]
+
+        temp_dry_bulb = [_to_float(value) for value in column(EPW_TEMP_DRY_BULB)]
+        relative_humidity = [
+            _to_float(value) for value in column(EPW_RELATIVE_HUMIDITY)
+        ]
+        row_pressure = [_to_float(value) for value in column(EPW_PRESSURE)]
+        inputs = {
+            "temp_dry_bulb": [
+                value if value < EPW_MISSING_TEMP_DRY_BULB else math.nan
+                for value in temp_dry_bulb
+            ],
+            "relative_humidity": [
+                value if value < EPW_MISSING_RELATIVE_HUMIDITY else math.nan
+                for value in relative_humidity
+            ],
+        }
+        return WeatherRecordsEntity(
+            start=start,
+            labels={
+                name: [value or "" for value in column(index)]
+                for name, index in EPW_LABELS
+            },
+            pressure=[
+                value if value < EPW_MISSING_PRESSURE else pressure
+                for value in row_pressure
+            ],
+            inputs=inputs,
+            errors=_invalid_values(inputs, [line_number for line_number, _ in rows]),
+        )
+
+
+class CsvWeatherFileReader(WeatherFileReaderInterface):
+    """Lecteur de fichiers météo CSV
+
+    La ligne d'en-tête nomme les colonnes : les entrées de l'état sont les
+    colonnes portant un nom d'entrée de get_ha_props, 'pressure' est
+    optionnelle et toutes les autres colonnes sont recopiées en sortie. Une
+    entrée manquante ou illisible est signalée en erreur.
+
+    Args:
+        WeatherFileReaderInterface (WeatherFileReaderInterface): Interface des lecteurs
+    """
+
+    def read(
+        self, lines: Iterable[str], pressure: float, chunk_size: int
+    ) -> Iterator[WeatherRecordsEntity]:
+        """Lit les enregistrements CSV par tranches
+
+        Args:
+            lines (Iterable[str]): Lignes du fichier
+            pressure (float): Pression absolue en [Pa] utilisée sans colonne 'pressure'
+            chunk_size (int): Nombre maximal d'enregistrements par tranche
+
+        Raises:
+            ValueError: Fichier sans ligne d'en-tête, ou dont l'en-tête ne nomme
+                pas deux colonnes d'entrée indépendantes
+
+        Returns:
+            Iterator[WeatherRecordsEntity]: Tranches d'enregistrements
+        """
+        rows = csv.DictReader(lines)
+        if not rows.fieldnames:
+            raise ValueError(HumidAirSettings.weather_csv_empty_message)
+        columns = [name.strip() for name in rows.fieldnames]
+        rows.fieldnames = columns
+        inputs = [name for name in HUMID_AIR_INPUT_NAMES if name in columns]
+        if frozenset(inputs) not in HUMID_AIR_INPUT_PAIRS:
+            raise ValueError(HumidAirSettings.weather_csv_missing_inputs_message)
+        labels = [name for name in columns if name not in inputs and name != "pressure"]
+
+        start = 0
+        chunk: list[tuple[int, dict[str, str | None]]] = []
+        for row in rows:
+            chunk.append((rows.line_num, row))
+            if len(chunk) == chunk_size:
+                yield self._to_records(start, chunk, pressure, inputs, labels)
+                start += len(chunk)
+                chunk = []
+        if chunk:
+            yield self._to_records(start, chunk, pressure, inputs, labels)
+
+    def _to_records(
+        self,
+        start: int,
+        rows: list[tuple[int, dict[str, str | None]]],
+        pressure: float,
+        inputs: list[str],
+        labels: list[str],
+    ) -> WeatherRecordsEntity:
+        values = {
+            name: [_to_float(row.get(name)) for _, row in rows] for name in inputs
+        }
+        return WeatherRecordsEntity(
+            start=start,
+            labels={name: [row.get(name) or "" for _, row in rows] for name in labels},
+            pressure=[
+                _or_default(_to_float(row.get("pressure")), pressure) for _, row in rows
+            ],
+            inputs=values,
+            errors=_invalid_values(values, [line_number for line_number, _ in rows]),
+        )
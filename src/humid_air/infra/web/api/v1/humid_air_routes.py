@@ -1,16 +1,100 @@
+import io
 from http import HTTPStatus
+from itertools import chain
+from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
 from flask import Response
+from flask_jwt_extended import get_jwt, verify_jwt_in_request
 from flask_openapi3 import APIBlueprint, Tag  # type: ignore[attr-defined]
 
 from common.infra.web.container import AppContainer
 from common.infra.web.dtos.generic import ErrorResponse
-from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertySchema
+from humid_air.app.schemas.compute_air_process_schema import ComputeAirProcessSchema
+from humid_air.app.schemas.compute_climate_analytics_schema import (
+    ComputeClimateAnalyticsSchema,
+)
+from humid_air.app.schemas.compute_thermal_comfort_schema import (
+    ComputeThermalComfortSchema,
+)
+from humid_air.app.schemas.get_comfort_zone_schema import GetComfortZoneSchema
+from humid_air.app.schemas.get_ha_props_schema import (
+    GetHumidAirPropertiesBatchSchema,
+    GetHumidAirPropertySchema,
+)
+from humid_air.app.schemas.get_psychrometric_chart_schema import (
+    GetPsychrometricChartSchema,
+)
+from humid_air.app.schemas.get_saturation_table_schema import (
+    GetSaturationTableSchema,
+)
+from humid_air.app.schemas.process_weather_file_schema import (
+    ProcessWeatherFileSchema,
+)
+from humid_air.app.schemas.propagate_uncertainty_schema import (
+    PropagateUncertaintySchema,
+)
+from humid_air.app.schemas.resolve_pressure_schema import ResolvePressureSchema
+from humid_air.app.schemas.solve_humid_air_schema import SolveHumidAirSchema
+from humid_air.app.usecases.compute_air_process import ComputeAirProcessUseCase
+from humid_air.app.usecases.compute_climate_analytics import (
+    ComputeClimateAnalyticsUseCase,
+)
+from humid_air.app.usecases.compute_thermal_comfort import (
+    ComputeThermalComfortUseCase,
+)
+from humid_air.app.usecases.get_comfort_zone import GetComfortZoneUseCase
 from humid_air.app.usecases.get_ha_props import GetHumidAirPropertyUseCase
+from humid_air.app.usecases.get_ha_props_approximate import (
+    GetApproximateHumidAirPropertyUseCase,
+)
+from humid_air.app.usecases.get_ha_props_batch import GetHumidAirPropertiesBatchUseCase
+from humid_air.app.usecases.get_ha_props_cache_statistics import (
+    GetHumidAirCacheStatisticsUseCase,
+)
+from humid_air.app.usecases.get_psychrometric_chart import (
+    GetPsychrometricChartUseCase,
+)
+from humid_air.app.usecases.get_saturation_table import GetSaturationTableUseCase
+from humid_air.app.usecases.process_weather_file import ProcessWeatherFileUseCase
+from humid_air.app.usecases.propagate_uncertainty import PropagateUncertaintyUseCase
+from humid_air.app.usecases.resolve_pressure import ResolvePressureUseCase
+from humid_air.app.usecases.solve_humid_air import SolveHumidAirUseCase
+from humid_air.app.usecases.stream_ha_props_batch import (
+    StreamHumidAirPropertiesBatchUseCase,
+)
+from humid_air.domain.entities.humid_air_batch_entity import (
+    HumidAirBatchOutputFormat,
+)
+from humid_air.domain.entities.psychrometric_chart_entity import (
+    PsychrometricChartFormat,
+)
+from humid_air.domain.entities.saturation_table_entity import SaturationTableFormat
+from humid_air.domain.exceptions.humid_air_exceptions import HumidAirValidationException
 from humid_air.infra.web.dtos.humid_air_dtos import (
+    AirProcessRequest,
+    ClimateAnalyticsRequest,
+    ComfortZoneRequest,
+    ComputeAirProcessResponse,
+    ComputeClimateAnalyticsResponse,
+    ComputeThermalComfortResponse,
+    GetComfortZoneResponse,
+    GetHumidAirCacheStatisticsResponse,
+    GetHumidAirPropertiesBatchResponse,
     GetHumidAirPropertyResponse,
-    HumidAirWithDryTemperatureAndRelativeHumidityRequest,
+    GetPsychrometricChartResponse,
+    GetSaturationTableResponse,
+    HumidAirBatchRequest,
+    HumidAirSolveRequest,
+    HumidAirStateRequest,
+    ProcessWeatherFileResponse,
+    PropagateUncertaintyResponse,
+    PsychrometricChartRequest,
+    SaturationTableRequest,
+    SolveHumidAirResponse,
+    ThermalComfortRequest,
+    UncertaintyRequest,
+    WeatherFileRequest,
 )
 
 tag = Tag(
@@ -18,6 +102,9 @@ tag = Tag(
     description="Propriétés thermodynamiques de l'air humide - Hermann et al. ASHRAE ASHREA-RP1485",
 )
 
+# jeton facultatif, exigé seulement pour lire la pression de site d'un projet
+security = [{}, {"jwt": []}]  # type: ignore[var-annotated]
+
 router = APIBlueprint(
     "/humid_air",
     __name__,
@@ -27,9 +114,32 @@ router = APIBlueprint(
 )
 
 
+def _project_user_id(project_id: UUID | None) -> UUID | None:
+    """Identifiant de l'utilisateur authentifié, exigé avec un projet
+
+    Args:
+        project_id (UUID | None): Projet dont la pression de site est demandée
+
+    Returns:
+        UUID | None: Utilisateur du jeton JWT, None sans projet
+    """
+    if project_id is None:
+        return None
+    verify_jwt_in_request()
+    return UUID(get_jwt().get("sub"))
+
+
 @router.get(
     "/get_ha_props",
-    description="Affiche l'ensemble des données disponibles pour l'air humide.",
+    description="Affiche l'ensemble des données disponibles pour l'air humide. "
+    "L'état est défini par la pression et deux entrées indépendantes parmi "
+    "température sèche, humidité relative, point de rosée, température humide, "
+    "humidité absolue et enthalpie. "
+    "Avec 'approximate', les propriétés sont interpolées dans une table précalculée "
+    "et leurs erreurs maximales sont indiquées dans 'max_errors'. "
+    "'fields' restreint le calcul et la réponse aux propriétés listées. "
+    "Sans pression, celle-ci est déduite de l'altitude ou du site du projet.",
+    security=security,
     responses={
         HTTPStatus.OK: GetHumidAirPropertyResponse,
         HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
@@ -37,23 +147,497 @@ router = APIBlueprint(
 )
 @inject
 def get_ha_props(
-    query: HumidAirWithDryTemperatureAndRelativeHumidityRequest,
+    query: HumidAirStateRequest,
     use_case: GetHumidAirPropertyUseCase = Provide[
         AppContainer.humid_air_usecases.provided["get_ha_props"]
     ],
+    approximate_use_case: GetApproximateHumidAirPropertyUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["get_ha_props_approximate"]
+    ],
+    pressure_use_case: ResolvePressureUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["resolve_pressure"]
+    ],
 ) -> Response:
     try:
+        pressure = pressure_use_case.execute(
+            ResolvePressureSchema(
+                **query.model_dump(include={"pressure", "altitude", "project_id"}),
+                user_id=_project_user_id(query.project_id),
+            )
+        )
         request = GetHumidAirPropertySchema(
-            pressure=query.pressure,
-            temp_dry_bulb=query.temp_dry_bulb,
-            relative_humidity=query.relative_humidity,
+            **{
+                **query.model_dump(exclude={"approximate", "altitude", "project_id"}),
+                "pressure": pressure,
+            }
         )
+        if query.approximate:
+            return GetHumidAirPropertyResponse.from_batch_result(
+                approximate_use_case.execute(request)
+            ).to_response()
         full_ha_props = use_case.execute(request)
         return GetHumidAirPropertyResponse.from_use_case_result(
-            full_ha_props
+            full_ha_props, request.fields
+        ).to_response()
+
+    except HumidAirValidationException as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=e.errors
+        ).to_response()
+
+    except ValueError as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
+        ).to_response()
+
+
+@router.post(
+    "/batch",
+    description="Calcule l'ensemble des données de l'air humide pour un lot d'états, "
+    "définis par deux entrées indépendantes comme pour 'get_ha_props'. "
+    "Les états invalides sont signalés individuellement dans 'errors'. "
+    "'fields' restreint le calcul et la réponse aux propriétés listées. "
+    "Sans liste de pressions, une pression unique est déduite de l'altitude ou "
+    "du site du projet et appliquée à tous les états. Avec 'output_format' à "
+    "'ndjson' ou 'csv', le lot est calculé par tranches et chaque ligne est "
+    "renvoyée au fil du calcul, avec son index et ses erreurs.",
+    security=security,
+    responses={
+        HTTPStatus.OK: GetHumidAirPropertiesBatchResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
+    },
+)
+@inject
+def get_ha_props_batch(
+    body: HumidAirBatchRequest,
+    use_case: GetHumidAirPropertiesBatchUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["get_ha_props_batch"]
+    ],
+    stream_use_case: StreamHumidAirPropertiesBatchUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["stream_ha_props_batch"]
+    ],
+    pressure_use_case: ResolvePressureUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["resolve_pressure"]
+    ],
+) -> Response:
+    try:
+        pressure: list[float] | float = (
+            body.pressure
+            if body.pressure is not None
+            else pressure_use_case.execute(
+                ResolvePressureSchema(
+                    altitude=body.altitude,
+                    project_id=body.project_id,
+                    user_id=_project_user_id(body.project_id),
+                )
+            )
+        )
+        request = GetHumidAirPropertiesBatchSchema(
+            **{
+                **body.model_dump(exclude={"altitude", "project_id", "output_format"}),
+                "pressure": pressure,
+            }
+        )
+        if body.output_format is not HumidAirBatchOutputFormat.JSON:
+            chunks = stream_use_case.execute(request)
+            # la première tranche est calculée avant l'envoi des en-têtes HTTP
+            # pour qu'une entrée non convertible donne une erreur 422
+            first = next(chunks, None)
+            return GetHumidAirPropertiesBatchResponse.to_stream_response(
+                chain([first], chunks) if first is not None else [],
+                body.output_format,
+                request.fields,
+            )
+        batch = use_case.execute(request)
+        return GetHumidAirPropertiesBatchResponse.from_use_case_result(
+            batch
+        ).to_response()
+
+    except ValueError as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
+        ).to_response()
+
+
+@router.post(
+    "/uncertainty",
+    description="Propage les incertitudes types des capteurs (température sèche, "
+    "humidité relative, pression) à chaque propriété d'un lot d'états, en une "
+    "seule requête : valeur nominale, moyenne, incertitude type et bornes de "
+    "l'intervalle élargi par propriété et par état. 'finite_difference' "
+    "combine les sensibilités par différences finies centrées, 'monte_carlo' "
+    "résume des tirages gaussiens des entrées. Les états nominaux et perturbés "
+    "sont calculés en une passe par le moteur choisi. Les états invalides sont "
+    "signalés individuellement dans 'errors'.",
+    security=security,
+    responses={
+        HTTPStatus.OK: PropagateUncertaintyResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
+    },
+)
+@inject
+def propagate_uncertainty(
+    body: UncertaintyRequest,
+    use_case: PropagateUncertaintyUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["propagate_uncertainty"]
+    ],
+    pressure_use_case: ResolvePressureUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["resolve_pressure"]
+    ],
+) -> Response:
+    try:
+        pressure: list[float] | float = (
+            body.pressure
+            if body.pressure is not None
+            else pressure_use_case.execute(
+                ResolvePressureSchema(
+                    altitude=body.altitude,
+                    project_id=body.project_id,
+                    user_id=_project_user_id(body.project_id),
+                )
+            )
+        )
+        request = PropagateUncertaintySchema(
+            **{
+                **body.model_dump(exclude={"altitude", "project_id"}),
+                "pressure": pressure,
+            }
+        )
+        uncertainty = use_case.execute(request)
+        return PropagateUncertaintyResponse.from_use_case_result(
+            uncertainty
+        ).to_response()
+
+    except ValueError as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
+        ).to_response()
+
+
+@router.post(
+    "/solve",
+    description="Recherche, pour chaque valeur cible d'une propriété, l'entrée "
+    "manquante d'un état : la température sèche à humidité relative fixée, ou "
+    "l'humidité relative à température sèche fixée (par exemple la température "
+    "de soufflage donnant une humidité absolue à 55 %, ou l'état de sortie de "
+    "batterie pour une enthalpie). Le lot est résolu en une passe vectorisée "
+    "par fausse position modifiée, avec encadrement garanti, puis les "
+    "propriétés des états trouvés sont calculées ('fields'). La convergence "
+    "est détaillée par état et résumée dans 'statistics' ; une cible non "
+    "encadrée est signalée dans 'errors'.",
+    security=security,
+    responses={
+        HTTPStatus.OK: SolveHumidAirResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
+    },
+)
+@inject
+def solve_humid_air(
+    body: HumidAirSolveRequest,
+    use_case: SolveHumidAirUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["solve_humid_air"]
+    ],
+    pressure_use_case: ResolvePressureUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["resolve_pressure"]
+    ],
+) -> Response:
+    try:
+        pressure: list[float] | float = (
+            body.pressure
+            if body.pressure is not None
+            else pressure_use_case.execute(
+                ResolvePressureSchema(
+                    altitude=body.altitude,
+                    project_id=body.project_id,
+                    user_id=_project_user_id(body.project_id),
+                )
+            )
+        )
+        request = SolveHumidAirSchema(
+            **{
+                **body.model_dump(exclude={"altitude", "project_id"}),
+                "pressure": pressure,
+            }
+        )
+        solution = use_case.execute(request)
+        return SolveHumidAirResponse.from_use_case_result(solution).to_response()
+
+    except ValueError as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
+        ).to_response()
+
+
+@router.post(
+    "/process",
+    description="Enchaîne les transformations d'une centrale de traitement d'air : "
+    "mélange des flux entrants, puis chauffage ou refroidissement sensible, "
+    "batterie froide (point de rosée de l'appareil et facteur de bypass), "
+    "humidification vapeur ou adiabatique. Chaque transformation renvoie son "
+    "état de sortie, ses puissances sensible, latente et totale et son débit "
+    "d'eau. 'fields' restreint le calcul et la réponse aux propriétés listées.",
+    responses={
+        HTTPStatus.OK: ComputeAirProcessResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
+    },
+)
+@inject
+def compute_air_process(
+    body: AirProcessRequest,
+    use_case: ComputeAirProcessUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["compute_air_process"]
+    ],
+) -> Response:
+    try:
+        request = ComputeAirProcessSchema(**body.model_dump())
+        process = use_case.execute(request)
+        return ComputeAirProcessResponse.from_use_case_result(
+            process, request.fields
+        ).to_response()
+
+    except HumidAirValidationException as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=e.errors
+        ).to_response()
+
+    except ValueError as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
+        ).to_response()
+
+
+@router.get(
+    "/chart",
+    description="Génère la géométrie d'un diagramme psychrométrique : lignes "
+    "d'humidité relative, d'enthalpie, de température humide et de volume "
+    "spécifique constants, en polylignes JSON ou en image SVG.",
+    responses={
+        HTTPStatus.OK: GetPsychrometricChartResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
+    },
+)
+@inject
+def get_psychrometric_chart(
+    query: PsychrometricChartRequest,
+    use_case: GetPsychrometricChartUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["get_psychrometric_chart"]
+    ],
+) -> Response:
+    try:
+        request = GetPsychrometricChartSchema(
+            pressure=query.pressure,
+            temp_dry_bulb_min=query.temp_dry_bulb_min,
+            temp_dry_bulb_max=query.temp_dry_bulb_max,
+            humidity_ratio_max=query.humidity_ratio_max,
+            resolution=query.resolution,
+        )
+        chart = use_case.execute(request)
+        if query.format is PsychrometricChartFormat.SVG:
+            return GetPsychrometricChartResponse.to_svg_response(chart)
+        return GetPsychrometricChartResponse.from_use_case_result(chart).to_response()
+
+    except ValueError as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
+        ).to_response()
+
+
+@router.get(
+    "/saturation_table",
+    description="Génère une table des propriétés de l'air saturé (pression de "
+    "vapeur saturante, humidité absolue, enthalpie et volume spécifique par kg "
+    "d'air sec) sur une plage de températures, comme le tableau 2 du chapitre 1 "
+    "de l'ASHRAE Fundamentals, en JSON ou en CSV pour un tableur.",
+    responses={
+        HTTPStatus.OK: GetSaturationTableResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
+    },
+)
+@inject
+def get_saturation_table(
+    query: SaturationTableRequest,
+    use_case: GetSaturationTableUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["get_saturation_table"]
+    ],
+) -> Response:
+    try:
+        request = GetSaturationTableSchema(**query.model_dump(exclude={"format"}))
+        table = use_case.execute(request)
+        if query.format is SaturationTableFormat.CSV:
+            return GetSaturationTableResponse.to_csv_response(table)
+        return GetSaturationTableResponse.from_use_case_result(table).to_response()
+
+    except ValueError as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
+        ).to_response()
+
+
+@router.post(
+    "/comfort",
+    description="Évalue le confort thermique d'un lot d'occupants (ISO 7730, "
+    "ASHRAE 55) : vote moyen prévisible PMV, pourcentage d'insatisfaits PPD et "
+    "température opérative, plus le modèle adaptatif si les températures "
+    "extérieures moyennes prédominantes sont fournies. Les conditions communes "
+    "(vitesse d'air, métabolisme, vêtements) peuvent être des valeurs uniques. "
+    "Les états hors du domaine du modèle sont signalés dans 'errors'.",
+    responses={
+        HTTPStatus.OK: ComputeThermalComfortResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
+    },
+)
+@inject
+def compute_thermal_comfort(
+    body: ThermalComfortRequest,
+    use_case: ComputeThermalComfortUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["compute_thermal_comfort"]
+    ],
+) -> Response:
+    try:
+        request = ComputeThermalComfortSchema(**body.model_dump())
+        batch = use_case.execute(request)
+        return ComputeThermalComfortResponse.from_use_case_result(batch).to_response()
+
+    except ValueError as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
+        ).to_response()
+
+
+@router.get(
+    "/comfort/zone",
+    description="Calcule le polygone de la zone de confort PMV de -0,5 à +0,5 "
+    "(méthode graphique d'ASHRAE 55) pour une tenue, une activité et une "
+    "vitesse d'air, en températures opératives et humidités absolues, "
+    "superposable au diagramme psychrométrique.",
+    responses={
+        HTTPStatus.OK: GetComfortZoneResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
+    },
+)
+@inject
+def get_comfort_zone(
+    query: ComfortZoneRequest,
+    use_case: GetComfortZoneUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["get_comfort_zone"]
+    ],
+) -> Response:
+    try:
+        zone = use_case.execute(GetComfortZoneSchema(**query.model_dump()))
+        return GetComfortZoneResponse.from_use_case_result(zone).to_response()
+
+    except ValueError as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
         ).to_response()
 
+
+@router.post(
+    "/weather_file",
+    description="Enrichit chaque heure d'un fichier météo (EPW ou CSV, 8760 heures "
+    "pour une année type) des propriétés de l'air humide. Le fichier est lu et "
+    "calculé par tranches, et les lignes enrichies sont renvoyées au fil du calcul "
+    "en CSV ou NDJSON. Les heures invalides sont signalées dans la colonne 'errors'.",
+    security=security,
+    responses={HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse},
+)
+@inject
+def process_weather_file(
+    form: WeatherFileRequest,
+    use_case: ProcessWeatherFileUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["process_weather_file"]
+    ],
+    pressure_use_case: ResolvePressureUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["resolve_pressure"]
+    ],
+) -> Response:
+    try:
+        pressure = pressure_use_case.execute(
+            ResolvePressureSchema(
+                **form.model_dump(include={"pressure", "altitude", "project_id"}),
+                user_id=_project_user_id(form.project_id),
+            )
+        )
+        request = ProcessWeatherFileSchema(
+            **form.model_dump(include={"file_format", "engine", "fields"}),
+            pressure=pressure,
+        )
+        lines = io.TextIOWrapper(
+            form.file.stream, encoding="utf-8", errors="replace", newline=""
+        )
+        chunks = use_case.execute(request, lines)
+        # la première tranche est calculée avant l'envoi des en-têtes HTTP
+        # pour qu'un fichier invalide donne une erreur 422
+        first = next(chunks, None)
+        return ProcessWeatherFileResponse.to_stream_response(
+            chain([first], chunks) if first is not None else [],
+            form.output_format,
+        )
+
     except ValueError as e:
         return ErrorResponse(
             code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
         ).to_response()
+
+
+@router.post(
+    "/weather_file/analytics",
+    description="Agrège un fichier météo horaire (EPW ou CSV) pour les estimations "
+    "énergétiques : heures par classe de température sèche avec température humide "
+    "moyenne coïncidente, degrés-jours de chauffage et de refroidissement et "
+    "enthalpies-heures. Le fichier est lu, calculé et réduit par tranches ; seules "
+    "les tables agrégées sont renvoyées.",
+    security=security,
+    responses={
+        HTTPStatus.OK: ComputeClimateAnalyticsResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
+    },
+)
+@inject
+def compute_climate_analytics(
+    form: ClimateAnalyticsRequest,
+    use_case: ComputeClimateAnalyticsUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["compute_climate_analytics"]
+    ],
+    pressure_use_case: ResolvePressureUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["resolve_pressure"]
+    ],
+) -> Response:
+    try:
+        pressure = pressure_use_case.execute(
+            ResolvePressureSchema(
+                **form.model_dump(include={"pressure", "altitude", "project_id"}),
+                user_id=_project_user_id(form.project_id),
+            )
+        )
+        request = ComputeClimateAnalyticsSchema(
+            **form.model_dump(exclude={"file", "pressure", "altitude", "project_id"}),
+            pressure=pressure,
+        )
+        lines = io.TextIOWrapper(
+            form.file.stream, encoding="utf-8", errors="replace", newline=""
+        )
+        return ComputeClimateAnalyticsResponse.from_use_case_result(
+            use_case.execute(request, lines)
+        ).to_response()
+
+    except ValueError as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
+        ).to_response()
+
+
+@router.get(
+    "/cache_statistics",
+    description="Affiche les compteurs du cache des états d'air humide de ce processus.",
+    responses={HTTPStatus.OK: GetHumidAirCacheStatisticsResponse},
+)
+@inject
+def get_cache_statistics(
+    use_case: GetHumidAirCacheStatisticsUseCase = Provide[
+        AppContainer.humid_air_usecases.provided["get_cache_statistics"]
+    ],
+) -> Response:
+    return GetHumidAirCacheStatisticsResponse.from_use_case_result(
+        use_case.execute()
+    ).to_response()
@@ -1,91 +1,1251 @@
+from collections.abc import Iterable
 from http import HTTPStatus
+from typing import Any
+from uuid import UUID
 
-from flask import Response, jsonify, make_response
-from pydantic import BaseModel, Field
+from flask import Response, jsonify, make_response, stream_with_context
+from flask_openapi3 import FileStorage  # type: ignore[attr-defined]
+from pydantic import BaseModel, Field, PrivateAttr
 
-from humid_air.domain.entities.humid_air_entity import HumidAirEntity
+from humid_air.domain.entities.air_process_entity import (
+    AirProcessEntity,
+    AirProcessKind,
+)
+from humid_air.domain.entities.climate_analytics_entity import ClimateAnalyticsEntity
+from humid_air.domain.entities.humid_air_batch_entity import (
+    HumidAirBatchChunkEntity,
+    HumidAirBatchEntity,
+    HumidAirBatchOutputFormat,
+)
+from humid_air.domain.entities.humid_air_entity import (
+    HUMID_AIR_PROPERTY_NAMES,
+    HumidAirEngine,
+    HumidAirEntity,
+)
+from humid_air.domain.entities.psychrometric_chart_entity import (
+    PsychrometricChartEntity,
+    PsychrometricChartFormat,
+    PsychrometricChartLineKind,
+)
+from humid_air.domain.entities.saturation_table_entity import (
+    SaturationTableEntity,
+    SaturationTableFormat,
+)
+from humid_air.domain.entities.solver_entity import (
+    HumidAirSolutionEntity,
+    SolverUnknown,
+)
+from humid_air.domain.entities.thermal_comfort_entity import (
+    ComfortZoneEntity,
+    ThermalComfortBatchEntity,
+)
+from humid_air.domain.entities.uncertainty_entity import (
+    HumidAirUncertaintyEntity,
+    UncertaintyMethod,
+)
+from humid_air.domain.entities.weather_file_entity import (
+    WeatherFileFormat,
+    WeatherOutputFormat,
+    WeatherResultsEntity,
+)
 from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+from humid_air.infra.web.renderers.batch_stream import (
+    index_chunks,
+    render_batch_csv,
+    render_batch_ndjson,
+)
+from humid_air.infra.web.renderers.psychrometric_chart_svg import (
+    render_psychrometric_chart_svg,
+)
+from humid_air.infra.web.renderers.saturation_table_csv import (
+    render_saturation_table_csv,
+)
+from humid_air.infra.web.renderers.weather_file_stream import (
+    render_weather_csv,
+    render_weather_ndjson,
+)
+from utils.lru_cache import LRUCacheStatistics
 
+STREAM_MIMETYPES: dict[HumidAirBatchOutputFormat, str] = {
+    HumidAirBatchOutputFormat.NDJSON: "application/x-ndjson",
+    HumidAirBatchOutputFormat.CSV: "text/csv",
+}
 
-class HumidAirWithDryTemperatureAndRelativeHumidityRequest(BaseModel):
+
+class HumidAirStateRequest(BaseModel):
+    pressure: float | None = Field(
+        default=None,
+        description=HumidAirSettings.request_pressure_description,
+        ge=HumidAirSettings.pressure_ge,
+        le=HumidAirSettings.pressure_le,
+    )
+    altitude: float | None = Field(
+        default=None,
+        description=HumidAirSettings.altitude_description,
+        ge=HumidAirSettings.altitude_ge,
+        le=HumidAirSettings.altitude_le,
+    )
+    project_id: UUID | None = Field(
+        default=None, description=HumidAirSettings.project_id_description
+    )
+    temp_dry_bulb: float | None = Field(
+        default=None,
+        description=HumidAirSettings.tdb_description,
+        ge=HumidAirSettings.tdb_ge,
+        le=HumidAirSettings.tdb_le,
+    )
+    relative_humidity: float | None = Field(
+        default=None,
+        description=HumidAirSettings.rh_description,
+        ge=HumidAirSettings.rh_ge,
+        le=HumidAirSettings.rh_le,
+    )
+    temp_dew_point: float | None = Field(
+        default=None,
+        description=HumidAirSettings.temp_dew_point_input_description,
+        ge=HumidAirSettings.tdb_ge,
+        le=HumidAirSettings.tdb_le,
+    )
+    temp_wet_bulb: float | None = Field(
+        default=None,
+        description=HumidAirSettings.temp_wet_bulb_input_description,
+        ge=HumidAirSettings.tdb_ge,
+        le=HumidAirSettings.tdb_le,
+    )
+    humidity_ratio: float | None = Field(
+        default=None,
+        description=HumidAirSettings.humidity_ratio_input_description,
+        ge=0,
+    )
+    enthalpy_per_humid_air: float | None = Field(
+        default=None, description=HumidAirSettings.enthalpy_input_description
+    )
+    approximate: bool = Field(
+        default=False, description=HumidAirSettings.approximate_description
+    )
+    fields: str | None = Field(
+        default=None, description=HumidAirSettings.fields_description
+    )
+
+
+class HumidAirBatchRequest(BaseModel):
+    pressure: list[float] | None = Field(
+        default=None,
+        description=HumidAirSettings.batch_pressure_description,
+        max_length=HumidAirSettings.batch_max_length,
+    )
+    altitude: float | None = Field(
+        default=None,
+        description=HumidAirSettings.altitude_description,
+        ge=HumidAirSettings.altitude_ge,
+        le=HumidAirSettings.altitude_le,
+    )
+    project_id: UUID | None = Field(
+        default=None, description=HumidAirSettings.project_id_description
+    )
+    temp_dry_bulb: list[float] | None = Field(
+        default=None,
+        description=HumidAirSettings.batch_tdb_description,
+        max_length=HumidAirSettings.batch_max_length,
+    )
+    relative_humidity: list[float] | None = Field(
+        default=None,
+        description=HumidAirSettings.batch_rh_description,
+        max_length=HumidAirSettings.batch_max_length,
+    )
+    temp_dew_point: list[float] | None = Field(
+        default=None,
+        description=HumidAirSettings.batch_tdp_description,
+        max_length=HumidAirSettings.batch_max_length,
+    )
+    temp_wet_bulb: list[float] | None = Field(
+        default=None,
+        description=HumidAirSettings.batch_twb_description,
+        max_length=HumidAirSettings.batch_max_length,
+    )
+    humidity_ratio: list[float] | None = Field(
+        default=None,
+        description=HumidAirSettings.batch_humidity_ratio_description,
+        max_length=HumidAirSettings.batch_max_length,
+    )
+    enthalpy_per_humid_air: list[float] | None = Field(
+        default=None,
+        description=HumidAirSettings.batch_enthalpy_description,
+        max_length=HumidAirSettings.batch_max_length,
+    )
+    engine: HumidAirEngine = Field(
+        default=HumidAirEngine.COOLPROP,
+        description=HumidAirSettings.engine_description,
+    )
+    fields: list[str] | None = Field(
+        default=None, description=HumidAirSettings.batch_fields_description
+    )
+    output_format: HumidAirBatchOutputFormat = Field(
+        default=HumidAirBatchOutputFormat.JSON,
+        description=HumidAirSettings.batch_output_format_description,
+    )
+
+
+class GetHumidAirPropertyResponse(BaseModel):
+    """Propriétés d'un état d'air humide
+
+    Le schéma décrit toutes les propriétés ; seules celles sélectionnées par
+    'fields' sont calculées et sérialisées.
+    """
+
+    pressure: float | None = Field(
+        default=None, description=HumidAirSettings.pressure_description
+    )
+    temp_dry_bulb: float | None = Field(
+        default=None, description=HumidAirSettings.tdb_description
+    )
+    relative_humidity: float | None = Field(
+        default=None, description=HumidAirSettings.rh_description
+    )
+    partial_pressure_of_water_vapor: float | None = Field(
+        default=None, description=HumidAirSettings.partial_pressure_of_water_vapor
+    )
+    humidity_ratio: float | None = Field(
+        default=None, description=HumidAirSettings.humidity_ratio_description
+    )
+    temp_dew_point: float | None = Field(
+        default=None, description=HumidAirSettings.temp_dew_point_description
+    )
+    temp_wet_bulb: float | None = Field(
+        default=None, description=HumidAirSettings.temp_wet_bulb_description
+    )
+    enthalpy_per_humid_air: float | None = Field(
+        default=None, description=HumidAirSettings.enthalpy_per_humid_air_description
+    )
+    specific_heat_per_unit_humid_air: float | None = Field(
+        default=None,
+        description=HumidAirSettings.specific_heat_per_unit_humid_air_description,
+    )
+    entropy_per_unit_humid_air: float | None = Field(
+        default=None,
+        description=HumidAirSettings.entropy_per_unit_humid_air_description,
+    )
+    specific_volume_per_unit_humid_air: float | None = Field(
+        default=None,
+        description=HumidAirSettings.specific_volume_per_unit_humid_air_description,
+    )
+    density_per_unit_humid_air: float | None = Field(
+        default=None,
+        description=HumidAirSettings.density_per_unit_humid_air_description,
+    )
+    thermal_conductivity: float | None = Field(
+        default=None, description=HumidAirSettings.thermal_conductivity_description
+    )
+    dynamic_viscosity: float | None = Field(
+        default=None, description=HumidAirSettings.dynamic_viscosity_description
+    )
+    kinematic_viscosity_per_unit_humid_air: float | None = Field(
+        default=None,
+        description=HumidAirSettings.kinematic_viscosity_per_unit_humid_air_description,
+    )
+    prandtl_number: float | None = Field(
+        default=None, description=HumidAirSettings.prandtl_number_description
+    )
+    compressibility_factor: float | None = Field(
+        default=None, description=HumidAirSettings.compressibility_factor_description
+    )
+    max_errors: dict[str, float] | None = Field(
+        default=None, description=HumidAirSettings.max_errors_description
+    )
+
+    _fields: tuple[str, ...] = PrivateAttr(default=HUMID_AIR_PROPERTY_NAMES)
+
+    @classmethod
+    def from_use_case_result(
+        cls,
+        full_ha_props: HumidAirEntity,
+        fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES,
+    ) -> "GetHumidAirPropertyResponse":
+        response = cls.model_validate(full_ha_props.get_properties(fields))
+        response._fields = fields
+        return response
+
+    @classmethod
+    def from_batch_result(
+        cls, batch: HumidAirBatchEntity
+    ) -> "GetHumidAirPropertyResponse":
+        response = cls(
+            **{name: column[0] for name, column in batch.properties.items()},
+            max_errors=batch.max_errors,
+        )
+        response._fields = tuple(batch.properties)
+        return response
+
+    def to_response(self) -> Response:
+        # erreurs maximales seulement pour les propriétés approchées
+        include = {*self._fields}
+        if self.max_errors is not None:
+            include.add("max_errors")
+        return make_response(jsonify(self.model_dump(include=include)), HTTPStatus.OK)
+
+
+class HumidAirBatchErrorResponse(BaseModel):
+    index: int = Field(..., description=HumidAirSettings.batch_error_index_description)
+    field: str = Field(..., description=HumidAirSettings.batch_error_field_description)
+    message: str = Field(
+        ..., description=HumidAirSettings.batch_error_message_description
+    )
+
+
+class GetHumidAirPropertiesBatchResponse(BaseModel):
+    """Propriétés d'un lot d'états d'air humide, en colonnes
+
+    Le schéma décrit toutes les propriétés ; seules celles sélectionnées par
+    'fields' sont calculées et sérialisées.
+    """
+
+    pressure: list[float | None] = Field(
+        default_factory=list, description=HumidAirSettings.pressure_description
+    )
+    temp_dry_bulb: list[float | None] = Field(
+        default_factory=list, description=HumidAirSettings.tdb_description
+    )
+    relative_humidity: list[float | None] = Field(
+        default_factory=list, description=HumidAirSettings.rh_description
+    )
+    partial_pressure_of_water_vapor: list[float | None] = Field(
+        default_factory=list,
+        description=HumidAirSettings.partial_pressure_of_water_vapor,
+    )
+    humidity_ratio: list[float | None] = Field(
+        default_factory=list, description=HumidAirSettings.humidity_ratio_description
+    )
+    temp_dew_point: list[float | None] = Field(
+        default_factory=list, description=HumidAirSettings.temp_dew_point_description
+    )
+    temp_wet_bulb: list[float | None] = Field(
+        default_factory=list, description=HumidAirSettings.temp_wet_bulb_description
+    )
+    enthalpy_per_humid_air: list[float | None] = Field(
+        default_factory=list,
+        description=HumidAirSettings.enthalpy_per_humid_air_description,
+    )
+    specific_heat_per_unit_humid_air: list[float | None] = Field(
+        default_factory=list,
+        description=HumidAirSettings.specific_heat_per_unit_humid_air_description,
+    )
+    entropy_per_unit_humid_air: list[float | None] = Field(
+        default_factory=list,
+        description=HumidAirSettings.entropy_per_unit_humid_air_description,
+    )
+    specific_volume_per_unit_humid_air: list[float | None] = Field(
+        default_factory=list,
+        description=HumidAirSettings.specific_volume_per_unit_humid_air_description,
+    )
+    density_per_unit_humid_air: list[float | None] = Field(
+        default_factory=list,
+        description=HumidAirSettings.density_per_unit_humid_air_description,
+    )
+    thermal_conductivity: list[float | None] = Field(
+        default_factory=list,
+        description=HumidAirSettings.thermal_conductivity_description,
+    )
+    dynamic_viscosity: list[float | None] = Field(
+        default_factory=list, description=HumidAirSettings.dynamic_viscosity_description
+    )
+    kinematic_viscosity_per_unit_humid_air: list[float | None] = Field(
+        default_factory=list,
+        description=HumidAirSettings.kinematic_viscosity_per_unit_humid_air_description,
+    )
+    prandtl_number: list[float | None] = Field(
+        default_factory=list, description=HumidAirSettings.prandtl_number_description
+    )
+    compressibility_factor: list[float | None] = Field(
+        default_factory=list,
+        description=HumidAirSettings.compressibility_factor_description,
+    )
+    errors: list[HumidAirBatchErrorResponse] = Field(
+        ..., description=HumidAirSettings.batch_errors_description
+    )
+    max_errors: dict[str, float] | None = Field(
+        default=None, description=HumidAirSettings.max_errors_description
+    )
+
+    _fields: tuple[str, ...] = PrivateAttr(default=HUMID_AIR_PROPERTY_NAMES)
+
+    @classmethod
+    def from_use_case_result(
+        cls, batch: HumidAirBatchEntity
+    ) -> "GetHumidAirPropertiesBatchResponse":
+        response = cls(
+            **batch.properties,
+            errors=[
+                HumidAirBatchErrorResponse(**error.model_dump())
+                for error in batch.errors
+            ],
+            max_errors=batch.max_errors,
+        )
+        response._fields = tuple(batch.properties)
+        return response
+
+    def to_response(self) -> Response:
+        # erreurs maximales seulement pour les propriétés approchées
+        include = {*self._fields, "errors"}
+        if self.max_errors is not None:
+            include.add("max_errors")
+        return make_response(jsonify(self.model_dump(include=include)), HTTPStatus.OK)
+
+    @staticmethod
+    def to_stream_response(
+        chunks: Iterable[HumidAirBatchChunkEntity],
+        output_format: HumidAirBatchOutputFormat,
+        fields: tuple[str, ...],
+    ) -> Response:
+        rendered = index_chunks(chunks)
+        lines = (
+            render_batch_ndjson(rendered)
+            if output_format is HumidAirBatchOutputFormat.NDJSON
+            # en-tête écrit même pour un lot vide
+            else render_batch_csv(
+                rendered, header=[HumidAirSettings.stream_index_column, *fields]
+            )
+        )
+        return Response(
+            stream_with_context(lines),
+            status=HTTPStatus.OK,
+            mimetype=STREAM_MIMETYPES[output_format],
+        )
+
+
+class GetHumidAirCacheStatisticsResponse(BaseModel):
+    hits: int = Field(..., description=HumidAirSettings.cache_hits_description)
+    misses: int = Field(..., description=HumidAirSettings.cache_misses_description)
+    evictions: int = Field(
+        ..., description=HumidAirSettings.cache_evictions_description
+    )
+    size: int = Field(..., description=HumidAirSettings.cache_size_description)
+    max_size: int = Field(..., description=HumidAirSettings.cache_max_size_description)
+
+    @classmethod
+    def from_use_case_result(
+        cls, statistics: LRUCacheStatistics
+    ) -> "GetHumidAirCacheStatisticsResponse":
+        return cls(**statistics.model_dump())
+
+    def to_response(self) -> Response:
+        return make_response(jsonify(self.model_dump()), HTTPStatus.OK)
+
+
+class PsychrometricChartRequest(BaseModel):
     pressure: float = Field(
         default=HumidAirSettings.pressure_default_value,
         description=HumidAirSettings.pressure_description,
         ge=HumidAirSettings.pressure_ge,
         le=HumidAirSettings.pressure_le,
     )
-    temp_dry_bulb: float = Field(
-        ...,
+    temp_dry_bulb_min: float = Field(
+        default=HumidAirSettings.chart_tdb_min_default_value,
+        description=HumidAirSettings.chart_tdb_min_description,
+        ge=HumidAirSettings.chart_tdb_ge,
+        le=HumidAirSettings.chart_tdb_le,
+    )
+    temp_dry_bulb_max: float = Field(
+        default=HumidAirSettings.chart_tdb_max_default_value,
+        description=HumidAirSettings.chart_tdb_max_description,
+        ge=HumidAirSettings.chart_tdb_ge,
+        le=HumidAirSettings.chart_tdb_le,
+    )
+    humidity_ratio_max: float = Field(
+        default=HumidAirSettings.chart_humidity_ratio_max_default_value,
+        description=HumidAirSettings.chart_humidity_ratio_max_description,
+        gt=0,
+        le=HumidAirSettings.chart_humidity_ratio_max_le,
+    )
+    resolution: int = Field(
+        default=HumidAirSettings.chart_resolution_default_value,
+        description=HumidAirSettings.chart_resolution_description,
+        ge=HumidAirSettings.chart_resolution_ge,
+        le=HumidAirSettings.chart_resolution_le,
+    )
+    format: PsychrometricChartFormat = Field(
+        default=PsychrometricChartFormat.JSON,
+        description=HumidAirSettings.chart_format_description,
+    )
+
+
+class PsychrometricChartLineResponse(BaseModel):
+    kind: PsychrometricChartLineKind = Field(
+        ..., description=HumidAirSettings.chart_line_kind_description
+    )
+    value: float = Field(..., description=HumidAirSettings.chart_line_value_description)
+    temp_dry_bulb: list[float] = Field(
+        ..., description=HumidAirSettings.chart_line_tdb_description
+    )
+    humidity_ratio: list[float] = Field(
+        ..., description=HumidAirSettings.chart_line_humidity_ratio_description
+    )
+
+
+class GetPsychrometricChartResponse(BaseModel):
+    pressure: float = Field(..., description=HumidAirSettings.pressure_description)
+    temp_dry_bulb_min: float = Field(
+        ..., description=HumidAirSettings.chart_tdb_min_description
+    )
+    temp_dry_bulb_max: float = Field(
+        ..., description=HumidAirSettings.chart_tdb_max_description
+    )
+    humidity_ratio_max: float = Field(
+        ..., description=HumidAirSettings.chart_humidity_ratio_max_description
+    )
+    lines: list[PsychrometricChartLineResponse] = Field(
+        ..., description=HumidAirSettings.chart_lines_description
+    )
+
+    @classmethod
+    def from_use_case_result(
+        cls, chart: PsychrometricChartEntity
+    ) -> "GetPsychrometricChartResponse":
+        return cls.model_validate(chart.model_dump())
+
+    def to_response(self) -> Response:
+        return make_response(jsonify(self.model_dump(mode="json")), HTTPStatus.OK)
+
+    @staticmethod
+    def to_svg_response(chart: PsychrometricChartEntity) -> Response:
+        response = make_response(render_psychrometric_chart_svg(chart), HTTPStatus.OK)
+        response.mimetype = "image/svg+xml"
+        return response
+
+
+class AirStreamRequest(BaseModel):
+    mass_flow_rate: float = Field(
+        ..., description=HumidAirSettings.process_mass_flow_rate_description, gt=0
+    )
+    temp_dry_bulb: float | None = Field(
+        default=None,
         description=HumidAirSettings.tdb_description,
         ge=HumidAirSettings.tdb_ge,
         le=HumidAirSettings.tdb_le,
     )
-    relative_humidity: float = Field(
-        ...,
+    relative_humidity: float | None = Field(
+        default=None,
         description=HumidAirSettings.rh_description,
         ge=HumidAirSettings.rh_ge,
         le=HumidAirSettings.rh_le,
     )
+    temp_dew_point: float | None = Field(
+        default=None,
+        description=HumidAirSettings.temp_dew_point_input_description,
+        ge=HumidAirSettings.tdb_ge,
+        le=HumidAirSettings.tdb_le,
+    )
+    temp_wet_bulb: float | None = Field(
+        default=None,
+        description=HumidAirSettings.temp_wet_bulb_input_description,
+        ge=HumidAirSettings.tdb_ge,
+        le=HumidAirSettings.tdb_le,
+    )
+    humidity_ratio: float | None = Field(
+        default=None,
+        description=HumidAirSettings.humidity_ratio_input_description,
+        ge=0,
+    )
+    enthalpy_per_humid_air: float | None = Field(
+        default=None, description=HumidAirSettings.enthalpy_input_description
+    )
 
 
-class GetHumidAirPropertyResponse(BaseModel):
+class AirProcessStepRequest(BaseModel):
+    kind: AirProcessKind = Field(
+        ..., description=HumidAirSettings.process_kind_description
+    )
+    temp_dry_bulb: float | None = Field(
+        default=None,
+        description=HumidAirSettings.process_tdb_description,
+        ge=HumidAirSettings.tdb_ge,
+        le=HumidAirSettings.tdb_le,
+    )
+    relative_humidity: float | None = Field(
+        default=None,
+        description=HumidAirSettings.process_rh_description,
+        ge=HumidAirSettings.rh_ge,
+        le=HumidAirSettings.rh_le,
+    )
+    humidity_ratio: float | None = Field(
+        default=None,
+        description=HumidAirSettings.process_humidity_ratio_description,
+        ge=0,
+    )
+    apparatus_dew_point: float | None = Field(
+        default=None,
+        description=HumidAirSettings.process_adp_description,
+        ge=HumidAirSettings.tdb_ge,
+        le=HumidAirSettings.tdb_le,
+    )
+    bypass_factor: float | None = Field(
+        default=None,
+        description=HumidAirSettings.process_bypass_factor_description,
+        ge=0,
+        le=1,
+    )
+
+
+class AirProcessRequest(BaseModel):
+    pressure: float = Field(
+        default=HumidAirSettings.pressure_default_value,
+        description=HumidAirSettings.pressure_description,
+        ge=HumidAirSettings.pressure_ge,
+        le=HumidAirSettings.pressure_le,
+    )
+    streams: list[AirStreamRequest] = Field(
+        ...,
+        description=HumidAirSettings.process_streams_description,
+        min_length=1,
+        max_length=HumidAirSettings.process_max_streams,
+    )
+    steps: list[AirProcessStepRequest] = Field(
+        default_factory=list,
+        description=HumidAirSettings.process_steps_description,
+        max_length=HumidAirSettings.process_max_steps,
+    )
+    engine: HumidAirEngine = Field(
+        default=HumidAirEngine.COOLPROP,
+        description=HumidAirSettings.engine_description,
+    )
+    fields: list[str] | None = Field(
+        default=None, description=HumidAirSettings.batch_fields_description
+    )
+
+
+class AirProcessStepResponse(BaseModel):
+    kind: AirProcessKind = Field(
+        ..., description=HumidAirSettings.process_kind_description
+    )
+    mass_flow_rate: float = Field(
+        ..., description=HumidAirSettings.process_mass_flow_rate_description
+    )
+    outlet: GetHumidAirPropertyResponse = Field(
+        ..., description=HumidAirSettings.process_outlet_description
+    )
+    sensible_load: float = Field(
+        ..., description=HumidAirSettings.process_sensible_load_description
+    )
+    latent_load: float = Field(
+        ..., description=HumidAirSettings.process_latent_load_description
+    )
+    total_load: float = Field(
+        ..., description=HumidAirSettings.process_total_load_description
+    )
+    water_flow_rate: float = Field(
+        ..., description=HumidAirSettings.process_water_flow_rate_description
+    )
+
+
+class ComputeAirProcessResponse(BaseModel):
+    """États et puissances d'une centrale de traitement d'air
+
+    Seules les propriétés sélectionnées par 'fields' sont calculées et
+    sérialisées pour les flux entrants et les états de sortie.
+    """
+
+    inlets: list[GetHumidAirPropertyResponse] = Field(
+        ..., description=HumidAirSettings.process_inlets_description
+    )
+    steps: list[AirProcessStepResponse] = Field(
+        ..., description=HumidAirSettings.process_steps_description
+    )
+    max_errors: dict[str, float] | None = Field(
+        default=None, description=HumidAirSettings.max_errors_description
+    )
+
+    _fields: tuple[str, ...] = PrivateAttr(default=HUMID_AIR_PROPERTY_NAMES)
+
+    @classmethod
+    def from_use_case_result(
+        cls,
+        process: AirProcessEntity,
+        fields: tuple[str, ...] = HUMID_AIR_PROPERTY_NAMES,
+    ) -> "ComputeAirProcessResponse":
+        response = cls.model_validate(process.model_dump())
+        response._fields = fields
+        return response
+
+    def to_response(self) -> Response:
+        fields = set(self._fields)
+        step_fields: dict[str, Any] = dict.fromkeys(
+            AirProcessStepResponse.model_fields, True
+        )
+        return make_response(
+            jsonify(
+                self.model_dump(
+                    mode="json",
+                    include={
+                        "inlets": {"__all__": fields},
+                        "steps": {"__all__": {**step_fields, "outlet": fields}},
+                        "max_errors": True,
+                    },
+                )
+            ),
+            HTTPStatus.OK,
+        )
+
+
+class SaturationTableRequest(BaseModel):
+    pressure: float = Field(
+        default=HumidAirSettings.pressure_default_value,
+        description=HumidAirSettings.pressure_description,
+        ge=HumidAirSettings.pressure_ge,
+        le=HumidAirSettings.pressure_le,
+    )
+    temp_dry_bulb_min: float = Field(
+        default=HumidAirSettings.saturation_table_tdb_min_default_value,
+        description=HumidAirSettings.saturation_table_tdb_min_description,
+        ge=HumidAirSettings.hyland_wexler_tdb_ge,
+        le=HumidAirSettings.hyland_wexler_tdb_le,
+    )
+    temp_dry_bulb_max: float = Field(
+        default=HumidAirSettings.saturation_table_tdb_max_default_value,
+        description=HumidAirSettings.saturation_table_tdb_max_description,
+        ge=HumidAirSettings.hyland_wexler_tdb_ge,
+        le=HumidAirSettings.hyland_wexler_tdb_le,
+    )
+    temp_dry_bulb_step: float = Field(
+        default=HumidAirSettings.saturation_table_step_default_value,
+        description=HumidAirSettings.saturation_table_step_description,
+        gt=0,
+        le=HumidAirSettings.saturation_table_step_le,
+    )
+    format: SaturationTableFormat = Field(
+        default=SaturationTableFormat.JSON,
+        description=HumidAirSettings.saturation_table_format_description,
+    )
+
+
+class GetSaturationTableResponse(BaseModel):
     pressure: float = Field(..., description=HumidAirSettings.pressure_description)
-    temp_dry_bulb: float = Field(..., description=HumidAirSettings.tdb_description)
-    relative_humidity: float = Field(..., description=HumidAirSettings.rh_description)
-    partial_pressure_of_water_vapor: float = Field(
-        ..., description=HumidAirSettings.partial_pressure_of_water_vapor
+    temp_dry_bulb: list[float] = Field(
+        ..., description=HumidAirSettings.saturation_table_tdb_description
+    )
+    saturation_pressure: list[float | None] = Field(
+        ..., description=HumidAirSettings.saturation_table_pws_description
+    )
+    humidity_ratio: list[float | None] = Field(
+        ..., description=HumidAirSettings.saturation_table_humidity_ratio_description
+    )
+    enthalpy: list[float | None] = Field(
+        ..., description=HumidAirSettings.saturation_table_enthalpy_description
+    )
+    specific_volume: list[float | None] = Field(
+        ..., description=HumidAirSettings.saturation_table_specific_volume_description
+    )
+
+    @classmethod
+    def from_use_case_result(
+        cls, table: SaturationTableEntity
+    ) -> "GetSaturationTableResponse":
+        return cls.model_validate(table.model_dump())
+
+    def to_response(self) -> Response:
+        return make_response(jsonify(self.model_dump()), HTTPStatus.OK)
+
+    @staticmethod
+    def to_csv_response(table: SaturationTableEntity) -> Response:
+        response = make_response(render_saturation_table_csv(table), HTTPStatus.OK)
+        response.mimetype = "text/csv"
+        return response
+
+
+class ThermalComfortRequest(BaseModel):
+    temp_dry_bulb: list[float] = Field(
+        ...,
+        description=HumidAirSettings.comfort_tdb_description,
+        max_length=HumidAirSettings.batch_max_length,
+    )
+    relative_humidity: list[float] = Field(
+        ...,
+        description=HumidAirSettings.comfort_rh_description,
+        max_length=HumidAirSettings.batch_max_length,
     )
-    humidity_ratio: float = Field(
-        ..., description=HumidAirSettings.humidity_ratio_description
+    mean_radiant_temperature: list[float] | float | None = Field(
+        default=None,
+        description=HumidAirSettings.comfort_tr_description,
     )
-    temp_dew_point: float = Field(
-        ..., description=HumidAirSettings.temp_dew_point_description
+    air_speed: list[float] | float = Field(
+        default=HumidAirSettings.comfort_air_speed_default_value,
+        description=HumidAirSettings.comfort_air_speed_description,
     )
-    temp_wet_bulb: float = Field(
-        ..., description=HumidAirSettings.temp_wet_bulb_description
+    metabolic_rate: list[float] | float = Field(
+        default=HumidAirSettings.comfort_met_default_value,
+        description=HumidAirSettings.comfort_met_description,
     )
-    enthalpy_per_humid_air: float = Field(
-        ..., description=HumidAirSettings.enthalpy_per_humid_air_description
+    clothing: list[float] | float = Field(
+        default=HumidAirSettings.comfort_clo_default_value,
+        description=HumidAirSettings.comfort_clo_description,
     )
-    specific_heat_per_unit_humid_air: float = Field(
-        ..., description=HumidAirSettings.specific_heat_per_unit_humid_air_description
+    prevailing_mean_outdoor_temperature: list[float] | float | None = Field(
+        default=None,
+        description=HumidAirSettings.comfort_prevailing_description,
     )
-    entropy_per_unit_humid_air: float = Field(
-        ..., description=HumidAirSettings.entropy_per_unit_humid_air_description
+
+
+class ComputeThermalComfortResponse(BaseModel):
+    pmv: list[float | None] = Field(
+        ..., description=HumidAirSettings.comfort_pmv_description
+    )
+    ppd: list[float | None] = Field(
+        ..., description=HumidAirSettings.comfort_ppd_description
     )
-    specific_volume_per_unit_humid_air: float = Field(
-        ..., description=HumidAirSettings.specific_volume_per_unit_humid_air_description
+    operative_temperature: list[float | None] = Field(
+        ..., description=HumidAirSettings.comfort_operative_temperature_description
     )
-    density_per_unit_humid_air: float = Field(
-        ..., description=HumidAirSettings.density_per_unit_humid_air_description
+    adaptive_comfort_temperature: list[float | None] | None = Field(
+        default=None,
+        description=HumidAirSettings.comfort_adaptive_temperature_description,
     )
-    thermal_conductivity: float = Field(
-        ..., description=HumidAirSettings.thermal_conductivity_description
+    adaptive_acceptable_80: list[bool | None] | None = Field(
+        default=None, description=HumidAirSettings.comfort_adaptive_80_description
     )
-    dynamic_viscosity: float = Field(
-        ..., description=HumidAirSettings.dynamic_viscosity_description
+    adaptive_acceptable_90: list[bool | None] | None = Field(
+        default=None, description=HumidAirSettings.comfort_adaptive_90_description
     )
-    kinematic_viscosity_per_unit_humid_air: float = Field(
+    errors: list[HumidAirBatchErrorResponse] = Field(
+        ..., description=HumidAirSettings.batch_errors_description
+    )
+
+    @classmethod
+    def from_use_case_result(
+        cls, batch: ThermalComfortBatchEntity
+    ) -> "ComputeThermalComfortResponse":
+        return cls.model_validate(batch.model_dump())
+
+    def to_response(self) -> Response:
+        exclude = {
+            name
+            for name in (
+                "adaptive_comfort_temperature",
+                "adaptive_acceptable_80",
+                "adaptive_acceptable_90",
+            )
+            if getattr(self, name) is None
+        }
+        return make_response(jsonify(self.model_dump(exclude=exclude)), HTTPStatus.OK)
+
+
+class ComfortZoneRequest(BaseModel):
+    pressure: float = Field(
+        default=HumidAirSettings.pressure_default_value,
+        description=HumidAirSettings.pressure_description,
+        ge=HumidAirSettings.pressure_ge,
+        le=HumidAirSettings.pressure_le,
+    )
+    clothing: float = Field(
+        default=HumidAirSettings.comfort_clo_default_value,
+        description=HumidAirSettings.comfort_zone_clo_description,
+        ge=HumidAirSettings.comfort_clo_ge,
+        le=HumidAirSettings.comfort_clo_le,
+    )
+    metabolic_rate: float = Field(
+        default=HumidAirSettings.comfort_met_default_value,
+        description=HumidAirSettings.comfort_zone_met_description,
+        ge=HumidAirSettings.comfort_met_ge,
+        le=HumidAirSettings.comfort_met_le,
+    )
+    air_speed: float = Field(
+        default=HumidAirSettings.comfort_air_speed_default_value,
+        description=HumidAirSettings.comfort_zone_air_speed_description,
+        ge=HumidAirSettings.comfort_air_speed_ge,
+        le=HumidAirSettings.comfort_air_speed_le,
+    )
+    humidity_ratio_max: float = Field(
+        default=HumidAirSettings.comfort_zone_humidity_ratio_max_default_value,
+        description=HumidAirSettings.comfort_zone_humidity_ratio_max_description,
+        gt=0,
+        le=HumidAirSettings.chart_humidity_ratio_max_le,
+    )
+
+
+class GetComfortZoneResponse(BaseModel):
+    pressure: float = Field(..., description=HumidAirSettings.pressure_description)
+    clothing: float = Field(
+        ..., description=HumidAirSettings.comfort_zone_clo_description
+    )
+    metabolic_rate: float = Field(
+        ..., description=HumidAirSettings.comfort_zone_met_description
+    )
+    air_speed: float = Field(
+        ..., description=HumidAirSettings.comfort_zone_air_speed_description
+    )
+    temp_dry_bulb: list[float] = Field(
+        ..., description=HumidAirSettings.comfort_zone_tdb_description
+    )
+    humidity_ratio: list[float] = Field(
+        ..., description=HumidAirSettings.comfort_zone_humidity_ratio_description
+    )
+
+    @classmethod
+    def from_use_case_result(cls, zone: ComfortZoneEntity) -> "GetComfortZoneResponse":
+        return cls.model_validate(zone.model_dump())
+
+    def to_response(self) -> Response:
+        return make_response(jsonify(self.model_dump()), HTTPStatus.OK)
+
+
+class UncertaintyRequest(BaseModel):
+    pressure: list[float] | None = Field(
+        default=None,
+        description=HumidAirSettings.batch_pressure_description,
+        max_length=HumidAirSettings.batch_max_length,
+    )
+    altitude: float | None = Field(
+        default=None,
+        description=HumidAirSettings.altitude_description,
+        ge=HumidAirSettings.altitude_ge,
+        le=HumidAirSettings.altitude_le,
+    )
+    project_id: UUID | None = Field(
+        default=None, description=HumidAirSettings.project_id_description
+    )
+    temp_dry_bulb: list[float] = Field(
         ...,
-        description=HumidAirSettings.kinematic_viscosity_per_unit_humid_air_description,
+        description=HumidAirSettings.batch_tdb_description,
+        max_length=HumidAirSettings.batch_max_length,
+    )
+    relative_humidity: list[float] = Field(
+        ...,
+        description=HumidAirSettings.batch_rh_description,
+        max_length=HumidAirSettings.batch_max_length,
+    )
+    pressure_uncertainty: float = Field(
+        default=HumidAirSettings.uncertainty_pressure_default_value,
+        description=HumidAirSettings.uncertainty_pressure_description,
+        ge=0,
+        le=HumidAirSettings.uncertainty_pressure_le,
+    )
+    temp_dry_bulb_uncertainty: float = Field(
+        default=HumidAirSettings.uncertainty_tdb_default_value,
+        description=HumidAirSettings.uncertainty_tdb_description,
+        ge=0,
+        le=HumidAirSettings.uncertainty_tdb_le,
+    )
+    relative_humidity_uncertainty: float = Field(
+        default=HumidAirSettings.uncertainty_rh_default_value,
+        description=HumidAirSettings.uncertainty_rh_description,
+        ge=0,
+        le=HumidAirSettings.uncertainty_rh_le,
+    )
+    method: UncertaintyMethod = Field(
+        default=UncertaintyMethod.FINITE_DIFFERENCE,
+        description=HumidAirSettings.uncertainty_method_description,
+    )
+    samples: int = Field(
+        default=HumidAirSettings.uncertainty_samples_default_value,
+        description=HumidAirSettings.uncertainty_samples_description,
+        ge=HumidAirSettings.uncertainty_samples_ge,
+        le=HumidAirSettings.uncertainty_samples_le,
+    )
+    coverage: float = Field(
+        default=HumidAirSettings.uncertainty_coverage_default_value,
+        description=HumidAirSettings.uncertainty_coverage_description,
+        ge=HumidAirSettings.uncertainty_coverage_ge,
+        le=HumidAirSettings.uncertainty_coverage_le,
+    )
+    seed: int | None = Field(
+        default=None, description=HumidAirSettings.uncertainty_seed_description, ge=0
+    )
+    engine: HumidAirEngine = Field(
+        default=HumidAirEngine.HYLAND_WEXLER,
+        description=HumidAirSettings.uncertainty_engine_description,
+    )
+    fields: list[str] | None = Field(
+        default=None, description=HumidAirSettings.batch_fields_description
+    )
+
+
+class PropertyUncertaintyResponse(BaseModel):
+    nominal: list[float | None] = Field(
+        ..., description=HumidAirSettings.uncertainty_nominal_description
     )
-    prandtl_number: float = Field(
-        ..., description=HumidAirSettings.prandtl_number_description
+    mean: list[float | None] = Field(
+        ..., description=HumidAirSettings.uncertainty_mean_description
     )
-    compressibility_factor: float = Field(
-        ..., description=HumidAirSettings.compressibility_factor_description
+    standard_deviation: list[float | None] = Field(
+        ..., description=HumidAirSettings.uncertainty_standard_deviation_description
+    )
+    lower: list[float | None] = Field(
+        ..., description=HumidAirSettings.uncertainty_lower_description
+    )
+    upper: list[float | None] = Field(
+        ..., description=HumidAirSettings.uncertainty_upper_description
+    )
+
+
+class PropagateUncertaintyResponse(BaseModel):
+    method: UncertaintyMethod = Field(
+        ..., description=HumidAirSettings.uncertainty_method_description
+    )
+    coverage: float = Field(
+        ..., description=HumidAirSettings.uncertainty_coverage_description
+    )
+    properties: dict[str, PropertyUncertaintyResponse] = Field(
+        ..., description=HumidAirSettings.uncertainty_properties_description
+    )
+    errors: list[HumidAirBatchErrorResponse] = Field(
+        ..., description=HumidAirSettings.batch_errors_description
     )
 
     @classmethod
     def from_use_case_result(
-        cls, full_ha_props: HumidAirEntity
-    ) -> "GetHumidAirPropertyResponse":
-        return cls(
-            **{
-                field: getattr(full_ha_props, field)
-                for field in cls.model_fields.keys()
-            }
+        cls, uncertainty: HumidAirUncertaintyEntity
+    ) -> "PropagateUncertaintyResponse":
+        return cls.model_validate(uncertainty.model_dump())
+
+    def to_response(self) -> Response:
+        return make_response(jsonify(self.model_dump(mode="json")), HTTPStatus.OK)
+
+
+class HumidAirSolveRequest(BaseModel):
+    pressure: list[float] | float | None = Field(
+        default=None, description=HumidAirSettings.batch_pressure_description
+    )
+    altitude: float | None = Field(
+        default=None,
+        description=HumidAirSettings.altitude_description,
+        ge=HumidAirSettings.altitude_ge,
+        le=HumidAirSettings.altitude_le,
+    )
+    project_id: UUID | None = Field(
+        default=None, description=HumidAirSettings.project_id_description
+    )
+    temp_dry_bulb: list[float] | float | None = Field(
+        default=None, description=HumidAirSettings.solver_tdb_description
+    )
+    relative_humidity: list[float] | float | None = Field(
+        default=None, description=HumidAirSettings.solver_rh_description
+    )
+    target: str = Field(..., description=HumidAirSettings.solver_target_description)
+    target_values: list[float] = Field(
+        ...,
+        description=HumidAirSettings.solver_target_values_description,
+        max_length=HumidAirSettings.batch_max_length,
+    )
+    lower: float | None = Field(
+        default=None, description=HumidAirSettings.solver_lower_description
+    )
+    upper: float | None = Field(
+        default=None, description=HumidAirSettings.solver_upper_description
+    )
+    tolerance: float = Field(
+        default=HumidAirSettings.solver_tolerance_default_value,
+        description=HumidAirSettings.solver_tolerance_description,
+        ge=HumidAirSettings.solver_tolerance_ge,
+        le=HumidAirSettings.solver_tolerance_le,
+    )
+    max_iterations: int = Field(
+        default=HumidAirSettings.solver_max_iterations_default_value,
+        description=HumidAirSettings.solver_max_iterations_description,
+        ge=1,
+        le=HumidAirSettings.solver_max_iterations_le,
+    )
+    fields: list[str] | None = Field(
+        default=None, description=HumidAirSettings.batch_fields_description
+    )
+
+
+class SolverStatisticsResponse(BaseModel):
+    states: int = Field(..., description=HumidAirSettings.solver_states_description)
+    converged: int = Field(
+        ..., description=HumidAirSettings.solver_converged_count_description
+    )
+    mean_iterations: float = Field(
+        ..., description=HumidAirSettings.solver_mean_iterations_description
+    )
+    max_iterations: int = Field(
+        ..., description=HumidAirSettings.solver_max_iterations_count_description
+    )
+    max_residual: float | None = Field(
+        ..., description=HumidAirSettings.solver_max_residual_description
+    )
+
+
+class SolveHumidAirResponse(BaseModel):
+    unknown: SolverUnknown = Field(
+        ..., description=HumidAirSettings.solver_unknown_description
+    )
+    target: str = Field(..., description=HumidAirSettings.solver_target_description)
+    properties: dict[str, list[float | None]] = Field(
+        ..., description=HumidAirSettings.solver_properties_description
+    )
+    residuals: list[float | None] = Field(
+        ..., description=HumidAirSettings.solver_residuals_description
+    )
+    iterations: list[int] = Field(
+        ..., description=HumidAirSettings.solver_iterations_description
+    )
+    converged: list[bool] = Field(
+        ..., description=HumidAirSettings.solver_converged_description
+    )
+    statistics: SolverStatisticsResponse = Field(
+        ..., description=HumidAirSettings.solver_statistics_description
+    )
+    errors: list[HumidAirBatchErrorResponse] = Field(
+        ..., description=HumidAirSettings.batch_errors_description
+    )
+
+    @classmethod
+    def from_use_case_result(
+        cls, solution: HumidAirSolutionEntity
+    ) -> "SolveHumidAirResponse":
+        return cls.model_validate(solution.model_dump())
+
+    def to_response(self) -> Response:
+        return make_response(jsonify(self.model_dump(mode="json")), HTTPStatus.OK)
+
+
+class WeatherFileRequest(BaseModel):
+    file: FileStorage = Field(
+        ..., description=HumidAirSettings.weather_file_description
+    )
+    file_format: WeatherFileFormat = Field(
+        default=WeatherFileFormat.EPW,
+        description=HumidAirSettings.weather_file_format_description,
+    )
+    output_format: WeatherOutputFormat = Field(
+        default=WeatherOutputFormat.CSV,
+        description=HumidAirSettings.weather_output_format_description,
+    )
+    pressure: float | None = Field(
+        default=None,
+        description=HumidAirSettings.weather_pressure_description,
+        ge=HumidAirSettings.pressure_ge,
+        le=HumidAirSettings.pressure_le,
+    )
+    altitude: float | None = Field(
+        default=None,
+        description=HumidAirSettings.altitude_description,
+        ge=HumidAirSettings.altitude_ge,
+        le=HumidAirSettings.altitude_le,
+    )
+    project_id: UUID | None = Field(
+        default=None, description=HumidAirSettings.project_id_description
+    )
+    engine: HumidAirEngine = Field(
+        default=HumidAirEngine.HYLAND_WEXLER,
+        description=HumidAirSettings.engine_description,
+    )
+    fields: str | None = Field(
+        default=None, description=HumidAirSettings.fields_description
+    )
+
+
+class ProcessWeatherFileResponse:
+    MIMETYPES: dict[WeatherOutputFormat, str] = {
+        WeatherOutputFormat.CSV: "text/csv",
+        WeatherOutputFormat.NDJSON: "application/x-ndjson",
+    }
+
+    @classmethod
+    def to_stream_response(
+        cls, chunks: Iterable[WeatherResultsEntity], output_format: WeatherOutputFormat
+    ) -> Response:
+        render = (
+            render_weather_ndjson
+            if output_format is WeatherOutputFormat.NDJSON
+            else render_weather_csv
         )
+        return Response(
+            stream_with_context(render(chunks)),
+            status=HTTPStatus.OK,
+            mimetype=cls.MIMETYPES[output_format],
+        )
+
+
+class ClimateAnalyticsRequest(BaseModel):
+    file: FileStorage = Field(
+        ..., description=HumidAirSettings.weather_file_description
+    )
+    file_format: WeatherFileFormat = Field(
+        default=WeatherFileFormat.EPW,
+        description=HumidAirSettings.weather_file_format_description,
+    )
+    pressure: float | None = Field(
+        default=None,
+        description=HumidAirSettings.weather_pressure_description,
+        ge=HumidAirSettings.pressure_ge,
+        le=HumidAirSettings.pressure_le,
+    )
+    altitude: float | None = Field(
+        default=None,
+        description=HumidAirSettings.altitude_description,
+        ge=HumidAirSettings.altitude_ge,
+        le=HumidAirSettings.altitude_le,
+    )
+    project_id: UUID | None = Field(
+        default=None, description=HumidAirSettings.project_id_description
+    )
+    engine: HumidAirEngine = Field(
+        default=HumidAirEngine.HYLAND_WEXLER,
+        description=HumidAirSettings.engine_description,
+    )
+    bin_width: float = Field(
+        default=HumidAirSettings.analytics_bin_width_default_value,
+        description=HumidAirSettings.analytics_bin_width_description,
+        gt=0,
+        le=HumidAirSettings.analytics_bin_width_le,
+    )
+    heating_base_temperature: float = Field(
+        default=HumidAirSettings.analytics_heating_base_default_value,
+        description=HumidAirSettings.analytics_heating_base_description,
+        ge=HumidAirSettings.tdb_ge,
+        le=HumidAirSettings.tdb_le,
+    )
+    cooling_base_temperature: float = Field(
+        default=HumidAirSettings.analytics_cooling_base_default_value,
+        description=HumidAirSettings.analytics_cooling_base_description,
+        ge=HumidAirSettings.tdb_ge,
+        le=HumidAirSettings.tdb_le,
+    )
+    enthalpy_base: float = Field(
+        default=HumidAirSettings.analytics_enthalpy_base_default_value,
+        description=HumidAirSettings.analytics_enthalpy_base_description,
+    )
+
+
+class ClimateBinResponse(BaseModel):
+    temp_dry_bulb_min: float = Field(
+        ..., description=HumidAirSettings.analytics_bin_tdb_min_description
+    )
+    temp_dry_bulb_max: float = Field(
+        ..., description=HumidAirSettings.analytics_bin_tdb_max_description
+    )
+    hours: int = Field(
+        ..., description=HumidAirSettings.analytics_bin_hours_description
+    )
+    mean_coincident_wet_bulb: float = Field(
+        ..., description=HumidAirSettings.analytics_bin_mcwb_description
+    )
+
+
+class ComputeClimateAnalyticsResponse(BaseModel):
+    hours: int = Field(..., description=HumidAirSettings.analytics_hours_description)
+    invalid_hours: int = Field(
+        ..., description=HumidAirSettings.analytics_invalid_hours_description
+    )
+    bins: list[ClimateBinResponse] = Field(
+        ..., description=HumidAirSettings.analytics_bins_description
+    )
+    heating_degree_days: float = Field(
+        ..., description=HumidAirSettings.analytics_heating_degree_days_description
+    )
+    cooling_degree_days: float = Field(
+        ..., description=HumidAirSettings.analytics_cooling_degree_days_description
+    )
+    heating_enthalpy_hours: float = Field(
+        ..., description=HumidAirSettings.analytics_heating_enthalpy_hours_description
+    )
+    cooling_enthalpy_hours: float = Field(
+        ..., description=HumidAirSettings.analytics_cooling_enthalpy_hours_description
+    )
+
+    @classmethod
+    def from_use_case_result(
+        cls, analytics: ClimateAnalyticsEntity
+    ) -> "ComputeClimateAnalyticsResponse":
+        return cls.model_validate(analytics.model_dump())
 
     def to_response(self) -> Response:
         return make_response(jsonify(self.model_dump()), HTTPStatus.OK)
@@ -0,0 +1,107 @@
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from humid_air.domain.entities.humid_air_batch_entity import (
+    HumidAirBatchChunkEntity,
+    HumidAirBatchEntity,
+)
+from humid_air.domain.settings.humid_air_settings import HumidAirSettings
+
+# colonnes placées avant les propriétés (index, horodatage...), et lot calculé
+RenderedChunk = tuple[dict[str, list[Any]], HumidAirBatchEntity]
+
+
+def index_chunks(chunks: Iterable[HumidAirBatchChunkEntity]) -> Iterator[RenderedChunk]:
+    """Précède les propriétés de chaque tranche de l'index des états dans le lot
+
+    Args:
+        chunks (Iterable[HumidAirBatchChunkEntity]): Tranches calculées
+
+    Returns:
+        Iterator[RenderedChunk]: Colonne d'index et lot de chaque tranche
+    """
+    for chunk in chunks:
+        size = len(next(iter(chunk.batch.properties.values()), []))
+        yield (
+            {
+                HumidAirSettings.stream_index_column: list(
+                    range(chunk.start, chunk.start + size)
+                )
+            },
+            chunk.batch,
+        )
+
+
+def render_batch_csv(
+    chunks: Iterable[RenderedChunk], header: list[str] | None = None
+) -> Iterator[str]:
+    """Rend des tranches calculées en CSV, une tranche à la fois
+
+    L'en-tête est écrit avec la première tranche : colonnes de tête,
+    propriétés calculées puis erreurs de l'état.
+
+    Args:
+        chunks (Iterable[RenderedChunk]): Colonnes de tête et lot de chaque tranche
+        header (list[str] | None, optional): Colonnes de tête et propriétés,
+            écrites seules si aucune tranche n'est rendue. Defaults to None.
+
+    Returns:
+        Iterator[str]: Texte CSV, un bloc par tranche
+    """
+    header_written = False
+    for leading, batch in chunks:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        if not header_written:
+            writer.writerow(
+                [*leading, *batch.properties, HumidAirSettings.stream_errors_column]
+            )
+            header_written = True
+        for row in _rows(leading, batch):
+            writer.writerow(
+                ["" if value is None else value for value in row[:-1]]
+                + ["; ".join(f"{field}: {message}" for field, message in row[-1])]
+            )
+        yield buffer.getvalue()
+    if not header_written and header is not None:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerow(
+            [*header, HumidAirSettings.stream_errors_column]
+        )
+        yield buffer.getvalue()
+
+
+def render_batch_ndjson(chunks: Iterable[RenderedChunk]) -> Iterator[str]:
+    """Rend des tranches calculées en NDJSON, une tranche à la fois
+
+    Args:
+        chunks (Iterable[RenderedChunk]): Colonnes de tête et lot de chaque tranche
+
+    Returns:
+        Iterator[str]: Un objet JSON par état et par ligne, groupés par tranche
+    """
+    for leading, batch in chunks:
+        names = [*leading, *batch.properties]
+        lines = []
+        for row in _rows(leading, batch):
+            record: dict[str, Any] = dict(zip(names, row[:-1], strict=True))
+            record[HumidAirSettings.stream_errors_column] = [
+                {"field": field, "message": message} for field, message in row[-1]
+            ]
+            lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+        yield "".join(lines)
+
+
+def _rows(
+    leading: dict[str, list[Any]], batch: HumidAirBatchEntity
+) -> Iterator[list[Any]]:
+    """Transpose une tranche en lignes : valeurs puis liste des erreurs (champ, message)"""
+    errors: dict[int, list[tuple[str, str]]] = {}
+    for error in batch.errors:
+        errors.setdefault(error.index, []).append((error.field, error.message))
+    columns = [*leading.values(), *batch.properties.values()]
+    for index, values in enumerate(zip(*columns, strict=True)):
+        yield [*values, errors.get(index, [])]
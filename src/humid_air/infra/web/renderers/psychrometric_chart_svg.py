@@ -0,0 +1,116 @@
+from humid_air.domain.entities.psychrometric_chart_entity import (
+    PsychrometricChartEntity,
+    PsychrometricChartLineEntity,
+    PsychrometricChartLineKind,
+)
+
+WIDTH = 900
+HEIGHT = 600
+MARGIN = 50
+TEMP_DRY_BULB_TICK = 5.0
+HUMIDITY_RATIO_TICK = 0.005
+
+LINE_STYLES: dict[PsychrometricChartLineKind, str] = {
+    PsychrometricChartLineKind.RELATIVE_HUMIDITY: 'stroke="#1f77b4" stroke-width="1"',
+    PsychrometricChartLineKind.ENTHALPY: 'stroke="#2ca02c" stroke-width="0.6"',
+    PsychrometricChartLineKind.TEMP_WET_BULB: (
+        'stroke="#ff7f0e" stroke-width="0.6" stroke-dasharray="4 2"'
+    ),
+    PsychrometricChartLineKind.SPECIFIC_VOLUME: 'stroke="#9467bd" stroke-width="0.6"',
+}
+
+
+def render_psychrometric_chart_svg(chart: PsychrometricChartEntity) -> str:
+    """Dessine un diagramme psychrométrique au format SVG
+
+    La température sèche est en abscisse et l'humidité absolue en ordonnée,
+    sur un axe à droite comme sur les diagrammes ASHRAE.
+
+    Args:
+        chart (PsychrometricChartEntity): Géométrie du diagramme
+
+    Returns:
+        str: Document SVG
+    """
+    scale = _Scale(chart)
+    elements = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{WIDTH}" height="{HEIGHT}" '
+        f'viewBox="0 0 {WIDTH} {HEIGHT}" font-family="sans-serif" font-size="10">',
+        f'<rect x="{MARGIN}" y="{MARGIN}" width="{WIDTH - 2 * MARGIN}" '
+        f'height="{HEIGHT - 2 * MARGIN}" fill="none" stroke="#000"/>',
+    ]
+    elements.extend(_axes(chart, scale))
+    for line in chart.lines:
+        elements.extend(_line(line, scale))
+    elements.append("</svg>")
+    return "\n".join(elements)
+
+
+class _Scale:
+    """Conversion des coordonnées physiques en coordonnées SVG"""
+
+    def __init__(self, chart: PsychrometricChartEntity) -> None:
+        self.chart = chart
+        self.x_ratio = (WIDTH - 2 * MARGIN) / (
+            chart.temp_dry_bulb_max - chart.temp_dry_bulb_min
+        )
+        self.y_ratio = (HEIGHT - 2 * MARGIN) / chart.humidity_ratio_max
+
+    def x(self, temp_dry_bulb: float) -> float:
+        return round(
+            MARGIN + (temp_dry_bulb - self.chart.temp_dry_bulb_min) * self.x_ratio, 2
+        )
+
+    def y(self, humidity_ratio: float) -> float:
+        return round(HEIGHT - MARGIN - humidity_ratio * self.y_ratio, 2)
+
+
+def _axes(chart: PsychrometricChartEntity, scale: _Scale) -> list[str]:
+    elements = []
+    tick = (chart.temp_dry_bulb_min // TEMP_DRY_BULB_TICK + 1) * TEMP_DRY_BULB_TICK
+    while tick < chart.temp_dry_bulb_max:
+        x = scale.x(tick)
+        elements.append(
+            f'<line x1="{x}" y1="{HEIGHT - MARGIN}" x2="{x}" '
+            f'y2="{HEIGHT - MARGIN + 4}" stroke="#000"/>'
+            f'<text x="{x}" y="{HEIGHT - MARGIN + 16}" text-anchor="middle">'
+            f"{tick:g}</text>"
+        )
+        tick += TEMP_DRY_BULB_TICK
+    tick = HUMIDITY_RATIO_TICK
+    while tick < chart.humidity_ratio_max:
+        y = scale.y(tick)
+        elements.append(
+            f'<line x1="{WIDTH - MARGIN}" y1="{y}" x2="{WIDTH - MARGIN + 4}" '
+            f'y2="{y}" stroke="#000"/>'
+            f'<text x="{WIDTH - MARGIN + 6}" y="{y + 3}">{tick:.3f}</text>'
+        )
+        tick += HUMIDITY_RATIO_TICK
+    elements.append(
+        f'<text x="{WIDTH / 2}" y="{HEIGHT - 10}" text-anchor="middle">'
+        f"Température sèche [°C] - {chart.pressure:g} Pa</text>"
+    )
+    elements.append(
+        f'<text x="{WIDTH - 10}" y="{HEIGHT / 2}" text-anchor="middle" '
+        f'transform="rotate(-90 {WIDTH - 10} {HEIGHT / 2})">'
+        "Humidité absolue [kg eau/kg air sec]</text>"
+    )
+    return elements
+
+
+def _line(line: PsychrometricChartLineEntity, scale: _Scale) -> list[str]:
+    points = " ".join(
+        f"{scale.x(t)},{scale.y(w)}"
+        for t, w in zip(line.temp_dry_bulb, line.humidity_ratio, strict=True)
+    )
+    elements = [
+        f'<polyline class="{line.kind.value}" fill="none" '
+        f'{LINE_STYLES[line.kind]} points="{points}"/>'
+    ]
+    if line.kind is PsychrometricChartLineKind.RELATIVE_HUMIDITY:
+        elements.append(
+            f'<text x="{scale.x(line.temp_dry_bulb[-1]) - 4}" '
+            f'y="{scale.y(line.humidity_ratio[-1]) - 4}" text-anchor="end" '
+            f'fill="#1f77b4">{line.value:g} %</text>'
+        )
+    return elements
@@ -0,0 +1,30 @@
+import csv
+import io
+
+from humid_air.domain.entities.saturation_table_entity import SaturationTableEntity
+
+SATURATION_TABLE_COLUMNS = (
+    "temp_dry_bulb",
+    "saturation_pressure",
+    "humidity_ratio",
+    "enthalpy",
+    "specific_volume",
+)
+
+
+def render_saturation_table_csv(table: SaturationTableEntity) -> str:
+    """Rend la table de saturation en CSV, une ligne par température
+
+    Args:
+        table (SaturationTableEntity): Table de saturation
+
+    Returns:
+        str: Texte CSV avec en-tête, cellules vides sans état saturé
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(SATURATION_TABLE_COLUMNS)
+    columns = [getattr(table, name) for name in SATURATION_TABLE_COLUMNS]
+    for row in zip(*columns, strict=True):
+        writer.writerow(["" if value is None else value for value in row])
+    return buffer.getvalue()
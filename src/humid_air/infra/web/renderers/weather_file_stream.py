@@ -0,0 +1,33 @@
+from collections.abc import Iterable, Iterator
+
+from humid_air.domain.entities.weather_file_entity import WeatherResultsEntity
+from humid_air.infra.web.renderers.batch_stream import (
+    render_batch_csv,
+    render_batch_ndjson,
+)
+
+
+def render_weather_csv(chunks: Iterable[WeatherResultsEntity]) -> Iterator[str]:
+    """Rend les enregistrements enrichis en CSV, une tranche à la fois
+
+    Les colonnes recopiées du fichier précèdent les propriétés calculées.
+
+    Args:
+        chunks (Iterable[WeatherResultsEntity]): Tranches enrichies
+
+    Returns:
+        Iterator[str]: Texte CSV, un bloc par tranche
+    """
+    return render_batch_csv((chunk.labels, chunk.batch) for chunk in chunks)
+
+
+def render_weather_ndjson(chunks: Iterable[WeatherResultsEntity]) -> Iterator[str]:
+    """Rend les enregistrements enrichis en NDJSON, une tranche à la fois
+
+    Args:
+        chunks (Iterable[WeatherResultsEntity]): Tranches enrichies
+
+    Returns:
+        Iterator[str]: Un objet JSON par enregistrement et par ligne, groupés par tranche
+    """
+    return render_batch_ndjson((chunk.labels, chunk.batch) for chunk in chunks)
@@ -84,3 +84,9 @@ class TestHumidAirEntity(unittest.TestCase):
         self.assertAlmostEqual(
             self.humid_air.compressibility_factor, expected_value, places=4
         )
+
+    def test_humid_air_state_is_solved_once(self) -> None:
+        first_instance = self.humid_air._get_humid_air_instance()
+        self.assertAlmostEqual(self.humid_air.humidity_ratio, 0.007294, places=6)
+        self.assertAlmostEqual(self.humid_air.temp_wet_bulb, 13.78, places=2)
+        self.assertIs(self.humid_air._get_humid_air_instance(), first_instance)
@@ -0,0 +1,73 @@
+from http import HTTPStatus
+
+from common.tests.routes.test_base_api import TestBaseAPI
+
+
+class TestComputeAirProcessRoutes(TestBaseAPI):
+    def test_compute_air_process_with_valid_data(self) -> None:
+        data = {
+            "streams": [
+                {"mass_flow_rate": 1.0, "temp_dry_bulb": 30.0, "relative_humidity": 50},
+                {"mass_flow_rate": 3.0, "temp_dry_bulb": 5.0, "temp_dew_point": 1.0},
+            ],
+            "steps": [
+                {"kind": "coil", "apparatus_dew_point": 8.0, "bypass_factor": 0.1},
+                {"kind": "sensible", "temp_dry_bulb": 22.0},
+                {"kind": "steam_humidification", "relative_humidity": 50.0},
+            ],
+            "engine": "hyland_wexler",
+        }
+        response = self.client.post("/v1/humid_air/process", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertEqual(len(response_data["inlets"]), 2)
+        self.assertEqual(
+            [step["kind"] for step in response_data["steps"]],
+            ["mixing", "coil", "sensible", "steam_humidification"],
+        )
+        self.assertEqual(response_data["steps"][2]["outlet"]["temp_dry_bulb"], 22.0)
+        self.assertIn("total_load", response_data["steps"][0])
+
+    def test_compute_air_process_with_selected_fields(self) -> None:
+        data = {
+            "streams": [
+                {"mass_flow_rate": 1.0, "temp_dry_bulb": 10.0, "relative_humidity": 50}
+            ],
+            "steps": [{"kind": "sensible", "temp_dry_bulb": 20.0}],
+            "fields": ["humidity_ratio"],
+        }
+        response = self.client.post("/v1/humid_air/process", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertEqual(set(response_data["inlets"][0]), {"humidity_ratio"})
+        self.assertEqual(set(response_data["steps"][0]["outlet"]), {"humidity_ratio"})
+
+    def test_compute_air_process_with_impossible_step(self) -> None:
+        data = {
+            "streams": [
+                {"mass_flow_rate": 1.0, "temp_dry_bulb": 25.0, "relative_humidity": 80}
+            ],
+            "steps": [{"kind": "sensible", "temp_dry_bulb": 5.0}],
+        }
+        response = self.client.post("/v1/humid_air/process", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    def test_compute_air_process_with_missing_step_parameters(self) -> None:
+        data = {
+            "streams": [
+                {"mass_flow_rate": 1.0, "temp_dry_bulb": 25.0, "relative_humidity": 80}
+            ],
+            "steps": [{"kind": "coil", "bypass_factor": 0.1}],
+        }
+        response = self.client.post("/v1/humid_air/process", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    def test_compute_air_process_with_out_of_range_state(self) -> None:
+        data = {
+            "streams": [
+                {"mass_flow_rate": 1.0, "temp_dry_bulb": 25.0, "relative_humidity": 50}
+            ],
+            "steps": [{"kind": "steam_humidification", "humidity_ratio": 5.0}],
+        }
+        response = self.client.post("/v1/humid_air/process", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
@@ -0,0 +1,37 @@
+import io
+from http import HTTPStatus
+
+from werkzeug.test import TestResponse
+
+from common.tests.routes.test_base_api import TestBaseAPI
+from humid_air.tests.services.test_weather_file_readers import EPW_HEADER, epw_row
+
+
+class TestClimateAnalyticsRoutes(TestBaseAPI):
+    def post_weather_file(self, content: str, **data: str) -> TestResponse:
+        response: TestResponse = self.client.post(
+            "/v1/humid_air/weather_file/analytics",
+            data={"file": (io.BytesIO(content.encode()), "weather.epw"), **data},
+            content_type="multipart/form-data",
+        )
+        return response
+
+    def test_epw_file_is_aggregated(self) -> None:
+        rows = [epw_row(hour, 10 + hour, 60, 100000) for hour in range(1, 25)]
+        rows.append(epw_row(1, 99.9, 60, 100000))
+        response = self.post_weather_file(
+            "\n".join(EPW_HEADER + rows),
+            bin_width="5",
+            heating_base_temperature="18",
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        data = response.get_json()
+        self.assertEqual(data["hours"], 24)
+        self.assertEqual(data["invalid_hours"], 1)
+        self.assertEqual([b["hours"] for b in data["bins"]], [4, 5, 5, 5, 5])
+        # 11 à 17 °C sous la base de 18 °C : (7 + 6 + ... + 1) / 24
+        self.assertAlmostEqual(data["heating_degree_days"], 28 / 24, places=1)
+
+    def test_invalid_file_returns_error(self) -> None:
+        response = self.post_weather_file("not an epw file")
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
@@ -0,0 +1,51 @@
+from http import HTTPStatus
+
+from common.tests.routes.test_base_api import TestBaseAPI
+
+
+class TestThermalComfortRoutes(TestBaseAPI):
+    def test_compute_thermal_comfort(self) -> None:
+        response = self.client.post(
+            "/v1/humid_air/comfort",
+            json={
+                "temp_dry_bulb": [22, 27],
+                "relative_humidity": [60, 60],
+                "metabolic_rate": 1.2,
+            },
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertEqual(len(response_data["pmv"]), 2)
+        self.assertLess(response_data["pmv"][0], 0)
+        self.assertGreater(response_data["pmv"][1], 0)
+        self.assertNotIn("adaptive_comfort_temperature", response_data)
+
+    def test_compute_thermal_comfort_with_adaptive_model(self) -> None:
+        response = self.client.post(
+            "/v1/humid_air/comfort",
+            json={
+                "temp_dry_bulb": [25],
+                "relative_humidity": [50],
+                "prevailing_mean_outdoor_temperature": 20,
+            },
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.get_json()["adaptive_acceptable_90"], [True])
+
+    def test_compute_thermal_comfort_with_mismatched_columns(self) -> None:
+        response = self.client.post(
+            "/v1/humid_air/comfort",
+            json={"temp_dry_bulb": [25, 26], "relative_humidity": [50]},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    def test_get_comfort_zone(self) -> None:
+        response = self.client.get(
+            "/v1/humid_air/comfort/zone", query_string={"clothing": 1.0}
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertEqual(
+            len(response_data["temp_dry_bulb"]), len(response_data["humidity_ratio"])
+        )
+        self.assertEqual(response_data["clothing"], 1.0)
@@ -0,0 +1,18 @@
+from http import HTTPStatus
+
+from common.tests.routes.test_base_api import TestBaseAPI
+
+
+class TestHumidAirCacheStatisticsRoute(TestBaseAPI):
+    def test_repeated_state_is_served_from_cache(self) -> None:
+        query = {"pressure": 101325, "temp_dry_bulb": 21.5, "relative_humidity": 45}
+        before = self.client.get("/v1/humid_air/cache_statistics").get_json()
+        self.client.get("/v1/humid_air/get_ha_props", query_string=query)
+        self.client.get("/v1/humid_air/get_ha_props", query_string=query)
+
+        response = self.client.get("/v1/humid_air/cache_statistics")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        after = response.get_json()
+        self.assertGreaterEqual(after["hits"], before["hits"] + 1)
+        self.assertIn("evictions", after)
+        self.assertIn("max_size", after)
@@ -19,6 +19,59 @@ class TestHumidAirRoutes(TestBaseAPI):
         self.assertIn("temp_dry_bulb", response_data)
         self.assertIn("relative_humidity", response_data)
 
+    def test_get_humid_air_properties_with_selected_fields(self) -> None:
+        data = {
+            "pressure": 101325,
+            "temp_dry_bulb": 25.0,
+            "relative_humidity": 50.0,
+            "fields": "humidity_ratio,temp_dew_point",
+        }
+        response = self.client.get("/v1/humid_air/get_ha_props", query_string=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            set(response.get_json()),
+            {"humidity_ratio", "temp_dew_point"},
+        )
+
+    def test_get_humid_air_properties_with_unknown_field(self) -> None:
+        data = {
+            "pressure": 101325,
+            "temp_dry_bulb": 25.0,
+            "relative_humidity": 50.0,
+            "fields": "humidity_ratio,unknown",
+        }
+        response = self.client.get("/v1/humid_air/get_ha_props", query_string=data)
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    def test_get_humid_air_properties_approximate(self) -> None:
+        data = {
+            "pressure": 101325,
+            "temp_dry_bulb": 25.0,
+            "relative_humidity": 50.0,
+            "approximate": True,
+        }
+        response = self.client.get("/v1/humid_air/get_ha_props", query_string=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertIsNotNone(response_data["humidity_ratio"])
+        self.assertIn("humidity_ratio", response_data["max_errors"])
+        self.assertIsNone(response_data["thermal_conductivity"])
+
+    def test_get_humid_air_properties_from_dew_point_and_wet_bulb(self) -> None:
+        data = {"pressure": 101325, "temp_dew_point": 10.0, "temp_wet_bulb": 15.0}
+        response = self.client.get("/v1/humid_air/get_ha_props", query_string=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertAlmostEqual(response_data["temp_dew_point"], 10.0, delta=0.25)
+        self.assertAlmostEqual(response_data["temp_wet_bulb"], 15.0, delta=0.25)
+
+    def test_get_humid_air_properties_with_dependent_inputs_returns_error(
+        self,
+    ) -> None:
+        data = {"pressure": 101325, "temp_dew_point": 10.0, "humidity_ratio": 0.007}
+        response = self.client.get("/v1/humid_air/get_ha_props", query_string=data)
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+
     def test_get_humid_air_properties_with_invalid_data_returns_error(self) -> None:
         invalid_data = {
             "pressure": 101325,
@@ -33,3 +86,17 @@ class TestHumidAirRoutes(TestBaseAPI):
         self.assertIn("code", response_data)
         self.assertEqual(response_data["code"], HTTPStatus.UNPROCESSABLE_ENTITY)
         self.assertIn("message", response_data)
+
+    def test_get_humid_air_properties_out_of_range_state_returns_error(self) -> None:
+        for approximate in ("false", "true"):
+            data = {
+                "pressure": 101325,
+                "humidity_ratio": 0.01,
+                "enthalpy_per_humid_air": 1e6,
+                "approximate": approximate,
+            }
+            with self.subTest(approximate=approximate):
+                response = self.client.get(
+                    "/v1/humid_air/get_ha_props", query_string=data
+                )
+                self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
@@ -0,0 +1,131 @@
+import json
+from http import HTTPStatus
+
+from common.tests.routes.test_base_api import TestBaseAPI
+
+
+class TestHumidAirBatchRoutes(TestBaseAPI):
+    def test_get_ha_props_batch_with_valid_data(self) -> None:
+        valid_data = {
+            "pressure": [101325, 101325],
+            "temp_dry_bulb": [20.0, 25.0],
+            "relative_humidity": [50.0, 60.0],
+        }
+        response = self.client.post("/v1/humid_air/batch", json=valid_data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertEqual(len(response_data["humidity_ratio"]), 2)
+        self.assertEqual(len(response_data["compressibility_factor"]), 2)
+        self.assertEqual(response_data["errors"], [])
+
+    def test_get_ha_props_batch_with_hyland_wexler_engine(self) -> None:
+        data = {
+            "pressure": [101325, 101325],
+            "temp_dry_bulb": [20.0, 25.0],
+            "relative_humidity": [50.0, 60.0],
+            "engine": "hyland_wexler",
+        }
+        response = self.client.post("/v1/humid_air/batch", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertEqual(len(response_data["humidity_ratio"]), 2)
+        self.assertEqual(response_data["thermal_conductivity"], [None, None])
+
+    def test_get_ha_props_batch_with_selected_fields(self) -> None:
+        data = {
+            "pressure": [101325, 101325],
+            "temp_dry_bulb": [20.0, 25.0],
+            "relative_humidity": [50.0, 60.0],
+            "engine": "hyland_wexler",
+            "fields": ["humidity_ratio"],
+        }
+        response = self.client.post("/v1/humid_air/batch", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(set(response.get_json()), {"humidity_ratio", "errors"})
+
+    def test_get_ha_props_batch_approximate_declares_max_errors(self) -> None:
+        data = {
+            "pressure": [101325, 101325],
+            "temp_dry_bulb": [20.0, 25.0],
+            "relative_humidity": [50.0, 60.0],
+            "engine": "lookup_table",
+            "fields": ["humidity_ratio"],
+        }
+        response = self.client.post("/v1/humid_air/batch", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn("humidity_ratio", response.get_json()["max_errors"])
+
+    def test_get_ha_props_batch_with_invalid_item_returns_partial_result(
+        self,
+    ) -> None:
+        data = {
+            "pressure": [101325, 101325],
+            "temp_dry_bulb": [345.0, 25.0],
+            "relative_humidity": [50.0, 50.0],
+        }
+        response = self.client.post("/v1/humid_air/batch", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertIsNone(response_data["humidity_ratio"][0])
+        self.assertIsNotNone(response_data["humidity_ratio"][1])
+        self.assertEqual(response_data["errors"][0]["index"], 0)
+
+    def test_get_ha_props_batch_with_different_lengths_returns_error(self) -> None:
+        data = {
+            "pressure": [101325],
+            "temp_dry_bulb": [20.0, 25.0],
+            "relative_humidity": [50.0, 50.0],
+        }
+        response = self.client.post("/v1/humid_air/batch", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+        self.assertEqual(response.get_json()["code"], HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    def test_get_ha_props_batch_as_ndjson(self) -> None:
+        data = {
+            "pressure": [101325, 101325, 101325],
+            "temp_dry_bulb": [20.0, 25.0, 400.0],
+            "relative_humidity": [50.0, 60.0, 50.0],
+            "engine": "hyland_wexler",
+            "fields": ["humidity_ratio"],
+            "output_format": "ndjson",
+        }
+        response = self.client.post("/v1/humid_air/batch", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        records = [
+            json.loads(line)
+            for line in response.get_data(as_text=True).strip().splitlines()
+        ]
+        self.assertEqual([record["index"] for record in records], [0, 1, 2])
+        self.assertEqual(records[0]["errors"], [])
+        self.assertIsNone(records[2]["humidity_ratio"])
+        self.assertNotEqual(records[2]["errors"], [])
+
+    def test_get_ha_props_batch_as_csv(self) -> None:
+        data = {
+            "temp_dry_bulb": [20.0, 25.0],
+            "relative_humidity": [50.0, 60.0],
+            "engine": "hyland_wexler",
+            "fields": ["temp_dry_bulb", "humidity_ratio"],
+            "output_format": "csv",
+        }
+        response = self.client.post("/v1/humid_air/batch", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.mimetype, "text/csv")
+        lines = response.get_data(as_text=True).strip().splitlines()
+        self.assertEqual(lines[0], "index,temp_dry_bulb,humidity_ratio,errors")
+        self.assertEqual(len(lines), 3)
+
+    def test_get_ha_props_batch_as_csv_without_states_keeps_header(self) -> None:
+        data = {
+            "temp_dry_bulb": [],
+            "relative_humidity": [],
+            "fields": ["temp_dry_bulb", "humidity_ratio"],
+            "output_format": "csv",
+        }
+        response = self.client.post("/v1/humid_air/batch", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.get_data(as_text=True),
+            "index,temp_dry_bulb,humidity_ratio,errors\n",
+        )
@@ -0,0 +1,54 @@
+import json
+from http import HTTPStatus
+
+from common.tests.routes.test_base_api import TestBaseAPI
+
+
+class TestPsychrometricChartRoutes(TestBaseAPI):
+    def test_get_chart_as_json(self) -> None:
+        response = self.client.get(
+            "/v1/humid_air/chart",
+            query_string={"temp_dry_bulb_min": 0, "temp_dry_bulb_max": 40},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertEqual(response_data["pressure"], 101325)
+        kinds = {line["kind"] for line in response_data["lines"]}
+        self.assertEqual(
+            kinds,
+            {"relative_humidity", "enthalpy", "temp_wet_bulb", "specific_volume"},
+        )
+
+    def test_get_chart_beyond_boiling_is_valid_json(self) -> None:
+        response = self.client.get(
+            "/v1/humid_air/chart",
+            query_string={
+                "pressure": 10,
+                "temp_dry_bulb_min": 50,
+                "temp_dry_bulb_max": 100,
+            },
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        def reject(constant: str) -> None:
+            raise ValueError(constant)
+
+        response_data = json.loads(
+            response.get_data(as_text=True), parse_constant=reject
+        )
+        self.assertEqual(response_data["pressure"], 10)
+
+    def test_get_chart_as_svg(self) -> None:
+        response = self.client.get(
+            "/v1/humid_air/chart", query_string={"format": "svg"}
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.mimetype, "image/svg+xml")
+        self.assertIn("<polyline", response.get_data(as_text=True))
+
+    def test_get_chart_with_invalid_range_returns_error(self) -> None:
+        response = self.client.get(
+            "/v1/humid_air/chart",
+            query_string={"temp_dry_bulb_min": 40, "temp_dry_bulb_max": 0},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
@@ -0,0 +1,38 @@
+from http import HTTPStatus
+
+from common.tests.routes.test_base_api import TestBaseAPI
+
+
+class TestSaturationTableRoutes(TestBaseAPI):
+    def test_get_saturation_table_as_json(self) -> None:
+        response = self.client.get(
+            "/v1/humid_air/saturation_table",
+            query_string={"temp_dry_bulb_min": 0, "temp_dry_bulb_max": 30},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertEqual(response_data["pressure"], 101325)
+        self.assertEqual(len(response_data["temp_dry_bulb"]), 31)
+        self.assertEqual(len(response_data["humidity_ratio"]), 31)
+
+    def test_get_saturation_table_as_csv(self) -> None:
+        response = self.client.get(
+            "/v1/humid_air/saturation_table",
+            query_string={
+                "temp_dry_bulb_min": 0,
+                "temp_dry_bulb_max": 30,
+                "temp_dry_bulb_step": 10,
+                "format": "csv",
+            },
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.mimetype, "text/csv")
+        lines = response.get_data(as_text=True).strip().splitlines()
+        self.assertEqual(len(lines), 5)
+
+    def test_get_saturation_table_with_invalid_range_returns_error(self) -> None:
+        response = self.client.get(
+            "/v1/humid_air/saturation_table",
+            query_string={"temp_dry_bulb_min": 40, "temp_dry_bulb_max": 0},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
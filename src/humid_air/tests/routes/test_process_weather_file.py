@@ -0,0 +1,58 @@
+import io
+import json
+from http import HTTPStatus
+
+from werkzeug.test import TestResponse
+
+from common.tests.routes.test_base_api import TestBaseAPI
+from humid_air.tests.services.test_weather_file_readers import EPW_HEADER, epw_row
+
+
+class TestWeatherFileRoutes(TestBaseAPI):
+    def post_weather_file(self, content: str, **data: str) -> TestResponse:
+        response: TestResponse = self.client.post(
+            "/v1/humid_air/weather_file",
+            data={"file": (io.BytesIO(content.encode()), "weather.epw"), **data},
+            content_type="multipart/form-data",
+        )
+        return response
+
+    def test_epw_file_is_streamed_as_csv(self) -> None:
+        rows = [epw_row(hour, 10 + hour, 60, 100000) for hour in range(1, 25)]
+        response = self.post_weather_file(
+            "\n".join(EPW_HEADER + rows), fields="humidity_ratio,temp_wet_bulb"
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.mimetype, "text/csv")
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual(
+            lines[0], "year,month,day,hour,minute,humidity_ratio,temp_wet_bulb,errors"
+        )
+        self.assertEqual(len(lines), 25)
+
+    def test_epw_file_is_streamed_as_ndjson(self) -> None:
+        rows = [epw_row(1, 20, 50, 101325), epw_row(2, 99.9, 50, 101325)]
+        response = self.post_weather_file(
+            "\n".join(EPW_HEADER + rows), output_format="ndjson"
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        first, second = (
+            json.loads(line) for line in response.get_data(as_text=True).splitlines()
+        )
+        self.assertEqual(first["hour"], "1")
+        self.assertAlmostEqual(first["humidity_ratio"], 0.0073, places=4)
+        self.assertEqual(first["errors"], [])
+        self.assertIsNone(second["humidity_ratio"])
+        self.assertEqual(second["errors"][0]["field"], "temp_dry_bulb")
+
+    def test_csv_without_input_columns_returns_error(self) -> None:
+        response = self.post_weather_file(
+            "timestamp,wind_speed\n2024-01-01T00:00,3", file_format="csv"
+        )
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+        self.assertIn("colonnes d'entrée", response.get_json()["message"])
+
+    def test_invalid_file_returns_error(self) -> None:
+        response = self.post_weather_file("not,a,weather,file\n1,2,3,4")
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
@@ -0,0 +1,49 @@
+from http import HTTPStatus
+
+from common.tests.routes.test_base_api import TestBaseAPI
+
+
+class TestUncertaintyRoutes(TestBaseAPI):
+    def test_propagate_uncertainty(self) -> None:
+        response = self.client.post(
+            "/v1/humid_air/uncertainty",
+            json={
+                "temp_dry_bulb": [20, 25],
+                "relative_humidity": [50, 60],
+                "fields": ["humidity_ratio", "temp_dew_point"],
+            },
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertEqual(response_data["method"], "finite_difference")
+        self.assertEqual(
+            set(response_data["properties"]), {"humidity_ratio", "temp_dew_point"}
+        )
+        dew_point = response_data["properties"]["temp_dew_point"]
+        self.assertEqual(len(dew_point["standard_deviation"]), 2)
+        self.assertLess(dew_point["lower"][0], dew_point["nominal"][0])
+        self.assertGreater(dew_point["upper"][0], dew_point["nominal"][0])
+
+    def test_propagate_uncertainty_with_monte_carlo(self) -> None:
+        response = self.client.post(
+            "/v1/humid_air/uncertainty",
+            json={
+                "pressure": [101325],
+                "temp_dry_bulb": [20],
+                "relative_humidity": [50],
+                "method": "monte_carlo",
+                "samples": 500,
+                "seed": 1,
+                "fields": ["enthalpy_per_humid_air"],
+            },
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        enthalpy = response.get_json()["properties"]["enthalpy_per_humid_air"]
+        self.assertGreater(enthalpy["standard_deviation"][0], 0)
+
+    def test_propagate_uncertainty_with_mismatched_columns(self) -> None:
+        response = self.client.post(
+            "/v1/humid_air/uncertainty",
+            json={"temp_dry_bulb": [20, 25], "relative_humidity": [50]},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
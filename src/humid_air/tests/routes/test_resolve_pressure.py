@@ -0,0 +1,120 @@
+from http import HTTPStatus
+from uuid import uuid4
+
+from common.tests.routes.test_base_api import TestBaseAPI
+
+
+class TestSitePressureRoutes(TestBaseAPI):
+    def setUp(self) -> None:
+        super().setUp()
+        user_data = {"email": "site@example.com", "password": "SecurePass123!"}
+        self.client.post("/v1/auth/sign_up", json=user_data)
+        token = self.client.post("/v1/auth/login", json=user_data).get_json()[
+            "access_token"
+        ]
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.client.post(
+            "/v1/projects/create_project",
+            json={
+                "project_number": "PRJ-ALT-001",
+                "name": "Projet en altitude",
+                "description": "Site à 1500 m",
+                "site_pressure": 84556,
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        projects = self.client.get(
+            "/v1/projects/user/projects",
+            headers={"Authorization": f"Bearer {token}"},
+        ).get_json()["projects"]
+        self.project_id = projects[0]["id"]
+
+    def test_get_ha_props_with_altitude(self) -> None:
+        data = {"altitude": 1000, "temp_dry_bulb": 25.0, "relative_humidity": 50.0}
+        response = self.client.get("/v1/humid_air/get_ha_props", query_string=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertAlmostEqual(response.get_json()["pressure"], 89875, delta=5)
+
+    def test_get_ha_props_with_project_site_pressure(self) -> None:
+        data = {
+            "project_id": self.project_id,
+            "temp_dry_bulb": 25.0,
+            "relative_humidity": 50.0,
+        }
+        response = self.client.get(
+            "/v1/humid_air/get_ha_props", query_string=data, headers=self.headers
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.get_json()["pressure"], 84556)
+
+    def test_get_ha_props_with_project_requires_jwt(self) -> None:
+        data = {
+            "project_id": self.project_id,
+            "temp_dry_bulb": 25.0,
+            "relative_humidity": 50.0,
+        }
+        response = self.client.get("/v1/humid_air/get_ha_props", query_string=data)
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+
+    def test_get_ha_props_with_project_of_another_user(self) -> None:
+        user_data = {"email": "other@example.com", "password": "SecurePass123!"}
+        self.client.post("/v1/auth/sign_up", json=user_data)
+        token = self.client.post("/v1/auth/login", json=user_data).get_json()[
+            "access_token"
+        ]
+        data = {
+            "project_id": self.project_id,
+            "temp_dry_bulb": 25.0,
+            "relative_humidity": 50.0,
+        }
+        response = self.client.get(
+            "/v1/humid_air/get_ha_props",
+            query_string=data,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    def test_get_ha_props_with_unknown_project(self) -> None:
+        data = {
+            "project_id": str(uuid4()),
+            "temp_dry_bulb": 25.0,
+            "relative_humidity": 50,
+        }
+        response = self.client.get(
+            "/v1/humid_air/get_ha_props", query_string=data, headers=self.headers
+        )
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+
+    def test_batch_without_pressure_uses_site_pressure(self) -> None:
+        data = {
+            "project_id": self.project_id,
+            "temp_dry_bulb": [20.0, 25.0, 30.0],
+            "relative_humidity": [50.0, 50.0, 50.0],
+            "engine": "hyland_wexler",
+            "fields": ["pressure", "humidity_ratio"],
+        }
+        response = self.client.post(
+            "/v1/humid_air/batch", json=data, headers=self.headers
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.get_json()["pressure"], [84556] * 3)
+
+    def test_batch_with_project_requires_jwt(self) -> None:
+        data = {
+            "project_id": self.project_id,
+            "temp_dry_bulb": [20.0],
+            "relative_humidity": [50.0],
+        }
+        response = self.client.post("/v1/humid_air/batch", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+
+    def test_batch_defaults_to_sea_level(self) -> None:
+        data = {
+            "temp_dry_bulb": [20.0, 25.0],
+            "relative_humidity": [50.0, 50.0],
+            "engine": "hyland_wexler",
+            "fields": ["pressure"],
+        }
+        response = self.client.post("/v1/humid_air/batch", json=data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.get_json()["pressure"], [101325] * 2)
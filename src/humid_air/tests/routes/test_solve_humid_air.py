@@ -0,0 +1,34 @@
+from http import HTTPStatus
+
+from common.tests.routes.test_base_api import TestBaseAPI
+
+
+class TestSolveHumidAirRoutes(TestBaseAPI):
+    def test_solve_humid_air(self) -> None:
+        response = self.client.post(
+            "/v1/humid_air/solve",
+            json={
+                "relative_humidity": 55,
+                "target": "humidity_ratio",
+                "target_values": [0.008, 0.01],
+                "fields": ["temp_dry_bulb", "humidity_ratio"],
+            },
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response_data = response.get_json()
+        self.assertEqual(response_data["unknown"], "temp_dry_bulb")
+        self.assertEqual(response_data["properties"]["humidity_ratio"], [0.008, 0.01])
+        self.assertEqual(response_data["converged"], [True, True])
+        self.assertEqual(response_data["statistics"]["states"], 2)
+        self.assertEqual(response_data["errors"], [])
+
+    def test_solve_humid_air_with_unknown_target(self) -> None:
+        response = self.client.post(
+            "/v1/humid_air/solve",
+            json={
+                "temp_dry_bulb": 25,
+                "target": "prandtl_number",
+                "target_values": [0.7],
+            },
+        )
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
@@ -0,0 +1,68 @@
+import unittest
+
+from humid_air.domain.entities.climate_analytics_entity import ClimateAnalyticsEntity
+from humid_air.domain.entities.humid_air_batch_entity import HumidAirBatchEntity
+from humid_air.infra.services.climate_analytics import NumpyClimateAnalytics
+
+
+def batch(
+    temp_dry_bulb: list[float | None],
+    temp_wet_bulb: list[float | None],
+    enthalpy: list[float | None],
+) -> HumidAirBatchEntity:
+    return HumidAirBatchEntity(
+        properties={
+            "temp_dry_bulb": temp_dry_bulb,
+            "temp_wet_bulb": temp_wet_bulb,
+            "enthalpy_per_humid_air": enthalpy,
+        },
+        errors=[],
+    )
+
+
+class TestNumpyClimateAnalytics(unittest.TestCase):
+    def setUp(self) -> None:
+        self.analytics = NumpyClimateAnalytics()
+
+    def aggregate(self, *batches: HumidAirBatchEntity) -> ClimateAnalyticsEntity:
+        return self.analytics.aggregate(
+            batches,
+            bin_width=2,
+            heating_base_temperature=18,
+            cooling_base_temperature=24,
+            enthalpy_base=50000,
+        )
+
+    def test_degree_days_are_accumulated_hour_by_hour(self) -> None:
+        # 24 heures à 6 °C puis 24 heures à 30 °C, sur deux lots
+        result = self.aggregate(
+            batch([6.0] * 24, [4.0] * 24, [20000.0] * 24),
+            batch([30.0] * 24, [20.0] * 24, [57000.0] * 24),
+        )
+        self.assertEqual(result.hours, 48)
+        self.assertEqual(result.heating_degree_days, 12)
+        self.assertEqual(result.cooling_degree_days, 6)
+        self.assertEqual(result.heating_enthalpy_hours, 24 * 30000)
+        self.assertEqual(result.cooling_enthalpy_hours, 24 * 7000)
+
+    def test_bins_merge_chunks_and_average_wet_bulb(self) -> None:
+        result = self.aggregate(
+            batch([-0.5, 0.5, 1.9], [-1.0, 0.0, 1.0], [0.0, 0.0, 0.0]),
+            batch([1.0, 3.0], [2.0, 2.5], [0.0, 0.0]),
+        )
+        self.assertEqual(
+            [(b.temp_dry_bulb_min, b.temp_dry_bulb_max, b.hours) for b in result.bins],
+            [(-2, 0, 1), (0, 2, 3), (2, 4, 1)],
+        )
+        self.assertEqual(result.bins[1].mean_coincident_wet_bulb, 1.0)
+        self.assertEqual(sum(b.hours for b in result.bins), result.hours)
+
+    def test_invalid_hours_are_skipped(self) -> None:
+        result = self.aggregate(batch([20.0, None], [15.0, None], [40000.0, None]))
+        self.assertEqual(result.hours, 1)
+        self.assertEqual(result.invalid_hours, 1)
+
+    def test_empty_series(self) -> None:
+        result = self.aggregate()
+        self.assertEqual(result.hours, 0)
+        self.assertEqual(result.bins, [])
@@ -0,0 +1,117 @@
+import unittest
+
+from humid_air.infra.services.coolprop_engine import CoolPropHumidAirEngine
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+
+# tolérances annoncées dans HylandWexlerHumidAirEngine : (relative, absolue)
+TOLERANCES: dict[str, tuple[float, float]] = {
+    "partial_pressure_of_water_vapor": (0.015, 0.01),
+    "humidity_ratio": (0.015, 1e-6),
+    "temp_dew_point": (0.0, 0.15),
+    "temp_wet_bulb": (0.0, 0.15),
+    "enthalpy_per_humid_air": (0.007, 300.0),
+    "specific_volume_per_unit_humid_air": (0.015, 0.001),
+    "density_per_unit_humid_air": (0.015, 0.001),
+}
+
+# domaine accepté par le moteur : l'ébullition à 50 kPa (81,3 °C) exclut 90 °C
+GRID_PRESSURES: list[float] = [50000, 101325, 200000]
+GRID_TEMPERATURES: list[float] = [float(t) for t in range(-60, 91, 10)]
+GRID_RELATIVE_HUMIDITIES: list[float] = [5, 30, 50, 70, 100]
+
+
+class TestHylandWexlerHumidAirEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = HylandWexlerHumidAirEngine()
+        self.pressure: list[float] = []
+        self.temp_dry_bulb: list[float] = []
+        self.relative_humidity: list[float] = []
+        for pressure in GRID_PRESSURES:
+            for temp_dry_bulb in GRID_TEMPERATURES:
+                for relative_humidity in GRID_RELATIVE_HUMIDITIES:
+                    self.pressure.append(pressure)
+                    self.temp_dry_bulb.append(temp_dry_bulb)
+                    self.relative_humidity.append(relative_humidity)
+
+    def test_agreement_with_coolprop_within_tolerances(self) -> None:
+        result = self.engine.compute(
+            self.pressure, self.temp_dry_bulb, self.relative_humidity
+        )
+        reference = CoolPropHumidAirEngine().compute(
+            self.pressure, self.temp_dry_bulb, self.relative_humidity
+        )
+        self.assertEqual(
+            [error.index for error in result.errors],
+            [
+                index
+                for index, (pressure, temp_dry_bulb) in enumerate(
+                    zip(self.pressure, self.temp_dry_bulb, strict=True)
+                )
+                if pressure == 50000 and temp_dry_bulb == 90
+            ],
+        )
+        for name, (relative, absolute) in TOLERANCES.items():
+            for index, (value, expected) in enumerate(
+                zip(result.properties[name], reference.properties[name], strict=True)
+            ):
+                if (
+                    expected is None
+                    or self.pressure[index] == 50000
+                    and (self.temp_dry_bulb[index] == 90)
+                ):
+                    continue
+                if name == "temp_wet_bulb" and abs(expected) < 1:
+                    # recouvrement des équations 33 et 35 d'ASHRAE autour de 0 °C
+                    continue
+                with self.subTest(
+                    property=name,
+                    pressure=self.pressure[index],
+                    temp_dry_bulb=self.temp_dry_bulb[index],
+                    relative_humidity=self.relative_humidity[index],
+                ):
+                    assert value is not None
+                    self.assertLessEqual(
+                        abs(value - expected), absolute + relative * abs(expected)
+                    )
+
+    def test_unavailable_properties_are_none(self) -> None:
+        result = self.engine.compute([101325], [20], [50])
+        self.assertIsNone(result.properties["thermal_conductivity"][0])
+        self.assertIsNone(result.properties["compressibility_factor"][0])
+        self.assertEqual(result.properties["temp_dry_bulb"], [20])
+
+    def test_only_selected_fields_are_computed(self) -> None:
+        result = self.engine.compute(
+            [101325], [20], [50], fields=("humidity_ratio", "temp_dew_point")
+        )
+        self.assertEqual(list(result.properties), ["humidity_ratio", "temp_dew_point"])
+        self.assertAlmostEqual(
+            result.properties["temp_dew_point"][0] or 0.0, 9.27, delta=0.15
+        )
+
+    def test_states_out_of_engine_range_are_reported(self) -> None:
+        result = self.engine.compute(
+            [101325, 101325, 50000, 101325, 1e6, 101325],
+            [-80, 150, 85, 85, 20, 20],
+            [50, 10, 5, 50, 50, 50],
+        )
+        self.assertEqual([error.index for error in result.errors], [0, 1, 2, 4])
+        self.assertIsNone(result.properties["humidity_ratio"][1])
+        self.assertIsNotNone(result.properties["humidity_ratio"][5])
+
+    def test_wet_bulb_just_below_boiling(self) -> None:
+        result = self.engine.compute([50000], [81], [5], fields=("temp_wet_bulb",))
+        reference = CoolPropHumidAirEngine().compute(
+            [50000], [81], [5], fields=("temp_wet_bulb",)
+        )
+        value = result.properties["temp_wet_bulb"][0]
+        expected = reference.properties["temp_wet_bulb"][0]
+        assert value is not None and expected is not None
+        self.assertAlmostEqual(value, expected, delta=0.15)
+
+    def test_dry_air_has_no_dew_point(self) -> None:
+        result = self.engine.compute([101325], [20], [0])
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.properties["humidity_ratio"], [0.0])
+        self.assertIsNone(result.properties["temp_dew_point"][0])
+        self.assertIsNotNone(result.properties["temp_wet_bulb"][0])
@@ -0,0 +1,73 @@
+import unittest
+
+from humid_air.domain.entities.humid_air_entity import (
+    HUMID_AIR_INPUT_PAIRS,
+    HumidAirEntity,
+)
+from humid_air.infra.services.hyland_wexler_input_converter import (
+    HylandWexlerInputConverter,
+)
+
+# tolérances annoncées dans HylandWexlerInputConverter : (température sèche, humidité relative)
+TOLERANCES = (0.25, 0.4)
+
+# (pression, température sèche, humidité relative)
+STATES: list[tuple[float, float, float]] = [
+    (101325, 25, 50),
+    (101325, -5, 80),
+    (80000, 35, 20),
+    (200000, 60, 30),
+    (101325, 0.5, 100),
+]
+
+
+class TestHylandWexlerInputConverter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.converter = HylandWexlerInputConverter()
+
+    def test_every_pair_recovers_coolprop_state(self) -> None:
+        for pressure, temp_dry_bulb, relative_humidity in STATES:
+            entity = HumidAirEntity(
+                pressure=pressure,
+                temp_dry_bulb=temp_dry_bulb,
+                relative_humidity=relative_humidity,
+            )
+            reference = entity.get_properties()
+            for pair in HUMID_AIR_INPUT_PAIRS:
+                with self.subTest(state=(pressure, temp_dry_bulb), pair=sorted(pair)):
+                    (converted_tdb,), (converted_rh,) = (
+                        self.converter.to_dry_bulb_and_relative_humidity(
+                            [pressure], {name: [reference[name]] for name in pair}
+                        )
+                    )
+                    self.assertIsNotNone(converted_tdb)
+                    self.assertIsNotNone(converted_rh)
+                    self.assertAlmostEqual(
+                        converted_tdb or 0.0, temp_dry_bulb, delta=TOLERANCES[0]
+                    )
+                    self.assertAlmostEqual(
+                        converted_rh or 0.0, relative_humidity, delta=TOLERANCES[1]
+                    )
+
+    def test_impossible_state_is_signalled(self) -> None:
+        temp_dry_bulb, relative_humidity = (
+            self.converter.to_dry_bulb_and_relative_humidity(
+                [101325, 101325],
+                {"temp_dry_bulb": [20, 20], "temp_dew_point": [25, 10]},
+            )
+        )
+        self.assertIsNone(temp_dry_bulb[0])
+        self.assertIsNone(relative_humidity[0])
+        self.assertEqual(temp_dry_bulb[1], 20)
+        self.assertAlmostEqual(relative_humidity[1] or 0.0, 52.5, delta=0.1)
+
+    def test_dry_bulb_outside_engine_domain_is_signalled(self) -> None:
+        temp_dry_bulb, relative_humidity = (
+            self.converter.to_dry_bulb_and_relative_humidity(
+                [101325, 101325],
+                {"humidity_ratio": [0.01, 0.01], "enthalpy_per_humid_air": [1e6, 5e4]},
+            )
+        )
+        self.assertIsNone(temp_dry_bulb[0])
+        self.assertIsNone(relative_humidity[0])
+        self.assertAlmostEqual(temp_dry_bulb[1] or 0.0, 25.1, delta=0.5)
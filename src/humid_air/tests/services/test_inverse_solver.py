@@ -0,0 +1,104 @@
+import unittest
+
+from humid_air.domain.entities.solver_entity import SOLVER_TARGET_NAMES, SolverUnknown
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.inverse_solver import HylandWexlerInverseSolver
+
+
+class TestHylandWexlerInverseSolver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.solver = HylandWexlerInverseSolver()
+        self.engine = HylandWexlerHumidAirEngine()
+
+    def test_round_trip_for_every_target(self) -> None:
+        # états de référence à 25 °C et 50 %, puis recherche de l'entrée manquante
+        reference = self.engine.compute(
+            [101325], [25], [50], fields=SOLVER_TARGET_NAMES
+        ).properties
+        for name in SOLVER_TARGET_NAMES:
+            for unknown, fixed in (
+                (SolverUnknown.TEMP_DRY_BULB, 50),
+                (SolverUnknown.RELATIVE_HUMIDITY, 25),
+            ):
+                with self.subTest(target=name, unknown=unknown.value):
+                    target = reference[name][0]
+                    assert target is not None
+                    solution = self.solver.solve(
+                        pressure=[101325],
+                        fixed=[fixed],
+                        unknown=unknown,
+                        target_name=name,
+                        target=[target],
+                        lower=None,
+                        upper=None,
+                        tolerance=1e-6,
+                        max_iterations=100,
+                    )
+                    value = solution.values[0]
+                    assert value is not None
+                    self.assertTrue(solution.converged[0])
+                    temp_dry_bulb, relative_humidity = (
+                        (value, fixed)
+                        if unknown is SolverUnknown.TEMP_DRY_BULB
+                        else (fixed, value)
+                    )
+                    computed = self.engine.compute(
+                        [101325], [temp_dry_bulb], [relative_humidity], fields=(name,)
+                    )
+                    self.assertEqual(computed.properties[name], [target])
+
+    def test_supply_temperature_for_humidity_ratio(self) -> None:
+        solution = self.solver.solve(
+            pressure=[101325] * 3,
+            fixed=[55] * 3,
+            unknown=SolverUnknown.TEMP_DRY_BULB,
+            target_name="humidity_ratio",
+            target=[0.006, 0.008, 0.01],
+            lower=None,
+            upper=None,
+            tolerance=1e-8,
+            max_iterations=200,
+        )
+        self.assertEqual(solution.converged, [True] * 3)
+        computed = self.engine.compute(
+            [101325] * 3,
+            [value for value in solution.values if value is not None],
+            [55] * 3,
+            fields=("humidity_ratio",),
+        )
+        self.assertEqual(computed.properties["humidity_ratio"], [0.006, 0.008, 0.01])
+        for residual in solution.residuals:
+            assert residual is not None
+            self.assertLess(abs(residual), 1e-9)
+
+    def test_unreachable_target_is_reported(self) -> None:
+        solution = self.solver.solve(
+            pressure=[101325, 101325],
+            fixed=[20, 20],
+            unknown=SolverUnknown.RELATIVE_HUMIDITY,
+            target_name="temp_dew_point",
+            target=[10, 25],
+            lower=None,
+            upper=None,
+            tolerance=1e-6,
+            max_iterations=100,
+        )
+        self.assertIsNotNone(solution.values[0])
+        self.assertIsNone(solution.values[1])
+        self.assertEqual([error.index for error in solution.errors], [1])
+        self.assertEqual(solution.iterations[1], 0)
+
+    def test_search_bounds_restrict_the_solution(self) -> None:
+        solution = self.solver.solve(
+            pressure=[101325],
+            fixed=[50],
+            unknown=SolverUnknown.TEMP_DRY_BULB,
+            target_name="enthalpy_per_humid_air",
+            target=[50000],
+            lower=30,
+            upper=60,
+            tolerance=1e-6,
+            max_iterations=100,
+        )
+        self.assertIsNone(solution.values[0])
+        self.assertEqual(len(solution.errors), 1)
@@ -0,0 +1,173 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from humid_air.infra.services.coolprop_engine import CoolPropHumidAirEngine
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.lookup_table_engine import (
+    HumidAirLookupTable,
+    LookupTableHumidAirEngine,
+)
+
+AXES = (
+    np.linspace(90000, 110000, 5),
+    np.linspace(-10, 40, 51),
+    np.linspace(0, 100, 21),
+)
+
+
+class TestHumidAirLookupTable(unittest.TestCase):
+    source: HylandWexlerHumidAirEngine
+    table: HumidAirLookupTable
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.source = HylandWexlerHumidAirEngine()
+        cls.table = HumidAirLookupTable.build("hyland_wexler", cls.source, AXES)
+
+    def test_interpolation_within_declared_max_errors(self) -> None:
+        rng = np.random.default_rng(0)
+        pressure = rng.uniform(90000, 110000, 500)
+        temp_dry_bulb = rng.uniform(-10, 40, 500)
+        relative_humidity = rng.uniform(0, 100, 500)
+        interpolated = self.table.interpolate(
+            pressure, temp_dry_bulb, relative_humidity
+        )
+        expected = self.source.compute(
+            pressure.tolist(),
+            temp_dry_bulb.tolist(),
+            relative_humidity.tolist(),
+            rounded=False,
+        )
+        max_errors = self.table.errors(pressure, temp_dry_bulb, relative_humidity)
+        for name, max_error in max_errors.items():
+            with self.subTest(name=name):
+                reference = np.array(
+                    [
+                        np.nan if value is None else value
+                        for value in expected.properties[name]
+                    ],
+                    dtype=np.float64,
+                )
+                error = np.abs(interpolated[name] - reference)
+                finite = np.isfinite(error)
+                self.assertTrue(np.all(error[finite] <= max_error[finite] + 1e-9))
+
+    def test_max_errors_measured_against_reference_engine(self) -> None:
+        reference_engine = CoolPropHumidAirEngine()
+        table = HumidAirLookupTable.build(
+            "hyland_wexler", self.source, AXES, "coolprop", reference_engine
+        )
+        rng = np.random.default_rng(1)
+        pressure = np.append(rng.uniform(90000, 110000, 100), 101325)
+        temp_dry_bulb = np.append(rng.uniform(-10, 40, 100), 25)
+        relative_humidity = np.append(rng.uniform(0, 100, 100), 50)
+        interpolated = table.interpolate(pressure, temp_dry_bulb, relative_humidity)
+        expected = reference_engine.compute(
+            pressure.tolist(),
+            temp_dry_bulb.tolist(),
+            relative_humidity.tolist(),
+            rounded=False,
+        )
+        max_errors = table.errors(pressure, temp_dry_bulb, relative_humidity)
+        source_errors = self.table.errors(pressure, temp_dry_bulb, relative_humidity)
+        self.assertEqual(table.reference, "coolprop")
+        for name, max_error in max_errors.items():
+            with self.subTest(name=name):
+                finite = np.isfinite(max_error)
+                self.assertTrue(
+                    np.all(max_error[finite] >= source_errors[name][finite])
+                )
+                reference = np.array(
+                    [
+                        np.nan if value is None else value
+                        for value in expected.properties[name]
+                    ],
+                    dtype=np.float64,
+                )
+                error = np.abs(interpolated[name] - reference)
+                finite &= np.isfinite(error)
+                self.assertTrue(np.all(error[finite] <= max_error[finite]))
+
+    def test_errors_are_local_to_each_cell(self) -> None:
+        errors = self.table.errors(
+            np.array([101325.0, 101325.0]),
+            np.array([-9.0, 39.0]),
+            np.array([50.0, 50.0]),
+        )
+        # l'erreur d'une maille froide ne reprend pas celle des mailles chaudes
+        self.assertLess(errors["humidity_ratio"][0], errors["humidity_ratio"][1] / 2)
+
+    def test_interpolation_at_nodes_is_exact(self) -> None:
+        result = self.table.interpolate(
+            np.array([100000.0]), np.array([20.0]), np.array([50.0])
+        )
+        expected = self.source.compute([100000.0], [20.0], [50.0])
+        self.assertAlmostEqual(
+            float(result["humidity_ratio"][0]),
+            float(expected.properties["humidity_ratio"][0] or 0.0),
+            places=6,
+        )
+
+    def test_save_and_load_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.npz")
+            self.table.save(path)
+            loaded = HumidAirLookupTable.load(path)
+        self.assertTrue(loaded.matches("hyland_wexler", AXES))
+        self.assertFalse(loaded.matches("coolprop", AXES))
+        self.assertFalse(loaded.matches("hyland_wexler", AXES, "coolprop"))
+        self.assertEqual(loaded.cell_errors.keys(), self.table.cell_errors.keys())
+        for name, error in self.table.cell_errors.items():
+            np.testing.assert_array_equal(loaded.cell_errors[name], error)
+
+
+class TestLookupTableHumidAirEngine(unittest.TestCase):
+    engine: LookupTableHumidAirEngine
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.engine = LookupTableHumidAirEngine(
+            source_name="hyland_wexler", source_engine=HylandWexlerHumidAirEngine()
+        )
+
+    def test_compute_declares_max_errors(self) -> None:
+        result = self.engine.compute([101325.0], [20.0], [50.0])
+        self.assertEqual(result.errors, [])
+        self.assertIsNotNone(result.max_errors)
+        self.assertAlmostEqual(
+            result.properties["humidity_ratio"][0] or 0.0, 0.007262, delta=0.0002
+        )
+        self.assertIsNone(result.properties["thermal_conductivity"][0])
+
+    def test_compute_signals_states_outside_table(self) -> None:
+        result = self.engine.compute([101325.0, 101325.0], [20.0, 80.0], [50.0, 50.0])
+        self.assertEqual([error.index for error in result.errors], [1])
+        self.assertIsNone(result.properties["humidity_ratio"][1])
+        self.assertIsNotNone(result.properties["humidity_ratio"][0])
+
+    def test_compute_signals_states_not_interpolable(self) -> None:
+        # le point de rosée est indisponible aux nœuds à 0 % d'humidité relative
+        result = self.engine.compute(
+            [101325.0, 101325.0], [20.0, 20.0], [1.0, 50.0], fields=("temp_dew_point",)
+        )
+        self.assertEqual([error.index for error in result.errors], [0])
+        self.assertIsNone(result.properties["temp_dew_point"][0])
+        self.assertIsNotNone(result.properties["temp_dew_point"][1])
+
+    def test_table_is_reloaded_from_path(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.npz")
+            self.engine.table.save(path)
+            engine = LookupTableHumidAirEngine(
+                source_name="hyland_wexler",
+                source_engine=HylandWexlerHumidAirEngine(),
+                path=path,
+            )
+            engine.warm_up()
+        np.testing.assert_array_equal(
+            engine.table.cell_errors["humidity_ratio"],
+            self.engine.table.cell_errors["humidity_ratio"],
+        )
@@ -0,0 +1,37 @@
+import unittest
+
+from humid_air.infra.services.coolprop_engine import CoolPropHumidAirEngine
+from humid_air.infra.services.process_pool_engine import ProcessPoolHumidAirEngine
+
+
+class TestProcessPoolHumidAirEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = ProcessPoolHumidAirEngine(
+            CoolPropHumidAirEngine(), workers=2, chunk_size=3
+        )
+        self.addCleanup(self.engine.shutdown)
+
+    def test_shards_match_in_place_computation(self) -> None:
+        pressure = [101325.0] * 7
+        temp_dry_bulb = [0.0, 5.0, 10.0, 15.0, 300.0, 25.0, 30.0]
+        relative_humidity = [50.0, 50.0, 50.0, 50.0, 100.0, 50.0, 50.0]
+        fields = ("humidity_ratio", "enthalpy_per_humid_air")
+
+        result = self.engine.compute(
+            pressure, temp_dry_bulb, relative_humidity, fields=fields
+        )
+        expected = CoolPropHumidAirEngine().compute(
+            pressure, temp_dry_bulb, relative_humidity, fields=fields
+        )
+        self.assertEqual(result.properties, expected.properties)
+        self.assertEqual([error.index for error in result.errors], [4])
+        self.assertIsNotNone(self.engine._executor)
+
+    def test_warm_up_starts_every_process(self) -> None:
+        self.engine.warm_up()
+        self.assertEqual(len(self.engine.process_ids), 2)
+
+    def test_small_batches_are_computed_in_place(self) -> None:
+        result = self.engine.compute([101325.0], [20.0], [50.0])
+        self.assertEqual(result.properties["humidity_ratio"], [0.007294])
+        self.assertIsNone(self.engine._executor)
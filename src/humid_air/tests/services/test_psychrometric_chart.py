@@ -0,0 +1,79 @@
+import math
+import unittest
+
+from humid_air.domain.entities.psychrometric_chart_entity import (
+    PsychrometricChartLineKind,
+)
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.psychrometric_chart import (
+    HylandWexlerPsychrometricChart,
+)
+
+
+class TestHylandWexlerPsychrometricChart(unittest.TestCase):
+    def setUp(self) -> None:
+        self.chart = HylandWexlerPsychrometricChart().build(
+            pressure=101325,
+            temp_dry_bulb_min=-10,
+            temp_dry_bulb_max=50,
+            humidity_ratio_max=0.03,
+            resolution=20,
+        )
+
+    def test_every_family_is_drawn_inside_the_frame(self) -> None:
+        kinds = {line.kind for line in self.chart.lines}
+        self.assertEqual(kinds, set(PsychrometricChartLineKind))
+        for line in self.chart.lines:
+            with self.subTest(kind=line.kind, value=line.value):
+                self.assertEqual(len(line.temp_dry_bulb), 20)
+                self.assertGreaterEqual(min(line.temp_dry_bulb), -10)
+                self.assertLessEqual(max(line.temp_dry_bulb), 50)
+                self.assertGreaterEqual(min(line.humidity_ratio), 0)
+                self.assertLessEqual(max(line.humidity_ratio), 0.03)
+
+    def test_saturation_line_matches_engine(self) -> None:
+        saturation = next(
+            line
+            for line in self.chart.lines
+            if line.kind is PsychrometricChartLineKind.RELATIVE_HUMIDITY
+            and line.value == 100
+        )
+        size = len(saturation.temp_dry_bulb)
+        expected = HylandWexlerHumidAirEngine().compute(
+            [101325.0] * size, saturation.temp_dry_bulb, [100.0] * size
+        )
+        for actual, reference in zip(
+            saturation.humidity_ratio,
+            expected.properties["humidity_ratio"],
+            strict=True,
+        ):
+            self.assertAlmostEqual(actual, reference or 0.0, places=5)
+
+    def test_enthalpy_is_constant_along_enthalpy_lines(self) -> None:
+        for line in self.chart.lines:
+            if line.kind is not PsychrometricChartLineKind.ENTHALPY:
+                continue
+            for t, w in zip(line.temp_dry_bulb, line.humidity_ratio, strict=True):
+                enthalpy = 1000 * (1.006 * t + w * (2501 + 1.86 * t))
+                self.assertAlmostEqual(enthalpy, line.value, delta=5)
+
+    def test_points_beyond_boiling_are_dropped(self) -> None:
+        # pression de vapeur saturante supérieure à 10 Pa sur tout le cadre
+        chart = HylandWexlerPsychrometricChart().build(
+            pressure=10,
+            temp_dry_bulb_min=50,
+            temp_dry_bulb_max=100,
+            humidity_ratio_max=0.03,
+            resolution=20,
+        )
+        self.assertNotIn(
+            PsychrometricChartLineKind.RELATIVE_HUMIDITY,
+            {line.kind for line in chart.lines},
+        )
+        self.assertTrue(
+            all(
+                len(line.humidity_ratio) >= 2
+                and all(math.isfinite(value) for value in line.humidity_ratio)
+                for line in chart.lines
+            )
+        )
@@ -0,0 +1,46 @@
+import unittest
+
+from humid_air.infra.services.saturation_table import HylandWexlerSaturationTable
+
+
+class TestHylandWexlerSaturationTable(unittest.TestCase):
+    def setUp(self) -> None:
+        self.table = HylandWexlerSaturationTable().build(
+            pressure=101325,
+            temp_dry_bulb_min=-20,
+            temp_dry_bulb_max=100,
+            temp_dry_bulb_step=10,
+        )
+
+    def test_table_rows_cover_range(self) -> None:
+        self.assertEqual(self.table.temp_dry_bulb[0], -20)
+        self.assertEqual(self.table.temp_dry_bulb[-1], 100)
+        self.assertEqual(len(self.table.temp_dry_bulb), 13)
+        self.assertEqual(len(self.table.enthalpy), 13)
+
+    def _value(self, column: list[float | None], temp_dry_bulb: float) -> float:
+        value = column[self.table.temp_dry_bulb.index(temp_dry_bulb)]
+        assert value is not None
+        return value
+
+    def test_values_match_ashrae_table(self) -> None:
+        table = self.table
+        self.assertAlmostEqual(
+            self._value(table.saturation_pressure, 20), 2339.3, delta=1
+        )
+        # sans facteur d'amélioration, comme le moteur Hyland-Wexler
+        self.assertAlmostEqual(
+            self._value(table.humidity_ratio, 20), 0.014695, delta=2e-5
+        )
+        self.assertAlmostEqual(self._value(table.enthalpy, 20), 57420, delta=100)
+        self.assertAlmostEqual(
+            self._value(table.specific_volume, 20), 0.8503, delta=1e-3
+        )
+        self.assertAlmostEqual(
+            self._value(table.saturation_pressure, -20), 103.26, delta=0.1
+        )
+
+    def test_boiling_rows_have_no_saturated_state(self) -> None:
+        self.assertIsNone(self.table.humidity_ratio[-1])
+        self.assertIsNone(self.table.enthalpy[-1])
+        self.assertIsNotNone(self.table.humidity_ratio[-2])
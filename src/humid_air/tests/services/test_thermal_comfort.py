@@ -0,0 +1,64 @@
+import unittest
+
+from humid_air.infra.services.thermal_comfort import FangerThermalComfort
+
+
+class TestFangerThermalComfort(unittest.TestCase):
+    def setUp(self) -> None:
+        self.comfort = FangerThermalComfort()
+
+    def test_pmv_matches_iso_7730_table(self) -> None:
+        # ISO 7730:2005, tableau D.1, lignes 1 à 6
+        batch = self.comfort.evaluate(
+            temp_dry_bulb=[22, 27, 27, 23.5, 23.5, 19],
+            mean_radiant_temperature=[22, 27, 27, 25.5, 25.5, 19],
+            air_speed=[0.1, 0.1, 0.3, 0.1, 0.3, 0.1],
+            relative_humidity=[60, 60, 60, 60, 60, 40],
+            metabolic_rate=[1.2] * 6,
+            clothing=[0.5, 0.5, 0.5, 0.5, 0.5, 1.0],
+        )
+        expected_pmv = [-0.75, 0.77, 0.44, -0.01, -0.55, -0.60]
+        expected_ppd = [17, 17, 9, 5, 11, 13]
+        for pmv, ppd, pmv_ref, ppd_ref in zip(
+            batch.pmv, batch.ppd, expected_pmv, expected_ppd, strict=True
+        ):
+            assert pmv is not None and ppd is not None
+            self.assertAlmostEqual(pmv, pmv_ref, delta=0.02)
+            self.assertAlmostEqual(ppd, ppd_ref, delta=0.6)
+        self.assertIsNone(batch.adaptive_comfort_temperature)
+
+    def test_adaptive_model(self) -> None:
+        batch = self.comfort.evaluate(
+            temp_dry_bulb=[26, 26, 26],
+            mean_radiant_temperature=[26, 26, 26],
+            air_speed=[0.1] * 3,
+            relative_humidity=[50] * 3,
+            metabolic_rate=[1.1] * 3,
+            clothing=[0.5] * 3,
+            prevailing_mean_outdoor_temperature=[20, 5, 10],
+        )
+        self.assertEqual(batch.adaptive_comfort_temperature, [24.0, None, 20.9])
+        self.assertEqual(batch.adaptive_acceptable_80, [True, None, False])
+        self.assertEqual(batch.adaptive_acceptable_90, [True, None, False])
+
+    def test_comfort_zone_is_closed_polygon(self) -> None:
+        summer = self.comfort.comfort_zone(
+            pressure=101325,
+            clothing=0.5,
+            metabolic_rate=1.1,
+            air_speed=0.1,
+            humidity_ratio_max=0.012,
+        )
+        winter = self.comfort.comfort_zone(
+            pressure=101325,
+            clothing=1.0,
+            metabolic_rate=1.1,
+            air_speed=0.1,
+            humidity_ratio_max=0.012,
+        )
+        self.assertEqual(summer.temp_dry_bulb[0], summer.temp_dry_bulb[-1])
+        self.assertEqual(summer.humidity_ratio[0], summer.humidity_ratio[-1])
+        self.assertEqual(max(summer.humidity_ratio), 0.012)
+        self.assertLess(min(winter.temp_dry_bulb), min(summer.temp_dry_bulb))
+        self.assertAlmostEqual(min(summer.temp_dry_bulb), 23.4, delta=0.5)
+        self.assertAlmostEqual(max(summer.temp_dry_bulb), 28.1, delta=0.5)
@@ -0,0 +1,130 @@
+import unittest
+
+from humid_air.domain.entities.uncertainty_entity import (
+    HumidAirUncertaintyEntity,
+    UncertaintyMethod,
+)
+from humid_air.infra.services.coolprop_engine import CoolPropHumidAirEngine
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.uncertainty_propagation import (
+    NumpyUncertaintyPropagator,
+)
+
+
+class TestNumpyUncertaintyPropagator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.propagator = NumpyUncertaintyPropagator()
+        self.engine = HylandWexlerHumidAirEngine()
+
+    def propagate(
+        self, method: UncertaintyMethod, relative_humidity: float = 50
+    ) -> HumidAirUncertaintyEntity:
+        return self.propagator.propagate(
+            engine=self.engine,
+            pressure=[101325, 101325],
+            temp_dry_bulb=[20, 30],
+            relative_humidity=[relative_humidity, relative_humidity],
+            pressure_uncertainty=0,
+            temp_dry_bulb_uncertainty=0.2,
+            relative_humidity_uncertainty=2,
+            method=method,
+            samples=4000,
+            coverage=0.95,
+            seed=0,
+            fields=(
+                "temp_dry_bulb",
+                "relative_humidity",
+                "humidity_ratio",
+                "dynamic_viscosity",
+            ),
+        )
+
+    def test_finite_difference_propagates_input_uncertainties(self) -> None:
+        result = self.propagate(UncertaintyMethod.FINITE_DIFFERENCE)
+        self.assertEqual(
+            result.properties["temp_dry_bulb"].standard_deviation, [0.2] * 2
+        )
+        humidity_ratio = result.properties["humidity_ratio"]
+        self.assertEqual(humidity_ratio.mean, humidity_ratio.nominal)
+        for nominal, deviation, lower, upper in zip(
+            humidity_ratio.nominal,
+            humidity_ratio.standard_deviation,
+            humidity_ratio.lower,
+            humidity_ratio.upper,
+            strict=True,
+        ):
+            assert nominal is not None and deviation is not None
+            assert lower is not None and upper is not None
+            # W ≈ 0,622·φ·pws/p : l'humidité relative domine l'incertitude
+            self.assertAlmostEqual(deviation / nominal, 0.04, delta=0.003)
+            self.assertAlmostEqual(upper - nominal, 1.96 * deviation, delta=1e-6)
+            self.assertAlmostEqual(nominal - lower, 1.96 * deviation, delta=1e-6)
+
+    def test_monte_carlo_agrees_with_finite_difference(self) -> None:
+        linear = self.propagate(UncertaintyMethod.FINITE_DIFFERENCE)
+        sampled = self.propagate(UncertaintyMethod.MONTE_CARLO)
+        for linear_value, sampled_value in zip(
+            linear.properties["humidity_ratio"].standard_deviation,
+            sampled.properties["humidity_ratio"].standard_deviation,
+            strict=True,
+        ):
+            assert linear_value is not None and sampled_value is not None
+            self.assertAlmostEqual(sampled_value / linear_value, 1, delta=0.05)
+
+    def test_small_deviations_are_not_hidden_by_rounding(self) -> None:
+        # écarts types inférieurs à l'arrondi des propriétés (0,001)
+        temp_dry_bulb = [20.0, 21.0, 22.0, 23.0, 24.0, 25.0]
+        fields = ("density_per_unit_humid_air", "specific_volume_per_unit_humid_air")
+        for engine in (self.engine, CoolPropHumidAirEngine()):
+            linear, sampled = (
+                self.propagator.propagate(
+                    engine=engine,
+                    pressure=[101325] * len(temp_dry_bulb),
+                    temp_dry_bulb=temp_dry_bulb,
+                    relative_humidity=[50] * len(temp_dry_bulb),
+                    pressure_uncertainty=0,
+                    temp_dry_bulb_uncertainty=0.2,
+                    relative_humidity_uncertainty=2,
+                    method=method,
+                    samples=1000,
+                    coverage=0.95,
+                    seed=0,
+                    fields=fields,
+                )
+                for method in (
+                    UncertaintyMethod.FINITE_DIFFERENCE,
+                    UncertaintyMethod.MONTE_CARLO,
+                )
+            )
+            for name in fields:
+                linear_values = linear.properties[name].standard_deviation
+                sampled_values = sampled.properties[name].standard_deviation
+                with self.subTest(engine=type(engine).__name__, name=name):
+                    for linear_value, sampled_value in zip(
+                        linear_values, sampled_values, strict=True
+                    ):
+                        assert linear_value is not None and sampled_value is not None
+                        self.assertAlmostEqual(
+                            sampled_value / linear_value, 1, delta=0.1
+                        )
+                    # pente régulière, sans saut d'un demi-pas d'arrondi (0,0005)
+                    deviations = [value or 0.0 for value in linear_values]
+                    self.assertLess(max(deviations) - min(deviations), 1e-4)
+
+    def test_monte_carlo_is_reproducible_with_seed(self) -> None:
+        self.assertEqual(
+            self.propagate(UncertaintyMethod.MONTE_CARLO),
+            self.propagate(UncertaintyMethod.MONTE_CARLO),
+        )
+
+    def test_relative_humidity_draws_are_clipped_at_saturation(self) -> None:
+        result = self.propagate(UncertaintyMethod.MONTE_CARLO, relative_humidity=99)
+        relative_humidity = result.properties["relative_humidity"]
+        self.assertEqual(relative_humidity.upper, [100.0, 100.0])
+        for mean in relative_humidity.mean:
+            assert mean is not None
+            self.assertLess(mean, 99)
+
+    def test_unavailable_property_has_no_statistics(self) -> None:
+        result = self.propagate(UncertaintyMethod.FINITE_DIFFERENCE)
+        self.assertEqual(result.properties["dynamic_viscosity"].upper, [None, None])
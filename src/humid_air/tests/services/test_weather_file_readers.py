@@ -0,0 +1,94 @@
+import math
+import unittest
+
+from humid_air.infra.services.weather_file_readers import (
+    CsvWeatherFileReader,
+    EpwWeatherFileReader,
+)
+
+EPW_HEADER = [
+    "LOCATION,Paris Orly,-,FRA,IWEC Data,071490,48.72,2.38,1.0,96.0",
+    "DESIGN CONDITIONS,0",
+    "TYPICAL/EXTREME PERIODS,0",
+    "GROUND TEMPERATURES,0",
+    "HOLIDAYS/DAYLIGHT SAVINGS,No,0,0,0",
+    "COMMENTS 1,",
+    "COMMENTS 2,",
+    "DATA PERIODS,1,1,Data,Sunday, 1/ 1,12/31",
+]
+
+
+def epw_row(
+    hour: int, temp_dry_bulb: float, relative_humidity: float, pressure: float
+) -> str:
+    return (
+        f"1995,1,1,{hour},60,?9?9?9?9E0?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9*9*9?9?9?9,"
+        f"{temp_dry_bulb},2.0,{relative_humidity},{pressure},0,0,315,0,0,0,0,0,0,0,"
+        "250,2.6,10,10,11.0,77777,9,999999999,0,0.0,0,88,0.000,0.0,0.0"
+    )
+
+
+class TestEpwWeatherFileReader(unittest.TestCase):
+    def test_records_are_read_by_chunks(self) -> None:
+        lines = EPW_HEADER + [epw_row(hour, 5.0, 80, 101000) for hour in range(1, 6)]
+        chunks = list(EpwWeatherFileReader().read(lines, 101325, chunk_size=2))
+        self.assertEqual([chunk.start for chunk in chunks], [0, 2, 4])
+        self.assertEqual(chunks[0].labels["hour"], ["1", "2"])
+        self.assertEqual(chunks[0].inputs["temp_dry_bulb"], [5.0, 5.0])
+        self.assertEqual(chunks[2].pressure, [101000])
+
+    def test_missing_values_are_flagged(self) -> None:
+        lines = EPW_HEADER + [epw_row(1, 99.9, 999, 999999)]
+        (chunk,) = EpwWeatherFileReader().read(lines, 95000, chunk_size=10)
+        self.assertTrue(math.isnan(chunk.inputs["temp_dry_bulb"][0]))
+        self.assertTrue(math.isnan(chunk.inputs["relative_humidity"][0]))
+        self.assertEqual(chunk.pressure, [95000])
+        self.assertEqual(
+            [(error.field, error.message) for error in chunk.errors],
+            [
+                (
+                    "temp_dry_bulb",
+                    "Valeur manquante ou invalide dans la colonne temp_dry_bulb "
+                    "à la ligne 9",
+                ),
+                (
+                    "relative_humidity",
+                    "Valeur manquante ou invalide dans la colonne relative_humidity "
+                    "à la ligne 9",
+                ),
+            ],
+        )
+
+    def test_invalid_header_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            next(EpwWeatherFileReader().read(["year,month"], 101325, chunk_size=10))
+
+
+class TestCsvWeatherFileReader(unittest.TestCase):
+    def test_inputs_pressure_and_labels_are_split(self) -> None:
+        lines = [
+            "timestamp, temp_dry_bulb,temp_dew_point",
+            "2024-01-01T00:00,5.0,2.0",
+            "2024-01-01T01:00,n/a,2.5",
+        ]
+        (chunk,) = CsvWeatherFileReader().read(lines, 90000, chunk_size=10)
+        self.assertEqual(
+            chunk.labels, {"timestamp": ["2024-01-01T00:00", "2024-01-01T01:00"]}
+        )
+        self.assertEqual(list(chunk.inputs), ["temp_dry_bulb", "temp_dew_point"])
+        self.assertTrue(math.isnan(chunk.inputs["temp_dry_bulb"][1]))
+        self.assertEqual(chunk.pressure, [90000, 90000])
+        self.assertEqual(
+            [(error.index, error.field) for error in chunk.errors],
+            [(1, "temp_dry_bulb")],
+        )
+        self.assertIn("à la ligne 3", chunk.errors[0].message)
+
+    def test_missing_input_columns_raise(self) -> None:
+        for header in ("timestamp,wind_speed", "timestamp,temp_dry_bulb"):
+            with self.subTest(header=header), self.assertRaises(ValueError):
+                next(CsvWeatherFileReader().read([header], 101325, chunk_size=10))
+
+    def test_empty_file_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            next(CsvWeatherFileReader().read([], 101325, chunk_size=10))
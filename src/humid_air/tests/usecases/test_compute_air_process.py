@@ -0,0 +1,168 @@
+import unittest
+from typing import Any
+
+from pydantic import ValidationError
+
+from humid_air.app.schemas.compute_air_process_schema import ComputeAirProcessSchema
+from humid_air.app.usecases.compute_air_process import ComputeAirProcessUseCase
+from humid_air.domain.entities.air_process_entity import (
+    AirProcessEntity,
+    AirProcessKind,
+)
+from humid_air.domain.entities.humid_air_entity import HumidAirEngine
+from humid_air.domain.exceptions.humid_air_exceptions import HumidAirValidationException
+from humid_air.domain.services.humid_air_input_converter_interface import (
+    HumidAirInputConverterInterface,
+)
+from humid_air.infra.services.coolprop_engine import CoolPropHumidAirEngine
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.hyland_wexler_input_converter import (
+    HylandWexlerInputConverter,
+)
+
+
+class OutOfRangeInputConverter(HumidAirInputConverterInterface):
+    """Convertisseur renvoyant un état hors des bornes de HumidAirEntity"""
+
+    def to_dry_bulb_and_relative_humidity(
+        self, pressure: list[float], inputs: dict[str, list[float]]
+    ) -> tuple[list[float | None], list[float | None]]:
+        return [1000.0] * len(pressure), [50.0] * len(pressure)
+
+
+class TestComputeAirProcessUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        hyland_wexler_engine = HylandWexlerHumidAirEngine()
+        self.use_case = ComputeAirProcessUseCase(
+            engines={
+                HumidAirEngine.COOLPROP.value: CoolPropHumidAirEngine(),
+                HumidAirEngine.HYLAND_WEXLER.value: hyland_wexler_engine,
+            },
+            process_engine=hyland_wexler_engine,
+            converter=HylandWexlerInputConverter(),
+        )
+
+    def execute(
+        self, streams: list[dict[str, Any]], steps: list[dict[str, Any]]
+    ) -> AirProcessEntity:
+        return self.use_case.execute(
+            ComputeAirProcessSchema.model_validate(
+                {
+                    "pressure": 101325,
+                    "streams": streams,
+                    "steps": steps,
+                    "engine": HumidAirEngine.HYLAND_WEXLER,
+                    "fields": ("temp_dry_bulb", "relative_humidity", "humidity_ratio"),
+                }
+            )
+        )
+
+    def test_mixing_conserves_water_and_energy(self) -> None:
+        process = self.execute(
+            [
+                {"mass_flow_rate": 1, "temp_dry_bulb": 30, "relative_humidity": 50},
+                {"mass_flow_rate": 3, "temp_dry_bulb": 5, "relative_humidity": 80},
+            ],
+            [],
+        )
+        self.assertEqual(len(process.inlets), 2)
+        (mixing,) = process.steps
+        self.assertEqual(mixing.kind, AirProcessKind.MIXING)
+        self.assertEqual(mixing.mass_flow_rate, 4)
+        self.assertEqual(mixing.total_load, 0)
+        self.assertEqual(mixing.water_flow_rate, 0)
+        humidity_ratios = [inlet["humidity_ratio"] or 0 for inlet in process.inlets]
+        self.assertAlmostEqual(
+            mixing.outlet["humidity_ratio"] or 0,
+            (humidity_ratios[0] + 3 * humidity_ratios[1]) / 4,
+            delta=1e-4,
+        )
+        self.assertGreater(mixing.outlet["temp_dry_bulb"] or 0, 5)
+        self.assertLess(mixing.outlet["temp_dry_bulb"] or 0, 30)
+
+    def test_sensible_heating_has_no_latent_load(self) -> None:
+        process = self.execute(
+            [{"mass_flow_rate": 2, "temp_dry_bulb": 10, "relative_humidity": 60}],
+            [{"kind": "sensible", "temp_dry_bulb": 25}],
+        )
+        (heating,) = process.steps
+        self.assertEqual(heating.outlet["temp_dry_bulb"], 25)
+        self.assertEqual(heating.latent_load, 0)
+        self.assertEqual(heating.sensible_load, heating.total_load)
+        # environ 2 kg/s x 1.02 kJ/kg.K x 15 K
+        self.assertAlmostEqual(heating.total_load, 30600, delta=500)
+
+    def test_cooling_coil_condenses_water(self) -> None:
+        process = self.execute(
+            [{"mass_flow_rate": 1, "temp_dry_bulb": 28, "relative_humidity": 60}],
+            [{"kind": "coil", "apparatus_dew_point": 10, "bypass_factor": 0.1}],
+        )
+        (coil,) = process.steps
+        self.assertAlmostEqual(coil.outlet["temp_dry_bulb"] or 0, 11.8)
+        self.assertLess(coil.water_flow_rate, 0)
+        self.assertLess(coil.latent_load, 0)
+        self.assertLess(coil.sensible_load, 0)
+        self.assertAlmostEqual(
+            coil.total_load, coil.sensible_load + coil.latent_load, places=0
+        )
+
+    def test_dry_coil_keeps_humidity_ratio(self) -> None:
+        process = self.execute(
+            [{"mass_flow_rate": 1, "temp_dry_bulb": 28, "relative_humidity": 20}],
+            [{"kind": "coil", "apparatus_dew_point": 10, "bypass_factor": 0.2}],
+        )
+        (coil,) = process.steps
+        self.assertEqual(coil.water_flow_rate, 0)
+        self.assertEqual(coil.latent_load, 0)
+
+    def test_humidifications_reach_their_targets(self) -> None:
+        process = self.execute(
+            [{"mass_flow_rate": 1, "temp_dry_bulb": 22, "relative_humidity": 30}],
+            [
+                {"kind": "steam_humidification", "relative_humidity": 50},
+                {"kind": "adiabatic_humidification", "humidity_ratio": 0.010},
+            ],
+        )
+        steam, adiabatic = process.steps
+        self.assertAlmostEqual(steam.outlet["relative_humidity"] or 0, 50)
+        self.assertGreater(steam.water_flow_rate, 0)
+        # la vapeur n'apporte presque que de la chaleur latente
+        self.assertLess(abs(steam.sensible_load), 0.1 * steam.latent_load)
+        self.assertAlmostEqual(
+            adiabatic.outlet["humidity_ratio"] or 0, 0.010, delta=1e-4
+        )
+        self.assertEqual(adiabatic.total_load, 0)
+        self.assertLess(
+            adiabatic.outlet["temp_dry_bulb"] or 0, steam.outlet["temp_dry_bulb"] or 0
+        )
+
+    def test_sensible_cooling_below_dew_point_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self.execute(
+                [{"mass_flow_rate": 1, "temp_dry_bulb": 25, "relative_humidity": 80}],
+                [{"kind": "sensible", "temp_dry_bulb": 5}],
+            )
+
+    def test_humidification_cannot_dry_air(self) -> None:
+        with self.assertRaises(ValueError):
+            self.execute(
+                [{"mass_flow_rate": 1, "temp_dry_bulb": 25, "relative_humidity": 60}],
+                [{"kind": "steam_humidification", "relative_humidity": 40}],
+            )
+
+    def test_step_parameters_are_validated(self) -> None:
+        stream = {"mass_flow_rate": 1, "temp_dry_bulb": 25, "relative_humidity": 60}
+        for step in ({"kind": "coil", "apparatus_dew_point": 10}, {"kind": "mixing"}):
+            with self.subTest(step=step), self.assertRaises(ValidationError):
+                ComputeAirProcessSchema.model_validate(
+                    {"pressure": 101325, "streams": [stream], "steps": [step]}
+                )
+
+    def test_out_of_range_state_is_rejected(self) -> None:
+        self.use_case.converter = OutOfRangeInputConverter()
+        with self.assertRaises(HumidAirValidationException) as context:
+            self.execute(
+                [{"mass_flow_rate": 1, "temp_dry_bulb": 30, "relative_humidity": 50}],
+                [{"kind": AirProcessKind.SENSIBLE, "temp_dry_bulb": 40}],
+            )
+        self.assertEqual("temp_dry_bulb", context.exception.errors[0]["field"])
@@ -0,0 +1,67 @@
+import unittest
+
+from humid_air.app.schemas.compute_climate_analytics_schema import (
+    ComputeClimateAnalyticsSchema,
+)
+from humid_air.app.usecases.compute_climate_analytics import (
+    ComputeClimateAnalyticsUseCase,
+)
+from humid_air.app.usecases.get_ha_props_batch import GetHumidAirPropertiesBatchUseCase
+from humid_air.app.usecases.process_weather_file import ProcessWeatherFileUseCase
+from humid_air.domain.entities.humid_air_entity import HumidAirEngine
+from humid_air.domain.entities.weather_file_entity import WeatherFileFormat
+from humid_air.infra.services.climate_analytics import NumpyClimateAnalytics
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.hyland_wexler_input_converter import (
+    HylandWexlerInputConverter,
+)
+from humid_air.infra.services.weather_file_readers import CsvWeatherFileReader
+
+
+class TestComputeClimateAnalyticsUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.use_case = ComputeClimateAnalyticsUseCase(
+            weather_use_case=ProcessWeatherFileUseCase(
+                readers={WeatherFileFormat.CSV.value: CsvWeatherFileReader()},
+                batch_use_case=GetHumidAirPropertiesBatchUseCase(
+                    engines={
+                        HumidAirEngine.HYLAND_WEXLER.value: HylandWexlerHumidAirEngine()
+                    },
+                    converter=HylandWexlerInputConverter(),
+                ),
+                chunk_size=744,
+            ),
+            analytics=NumpyClimateAnalytics(),
+        )
+
+    def test_typical_year_is_aggregated(self) -> None:
+        lines = (
+            f"{hour},{-5 + 30 * (hour % 24) / 23:.2f},{40 + hour % 50}"
+            for hour in range(8760)
+        )
+        result = self.use_case.execute(
+            ComputeClimateAnalyticsSchema(
+                file_format=WeatherFileFormat.CSV, pressure=101325, bin_width=5
+            ),
+            ["hour,temp_dry_bulb,relative_humidity", *lines],
+        )
+        self.assertEqual(result.hours, 8760)
+        self.assertEqual(result.invalid_hours, 0)
+        self.assertEqual(result.bins[0].temp_dry_bulb_min, -5)
+        self.assertEqual(result.bins[-1].temp_dry_bulb_max, 30)
+        self.assertEqual(sum(b.hours for b in result.bins), 8760)
+        for climate_bin in result.bins:
+            self.assertLessEqual(
+                climate_bin.mean_coincident_wet_bulb, climate_bin.temp_dry_bulb_max
+            )
+        self.assertGreater(result.heating_degree_days, 0)
+        self.assertGreater(result.cooling_degree_days, 0)
+
+    def test_invalid_file_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self.use_case.execute(
+                ComputeClimateAnalyticsSchema(
+                    file_format=WeatherFileFormat.CSV, pressure=101325
+                ),
+                ["hour,temp_dry_bulb,pressure", "0,20,101325"],
+            )
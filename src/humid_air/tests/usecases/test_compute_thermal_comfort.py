@@ -0,0 +1,64 @@
+import unittest
+
+from pydantic import ValidationError
+
+from humid_air.app.schemas.compute_thermal_comfort_schema import (
+    ComputeThermalComfortSchema,
+)
+from humid_air.app.usecases.compute_thermal_comfort import (
+    ComputeThermalComfortUseCase,
+)
+from humid_air.infra.services.thermal_comfort import FangerThermalComfort
+
+
+class TestComputeThermalComfortUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.use_case = ComputeThermalComfortUseCase(comfort=FangerThermalComfort())
+
+    def test_scalar_conditions_are_broadcast(self) -> None:
+        schema = ComputeThermalComfortSchema.model_validate(
+            {
+                "temp_dry_bulb": [22, 24, 26],
+                "relative_humidity": [50, 50, 50],
+                "air_speed": 0.1,
+                "metabolic_rate": 1.2,
+                "clothing": 0.5,
+                "prevailing_mean_outdoor_temperature": 20,
+            }
+        )
+        self.assertEqual(schema.mean_radiant_temperature, [22, 24, 26])
+        batch = self.use_case.execute(schema)
+        self.assertEqual(len(batch.pmv), 3)
+        self.assertEqual(batch.operative_temperature, [22, 24, 26])
+        self.assertEqual(batch.adaptive_comfort_temperature, [24.0] * 3)
+        self.assertEqual(batch.errors, [])
+
+    def test_invalid_states_are_reported_individually(self) -> None:
+        schema = ComputeThermalComfortSchema.model_validate(
+            {
+                "temp_dry_bulb": [24, 35, 24],
+                "relative_humidity": [50, 50, 50],
+                "air_speed": [0.1, 0.1, 3],
+                "metabolic_rate": 1.2,
+                "clothing": 0.5,
+            }
+        )
+        batch = self.use_case.execute(schema)
+        self.assertIsNotNone(batch.pmv[0])
+        self.assertEqual(batch.pmv[1:], [None, None])
+        self.assertEqual(
+            [(error.index, error.field) for error in batch.errors],
+            [(1, "temp_dry_bulb"), (2, "air_speed")],
+        )
+
+    def test_columns_must_have_same_length(self) -> None:
+        with self.assertRaises(ValidationError):
+            ComputeThermalComfortSchema.model_validate(
+                {
+                    "temp_dry_bulb": [24, 25],
+                    "relative_humidity": [50],
+                    "air_speed": 0.1,
+                    "metabolic_rate": 1.2,
+                    "clothing": 0.5,
+                }
+            )
@@ -1,13 +1,20 @@
 import unittest
 
+from pydantic import ValidationError
+
 from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertySchema
 from humid_air.app.usecases.get_ha_props import GetHumidAirPropertyUseCase
 from humid_air.domain.exceptions.humid_air_exceptions import HumidAirValidationException
+from humid_air.infra.services.hyland_wexler_input_converter import (
+    HylandWexlerInputConverter,
+)
 
 
 class TestGetFullHAPropertyUseCase(unittest.TestCase):
     def setUp(self) -> None:
-        self.use_case = GetHumidAirPropertyUseCase()
+        self.use_case = GetHumidAirPropertyUseCase(
+            converter=HylandWexlerInputConverter()
+        )
 
     def test_get_full_ha_props_success(self) -> None:
         humid_air_schema = GetHumidAirPropertySchema(
@@ -30,3 +37,24 @@ class TestGetFullHAPropertyUseCase(unittest.TestCase):
         self.assertTrue(len(context.exception.errors) > 0)
         self.assertEqual(context.exception.errors[0]["field"], "temp_dry_bulb")
         self.assertEqual(context.exception.errors[1]["field"], "relative_humidity")
+
+    def test_get_full_ha_props_from_wet_bulb(self) -> None:
+        humid_air_schema = GetHumidAirPropertySchema(
+            pressure=101325, temp_dry_bulb=25, temp_wet_bulb=18
+        )
+        humid_air_entity = self.use_case.execute(humid_air_schema)
+        self.assertEqual(humid_air_entity.temp_dry_bulb, 25)
+        self.assertAlmostEqual(humid_air_entity.temp_wet_bulb, 18, delta=0.25)
+
+    def test_get_full_ha_props_with_impossible_inputs(self) -> None:
+        humid_air_schema = GetHumidAirPropertySchema(
+            pressure=101325, temp_dry_bulb=20, temp_dew_point=25
+        )
+        with self.assertRaises(ValueError):
+            self.use_case.execute(humid_air_schema)
+
+    def test_dependent_inputs_are_rejected(self) -> None:
+        with self.assertRaises(ValidationError):
+            GetHumidAirPropertySchema(
+                pressure=101325, temp_dew_point=10, humidity_ratio=0.007
+            )
@@ -0,0 +1,47 @@
+import unittest
+
+from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertySchema
+from humid_air.app.usecases.get_ha_props_approximate import (
+    GetApproximateHumidAirPropertyUseCase,
+)
+from humid_air.domain.exceptions.humid_air_exceptions import HumidAirValidationException
+from humid_air.infra.services.coolprop_engine import CoolPropHumidAirEngine
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.lookup_table_engine import LookupTableHumidAirEngine
+
+
+class TestGetApproximateHumidAirPropertyUseCase(unittest.TestCase):
+    use_case: GetApproximateHumidAirPropertyUseCase
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.use_case = GetApproximateHumidAirPropertyUseCase(
+            engine=LookupTableHumidAirEngine(
+                source_name="hyland_wexler",
+                source_engine=HylandWexlerHumidAirEngine(),
+            ),
+            fallback_engine=CoolPropHumidAirEngine(),
+        )
+
+    def test_state_inside_table_declares_max_errors(self) -> None:
+        schema = GetHumidAirPropertySchema(
+            pressure=101325, temp_dry_bulb=20, relative_humidity=50
+        )
+        result = self.use_case.execute(schema)
+        self.assertIsNotNone(result.max_errors)
+        self.assertIsNotNone(result.properties["humidity_ratio"][0])
+
+    def test_state_outside_table_falls_back_to_exact_engine(self) -> None:
+        schema = GetHumidAirPropertySchema(
+            pressure=101325, temp_dry_bulb=80, relative_humidity=50
+        )
+        result = self.use_case.execute(schema)
+        self.assertIsNone(result.max_errors)
+        self.assertIsNotNone(result.properties["thermal_conductivity"][0])
+
+    def test_invalid_state_raises_validation_error(self) -> None:
+        schema = GetHumidAirPropertySchema(
+            pressure=101325, temp_dry_bulb=360, relative_humidity=110
+        )
+        with self.assertRaises(HumidAirValidationException):
+            self.use_case.execute(schema)
@@ -0,0 +1,129 @@
+import unittest
+
+from pydantic import ValidationError
+
+from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertiesBatchSchema
+from humid_air.app.usecases.get_ha_props_batch import GetHumidAirPropertiesBatchUseCase
+from humid_air.domain.entities.humid_air_entity import HumidAirEngine
+from humid_air.infra.services.coolprop_engine import CoolPropHumidAirEngine
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.hyland_wexler_input_converter import (
+    HylandWexlerInputConverter,
+)
+
+
+class TestGetHumidAirPropertiesBatchUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.use_case = GetHumidAirPropertiesBatchUseCase(
+            engines={
+                HumidAirEngine.COOLPROP.value: CoolPropHumidAirEngine(),
+                HumidAirEngine.HYLAND_WEXLER.value: HylandWexlerHumidAirEngine(),
+            },
+            converter=HylandWexlerInputConverter(),
+        )
+
+    def test_get_ha_props_batch_success(self) -> None:
+        schema = GetHumidAirPropertiesBatchSchema(
+            pressure=[101325, 101325],
+            temp_dry_bulb=[20, 25],
+            relative_humidity=[50, 50],
+        )
+        batch = self.use_case.execute(schema)
+        self.assertEqual(batch.errors, [])
+        self.assertEqual(batch.properties["temp_dry_bulb"], [20, 25])
+        self.assertEqual(batch.properties["humidity_ratio"][0], 0.007294)
+
+    def test_get_ha_props_batch_with_selected_fields(self) -> None:
+        schema = GetHumidAirPropertiesBatchSchema(
+            pressure=[101325, 101325],
+            temp_dry_bulb=[20, 360],
+            relative_humidity=[50, 50],
+            fields=("humidity_ratio", "humidity_ratio"),
+        )
+        batch = self.use_case.execute(schema)
+        self.assertEqual(batch.properties, {"humidity_ratio": [0.007294, None]})
+        self.assertEqual([error.index for error in batch.errors], [1])
+
+    def test_get_ha_props_batch_from_dew_point(self) -> None:
+        schema = GetHumidAirPropertiesBatchSchema(
+            pressure=[101325, 101325],
+            temp_dry_bulb=[20, 20],
+            temp_dew_point=[10, 25],
+        )
+        batch = self.use_case.execute(schema)
+        self.assertEqual([error.index for error in batch.errors], [1])
+        self.assertAlmostEqual(
+            batch.properties["temp_dew_point"][0] or 0.0, 10, delta=0.05
+        )
+        self.assertIsNone(batch.properties["temp_dew_point"][1])
+
+    def test_get_ha_props_batch_reports_errors_per_item(self) -> None:
+        schema = GetHumidAirPropertiesBatchSchema(
+            pressure=[101325, 101325, 101325],
+            temp_dry_bulb=[20, 360, 25],
+            relative_humidity=[50, 50, 50],
+        )
+        batch = self.use_case.execute(schema)
+        self.assertEqual(len(batch.errors), 1)
+        self.assertEqual(batch.errors[0].index, 1)
+        self.assertEqual(batch.errors[0].field, "temp_dry_bulb")
+        self.assertIsNone(batch.properties["humidity_ratio"][1])
+        self.assertIsNotNone(batch.properties["humidity_ratio"][2])
+
+    def test_get_ha_props_batch_keeps_valid_inputs_of_errored_states(self) -> None:
+        schema = GetHumidAirPropertiesBatchSchema(
+            pressure=[95000, 101325],
+            temp_dry_bulb=[360, 300],
+            relative_humidity=[50, 100],
+            fields=("pressure", "temp_dry_bulb", "relative_humidity", "humidity_ratio"),
+        )
+        batch = self.use_case.execute(schema)
+        self.assertEqual([error.index for error in batch.errors], [0, 1])
+        self.assertEqual(batch.properties["pressure"], [95000, 101325])
+        self.assertEqual(batch.properties["temp_dry_bulb"], [None, 300])
+        self.assertEqual(batch.properties["relative_humidity"], [50, 100])
+
+    def test_get_ha_props_batch_rounds_converted_inputs(self) -> None:
+        schema = GetHumidAirPropertiesBatchSchema(
+            pressure=[101325],
+            temp_dry_bulb=[20],
+            temp_dew_point=[10.003],
+            fields=("relative_humidity",),
+        )
+        batch = self.use_case.execute(schema)
+        relative_humidity = batch.properties["relative_humidity"][0]
+        self.assertEqual(relative_humidity, round(relative_humidity or 0.0, 2))
+
+    def test_get_ha_props_batch_reports_coolprop_errors_per_item(self) -> None:
+        schema = GetHumidAirPropertiesBatchSchema(
+            pressure=[101325, 101325],
+            temp_dry_bulb=[300, 25],
+            relative_humidity=[100, 50],
+        )
+        batch = self.use_case.execute(schema)
+        self.assertEqual(len(batch.errors), 1)
+        self.assertEqual(batch.errors[0].index, 0)
+        self.assertEqual(batch.errors[0].field, "state")
+        self.assertIsNotNone(batch.properties["humidity_ratio"][1])
+
+    def test_get_ha_props_batch_with_hyland_wexler_engine(self) -> None:
+        schema = GetHumidAirPropertiesBatchSchema(
+            pressure=[101325, 101325, 101325],
+            temp_dry_bulb=[20, 360, 250],
+            relative_humidity=[50, 50, 50],
+            engine=HumidAirEngine.HYLAND_WEXLER,
+        )
+        batch = self.use_case.execute(schema)
+        self.assertEqual([error.index for error in batch.errors], [1, 2])
+        self.assertEqual(batch.errors[0].field, "temp_dry_bulb")
+        self.assertEqual(batch.errors[1].field, "state")
+        self.assertEqual(batch.properties["humidity_ratio"][0], 0.007262)
+        self.assertIsNone(batch.properties["thermal_conductivity"][0])
+
+    def test_get_ha_props_batch_with_different_lengths_raises(self) -> None:
+        with self.assertRaises(ValidationError):
+            GetHumidAirPropertiesBatchSchema(
+                pressure=[101325],
+                temp_dry_bulb=[20, 25],
+                relative_humidity=[50, 50],
+            )
@@ -0,0 +1,88 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertySchema
+from humid_air.app.usecases.get_ha_props_cache_statistics import (
+    GetHumidAirCacheStatisticsUseCase,
+)
+from humid_air.app.usecases.get_ha_props_cached import (
+    CachedGetHumidAirPropertyUseCase,
+    HumidAirCacheKey,
+)
+from humid_air.domain.entities.humid_air_entity import (
+    HumidAirEntity,
+    HumidAirOutputs,
+)
+from humid_air.domain.exceptions.humid_air_exceptions import HumidAirValidationException
+from utils.lru_cache import LRUCache
+
+
+class TestCachedGetHumidAirPropertyUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache: LRUCache[HumidAirCacheKey, HumidAirOutputs] = LRUCache(max_size=8)
+        self.use_case = CachedGetHumidAirPropertyUseCase(cache=self.cache, decimals=1)
+
+    def test_close_inputs_share_the_same_state(self) -> None:
+        first = self.use_case.execute(
+            GetHumidAirPropertySchema(
+                pressure=101325, temp_dry_bulb=25.01, relative_humidity=50
+            )
+        )
+        second = self.use_case.execute(
+            GetHumidAirPropertySchema(
+                pressure=101325, temp_dry_bulb=24.98, relative_humidity=50
+            )
+        )
+        self.assertEqual(first.temp_dry_bulb, 25.01)
+        self.assertEqual(second.temp_dry_bulb, 24.98)
+        self.assertEqual(
+            first.get_properties(),
+            {
+                **second.get_properties(),
+                "temp_dry_bulb": 25.01,
+            },
+        )
+        statistics = GetHumidAirCacheStatisticsUseCase(cache=self.cache).execute()
+        self.assertEqual(statistics.hits, 1)
+        self.assertEqual(statistics.misses, 1)
+
+    def test_invalid_inputs_are_not_cached(self) -> None:
+        schema = GetHumidAirPropertySchema(
+            pressure=101325, temp_dry_bulb=360, relative_humidity=50
+        )
+        with self.assertRaises(HumidAirValidationException):
+            self.use_case.execute(schema)
+        self.assertEqual(self.cache.statistics.size, 0)
+
+    def test_cache_miss_keeps_requested_inputs(self) -> None:
+        state = self.use_case.execute(
+            GetHumidAirPropertySchema(
+                pressure=101325.04, temp_dry_bulb=25.0, relative_humidity=50.004
+            )
+        )
+        self.assertEqual(state.pressure, 101325.04)
+        self.assertEqual(state.relative_humidity, 50.004)
+        expected = HumidAirEntity(
+            pressure=101325.04, temp_dry_bulb=25.0, relative_humidity=50.004
+        )
+        self.assertEqual(state.humidity_ratio, expected.humidity_ratio)
+
+    def test_cached_outputs_are_resolved_and_read_only(self) -> None:
+        schema = GetHumidAirPropertySchema(
+            pressure=101325, temp_dry_bulb=25, relative_humidity=50
+        )
+        self.use_case.execute(schema)
+        outputs = self.cache.get((101325, 25, 50))
+        self.assertIsInstance(outputs, HumidAirOutputs)
+        with self.assertRaises(AttributeError):
+            outputs.humidity = 0.0  # type: ignore[union-attr]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            states = list(executor.map(self.use_case.execute, [schema] * 16))
+        self.assertEqual(
+            {state.enthalpy_per_humid_air for state in states},
+            {
+                HumidAirEntity(
+                    pressure=101325, temp_dry_bulb=25, relative_humidity=50
+                ).enthalpy_per_humid_air
+            },
+        )
@@ -0,0 +1,54 @@
+import unittest
+
+from pydantic import ValidationError
+
+from humid_air.app.schemas.get_psychrometric_chart_schema import (
+    GetPsychrometricChartSchema,
+)
+from humid_air.app.usecases.get_psychrometric_chart import (
+    GetPsychrometricChartUseCase,
+    PsychrometricChartCacheKey,
+)
+from humid_air.domain.entities.psychrometric_chart_entity import (
+    PsychrometricChartEntity,
+)
+from humid_air.infra.services.psychrometric_chart import (
+    HylandWexlerPsychrometricChart,
+)
+from utils.lru_cache import LRUCache
+
+
+class TestGetPsychrometricChartUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache: LRUCache[PsychrometricChartCacheKey, PsychrometricChartEntity] = (
+            LRUCache(max_size=4)
+        )
+        self.use_case = GetPsychrometricChartUseCase(
+            chart=HylandWexlerPsychrometricChart(), cache=self.cache
+        )
+        self.schema = GetPsychrometricChartSchema(
+            pressure=101325,
+            temp_dry_bulb_min=-10,
+            temp_dry_bulb_max=50,
+            humidity_ratio_max=0.03,
+            resolution=20,
+        )
+
+    def test_chart_is_cached_per_parameters(self) -> None:
+        first = self.use_case.execute(self.schema)
+        second = self.use_case.execute(self.schema)
+        self.assertIs(first, second)
+        self.use_case.execute(self.schema.model_copy(update={"resolution": 30}))
+        statistics = self.cache.statistics
+        self.assertEqual(statistics.hits, 1)
+        self.assertEqual(statistics.size, 2)
+
+    def test_invalid_temperature_range_raises_error(self) -> None:
+        with self.assertRaises(ValidationError):
+            GetPsychrometricChartSchema(
+                pressure=101325,
+                temp_dry_bulb_min=50,
+                temp_dry_bulb_max=-10,
+                humidity_ratio_max=0.03,
+                resolution=20,
+            )
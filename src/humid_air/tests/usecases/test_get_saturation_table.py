@@ -0,0 +1,48 @@
+import unittest
+
+from pydantic import ValidationError
+
+from humid_air.app.schemas.get_saturation_table_schema import (
+    GetSaturationTableSchema,
+)
+from humid_air.app.usecases.get_saturation_table import (
+    GetSaturationTableUseCase,
+    SaturationTableCacheKey,
+)
+from humid_air.domain.entities.saturation_table_entity import SaturationTableEntity
+from humid_air.infra.services.saturation_table import HylandWexlerSaturationTable
+from utils.lru_cache import LRUCache
+
+
+class TestGetSaturationTableUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache: LRUCache[SaturationTableCacheKey, SaturationTableEntity] = LRUCache(
+            max_size=4
+        )
+        self.use_case = GetSaturationTableUseCase(
+            table=HylandWexlerSaturationTable(), cache=self.cache
+        )
+        self.schema = GetSaturationTableSchema(
+            pressure=101325,
+            temp_dry_bulb_min=0,
+            temp_dry_bulb_max=40,
+            temp_dry_bulb_step=1,
+        )
+
+    def test_table_is_cached_per_parameters(self) -> None:
+        first = self.use_case.execute(self.schema)
+        second = self.use_case.execute(self.schema)
+        self.assertIs(first, second)
+        self.use_case.execute(self.schema.model_copy(update={"pressure": 90000}))
+        statistics = self.cache.statistics
+        self.assertEqual(statistics.hits, 1)
+        self.assertEqual(statistics.size, 2)
+
+    def test_too_many_rows_raises_error(self) -> None:
+        with self.assertRaises(ValidationError):
+            GetSaturationTableSchema(
+                pressure=101325,
+                temp_dry_bulb_min=-100,
+                temp_dry_bulb_max=200,
+                temp_dry_bulb_step=0.01,
+            )
@@ -0,0 +1,82 @@
+import unittest
+
+from humid_air.app.schemas.process_weather_file_schema import ProcessWeatherFileSchema
+from humid_air.app.usecases.get_ha_props_batch import GetHumidAirPropertiesBatchUseCase
+from humid_air.app.usecases.process_weather_file import ProcessWeatherFileUseCase
+from humid_air.domain.entities.humid_air_entity import HumidAirEngine
+from humid_air.domain.entities.weather_file_entity import WeatherFileFormat
+from humid_air.infra.services.coolprop_engine import CoolPropHumidAirEngine
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.hyland_wexler_input_converter import (
+    HylandWexlerInputConverter,
+)
+from humid_air.infra.services.weather_file_readers import (
+    CsvWeatherFileReader,
+    EpwWeatherFileReader,
+)
+
+
+class TestProcessWeatherFileUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.use_case = ProcessWeatherFileUseCase(
+            readers={
+                WeatherFileFormat.EPW.value: EpwWeatherFileReader(),
+                WeatherFileFormat.CSV.value: CsvWeatherFileReader(),
+            },
+            batch_use_case=GetHumidAirPropertiesBatchUseCase(
+                engines={
+                    HumidAirEngine.COOLPROP.value: CoolPropHumidAirEngine(),
+                    HumidAirEngine.HYLAND_WEXLER.value: HylandWexlerHumidAirEngine(),
+                },
+                converter=HylandWexlerInputConverter(),
+            ),
+            chunk_size=1000,
+        )
+
+    def test_typical_year_is_processed_by_chunks(self) -> None:
+        lines = (
+            f"{hour},{-5 + 30 * (hour % 24) / 23:.2f},{40 + hour % 50}"
+            for hour in range(8760)
+        )
+        chunks = self.use_case.execute(
+            ProcessWeatherFileSchema(
+                file_format=WeatherFileFormat.CSV,
+                pressure=101325,
+                fields=("humidity_ratio", "enthalpy_per_humid_air"),
+            ),
+            ["hour,temp_dry_bulb,relative_humidity", *lines],
+        )
+        sizes = []
+        for chunk in chunks:
+            self.assertEqual(chunk.batch.errors, [])
+            self.assertEqual(
+                list(chunk.batch.properties),
+                ["humidity_ratio", "enthalpy_per_humid_air"],
+            )
+            sizes.append(len(chunk.labels["hour"]))
+        self.assertEqual(sizes, [1000] * 8 + [760])
+
+    def test_invalid_records_are_reported_per_row(self) -> None:
+        (chunk,) = self.use_case.execute(
+            ProcessWeatherFileSchema(
+                file_format=WeatherFileFormat.CSV, pressure=101325
+            ),
+            ["temp_dry_bulb,relative_humidity", "20,50", ",50", "20,50"],
+        )
+        self.assertEqual([error.index for error in chunk.batch.errors], [1])
+        self.assertEqual(
+            chunk.batch.errors[0].message,
+            "Valeur manquante ou invalide dans la colonne temp_dry_bulb à la ligne 3",
+        )
+        self.assertIsNone(chunk.batch.properties["humidity_ratio"][1])
+        self.assertIsNotNone(chunk.batch.properties["humidity_ratio"][2])
+
+    def test_unsupported_input_columns_raise_on_first_chunk(self) -> None:
+        chunks = self.use_case.execute(
+            ProcessWeatherFileSchema(
+                file_format=WeatherFileFormat.CSV, pressure=101325
+            ),
+            ["temp_dry_bulb,wind_speed", "20,3"],
+        )
+        with self.assertRaises(ValueError):
+            next(chunks)
@@ -0,0 +1,46 @@
+import unittest
+
+from pydantic import ValidationError
+
+from humid_air.app.schemas.propagate_uncertainty_schema import (
+    PropagateUncertaintySchema,
+)
+from humid_air.app.usecases.propagate_uncertainty import PropagateUncertaintyUseCase
+from humid_air.domain.entities.humid_air_entity import HumidAirEngine
+from humid_air.domain.entities.uncertainty_entity import UncertaintyMethod
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.uncertainty_propagation import (
+    NumpyUncertaintyPropagator,
+)
+
+
+class TestPropagateUncertaintyUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.use_case = PropagateUncertaintyUseCase(
+            engines={HumidAirEngine.HYLAND_WEXLER.value: HylandWexlerHumidAirEngine()},
+            propagator=NumpyUncertaintyPropagator(),
+        )
+
+    def test_invalid_states_are_reported_and_skipped(self) -> None:
+        schema = PropagateUncertaintySchema(
+            pressure=[101325] * 3,
+            temp_dry_bulb=[20, 400, 25],
+            relative_humidity=[50, 50, 60],
+            fields=("humidity_ratio",),
+        )
+        result = self.use_case.execute(schema)
+        humidity_ratio = result.properties["humidity_ratio"]
+        self.assertIsNone(humidity_ratio.nominal[1])
+        self.assertIsNotNone(humidity_ratio.standard_deviation[2])
+        self.assertEqual([error.index for error in result.errors], [1])
+        self.assertEqual(result.errors[0].field, "temp_dry_bulb")
+
+    def test_monte_carlo_evaluations_are_bounded(self) -> None:
+        with self.assertRaises(ValidationError):
+            PropagateUncertaintySchema(
+                pressure=[101325] * 1000,
+                temp_dry_bulb=[20] * 1000,
+                relative_humidity=[50] * 1000,
+                method=UncertaintyMethod.MONTE_CARLO,
+                samples=1000,
+            )
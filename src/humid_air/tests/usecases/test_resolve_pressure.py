@@ -0,0 +1,73 @@
+import unittest
+from uuid import UUID, uuid4
+
+from humid_air.app.schemas.resolve_pressure_schema import ResolvePressureSchema
+from humid_air.app.usecases.resolve_pressure import (
+    ResolvePressureUseCase,
+    standard_atmosphere_pressure,
+)
+from humid_air.domain.services.site_pressure_provider_interface import (
+    SitePressureProviderInterface,
+)
+
+
+class FakeSitePressureProvider(SitePressureProviderInterface):
+    def __init__(self, site_pressures: dict[UUID, float | None], member_id: UUID):
+        self.site_pressures = site_pressures
+        self.member_id = member_id
+        self.calls = 0
+
+    def get_site_pressure(self, project_id: UUID, user_id: UUID) -> float | None:
+        self.calls += 1
+        if project_id not in self.site_pressures or user_id != self.member_id:
+            raise ValueError("Projet introuvable")
+        return self.site_pressures[project_id]
+
+
+class TestResolvePressureUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.project_id = uuid4()
+        self.project_without_site_id = uuid4()
+        self.user_id = uuid4()
+        self.provider = FakeSitePressureProvider(
+            {self.project_id: 84000, self.project_without_site_id: None}, self.user_id
+        )
+        self.use_case = ResolvePressureUseCase(site_pressure_provider=self.provider)
+
+    def test_standard_atmosphere_pressure(self) -> None:
+        # ASHRAE Fundamentals (2017) chapitre 1, tableau 1
+        self.assertAlmostEqual(standard_atmosphere_pressure(0), 101325)
+        self.assertAlmostEqual(standard_atmosphere_pressure(1000), 89875, delta=5)
+        self.assertAlmostEqual(standard_atmosphere_pressure(-500), 107478, delta=5)
+
+    def test_explicit_pressure_takes_precedence(self) -> None:
+        schema = ResolvePressureSchema(
+            pressure=95000, altitude=1000, project_id=self.project_id
+        )
+        self.assertEqual(self.use_case.execute(schema), 95000)
+        self.assertEqual(self.provider.calls, 0)
+
+    def test_altitude_takes_precedence_over_project(self) -> None:
+        schema = ResolvePressureSchema(altitude=1000, project_id=self.project_id)
+        self.assertAlmostEqual(self.use_case.execute(schema), 89875, delta=5)
+        self.assertEqual(self.provider.calls, 0)
+
+    def test_project_site_pressure(self) -> None:
+        schema = ResolvePressureSchema(project_id=self.project_id, user_id=self.user_id)
+        self.assertEqual(self.use_case.execute(schema), 84000)
+
+    def test_project_requires_authenticated_user(self) -> None:
+        with self.assertRaises(ValueError):
+            self.use_case.execute(ResolvePressureSchema(project_id=self.project_id))
+        self.assertEqual(self.provider.calls, 0)
+
+    def test_project_without_site_pressure(self) -> None:
+        with self.assertRaises(ValueError):
+            self.use_case.execute(
+                ResolvePressureSchema(
+                    project_id=self.project_without_site_id, user_id=self.user_id
+                )
+            )
+
+    def test_sea_level_by_default(self) -> None:
+        self.assertEqual(self.use_case.execute(ResolvePressureSchema()), 101325)
@@ -0,0 +1,79 @@
+import unittest
+
+from pydantic import ValidationError
+
+from humid_air.app.schemas.solve_humid_air_schema import SolveHumidAirSchema
+from humid_air.app.usecases.solve_humid_air import SolveHumidAirUseCase
+from humid_air.domain.entities.solver_entity import SolverUnknown
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.inverse_solver import HylandWexlerInverseSolver
+
+
+class TestSolveHumidAirUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.use_case = SolveHumidAirUseCase(
+            solver=HylandWexlerInverseSolver(), engine=HylandWexlerHumidAirEngine()
+        )
+
+    def test_coil_leaving_state_for_target_enthalpy(self) -> None:
+        schema = SolveHumidAirSchema.model_validate(
+            {
+                "pressure": 101325,
+                "relative_humidity": 95,
+                "target": "enthalpy_per_humid_air",
+                "target_values": [30000, 35000],
+                "fields": ["temp_dry_bulb", "enthalpy_per_humid_air"],
+            }
+        )
+        solution = self.use_case.execute(schema)
+        self.assertIs(solution.unknown, SolverUnknown.TEMP_DRY_BULB)
+        self.assertEqual(
+            solution.properties["enthalpy_per_humid_air"], [30000.0, 35000.0]
+        )
+        self.assertEqual(solution.statistics.converged, 2)
+        self.assertGreater(solution.statistics.mean_iterations, 0)
+
+    def test_invalid_fixed_inputs_are_reported_and_skipped(self) -> None:
+        schema = SolveHumidAirSchema.model_validate(
+            {
+                "pressure": 101325,
+                "temp_dry_bulb": [25, 400, 25],
+                "target": "humidity_ratio",
+                "target_values": [0.01, 0.01, 0.5],
+                "fields": ["relative_humidity"],
+            }
+        )
+        solution = self.use_case.execute(schema)
+        relative_humidity = solution.properties["relative_humidity"]
+        assert relative_humidity[0] is not None
+        self.assertAlmostEqual(relative_humidity[0], 50.5, delta=0.5)
+        self.assertEqual(relative_humidity[1:], [None, None])
+        self.assertEqual(
+            [(error.index, error.field) for error in solution.errors],
+            [(1, "temp_dry_bulb"), (2, "target")],
+        )
+        self.assertEqual(solution.statistics.states, 3)
+        self.assertEqual(solution.statistics.converged, 1)
+
+    def test_exactly_one_fixed_input_is_required(self) -> None:
+        with self.assertRaises(ValidationError):
+            SolveHumidAirSchema.model_validate(
+                {
+                    "pressure": 101325,
+                    "temp_dry_bulb": 25,
+                    "relative_humidity": 50,
+                    "target": "humidity_ratio",
+                    "target_values": [0.01],
+                }
+            )
+
+    def test_unsupported_target_is_rejected(self) -> None:
+        with self.assertRaises(ValidationError):
+            SolveHumidAirSchema.model_validate(
+                {
+                    "pressure": 101325,
+                    "temp_dry_bulb": 25,
+                    "target": "dynamic_viscosity",
+                    "target_values": [1e-5],
+                }
+            )
@@ -0,0 +1,46 @@
+import unittest
+
+from humid_air.app.schemas.get_ha_props_schema import GetHumidAirPropertiesBatchSchema
+from humid_air.app.usecases.get_ha_props_batch import GetHumidAirPropertiesBatchUseCase
+from humid_air.app.usecases.stream_ha_props_batch import (
+    StreamHumidAirPropertiesBatchUseCase,
+)
+from humid_air.domain.entities.humid_air_entity import HumidAirEngine
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.hyland_wexler_input_converter import (
+    HylandWexlerInputConverter,
+)
+
+
+class TestStreamHumidAirPropertiesBatchUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.batch_use_case = GetHumidAirPropertiesBatchUseCase(
+            engines={HumidAirEngine.HYLAND_WEXLER.value: HylandWexlerHumidAirEngine()},
+            converter=HylandWexlerInputConverter(),
+        )
+        self.use_case = StreamHumidAirPropertiesBatchUseCase(
+            batch_use_case=self.batch_use_case, chunk_size=2
+        )
+        self.schema = GetHumidAirPropertiesBatchSchema(
+            pressure=[101325] * 5,
+            temp_dry_bulb=[10, 20, 30, 400, 15],
+            temp_dew_point=[5, 10, 15, 5, 10],
+            engine=HumidAirEngine.HYLAND_WEXLER,
+            fields=("humidity_ratio",),
+        )
+
+    def test_chunks_match_single_batch(self) -> None:
+        chunks = list(self.use_case.execute(self.schema))
+        self.assertEqual([chunk.start for chunk in chunks], [0, 2, 4])
+        streamed = [
+            value
+            for chunk in chunks
+            for value in chunk.batch.properties["humidity_ratio"]
+        ]
+        batch = self.batch_use_case.execute(self.schema)
+        self.assertEqual(streamed, batch.properties["humidity_ratio"])
+
+    def test_errors_are_indexed_within_chunk(self) -> None:
+        chunks = list(self.use_case.execute(self.schema))
+        self.assertEqual([error.index for error in chunks[1].batch.errors], [1])
+        self.assertEqual(chunks[0].batch.errors, [])
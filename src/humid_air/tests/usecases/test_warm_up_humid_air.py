@@ -0,0 +1,74 @@
+import unittest
+
+from humid_air.app.usecases.get_ha_props import GetHumidAirPropertyUseCase
+from humid_air.app.usecases.get_psychrometric_chart import (
+    GetPsychrometricChartUseCase,
+    PsychrometricChartCacheKey,
+)
+from humid_air.app.usecases.get_saturation_table import (
+    GetSaturationTableUseCase,
+    SaturationTableCacheKey,
+)
+from humid_air.app.usecases.warm_up_humid_air import WarmUpHumidAirUseCase
+from humid_air.domain.entities.psychrometric_chart_entity import (
+    PsychrometricChartEntity,
+)
+from humid_air.domain.entities.saturation_table_entity import SaturationTableEntity
+from humid_air.infra.services.coolprop_engine import CoolPropHumidAirEngine
+from humid_air.infra.services.hyland_wexler_engine import HylandWexlerHumidAirEngine
+from humid_air.infra.services.process_pool_engine import ProcessPoolHumidAirEngine
+from humid_air.infra.services.psychrometric_chart import (
+    HylandWexlerPsychrometricChart,
+)
+from humid_air.infra.services.saturation_table import HylandWexlerSaturationTable
+from utils.lru_cache import LRUCache
+
+
+class TestWarmUpHumidAirUseCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.chart_cache: LRUCache[
+            PsychrometricChartCacheKey, PsychrometricChartEntity
+        ] = LRUCache(max_size=4)
+        self.table_cache: LRUCache[SaturationTableCacheKey, SaturationTableEntity] = (
+            LRUCache(max_size=4)
+        )
+        self.use_case = WarmUpHumidAirUseCase(
+            state_use_case=GetHumidAirPropertyUseCase(),
+            engines={"hyland_wexler": HylandWexlerHumidAirEngine()},
+            chart_use_case=GetPsychrometricChartUseCase(
+                chart=HylandWexlerPsychrometricChart(), cache=self.chart_cache
+            ),
+            saturation_table_use_case=GetSaturationTableUseCase(
+                table=HylandWexlerSaturationTable(), cache=self.table_cache
+            ),
+        )
+
+    def test_every_step_is_timed(self) -> None:
+        report = self.use_case.execute()
+        self.assertEqual(
+            [step.name for step in report.steps],
+            [
+                "get_ha_props",
+                "engine_hyland_wexler",
+                "psychrometric_chart",
+                "saturation_table",
+            ],
+        )
+        self.assertTrue(all(step.seconds >= 0 for step in report.steps))
+        self.assertAlmostEqual(
+            report.seconds, sum(step.seconds for step in report.steps)
+        )
+
+    def test_process_pool_is_started(self) -> None:
+        engine = ProcessPoolHumidAirEngine(
+            CoolPropHumidAirEngine(), workers=2, chunk_size=500
+        )
+        self.addCleanup(engine.shutdown)
+        self.use_case.engines = {"coolprop": engine}
+        self.use_case.execute()
+        self.assertIsNotNone(engine._executor)
+
+    def test_default_chart_and_table_are_cached(self) -> None:
+        self.use_case.execute()
+        self.assertEqual(self.chart_cache.statistics.size, 1)
+        self.assertEqual(self.table_cache.statistics.size, 1)
@@ -6,6 +6,13 @@ from projects.domain.entities.project_entity import (
     ProjectEntity,
     ProjectMemberRole,
 )
+from projects.domain.entities.project_import_entity import (
+    ProjectImportErrorEntity,
+    ProjectImportRowEntity,
+)
+from projects.domain.entities.project_members_batch_entity import (
+    ProjectMembersBatchEntity,
+)
 from users.domain.entities.user_entity import UserEntity
 
 
@@ -76,6 +83,34 @@ class ProjectRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def update_project_members(self, batch: ProjectMembersBatchEntity) -> None:
+        """Ajoute, retire et modifie le rôle de plusieurs membres d'un projet
+
+        Toutes les modifications sont appliquées dans une même transaction, ou
+        aucune si l'une d'elles est refusée.
+
+        Args:
+            batch (ProjectMembersBatchEntity): Modifications des membres du projet
+        """
+        pass
+
+    @abstractmethod
+    def import_projects(
+        self, rows: list[ProjectImportRowEntity], creator_id: UUID
+    ) -> list[ProjectImportErrorEntity]:
+        """Crée une tranche de projets importés avec leurs membres
+
+        Args:
+            rows (list[ProjectImportRowEntity]): Lignes validées de la tranche
+            creator_id (UUID): Identifiant de l'utilisateur créateur, ajouté
+                comme ADMIN de chaque projet
+
+        Returns:
+            list[ProjectImportErrorEntity]: Erreurs des lignes non créées
+        """
+        pass
+
     # read
     @abstractmethod
     def get_project_by_id(self, project_id: UUID) -> ProjectEntity:
@@ -90,11 +125,15 @@ class ProjectRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def get_all_projects_with_limit(self, limit: int) -> list[ProjectEntity]:
-        """Récupère tous les projets avec une limite
+    def get_all_projects_with_limit(
+        self, limit: int, after: tuple[str, UUID] | None = None
+    ) -> list[ProjectEntity]:
+        """Récupère tous les projets avec une limite, triés par nom puis identifiant
 
         Args:
             limit (int): Limite de récupération
+            after (tuple[str, UUID] | None, optional): Nom et identifiant du dernier
+                projet de la page précédente. Defaults to None.
 
         Returns:
             list[ProjectEntity]: Liste des projets récupérés
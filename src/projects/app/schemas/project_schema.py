@@ -2,6 +2,8 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from projects.domain.entities.project_entity import ProjectMemberRole
+
 
 class ProjectCreateSchema(BaseModel):
     """Schéma pour la création d'un projet
@@ -12,11 +14,13 @@ class ProjectCreateSchema(BaseModel):
         project_number (str): Numéro du projet
         name (str): Nom du projet
         description (str): Description du projet
+        site_pressure (float | None): Pression atmosphérique du site en [Pa]
     """
 
     project_number: str
     name: str
     description: str
+    site_pressure: float | None = None
 
 
 class ProjectUpdateSchema(BaseModel):
@@ -29,12 +33,14 @@ class ProjectUpdateSchema(BaseModel):
         project_number (str): Numéro du projet
         name (str): Nom du projet
         description (str): Description du projet
+        site_pressure (float | None): Pression atmosphérique du site en [Pa]
     """
 
     id: UUID
     project_number: str
     name: str
     description: str
+    site_pressure: float | None = None
 
 
 class ProjectAddMemberSchema(BaseModel):
@@ -50,3 +56,76 @@ class ProjectAddMemberSchema(BaseModel):
 
     project_id: UUID
     user_id: UUID
+
+
+class ProjectMemberChangeSchema(BaseModel):
+    """Schéma d'un membre ajouté ou dont le rôle change
+
+    Attributs:
+        user_id (UUID): ID de l'utilisateur
+        role (ProjectMemberRole): Rôle de l'utilisateur dans le projet
+    """
+
+    user_id: UUID
+    role: ProjectMemberRole = ProjectMemberRole.MEMBER
+
+
+class ProjectMembersBatchSchema(BaseModel):
+    """Schéma pour modifier en lot les membres d'un projet
+
+    Attributs:
+        project_id (UUID): ID du projet
+        add (list[ProjectMemberChangeSchema]): Utilisateurs à ajouter
+        remove (list[UUID]): IDs des membres à retirer
+        change_role (list[ProjectMemberChangeSchema]): Membres dont le rôle change
+    """
+
+    project_id: UUID
+    add: list[ProjectMemberChangeSchema] = []
+    remove: list[UUID] = []
+    change_role: list[ProjectMemberChangeSchema] = []
+
+
+class ProjectImportMemberSchema(BaseModel):
+    """Schéma d'un membre d'un projet importé
+
+    Le rôle est validé ligne par ligne par le cas d'utilisation.
+
+    Attributs:
+        email (str): Email de l'utilisateur
+        role (str): Rôle de l'utilisateur dans le projet
+    """
+
+    email: str
+    role: str = "MEMBER"
+
+
+class ProjectImportRowSchema(BaseModel):
+    """Schéma d'une ligne d'un import de projets
+
+    Les champs sont validés ligne par ligne par le cas d'utilisation, pour
+    qu'une ligne invalide n'empêche pas l'import des autres.
+
+    Attributs:
+        project_number (str): Numéro du projet
+        name (str): Nom du projet
+        description (str): Description du projet
+        site_pressure (float | str | None): Pression atmosphérique du site en [Pa]
+        members (list[ProjectImportMemberSchema]): Membres du projet
+    """
+
+    project_number: str
+    name: str
+    description: str
+    site_pressure: float | str | None = None
+    members: list[ProjectImportMemberSchema] = []
+
+
+class ProjectImportSchema(BaseModel):
+    """Schéma pour l'import de projets en masse
+
+    Attributs:
+        projects (list[ProjectImportRowSchema]): Lignes à importer
+    """
+
+    projects: list[ProjectImportRowSchema]
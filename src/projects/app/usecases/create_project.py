@@ -45,6 +45,7 @@ class CreateProjectUseCase:
                 project_number=schema.project_number,
                 name=schema.name,
                 description=schema.description,
+                site_pressure=schema.site_pressure,
             )
             return self.repository.create_project(
                 schema=project_to_create, creator_id=creator_id
@@ -1,12 +1,15 @@
 from projects.app.repositories.project_interface import ProjectRepositoryInterface
-from projects.domain.entities.project_entity import ProjectEntity
+from projects.domain.entities.project_entity import ProjectPageEntity
+from utils.keyset_cursor import decode_cursor, encode_cursor
 
 
 class GetAllProjectsUseCase:
-    """Cas d'utilisation pour récupérer tous les projets avec une limite
+    """Cas d'utilisation pour récupérer tous les projets page par page
 
     Cette classe implémente la logique métier nécessaire pour récupérer
-    une liste limitée de projets depuis la base de données.
+    une page de projets depuis la base de données. La pagination par clé
+    (nom puis identifiant) reprend après le dernier projet de la page
+    précédente : une page lointaine coûte autant que la première.
     """
 
     def __init__(
@@ -20,13 +23,26 @@ class GetAllProjectsUseCase:
         """
         self.repository = repository
 
-    def execute(self, limit: int) -> list[ProjectEntity]:
-        """Exécute le cas d'utilisation pour récupérer tous les projets avec une limite
+    def execute(self, limit: int, cursor: str | None = None) -> ProjectPageEntity:
+        """Exécute le cas d'utilisation pour récupérer une page de projets
 
         Args:
             limit (int): Nombre maximum de projets à récupérer.
+            cursor (str | None, optional): Curseur de la page à récupérer, première
+                page par défaut. Defaults to None.
+
+        Raises:
+            ValueError: Le curseur est invalide
 
         Returns:
-            list[ProjectEntity]: Liste des projets récupérés
+            ProjectPageEntity: Projets de la page et curseur de la page suivante
         """
-        return self.repository.get_all_projects_with_limit(limit)
+        after = decode_cursor(cursor) if cursor is not None else None
+        # Un projet de plus indique l'existence d'une page suivante
+        projects = self.repository.get_all_projects_with_limit(limit + 1, after)
+        if len(projects) <= limit:
+            return ProjectPageEntity(projects=projects)
+        last = projects[limit - 1]
+        return ProjectPageEntity(
+            projects=projects[:limit], next_cursor=encode_cursor(last.name, last.id)
+        )
@@ -0,0 +1,142 @@
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from projects.app.repositories.project_interface import ProjectRepositoryInterface
+from projects.app.schemas.project_schema import (
+    ProjectImportRowSchema,
+    ProjectImportSchema,
+)
+from projects.domain.entities.project_import_entity import (
+    ProjectImportErrorEntity,
+    ProjectImportReportEntity,
+    ProjectImportRowEntity,
+)
+from projects.domain.exceptions.project_exceptions import ProjectValidationException
+from projects.domain.settings.project_settings import ProjectSettings
+
+
+class ImportProjectsUseCase:
+    """Cas d'utilisation pour importer des projets en masse
+
+    Toutes les lignes sont validées en une passe (champs, membres et doublons
+    internes à l'import), puis les lignes valides sont écrites par tranches
+    de ProjectSettings.import_chunk_size. Une ligne invalide ou en conflit
+    est signalée dans le rapport sans interrompre l'import des autres.
+    """
+
+    def __init__(self, repository: ProjectRepositoryInterface):
+        """Initialise le cas d'utilisation pour importer des projets
+
+        Args:
+            repository (ProjectRepositoryInterface): Repository du projet
+        """
+        self.repository = repository
+
+    def execute(
+        self, schema: ProjectImportSchema, creator_id: UUID
+    ) -> ProjectImportReportEntity:
+        """Exécute l'import des projets
+
+        Args:
+            schema (ProjectImportSchema): Lignes à importer
+            creator_id (UUID): Identifiant de l'utilisateur créateur, ajouté
+                comme ADMIN de chaque projet
+
+        Raises:
+            ValueError: L'import dépasse ProjectSettings.import_max_rows lignes
+            ProjectDBException: L'utilisateur créateur n'existe pas
+
+        Returns:
+            ProjectImportReportEntity: Projets créés et erreurs par ligne
+        """
+        if len(schema.projects) > ProjectSettings.import_max_rows:
+            raise ValueError(
+                ProjectSettings.import_max_rows_message.format(
+                    max_rows=ProjectSettings.import_max_rows
+                )
+            )
+
+        rows, errors = self._validate_rows(schema.projects)
+        chunk_size = ProjectSettings.import_chunk_size
+        for start in range(0, len(rows), chunk_size):
+            errors.extend(
+                self.repository.import_projects(
+                    rows[start : start + chunk_size], creator_id
+                )
+            )
+        errors.sort(key=lambda error: error.index)
+
+        failed = {error.index for error in errors}
+        return ProjectImportReportEntity(
+            total=len(schema.projects),
+            created=[row.project.id for row in rows if row.index not in failed],
+            errors=errors,
+        )
+
+    def _validate_rows(
+        self, projects: list[ProjectImportRowSchema]
+    ) -> tuple[list[ProjectImportRowEntity], list[ProjectImportErrorEntity]]:
+        """Valide chaque ligne et écarte les noms et numéros déjà vus dans l'import
+
+        Args:
+            projects (list[ProjectImportRowSchema]): Lignes à importer
+
+        Returns:
+            tuple[list[ProjectImportRowEntity], list[ProjectImportErrorEntity]]:
+                Lignes valides et erreurs
+        """
+        rows: list[ProjectImportRowEntity] = []
+        errors: list[ProjectImportErrorEntity] = []
+        names: dict[str, int] = {}
+        numbers: dict[str, int] = {}
+        for index, project in enumerate(projects):
+            try:
+                row = ProjectImportRowEntity.model_validate(
+                    {
+                        "index": index,
+                        "project": project.model_dump(exclude={"members"}),
+                        "members": [member.model_dump() for member in project.members],
+                    }
+                )
+            except ValidationError as e:
+                # champs du projet nommés comme dans l'import, sans préfixe
+                errors.extend(
+                    ProjectImportErrorEntity(
+                        index=index,
+                        field=error["field"].removeprefix("project."),
+                        message=error["message"],
+                    )
+                    for error in ProjectValidationException(e.errors()).errors
+                )
+                continue
+
+            row_errors = []
+            if row.project.name in names:
+                row_errors.append(
+                    ProjectImportErrorEntity(
+                        index=index,
+                        field="name",
+                        message=ProjectSettings.import_duplicate_name_message.format(
+                            name=row.project.name, index=names[row.project.name]
+                        ),
+                    )
+                )
+            if row.project.project_number in numbers:
+                row_errors.append(
+                    ProjectImportErrorEntity(
+                        index=index,
+                        field="project_number",
+                        message=ProjectSettings.import_duplicate_number_message.format(
+                            project_number=row.project.project_number,
+                            index=numbers[row.project.project_number],
+                        ),
+                    )
+                )
+            names.setdefault(row.project.name, index)
+            numbers.setdefault(row.project.project_number, index)
+            if row_errors:
+                errors.extend(row_errors)
+            else:
+                rows.append(row)
+        return rows, errors
@@ -46,6 +46,7 @@ class UpdateProjectUseCase:
                 project_number=schema.project_number,
                 name=schema.name,
                 description=schema.description,
+                site_pressure=schema.site_pressure,
             )
 
             # Mettre à jour le projet
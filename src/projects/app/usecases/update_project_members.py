@@ -0,0 +1,74 @@
+from uuid import UUID
+
+from projects.app.repositories.project_interface import ProjectRepositoryInterface
+from projects.app.schemas.project_schema import ProjectMembersBatchSchema
+from projects.domain.entities.project_members_batch_entity import (
+    ProjectMembersBatchEntity,
+)
+from projects.domain.exceptions.project_exceptions import ProjectMembersBatchException
+from projects.domain.settings.project_settings import ProjectMemberSettings
+
+
+class UpdateProjectMembersUseCase:
+    """Cas d'utilisation pour modifier en lot les membres d'un projet
+
+    Un utilisateur ne peut apparaître qu'une fois dans la requête. Les
+    modifications sont ensuite vérifiées et appliquées ensemble par le
+    repository : toutes ou aucune.
+    """
+
+    def __init__(self, repository: ProjectRepositoryInterface):
+        """Initialise le cas d'utilisation pour modifier les membres d'un projet
+
+        Args:
+            repository (ProjectRepositoryInterface): Repository du projet
+        """
+        self.repository = repository
+
+    def execute(self, schema: ProjectMembersBatchSchema) -> ProjectMembersBatchEntity:
+        """Exécute la modification en lot des membres du projet
+
+        Args:
+            schema (ProjectMembersBatchSchema): Ajouts, retraits et changements de rôle
+
+        Raises:
+            ProjectMembersBatchException: Un utilisateur apparaît plusieurs fois
+                ou une modification est refusée par le repository
+            ProjectDBException: Le projet n'existe pas
+
+        Returns:
+            ProjectMembersBatchEntity: Modifications appliquées
+        """
+        batch = ProjectMembersBatchEntity.model_validate(schema.model_dump())
+        fields = [
+            *(f"add.{position}.user_id" for position in range(len(batch.add))),
+            *(f"remove.{position}" for position in range(len(batch.remove))),
+            *(
+                f"change_role.{position}.user_id"
+                for position in range(len(batch.change_role))
+            ),
+        ]
+        user_ids = [
+            *(change.user_id for change in batch.add),
+            *batch.remove,
+            *(change.user_id for change in batch.change_role),
+        ]
+        seen: set[UUID] = set()
+        errors: list[dict[str, str]] = []
+        for field, user_id in zip(fields, user_ids, strict=True):
+            if user_id in seen:
+                errors.append(
+                    {
+                        "field": field,
+                        "message": ProjectMemberSettings.batch_duplicate_user_message.format(
+                            user_id=user_id
+                        ),
+                    }
+                )
+            seen.add(user_id)
+        if errors:
+            raise ProjectMembersBatchException(errors)
+
+        if user_ids:
+            self.repository.update_project_members(batch)
+        return batch
@@ -37,6 +37,7 @@ class ProjectEntity(BaseModel):
         project_number (str): Numéro de projet utilisé comme identifiant par l'entreprise
         name (str): Nom du projet
         description (str): Description du projet
+        site_pressure (float | None): Pression atmosphérique du site en [Pa]
         created_at (datetime): Date de création du projet
         updated_at (datetime): Date de mise à jour du projet
         members (list[UserEntity]): Liste des membres du projet
@@ -57,6 +58,11 @@ class ProjectEntity(BaseModel):
         ...,
         max_length=ProjectSettings.description_max_length,
     )
+    site_pressure: float | None = Field(
+        default=None,
+        ge=ProjectSettings.site_pressure_ge,
+        le=ProjectSettings.site_pressure_le,
+    )
     created_at: datetime = Field(default=datetime.now(timezone.utc))
     updated_at: datetime = Field(default=datetime.now(timezone.utc))
     members: list[UserEntityRef] = Field(default_factory=list)  # type: ignore
@@ -76,3 +82,15 @@ class ProjectAndUserJonctionTableEntity(BaseModel):
     project_id: UUID
     user_id: UUID
     role: ProjectMemberRole = Field(default=ProjectMemberRole.MEMBER)
+
+
+class ProjectPageEntity(BaseModel):
+    """Page de projets d'une pagination par curseur
+
+    Attributs:
+        projects (list[ProjectEntity]): Projets de la page, triés par nom
+        next_cursor (str | None): Curseur de la page suivante, None sur la dernière page
+    """
+
+    projects: list[ProjectEntity]
+    next_cursor: str | None = None
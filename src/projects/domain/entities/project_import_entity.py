@@ -0,0 +1,59 @@
+from uuid import UUID
+
+from pydantic import BaseModel, EmailStr, Field
+
+from projects.domain.entities.project_entity import ProjectEntity, ProjectMemberRole
+
+
+class ProjectImportMemberEntity(BaseModel):
+    """Membre d'un projet importé, identifié par son email
+
+    Attributs:
+        email (EmailStr): Email de l'utilisateur
+        role (ProjectMemberRole): Rôle de l'utilisateur dans le projet
+    """
+
+    email: EmailStr
+    role: ProjectMemberRole = Field(default=ProjectMemberRole.MEMBER)
+
+
+class ProjectImportRowEntity(BaseModel):
+    """Ligne validée d'un import de projets
+
+    Attributs:
+        index (int): Index de la ligne dans l'import
+        project (ProjectEntity): Projet à créer
+        members (list[ProjectImportMemberEntity]): Membres à ajouter au projet
+    """
+
+    index: int
+    project: ProjectEntity
+    members: list[ProjectImportMemberEntity] = Field(default_factory=list)
+
+
+class ProjectImportErrorEntity(BaseModel):
+    """Erreur d'une ligne d'un import de projets
+
+    Attributs:
+        index (int): Index de la ligne dans l'import
+        field (str): Champ en erreur
+        message (str): Message d'erreur
+    """
+
+    index: int
+    field: str
+    message: str
+
+
+class ProjectImportReportEntity(BaseModel):
+    """Rapport d'un import de projets
+
+    Attributs:
+        total (int): Nombre de lignes lues
+        created (list[UUID]): Identifiants des projets créés
+        errors (list[ProjectImportErrorEntity]): Erreurs par ligne
+    """
+
+    total: int
+    created: list[UUID] = Field(default_factory=list)
+    errors: list[ProjectImportErrorEntity] = Field(default_factory=list)
@@ -0,0 +1,33 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from projects.domain.entities.project_entity import ProjectMemberRole
+
+
+class ProjectMemberChangeEntity(BaseModel):
+    """Membre à ajouter à un projet ou dont le rôle est à modifier
+
+    Attributs:
+        user_id (UUID): Identifiant de l'utilisateur
+        role (ProjectMemberRole): Rôle de l'utilisateur dans le projet
+    """
+
+    user_id: UUID
+    role: ProjectMemberRole = Field(default=ProjectMemberRole.MEMBER)
+
+
+class ProjectMembersBatchEntity(BaseModel):
+    """Modifications des membres d'un projet appliquées ensemble
+
+    Attributs:
+        project_id (UUID): Identifiant du projet
+        add (list[ProjectMemberChangeEntity]): Utilisateurs à ajouter
+        remove (list[UUID]): Identifiants des membres à retirer
+        change_role (list[ProjectMemberChangeEntity]): Membres dont le rôle change
+    """
+
+    project_id: UUID
+    add: list[ProjectMemberChangeEntity] = Field(default_factory=list)
+    remove: list[UUID] = Field(default_factory=list)
+    change_role: list[ProjectMemberChangeEntity] = Field(default_factory=list)
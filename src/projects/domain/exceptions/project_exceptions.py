@@ -74,3 +74,20 @@ class ProjectMemberValidationException(ProjectException):
             for err in errors
         ]
         super().__init__(message="ProjectMemberValidationException")
+
+
+class ProjectMembersBatchException(ProjectException):
+    """Exception pour une modification en lot des membres d'un projet refusée
+
+    Args:
+        ProjectException (ProjectException): Exception de base pour les projets
+    """
+
+    def __init__(self, errors: list[dict[str, str]]):
+        """Initialise l'exception
+
+        Args:
+            errors (list[dict[str, str]]): Champs en erreur et messages associés
+        """
+        self.errors = errors
+        super().__init__(message="ProjectMembersBatchException")
@@ -17,6 +17,13 @@ class ProjectSettings:
     # description
     description_description: str = "Description du projet"
     description_max_length: int = 250
+    # site_pressure
+    site_pressure_description: str = (
+        "Pression atmosphérique du site en [Pa], utilisée par défaut pour les "
+        "calculs d'air humide rattachés au projet"
+    )
+    site_pressure_ge: int = 10
+    site_pressure_le: float = 1e7
     # owner
     owner_id_description: str = "Identifiant unique du propriétaire du projet"
     owner_description: str = "L'entité propriétaire du projet"
@@ -31,6 +38,54 @@ class ProjectSettings:
     limit_description: str = "Nombre maximum de projets à récupérer"
     limit_default: int = 100
     limit_gt: int = 0
+    limit_le: int = 1000
+    # cursor
+    cursor_description: str = (
+        "Curseur opaque de la page à récupérer, renvoyé dans next_cursor par la "
+        "page précédente"
+    )
+    next_cursor_description: str = (
+        "Curseur de la page suivante, absent sur la dernière page"
+    )
+    # import
+    import_projects_description: str = "Projets à importer, avec leurs membres"
+    import_file_description: str = (
+        "Fichier CSV des projets à importer, colonnes project_number, name, "
+        "description, site_pressure et members (emails séparés par des ';', "
+        "suivis éventuellement de ':ROLE')"
+    )
+    import_members_description: str = (
+        "Membres du projet identifiés par leur email ; le créateur de l'import "
+        "est ajouté comme ADMIN"
+    )
+    import_total_description: str = "Nombre de projets lus"
+    import_created_description: str = "Nombre de projets créés"
+    import_errors_description: str = (
+        "Erreurs par ligne, les lignes en erreur ne sont pas importées"
+    )
+    import_index_description: str = "Index de la ligne en erreur, à partir de 0"
+    import_field_description: str = "Champ en erreur"
+    import_message_description: str = "Message d'erreur"
+    import_max_rows: int = 10000
+    import_chunk_size: int = 500
+    import_max_rows_message: str = "L'import est limité à {max_rows} projets."
+    import_missing_columns_message: str = "Colonnes CSV manquantes : {columns}."
+    import_duplicate_name_message: str = (
+        "Le nom '{name}' apparaît déjà à la ligne {index} de l'import."
+    )
+    import_duplicate_number_message: str = (
+        "Le numéro '{project_number}' apparaît déjà à la ligne {index} de l'import."
+    )
+    import_name_taken_message: str = "Un projet avec le nom '{name}' existe déjà."
+    import_number_taken_message: str = (
+        "Un projet avec le numéro '{project_number}' existe déjà."
+    )
+    import_unknown_member_message: str = (
+        "L'utilisateur avec l'email '{email}' n'existe pas."
+    )
+    import_conflict_message: str = (
+        "Le projet n'a pas pu être enregistré : conflit avec un projet existant."
+    )
 
 
 class ProjectMemberSettings:
@@ -46,3 +101,24 @@ class ProjectMemberSettings:
     email_description: str = "Adresse email de l'utilisateur"
     # members
     members_description: str = "Liste des membres du projet"
+    # batch
+    batch_add_description: str = "Utilisateurs à ajouter au projet avec leur rôle"
+    batch_remove_description: str = "Identifiants des utilisateurs à retirer du projet"
+    batch_change_role_description: str = "Membres du projet dont le rôle est à modifier"
+    batch_max_items: int = 1000
+    batch_duplicate_user_message: str = (
+        "L'utilisateur '{user_id}' apparaît plusieurs fois dans la requête."
+    )
+    batch_unknown_user_message: str = (
+        "L'utilisateur avec l'id '{user_id}' n'existe pas."
+    )
+    batch_already_member_message: str = (
+        "L'utilisateur '{user_id}' est déjà membre du projet."
+    )
+    batch_not_member_message: str = (
+        "L'utilisateur '{user_id}' n'est pas membre du projet."
+    )
+    batch_success_message: str = (
+        "Membres du projet mis à jour : {added} ajoutés, {removed} retirés, "
+        "{updated} rôles modifiés."
+    )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from sqlmodel import Field, Relationship, SQLModel
@@ -23,12 +23,17 @@ class ProjectAndUserJonctionTableSQLModel(SQLModel, table=True):
         project_id (UUID): ID du projet associé
         user_id (UUID): ID de l'utilisateur associé
         role (ProjectMemberRole): Rôle de l'utilisateur dans le projet
+        project (ProjectSQLModel | None): Projet associé, qui ordonne l'insertion
+            du lien après celle d'un nouveau projet
     """
 
     __tablename__ = "project_members_links"
     project_id: UUID = Field(..., foreign_key="projects.id", primary_key=True)
     user_id: UUID = Field(..., foreign_key="users.id", primary_key=True)
     role: str = Field(...)
+    project: Optional["ProjectSQLModel"] = Relationship(
+        sa_relationship_kwargs={"overlaps": "members,projects"}
+    )
 
     def to_entity(self) -> ProjectAndUserJonctionTableEntity:
         """Convertit le modèle SQL en entité
@@ -53,6 +58,7 @@ class ProjectSQLModel(SQLModel, table=True):
         project_number (str): Numéro de projet utilisé comme identifiant par l'entreprise
         name (str): Nom du projet
         description (str): Description du projet
+        site_pressure (float | None): Pression atmosphérique du site en [Pa]
         created_at (datetime): Date de création du projet
         updated_at (datetime): Date de mise à jour du projet
         members (list[UserSQLModel]): Liste des membres du projet
@@ -63,6 +69,7 @@ class ProjectSQLModel(SQLModel, table=True):
     project_number: str = Field(..., unique=True)
     name: str = Field(..., unique=True)
     description: str = Field(...)
+    site_pressure: float | None = Field(default=None)
     created_at: datetime = Field(...)
     updated_at: datetime = Field(...)
     members: list["UserSQLModel"] = Relationship(
@@ -83,6 +90,7 @@ class ProjectSQLModel(SQLModel, table=True):
             project_number=self.project_number,
             name=self.name,
             description=self.description,
+            site_pressure=self.site_pressure,
             created_at=self.created_at,
             updated_at=self.updated_at,
             members=[member.to_entity(include_related=False) for member in self.members]
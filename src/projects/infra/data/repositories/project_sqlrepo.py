@@ -1,6 +1,11 @@
+from typing import Any
 from uuid import UUID
 
-from sqlmodel import and_, asc, select
+from sqlalchemy import delete, insert, literal, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, and_, asc, col, exists, or_, select
 
 from common.infra.data.sql_unit_of_work import SQLUnitOfWork
 from projects.app.repositories.project_interface import ProjectRepositoryInterface
@@ -9,8 +14,20 @@ from projects.domain.entities.project_entity import (
     ProjectEntity,
     ProjectMemberRole,
 )
+from projects.domain.entities.project_import_entity import (
+    ProjectImportErrorEntity,
+    ProjectImportRowEntity,
+)
+from projects.domain.entities.project_members_batch_entity import (
+    ProjectMembersBatchEntity,
+)
 from projects.domain.exceptions.project_exceptions import (
     ProjectDBException,
+    ProjectMembersBatchException,
+)
+from projects.domain.settings.project_settings import (
+    ProjectMemberSettings,
+    ProjectSettings,
 )
 from projects.infra.data.models.project_sqlmodel import (
     ProjectAndUserJonctionTableSQLModel,
@@ -50,53 +67,54 @@ class ProjectSQLRepository(ProjectRepositoryInterface):
             ProjectEntity: Projet créé
         """
         with self.unit_of_work as uow:
-            # Vérifier si un projet avec le même nom existe déjà
-            name_query = select(ProjectSQLModel).where(
-                ProjectSQLModel.name == schema.name
-            )
-            existing_name = uow.session.exec(name_query).first()
-            if existing_name:
+            # Vérifier le nom et le numéro et charger le créateur en un seul
+            # aller-retour, la jointure externe renvoyant None s'il n'existe pas
+            name_taken, number_taken, creator = uow.session.exec(
+                select(
+                    exists().where(col(ProjectSQLModel.name) == schema.name),
+                    exists().where(
+                        col(ProjectSQLModel.project_number) == schema.project_number
+                    ),
+                    UserSQLModel,
+                )
+                .select_from(select(literal(1)).subquery())
+                .outerjoin(UserSQLModel, col(UserSQLModel.id) == creator_id)
+            ).one()
+            if name_taken:
                 raise ProjectDBException(
                     message=f"Un projet avec le nom '{schema.name}' existe déjà."
                 )
-
-            # Vérifier si un projet avec le même numéro existe déjà
-            number_query = select(ProjectSQLModel).where(
-                ProjectSQLModel.project_number == schema.project_number
-            )
-            existing_number = uow.session.exec(number_query).first()
-            if existing_number:
+            if number_taken:
                 raise ProjectDBException(
                     message=f"Un projet avec le numéro '{schema.project_number}' existe déjà."
                 )
-
-            # Vérifier si l'utilisateur créateur existe
-            creator = uow.session.get(UserSQLModel, creator_id)
-            if not creator:
+            if creator is None:
                 raise ProjectDBException(
                     message=f"L'utilisateur avec l'id '{creator_id}' n'existe pas."
                 )
 
-            # Créer le projet
+            # Créer le projet et le créateur comme membre ADMIN : la relation
+            # du lien vers le projet ordonne les insertions en un seul flush,
+            # le créateur est le seul membre, inutile de relire les membres
             query = ProjectSQLModel(
                 id=schema.id,
                 project_number=schema.project_number,
                 name=schema.name,
                 description=schema.description,
+                site_pressure=schema.site_pressure,
                 created_at=schema.created_at,
                 updated_at=schema.updated_at,
             )
-            uow.session.add(query)
-            uow.session.flush()
-
-            # Ajouter le créateur comme membre avec le rôle ADMIN
             member = ProjectAndUserJonctionTableSQLModel(
                 project_id=schema.id,
                 user_id=creator_id,
                 role=ProjectMemberRole.ADMIN.value,
+                project=query,
             )
+            uow.session.add(query)
             uow.session.add(member)
             uow.session.flush()
+            set_committed_value(query, "members", [creator])  # type: ignore[no-untyped-call]
 
             return query.to_entity()
 
@@ -137,26 +155,29 @@ class ProjectSQLRepository(ProjectRepositoryInterface):
                     message=f"Le projet avec l'id '{schema.id}' n'existe pas."
                 )
 
-            # Vérifier si le nom existe déjà pour un autre projet
-            if project_to_update.name != schema.name:
-                name_query = select(ProjectSQLModel).where(
-                    ProjectSQLModel.name == schema.name,
-                    ProjectSQLModel.id != schema.id,
-                )
-                existing_name = uow.session.exec(name_query).first()
-                if existing_name:
+            # Vérifier le nom et le numéro modifiés en un seul aller-retour
+            if (
+                project_to_update.name != schema.name
+                or project_to_update.project_number != schema.project_number
+            ):
+                others = col(ProjectSQLModel.id) != schema.id
+                name_taken, number_taken = uow.session.exec(
+                    select(
+                        exists().where(
+                            col(ProjectSQLModel.name) == schema.name, others
+                        ),
+                        exists().where(
+                            col(ProjectSQLModel.project_number)
+                            == schema.project_number,
+                            others,
+                        ),
+                    )
+                ).one()
+                if name_taken:
                     raise ProjectDBException(
                         message=f"Un projet avec le nom '{schema.name}' existe déjà."
                     )
-
-            # Vérifier si le numéro existe déjà pour un autre projet
-            if project_to_update.project_number != schema.project_number:
-                number_query = select(ProjectSQLModel).where(
-                    ProjectSQLModel.project_number == schema.project_number,
-                    ProjectSQLModel.id != schema.id,
-                )
-                existing_number = uow.session.exec(number_query).first()
-                if existing_number:
+                if number_taken:
                     raise ProjectDBException(
                         message=f"Un projet avec le numéro '{schema.project_number}' existe déjà."
                     )
@@ -164,6 +185,7 @@ class ProjectSQLRepository(ProjectRepositoryInterface):
             project_to_update.project_number = schema.project_number
             project_to_update.name = schema.name
             project_to_update.description = schema.description
+            project_to_update.site_pressure = schema.site_pressure
             project_to_update.updated_at = schema.updated_at
 
             uow.session.add(project_to_update)
@@ -259,6 +281,269 @@ class ProjectSQLRepository(ProjectRepositoryInterface):
             uow.session.delete(member)
             uow.session.flush()
 
+    def update_project_members(self, batch: ProjectMembersBatchEntity) -> None:
+        """Ajoute, retire et modifie le rôle de plusieurs membres d'un projet
+
+        Les utilisateurs à ajouter et les membres actuels concernés sont
+        vérifiés en deux requêtes, puis les modifications sont appliquées par
+        lots : un INSERT, un DELETE et un UPDATE par rôle cible. Rien n'est
+        modifié si une des modifications est refusée.
+
+        Args:
+            batch (ProjectMembersBatchEntity): Modifications des membres du projet
+
+        Raises:
+            ProjectDBException: Le projet n'existe pas
+            ProjectMembersBatchException: Un utilisateur à ajouter n'existe pas
+                ou est déjà membre, ou un membre à retirer ou à modifier n'est
+                pas membre du projet
+        """
+        added = [change.user_id for change in batch.add]
+        changed = [change.user_id for change in batch.change_role]
+        with self.unit_of_work as uow:
+            project = uow.session.get(ProjectSQLModel, batch.project_id)
+            if not project:
+                raise ProjectDBException(
+                    message=f"Le projet avec l'id '{batch.project_id}' n'existe pas."
+                )
+
+            # Vérifier les utilisateurs à ajouter et les membres concernés
+            users: set[UUID] = set()
+            if added:
+                users = set(
+                    uow.session.exec(
+                        select(UserSQLModel.id).where(col(UserSQLModel.id).in_(added))
+                    ).all()
+                )
+            members = set(
+                uow.session.exec(
+                    select(ProjectAndUserJonctionTableSQLModel.user_id).where(
+                        ProjectAndUserJonctionTableSQLModel.project_id
+                        == batch.project_id,
+                        col(ProjectAndUserJonctionTableSQLModel.user_id).in_(
+                            [*added, *batch.remove, *changed]
+                        ),
+                    )
+                ).all()
+            )
+
+            errors: list[dict[str, str]] = []
+            for position, user_id in enumerate(added):
+                if user_id not in users:
+                    message = ProjectMemberSettings.batch_unknown_user_message
+                elif user_id in members:
+                    message = ProjectMemberSettings.batch_already_member_message
+                else:
+                    continue
+                errors.append(
+                    {
+                        "field": f"add.{position}.user_id",
+                        "message": message.format(user_id=user_id),
+                    }
+                )
+            for field, user_ids in (
+                ("remove.{position}", batch.remove),
+                ("change_role.{position}.user_id", changed),
+            ):
+                errors.extend(
+                    {
+                        "field": field.format(position=position),
+                        "message": ProjectMemberSettings.batch_not_member_message.format(
+                            user_id=user_id
+                        ),
+                    }
+                    for position, user_id in enumerate(user_ids)
+                    if user_id not in members
+                )
+            if errors:
+                raise ProjectMembersBatchException(errors)
+
+            if batch.add:
+                uow.session.execute(
+                    insert(ProjectAndUserJonctionTableSQLModel),
+                    [
+                        {
+                            "project_id": batch.project_id,
+                            "user_id": change.user_id,
+                            "role": change.role.value,
+                        }
+                        for change in batch.add
+                    ],
+                )
+            if batch.remove:
+                uow.session.execute(
+                    delete(ProjectAndUserJonctionTableSQLModel).where(
+                        col(ProjectAndUserJonctionTableSQLModel.project_id)
+                        == batch.project_id,
+                        col(ProjectAndUserJonctionTableSQLModel.user_id).in_(
+                            batch.remove
+                        ),
+                    )
+                )
+            roles: dict[ProjectMemberRole, list[UUID]] = {}
+            for change in batch.change_role:
+                roles.setdefault(change.role, []).append(change.user_id)
+            for role, user_ids in roles.items():
+                uow.session.execute(
+                    update(ProjectAndUserJonctionTableSQLModel)
+                    .where(
+                        col(ProjectAndUserJonctionTableSQLModel.project_id)
+                        == batch.project_id,
+                        col(ProjectAndUserJonctionTableSQLModel.user_id).in_(user_ids),
+                    )
+                    .values(role=role.value)
+                )
+
+    def import_projects(
+        self, rows: list[ProjectImportRowEntity], creator_id: UUID
+    ) -> list[ProjectImportErrorEntity]:
+        """Crée une tranche de projets importés avec leurs membres
+
+        Les noms, numéros et emails de toute la tranche sont vérifiés en trois
+        requêtes, puis les projets et leurs membres sont insérés par lots dans
+        un point de sauvegarde. Si un conflit apparaît malgré tout (écriture
+        concurrente), la tranche est rejouée projet par projet pour n'écarter
+        que les lignes fautives.
+
+        Args:
+            rows (list[ProjectImportRowEntity]): Lignes validées de la tranche
+            creator_id (UUID): Identifiant de l'utilisateur créateur, ajouté
+                comme ADMIN de chaque projet
+
+        Raises:
+            ProjectDBException: L'utilisateur créateur n'existe pas
+
+        Returns:
+            list[ProjectImportErrorEntity]: Erreurs des lignes non créées
+        """
+        with self.unit_of_work as uow:
+            creator = uow.session.get(UserSQLModel, creator_id)
+            if not creator:
+                raise ProjectDBException(
+                    message=f"L'utilisateur avec l'id '{creator_id}' n'existe pas."
+                )
+
+            # Vérifier les noms, numéros et membres de toute la tranche
+            taken_names = set(
+                uow.session.exec(
+                    select(ProjectSQLModel.name).where(
+                        col(ProjectSQLModel.name).in_(
+                            [row.project.name for row in rows]
+                        )
+                    )
+                ).all()
+            )
+            taken_numbers = set(
+                uow.session.exec(
+                    select(ProjectSQLModel.project_number).where(
+                        col(ProjectSQLModel.project_number).in_(
+                            [row.project.project_number for row in rows]
+                        )
+                    )
+                ).all()
+            )
+            emails = {member.email for row in rows for member in row.members}
+            user_ids = dict(
+                uow.session.exec(
+                    select(UserSQLModel.email, UserSQLModel.id).where(
+                        col(UserSQLModel.email).in_(emails)
+                    )
+                ).all()
+            )
+
+            errors: list[ProjectImportErrorEntity] = []
+            accepted: list[ProjectImportRowEntity] = []
+            for row in rows:
+                row_errors = []
+                if row.project.name in taken_names:
+                    row_errors.append(
+                        ProjectImportErrorEntity(
+                            index=row.index,
+                            field="name",
+                            message=ProjectSettings.import_name_taken_message.format(
+                                name=row.project.name
+                            ),
+                        )
+                    )
+                if row.project.project_number in taken_numbers:
+                    row_errors.append(
+                        ProjectImportErrorEntity(
+                            index=row.index,
+                            field="project_number",
+                            message=ProjectSettings.import_number_taken_message.format(
+                                project_number=row.project.project_number
+                            ),
+                        )
+                    )
+                row_errors.extend(
+                    ProjectImportErrorEntity(
+                        index=row.index,
+                        field=f"members.{position}.email",
+                        message=ProjectSettings.import_unknown_member_message.format(
+                            email=member.email
+                        ),
+                    )
+                    for position, member in enumerate(row.members)
+                    if member.email not in user_ids
+                )
+                if row_errors:
+                    errors.extend(row_errors)
+                else:
+                    accepted.append(row)
+
+            if not accepted:
+                return errors
+            try:
+                with uow.session.begin_nested():
+                    self._insert_projects(uow.session, accepted, user_ids, creator_id)
+            except IntegrityError:
+                # Rejouer projet par projet pour n'écarter que les lignes en conflit
+                for row in accepted:
+                    try:
+                        with uow.session.begin_nested():
+                            self._insert_projects(
+                                uow.session, [row], user_ids, creator_id
+                            )
+                    except IntegrityError:
+                        errors.append(
+                            ProjectImportErrorEntity(
+                                index=row.index,
+                                field="project",
+                                message=ProjectSettings.import_conflict_message,
+                            )
+                        )
+            return errors
+
+    def _insert_projects(
+        self,
+        session: Session,
+        rows: list[ProjectImportRowEntity],
+        user_ids: dict[str, UUID],
+        creator_id: UUID,
+    ) -> None:
+        """Insère des projets et leurs membres en deux INSERT par lots
+
+        Args:
+            session (Session): Session de l'unité de travail
+            rows (list[ProjectImportRowEntity]): Lignes à insérer
+            user_ids (dict[str, UUID]): Identifiants des membres par email
+            creator_id (UUID): Identifiant de l'utilisateur créateur
+        """
+        projects: list[dict[str, Any]] = []
+        members: list[dict[str, Any]] = []
+        for row in rows:
+            projects.append(row.project.model_dump(exclude={"members"}))
+            # Le créateur reste ADMIN, un membre cité deux fois garde son premier rôle
+            roles = {creator_id: ProjectMemberRole.ADMIN}
+            for member in row.members:
+                roles.setdefault(user_ids[member.email], member.role)
+            members.extend(
+                {"project_id": row.project.id, "user_id": user_id, "role": role.value}
+                for user_id, role in roles.items()
+            )
+        session.execute(insert(ProjectSQLModel), projects)
+        session.execute(insert(ProjectAndUserJonctionTableSQLModel), members)
+
     # read
     def get_project_by_id(self, project_id: UUID) -> ProjectEntity:
         """Récupère un projet par son identifiant
@@ -273,7 +558,12 @@ class ProjectSQLRepository(ProjectRepositoryInterface):
             ProjectEntity: Projet récupéré
         """
         with self.unit_of_work as uow:
-            project = uow.session.get(ProjectSQLModel, project_id)
+            query = (
+                select(ProjectSQLModel)
+                .where(ProjectSQLModel.id == project_id)
+                .options(selectinload(ProjectSQLModel.members))  # type: ignore[arg-type]
+            )
+            project = uow.session.exec(query).first()
             if not project:
                 raise ProjectDBException(
                     message=f"Le projet avec l'id '{project_id}' n'existe pas."
@@ -281,19 +571,39 @@ class ProjectSQLRepository(ProjectRepositoryInterface):
 
             return project.to_entity()
 
-    def get_all_projects_with_limit(self, limit: int) -> list[ProjectEntity]:
-        """Récupère tous les projets avec une limite
+    def get_all_projects_with_limit(
+        self, limit: int, after: tuple[str, UUID] | None = None
+    ) -> list[ProjectEntity]:
+        """Récupère tous les projets avec une limite, triés par nom puis identifiant
 
         Args:
             limit (int): Limite de récupération
+            after (tuple[str, UUID] | None, optional): Nom et identifiant du dernier
+                projet de la page précédente. Defaults to None.
 
         Returns:
             list[ProjectEntity]: Liste des projets récupérés
         """
         with self.unit_of_work as uow:
+            # Charger les membres en une requête pour tous les projets (évite N+1)
             query = (
-                select(ProjectSQLModel).order_by(asc(ProjectSQLModel.name)).limit(limit)
+                select(ProjectSQLModel)
+                .order_by(asc(ProjectSQLModel.name), asc(ProjectSQLModel.id))
+                .limit(limit)
+                .options(selectinload(ProjectSQLModel.members))  # type: ignore[arg-type]
             )
+            # Reprendre après la page précédente (pagination par clé)
+            if after is not None:
+                name, project_id = after
+                query = query.where(
+                    or_(
+                        ProjectSQLModel.name > name,
+                        and_(
+                            ProjectSQLModel.name == name,
+                            ProjectSQLModel.id > project_id,
+                        ),
+                    )
+                )
             projects = uow.session.exec(query).all()
             return [project.to_entity() for project in projects]
 
@@ -318,6 +628,7 @@ class ProjectSQLRepository(ProjectRepositoryInterface):
                     ),
                 )
                 .where(ProjectAndUserJonctionTableSQLModel.user_id == user_id)
+                .options(selectinload(ProjectSQLModel.members))  # type: ignore[arg-type]
             )
             projects = uow.session.exec(query).all()
             return [project.to_entity() for project in projects]
@@ -1,3 +1,4 @@
+import io
 from collections.abc import Callable
 from http import HTTPStatus
 from typing import cast
@@ -13,6 +14,9 @@ from common.infra.web.dtos.generic import ErrorResponse, SuccessResponse
 from projects.app.schemas.project_schema import (
     ProjectAddMemberSchema,
     ProjectCreateSchema,
+    ProjectImportSchema,
+    ProjectMemberChangeSchema,
+    ProjectMembersBatchSchema,
     ProjectUpdateSchema,
 )
 from projects.app.usecases.add_project_member import AddProjectMemberUseCase
@@ -23,12 +27,16 @@ from projects.app.usecases.get_all_projects import GetAllProjectsUseCase
 from projects.app.usecases.get_project_by_id import GetProjectByIdUseCase
 from projects.app.usecases.get_project_members import GetProjectMembersUseCase
 from projects.app.usecases.get_user_projects import GetUserProjectsUseCase
+from projects.app.usecases.import_projects import ImportProjectsUseCase
 from projects.app.usecases.update_project import UpdateProjectUseCase
+from projects.app.usecases.update_project_members import UpdateProjectMembersUseCase
 from projects.domain.exceptions.project_exceptions import (
     ProjectDBException,
+    ProjectMembersBatchException,
     ProjectMemberValidationException,
     ProjectValidationException,
 )
+from projects.domain.settings.project_settings import ProjectMemberSettings
 from projects.infra.web.dtos.project_dtos import (
     GetAllProjectsQueryParams,
     GetAllProjectsResponse,
@@ -37,10 +45,15 @@ from projects.infra.web.dtos.project_dtos import (
     GetUserResponse,
     ProjectAddMemberRequest,
     ProjectCreateRequest,
+    ProjectImportFileRequest,
+    ProjectImportRequest,
+    ProjectImportResponse,
     ProjectMemberPath,
+    ProjectMembersBatchRequest,
     ProjectPath,
     ProjectUpdateRequest,
 )
+from projects.infra.web.readers.project_import_csv import read_project_import_csv
 from users.domain.entities.user_entity import UserRole
 from users.infra.web.decorators.role_required import role_required
 
@@ -88,6 +101,7 @@ def create_project(
             project_number=body.project_number,
             name=body.name,
             description=body.description,
+            site_pressure=body.site_pressure,
         )
         user_id = UUID(get_jwt().get("sub"))
         use_case.execute(schema=schema, creator_id=user_id)
@@ -106,12 +120,113 @@ def create_project(
         ).to_response()
 
 
+@router.post(
+    "/import_projects",
+    description=(
+        "Permet d'importer des projets en masse avec leurs membres. Les lignes "
+        "invalides ou en conflit sont signalées sans interrompre l'import."
+    ),
+    security=security,
+    responses={
+        HTTPStatus.OK: ProjectImportResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
+    },
+)
+@inject
+@cast("Callable[..., Response]", jwt_required())
+@cast("Callable[..., Response]", role_required(UserRole.ADMIN))
+def import_projects(
+    body: ProjectImportRequest,
+    use_case: ImportProjectsUseCase = Provide[
+        AppContainer.project_usecases.provided["import_projects"]
+    ],
+) -> Response:
+    """Permet d'importer des projets en masse depuis un corps JSON.
+
+    Args:
+        body (ProjectImportRequest): Projets à importer avec leurs membres
+        use_case (ImportProjectsUseCase, optional): Cas d'utilisation pour importer des projets.
+
+    Returns:
+        Response: Rapport d'import ou réponse d'erreur
+    """
+    return _import_projects(
+        use_case, lambda: ProjectImportSchema.model_validate(body.model_dump())
+    )
+
+
+@router.post(
+    "/import_projects_csv",
+    description=(
+        "Permet d'importer des projets en masse depuis un fichier CSV, une ligne "
+        "par projet. Les lignes invalides ou en conflit sont signalées sans "
+        "interrompre l'import."
+    ),
+    security=security,
+    responses={
+        HTTPStatus.OK: ProjectImportResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
+    },
+)
+@inject
+@cast("Callable[..., Response]", jwt_required())
+@cast("Callable[..., Response]", role_required(UserRole.ADMIN))
+def import_projects_csv(
+    form: ProjectImportFileRequest,
+    use_case: ImportProjectsUseCase = Provide[
+        AppContainer.project_usecases.provided["import_projects"]
+    ],
+) -> Response:
+    """Permet d'importer des projets en masse depuis un fichier CSV.
+
+    Args:
+        form (ProjectImportFileRequest): Fichier CSV des projets à importer
+        use_case (ImportProjectsUseCase, optional): Cas d'utilisation pour importer des projets.
+
+    Returns:
+        Response: Rapport d'import ou réponse d'erreur
+    """
+    return _import_projects(
+        use_case,
+        lambda: ProjectImportSchema(
+            projects=read_project_import_csv(
+                io.TextIOWrapper(form.file.stream, encoding="utf-8-sig", newline="")
+            )
+        ),
+    )
+
+
+def _import_projects(
+    use_case: ImportProjectsUseCase, read_schema: Callable[[], ProjectImportSchema]
+) -> Response:
+    """Lit les lignes à importer puis exécute l'import pour l'utilisateur connecté
+
+    Args:
+        use_case (ImportProjectsUseCase): Cas d'utilisation pour importer des projets
+        read_schema (Callable[[], ProjectImportSchema]): Lecture des lignes à importer
+
+    Returns:
+        Response: Rapport d'import ou réponse d'erreur
+    """
+    try:
+        report = use_case.execute(
+            schema=read_schema(), creator_id=UUID(get_jwt().get("sub"))
+        )
+        return ProjectImportResponse.from_use_case_result(report).to_response()
+
+    except (ValueError, ProjectDBException) as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
+        ).to_response()
+
+
 @router.get(
     "get_all_projects",
-    description="Permet de récupérer la liste de tous les projets.",
+    description="Permet de récupérer la liste de tous les projets, page par page.",
     security=security,
     responses={
         HTTPStatus.OK: GetAllProjectsResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
     },
 )
 @inject
@@ -132,11 +247,19 @@ def get_all_projects(
     Returns:
         Response: Réponse de succès ou d'erreur
     """
-    projects = use_case.execute(limit=query.limit)
+    try:
+        page = use_case.execute(limit=query.limit, cursor=query.cursor)
+    except ValueError as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
+        ).to_response()
     projects_response = [
-        GetProjectResponse.model_validate(project.model_dump()) for project in projects
+        GetProjectResponse.model_validate(project.model_dump())
+        for project in page.projects
     ]
-    return GetAllProjectsResponse(projects=projects_response).to_response()
+    return GetAllProjectsResponse(
+        projects=projects_response, next_cursor=page.next_cursor
+    ).to_response()
 
 
 @router.get(
@@ -208,6 +331,7 @@ def update_project(
             project_number=body.project_number,
             name=body.name,
             description=body.description,
+            site_pressure=body.site_pressure,
         )
         updated_project = use_case.execute(schema=schema)
         return GetProjectResponse.model_validate(
@@ -307,6 +431,68 @@ def add_project_member(
         return ErrorResponse(code=HTTPStatus.NOT_FOUND, message=str(e)).to_response()
 
 
+@router.patch(
+    "/<uuid:id>/members",
+    description="Permet d'ajouter, de retirer et de modifier le rôle de plusieurs "
+    "membres d'un projet en une requête.",
+    security=security,
+    responses={
+        HTTPStatus.OK: SuccessResponse,
+        HTTPStatus.NOT_FOUND: ErrorResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
+    },
+)
+@inject
+@cast("Callable[..., Response]", jwt_required())
+def update_project_members(
+    path: ProjectPath,
+    body: ProjectMembersBatchRequest,
+    use_case: UpdateProjectMembersUseCase = Provide[
+        AppContainer.project_usecases.provided["update_project_members"]
+    ],
+) -> Response:
+    """Permet de modifier en lot les membres d'un projet.
+
+    Args:
+        path (ProjectPath): Chemin avec l'identifiant du projet
+        body (ProjectMembersBatchRequest): Ajouts, retraits et changements de rôle
+        use_case (UpdateProjectMembersUseCase, optional): Cas d'utilisation pour modifier les membres d'un projet.
+
+    Returns:
+        Response: Réponse de succès ou d'erreur
+    """
+    try:
+        schema = ProjectMembersBatchSchema(
+            project_id=path.id,
+            add=[
+                ProjectMemberChangeSchema(user_id=member.user_id, role=member.role)
+                for member in body.add
+            ],
+            remove=body.remove,
+            change_role=[
+                ProjectMemberChangeSchema(user_id=member.user_id, role=member.role)
+                for member in body.change_role
+            ],
+        )
+        batch = use_case.execute(schema=schema)
+        return SuccessResponse(
+            code=HTTPStatus.OK,
+            message=ProjectMemberSettings.batch_success_message.format(
+                added=len(batch.add),
+                removed=len(batch.remove),
+                updated=len(batch.change_role),
+            ),
+        ).to_response()
+
+    except ProjectMembersBatchException as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=e.errors
+        ).to_response()
+
+    except ProjectDBException as e:
+        return ErrorResponse(code=HTTPStatus.NOT_FOUND, message=str(e)).to_response()
+
+
 @router.delete(
     "/<uuid:project_id>/members/<uuid:user_id>",
     description="Permet de supprimer un membre d'un projet.",
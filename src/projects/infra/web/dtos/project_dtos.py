@@ -3,9 +3,11 @@ from http import HTTPStatus
 from uuid import UUID
 
 from flask import Response, jsonify, make_response
+from flask_openapi3 import FileStorage  # type: ignore[attr-defined]
 from pydantic import BaseModel, Field
 
 from projects.domain.entities.project_entity import ProjectMemberRole
+from projects.domain.entities.project_import_entity import ProjectImportReportEntity
 from projects.domain.settings.project_settings import (
     ProjectMemberSettings,
     ProjectSettings,
@@ -36,6 +38,12 @@ class ProjectCreateRequest(BaseModel):
         max_length=ProjectSettings.description_max_length,
         description=ProjectSettings.description_description,
     )
+    site_pressure: float | None = Field(
+        default=None,
+        ge=ProjectSettings.site_pressure_ge,
+        le=ProjectSettings.site_pressure_le,
+        description=ProjectSettings.site_pressure_description,
+    )
 
 
 class ProjectUpdateRequest(BaseModel):
@@ -60,6 +68,12 @@ class ProjectUpdateRequest(BaseModel):
         max_length=ProjectSettings.description_max_length,
         description=ProjectSettings.description_description,
     )
+    site_pressure: float | None = Field(
+        default=None,
+        ge=ProjectSettings.site_pressure_ge,
+        le=ProjectSettings.site_pressure_le,
+        description=ProjectSettings.site_pressure_description,
+    )
 
 
 class ProjectPath(BaseModel):
@@ -82,8 +96,12 @@ class GetAllProjectsQueryParams(BaseModel):
     limit: int = Field(
         default=ProjectSettings.limit_default,
         gt=ProjectSettings.limit_gt,
+        le=ProjectSettings.limit_le,
         description=ProjectSettings.limit_description,
     )
+    cursor: str | None = Field(
+        default=None, description=ProjectSettings.cursor_description
+    )
 
 
 class ProjectAddMemberRequest(BaseModel):
@@ -110,6 +128,100 @@ class ProjectMemberPath(BaseModel):
     user_id: UUID = Field(..., description=ProjectMemberSettings.user_id_description)
 
 
+class ProjectMemberChangeRequest(BaseModel):
+    """Schéma de validation d'un membre ajouté ou dont le rôle change
+
+    Args:
+        BaseModel (BaseModel): Schéma de validation d'un membre ajouté ou dont le rôle change
+    """
+
+    user_id: UUID = Field(..., description=ProjectMemberSettings.user_id_description)
+    role: ProjectMemberRole = Field(
+        default=ProjectMemberRole.MEMBER,
+        description=ProjectMemberSettings.role_description,
+    )
+
+
+class ProjectMembersBatchRequest(BaseModel):
+    """Schéma de validation pour modifier en lot les membres d'un projet
+
+    Args:
+        BaseModel (BaseModel): Schéma de validation pour modifier en lot les membres d'un projet
+    """
+
+    add: list[ProjectMemberChangeRequest] = Field(
+        default_factory=list,
+        max_length=ProjectMemberSettings.batch_max_items,
+        description=ProjectMemberSettings.batch_add_description,
+    )
+    remove: list[UUID] = Field(
+        default_factory=list,
+        max_length=ProjectMemberSettings.batch_max_items,
+        description=ProjectMemberSettings.batch_remove_description,
+    )
+    change_role: list[ProjectMemberChangeRequest] = Field(
+        default_factory=list,
+        max_length=ProjectMemberSettings.batch_max_items,
+        description=ProjectMemberSettings.batch_change_role_description,
+    )
+
+
+class ProjectImportMemberRequest(BaseModel):
+    """Schéma d'un membre d'un projet importé
+
+    Args:
+        BaseModel (BaseModel): Schéma d'un membre d'un projet importé
+    """
+
+    email: str = Field(..., description=ProjectMemberSettings.email_description)
+    role: str = Field(
+        default=ProjectMemberRole.MEMBER.value,
+        description=ProjectMemberSettings.role_description,
+    )
+
+
+class ProjectImportRowRequest(BaseModel):
+    """Schéma d'un projet importé, validé ligne par ligne
+
+    Args:
+        BaseModel (BaseModel): Schéma d'un projet importé
+    """
+
+    project_number: str = Field(
+        ..., description=ProjectSettings.project_number_description
+    )
+    name: str = Field(..., description=ProjectSettings.name_description)
+    description: str = Field(..., description=ProjectSettings.description_description)
+    site_pressure: float | None = Field(
+        default=None, description=ProjectSettings.site_pressure_description
+    )
+    members: list[ProjectImportMemberRequest] = Field(
+        default_factory=list, description=ProjectSettings.import_members_description
+    )
+
+
+class ProjectImportRequest(BaseModel):
+    """Schéma de validation pour importer des projets en JSON
+
+    Args:
+        BaseModel (BaseModel): Schéma de validation pour importer des projets
+    """
+
+    projects: list[ProjectImportRowRequest] = Field(
+        ..., description=ProjectSettings.import_projects_description
+    )
+
+
+class ProjectImportFileRequest(BaseModel):
+    """Schéma de validation pour importer des projets depuis un fichier CSV
+
+    Args:
+        BaseModel (BaseModel): Schéma de validation pour importer des projets
+    """
+
+    file: FileStorage = Field(..., description=ProjectSettings.import_file_description)
+
+
 # === responses ===
 
 
@@ -129,6 +241,9 @@ class GetProjectResponse(BaseModel):
     )
     name: str = Field(..., description=ProjectSettings.name_description)
     description: str = Field(..., description=ProjectSettings.description_description)
+    site_pressure: float | None = Field(
+        ..., description=ProjectSettings.site_pressure_description
+    )
     created_at: datetime = Field(
         ..., description=ProjectSettings.created_at_description
     )
@@ -153,6 +268,9 @@ class GetAllProjectsResponse(BaseModel):
     projects: list[GetProjectResponse] = Field(
         ..., description=ProjectSettings.projects_description
     )
+    next_cursor: str | None = Field(
+        default=None, description=ProjectSettings.next_cursor_description
+    )
 
     def to_response(self) -> Response:
         return make_response(jsonify(self.model_dump()), HTTPStatus.OK)
@@ -192,3 +310,48 @@ class GetProjectMembersResponse(BaseModel):
 
     def to_response(self) -> Response:
         return make_response(jsonify(self.model_dump()), HTTPStatus.OK)
+
+
+class ProjectImportErrorResponse(BaseModel):
+    """Schéma de validation d'une erreur de ligne d'un import
+
+    Args:
+        BaseModel (BaseModel): Schéma de validation d'une erreur de ligne
+    """
+
+    index: int = Field(..., description=ProjectSettings.import_index_description)
+    field: str = Field(..., description=ProjectSettings.import_field_description)
+    message: str = Field(..., description=ProjectSettings.import_message_description)
+
+
+class ProjectImportResponse(BaseModel):
+    """Schéma de validation de la réponse d'un import de projets
+
+    Args:
+        BaseModel (BaseModel): Schéma de validation de la réponse d'un import
+
+    Returns:
+        dict: Nombre de projets lus et créés, erreurs par ligne
+    """
+
+    total: int = Field(..., description=ProjectSettings.import_total_description)
+    created: int = Field(..., description=ProjectSettings.import_created_description)
+    errors: list[ProjectImportErrorResponse] = Field(
+        ..., description=ProjectSettings.import_errors_description
+    )
+
+    @classmethod
+    def from_use_case_result(
+        cls, report: ProjectImportReportEntity
+    ) -> "ProjectImportResponse":
+        return cls(
+            total=report.total,
+            created=len(report.created),
+            errors=[
+                ProjectImportErrorResponse.model_validate(error.model_dump())
+                for error in report.errors
+            ],
+        )
+
+    def to_response(self) -> Response:
+        return make_response(jsonify(self.model_dump()), HTTPStatus.OK)
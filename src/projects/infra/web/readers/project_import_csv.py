@@ -0,0 +1,69 @@
+import csv
+from collections.abc import Iterable
+
+from projects.app.schemas.project_schema import (
+    ProjectImportMemberSchema,
+    ProjectImportRowSchema,
+)
+from projects.domain.entities.project_entity import ProjectMemberRole
+from projects.domain.settings.project_settings import ProjectSettings
+
+PROJECT_IMPORT_REQUIRED_COLUMNS = ("project_number", "name", "description")
+
+
+def _read_members(cell: str) -> list[ProjectImportMemberSchema]:
+    """Lit les membres d'une cellule 'email[:ROLE];email[:ROLE]'"""
+    members: list[ProjectImportMemberSchema] = []
+    for item in cell.split(";"):
+        email, separator, role = item.strip().rpartition(":")
+        if not separator:
+            email, role = role, ""
+        if email:
+            members.append(
+                ProjectImportMemberSchema(
+                    email=email,
+                    role=role.strip().upper() or ProjectMemberRole.MEMBER.value,
+                )
+            )
+    return members
+
+
+def read_project_import_csv(lines: Iterable[str]) -> list[ProjectImportRowSchema]:
+    """Lit un CSV d'import de projets, une ligne par projet
+
+    Les cellules sont transmises telles quelles au cas d'utilisation, qui les
+    valide ligne par ligne. Une cellule site_pressure vide vaut None.
+
+    Args:
+        lines (Iterable[str]): Lignes du fichier CSV, en-tête compris
+
+    Raises:
+        ValueError: Une colonne obligatoire manque dans l'en-tête
+
+    Returns:
+        list[ProjectImportRowSchema]: Lignes à importer
+    """
+    reader = csv.DictReader(lines)
+    columns = [name.strip() for name in reader.fieldnames or []]
+    missing = [name for name in PROJECT_IMPORT_REQUIRED_COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(
+            ProjectSettings.import_missing_columns_message.format(
+                columns=", ".join(missing)
+            )
+        )
+    reader.fieldnames = columns
+
+    rows: list[ProjectImportRowSchema] = []
+    for record in reader:
+        site_pressure = (record.get("site_pressure") or "").strip()
+        rows.append(
+            ProjectImportRowSchema(
+                project_number=(record["project_number"] or "").strip(),
+                name=(record["name"] or "").strip(),
+                description=(record["description"] or "").strip(),
+                site_pressure=site_pressure or None,
+                members=_read_members(record.get("members") or ""),
+            )
+        )
+    return rows
@@ -1,3 +1,5 @@
+from uuid import uuid4
+
 from common.tests.repositories.test_base_repo import TestBaseRepository
 from projects.domain.entities.project_entity import ProjectEntity
 from projects.domain.exceptions.project_exceptions import ProjectDBException
@@ -59,6 +61,26 @@ class TestCreateProjectSQLRepository(TestBaseRepository):
         self.assertEqual(test_project.name, created_project.name)
         self.assertEqual(test_project.description, created_project.description)
 
+    def test_create_project_with_site_pressure(self) -> None:
+        """Test de la création d'un projet avec une pression de site
+
+        Returns:
+            None
+        """
+        test_project = ProjectEntity(
+            project_number="PRJ-P01",
+            name="Test Project Site Pressure",
+            description="A test project with a site pressure",
+            site_pressure=84556,
+        )
+
+        self.project_repository.create_project(
+            schema=test_project, creator_id=self.user.id
+        )
+
+        project = self.project_repository.get_project_by_id(test_project.id)
+        self.assertEqual(project.site_pressure, 84556)
+
     def test_create_project_duplicate_project_number_raises_exception(self) -> None:
         """Test de la création d'un projet avec un numéro de projet déjà utilisé
 
@@ -114,3 +136,73 @@ class TestCreateProjectSQLRepository(TestBaseRepository):
             self.project_repository.create_project(
                 schema=duplicate_project, creator_id=self.user.id
             )
+
+    def test_create_project_nonexistent_creator_raises_exception(self) -> None:
+        """Test de la création d'un projet par un utilisateur inexistant
+
+        Returns:
+            None
+        """
+        creator_id = uuid4()
+
+        with self.assertRaises(ProjectDBException) as context:
+            self.project_repository.create_project(
+                schema=self.valid_project, creator_id=creator_id
+            )
+
+        self.assertIn(f"L'utilisateur avec l'id '{creator_id}'", str(context.exception))
+
+    def test_create_project_checks_name_before_number(self) -> None:
+        """Test de l'ordre des vérifications quand le nom et le numéro sont pris
+
+        Returns:
+            None
+        """
+        self.project_repository.create_project(
+            schema=self.valid_project, creator_id=self.user.id
+        )
+        duplicate_project = ProjectEntity(
+            project_number=self.valid_project.project_number,
+            name=self.valid_project.name,
+            description="A different project",
+        )
+
+        with self.assertRaises(ProjectDBException) as context:
+            self.project_repository.create_project(
+                schema=duplicate_project, creator_id=uuid4()
+            )
+
+        self.assertIn("Un projet avec le nom", str(context.exception))
+
+    def test_create_project_with_foreign_keys(self) -> None:
+        """Test de la création d'un projet avec les clés étrangères vérifiées
+
+        Le projet doit être inséré avant le lien qui le référence, comme sous
+        PostgreSQL.
+
+        Returns:
+            None
+        """
+        with self.foreign_keys():
+            created_project = self.project_repository.create_project(
+                schema=self.valid_project, creator_id=self.user.id
+            )
+
+        self.assertEqual(self.valid_project.id, created_project.id)
+        members = self.project_repository.get_project_members(created_project.id)
+        self.assertEqual([self.user.id], [member.id for member in members])
+
+    def test_create_project_query_count(self) -> None:
+        """Test du nombre de requêtes de la création d'un projet
+
+        Returns:
+            None
+        """
+        with self.count_queries() as statements:
+            created_project = self.project_repository.create_project(
+                schema=self.valid_project, creator_id=self.user.id
+            )
+
+        # Vérifications avec lecture du créateur, insertion du projet et du membre
+        self.assertQueryCount(3, statements)
+        self.assertEqual(1, len(created_project.members))
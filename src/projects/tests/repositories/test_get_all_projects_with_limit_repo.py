@@ -1,5 +1,9 @@
 from common.tests.repositories.test_base_repo import TestBaseRepository
-from projects.domain.entities.project_entity import ProjectEntity
+from projects.domain.entities.project_entity import ProjectEntity, ProjectMemberRole
+from projects.infra.data.models.project_sqlmodel import (
+    ProjectAndUserJonctionTableSQLModel,
+    ProjectSQLModel,
+)
 from projects.infra.data.repositories.project_sqlrepo import ProjectSQLRepository
 from users.domain.entities.user_entity import UserEntity
 from users.infra.data.repositories.user_sqlrepo import UserSQLRepository
@@ -61,6 +65,29 @@ class TestGetAllProjectsWithLimitSQLRepository(TestBaseRepository):
         # Vérifier que tous les projets sont récupérés
         self.assertEqual(5, len(all_projects))
 
+    def test_get_all_projects_with_limit_after(self) -> None:
+        """Test de la reprise après un projet (pagination par clé)
+
+        Returns:
+            None
+        """
+        # Parcourir les projets deux par deux
+        pages = []
+        after = None
+        while True:
+            page = self.project_repository.get_all_projects_with_limit(2, after)
+            if not page:
+                break
+            pages.append(page)
+            after = (page[-1].name, page[-1].id)
+
+        # Vérifier que les pages couvrent tous les projets dans l'ordre, sans doublon
+        self.assertEqual([2, 2, 1], [len(page) for page in pages])
+        self.assertEqual(
+            [project.name for project in self.projects],
+            [project.name for page in pages for project in page],
+        )
+
     def test_get_all_projects_with_limit_zero(self) -> None:
         """Test de la récupération de tous les projets avec une limite de zéro
 
@@ -88,3 +115,38 @@ class TestGetAllProjectsWithLimitSQLRepository(TestBaseRepository):
 
         # Vérifier qu'aucun projet n'est récupéré
         self.assertEqual(0, len(projects))
+
+    def test_get_all_projects_with_limit_constant_query_count(self) -> None:
+        """Test du nombre de requêtes indépendant du nombre de projets récupérés
+
+        Returns:
+            None
+        """
+        # Ajouter directement 495 projets dont l'utilisateur est membre
+        for i in range(5, 500):
+            project = ProjectEntity(
+                project_number=f"PRJ-{i + 1:03d}",
+                name=f"Test Project {i + 1}",
+                description=f"A test project {i + 1}",
+            )
+            self.session.add(ProjectSQLModel(**project.model_dump(exclude={"members"})))
+            self.session.add(
+                ProjectAndUserJonctionTableSQLModel(
+                    project_id=project.id,
+                    user_id=self.user.id,
+                    role=ProjectMemberRole.ADMIN.value,
+                )
+            )
+        self.session.commit()
+
+        with self.count_queries() as few_statements:
+            few_projects = self.project_repository.get_all_projects_with_limit(5)
+        with self.count_queries() as statements:
+            projects = self.project_repository.get_all_projects_with_limit(500)
+
+        # Projets puis membres de tous les projets, quelle que soit la limite
+        self.assertEqual(500, len(projects))
+        self.assertTrue(all(len(project.members) == 1 for project in projects))
+        self.assertEqual(5, len(few_projects))
+        self.assertQueryCount(2, few_statements)
+        self.assertQueryCount(2, statements)
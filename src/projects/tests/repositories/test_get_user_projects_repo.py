@@ -2,6 +2,10 @@ from uuid import UUID, uuid4
 
 from common.tests.repositories.test_base_repo import TestBaseRepository
 from projects.domain.entities.project_entity import ProjectEntity, ProjectMemberRole
+from projects.infra.data.models.project_sqlmodel import (
+    ProjectAndUserJonctionTableSQLModel,
+    ProjectSQLModel,
+)
 from projects.infra.data.repositories.project_sqlrepo import ProjectSQLRepository
 from users.domain.entities.user_entity import UserEntity
 from users.infra.data.repositories.user_sqlrepo import UserSQLRepository
@@ -124,3 +128,34 @@ class TestGetUserProjectsSQLRepository(TestBaseRepository):
 
         # Vérifier que la liste est vide
         self.assertEqual(0, len(projects))
+
+    def test_get_user_projects_constant_query_count(self) -> None:
+        """Test du nombre de requêtes indépendant du nombre de projets de l'utilisateur
+
+        Returns:
+            None
+        """
+        # Ajouter directement 100 projets partagés par user1 et user2
+        for i in range(3, 103):
+            project = ProjectEntity(
+                project_number=f"PRJ-{i + 1:03d}",
+                name=f"Test Project {i + 1}",
+                description=f"A test project {i + 1}",
+            )
+            self.session.add(ProjectSQLModel(**project.model_dump(exclude={"members"})))
+            for user_id in (self.user1.id, self.user2.id):
+                self.session.add(
+                    ProjectAndUserJonctionTableSQLModel(
+                        project_id=project.id,
+                        user_id=user_id,
+                        role=ProjectMemberRole.MEMBER.value,
+                    )
+                )
+        self.session.commit()
+
+        with self.count_queries() as statements:
+            user1_projects = self.project_repository.get_user_projects(self.user1.id)
+
+        # Projets de l'utilisateur puis membres de tous ces projets
+        self.assertEqual(102, len(user1_projects))
+        self.assertQueryCount(2, statements)
@@ -0,0 +1,158 @@
+from uuid import uuid4
+
+from sqlmodel import select
+
+from common.tests.repositories.test_base_repo import TestBaseRepository
+from projects.domain.entities.project_entity import ProjectEntity, ProjectMemberRole
+from projects.domain.entities.project_import_entity import (
+    ProjectImportMemberEntity,
+    ProjectImportRowEntity,
+)
+from projects.domain.exceptions.project_exceptions import ProjectDBException
+from projects.infra.data.models.project_sqlmodel import (
+    ProjectAndUserJonctionTableSQLModel,
+)
+from projects.infra.data.repositories.project_sqlrepo import ProjectSQLRepository
+from users.domain.entities.user_entity import UserEntity
+from users.infra.data.repositories.user_sqlrepo import UserSQLRepository
+
+
+class TestImportProjectsSQLRepository(TestBaseRepository):
+    """Test de l'import d'une tranche de projets
+
+    Args:
+        BaseRepositoryTest (BaseRepositoryTest): Testeur de base pour les tests des répositories
+    """
+
+    def setUp(self) -> None:
+        """Initialise le testeur d'import de projets
+
+        Returns:
+            None
+        """
+        super().setUp()
+        self.project_repository = ProjectSQLRepository(unit_of_work=self.uow)
+        self.user_repository = UserSQLRepository(
+            unit_of_work=self.uow, password_hasher=self.password_hasher
+        )
+        self.owner = self.user_repository.sign_up_user(
+            UserEntity(email="owner@example.com", password="Password_1234!")
+        )
+        self.member = self.user_repository.sign_up_user(
+            UserEntity(email="member@example.com", password="Password_1234!")
+        )
+
+    def _row(
+        self, index: int, members: list[ProjectImportMemberEntity] | None = None
+    ) -> ProjectImportRowEntity:
+        return ProjectImportRowEntity(
+            index=index,
+            project=ProjectEntity(
+                project_number=f"PRJ-{index:03d}",
+                name=f"Projet {index}",
+                description="Projet importé",
+            ),
+            members=members or [],
+        )
+
+    def test_import_projects_success(self) -> None:
+        """Test de l'import de projets avec leurs membres
+
+        Returns:
+            None
+        """
+        rows = [
+            self._row(
+                0,
+                [
+                    ProjectImportMemberEntity(
+                        email="member@example.com", role=ProjectMemberRole.ADMIN
+                    ),
+                    # Le créateur reste ADMIN
+                    ProjectImportMemberEntity(email="owner@example.com"),
+                ],
+            ),
+            self._row(1),
+        ]
+
+        errors = self.project_repository.import_projects(rows, self.owner.id)
+
+        self.assertEqual([], errors)
+        links = self.session.exec(select(ProjectAndUserJonctionTableSQLModel)).all()
+        self.assertEqual(
+            {
+                (rows[0].project.id, self.owner.id, "ADMIN"),
+                (rows[0].project.id, self.member.id, "ADMIN"),
+                (rows[1].project.id, self.owner.id, "ADMIN"),
+            },
+            {(link.project_id, link.user_id, link.role) for link in links},
+        )
+
+    def test_import_projects_reports_existing_and_unknown(self) -> None:
+        """Test des erreurs de nom existant et de membre inconnu
+
+        Returns:
+            None
+        """
+        existing = self._row(0)
+        self.project_repository.import_projects([existing], self.owner.id)
+        rows = [
+            self._row(0),
+            self._row(1, [ProjectImportMemberEntity(email="unknown@example.com")]),
+            self._row(2),
+        ]
+
+        errors = self.project_repository.import_projects(rows, self.owner.id)
+
+        self.assertEqual(
+            [(0, "name"), (0, "project_number"), (1, "members.0.email")],
+            [(error.index, error.field) for error in errors],
+        )
+        projects = self.project_repository.get_all_projects_with_limit(10)
+        self.assertEqual(["Projet 0", "Projet 2"], [p.name for p in projects])
+
+    def test_import_projects_isolates_conflicting_rows(self) -> None:
+        """Test du rejeu ligne par ligne quand l'insertion par lots échoue
+
+        Returns:
+            None
+        """
+        first = self._row(0)
+        # Même identifiant que le premier projet : conflit à l'insertion seulement
+        second = self._row(1)
+        second.project.id = first.project.id
+        rows = [first, second, self._row(2)]
+
+        errors = self.project_repository.import_projects(rows, self.owner.id)
+
+        self.assertEqual([(1, "project")], [(e.index, e.field) for e in errors])
+        projects = self.project_repository.get_all_projects_with_limit(10)
+        self.assertEqual(["Projet 0", "Projet 2"], [p.name for p in projects])
+
+    def test_import_projects_query_count(self) -> None:
+        """Test du nombre de requêtes indépendant du nombre de projets
+
+        Returns:
+            None
+        """
+        rows = [
+            self._row(index, [ProjectImportMemberEntity(email="member@example.com")])
+            for index in range(200)
+        ]
+
+        with self.count_queries() as statements:
+            errors = self.project_repository.import_projects(rows, self.owner.id)
+
+        # Créateur, noms, numéros, emails, puis deux INSERT par lots encadrés
+        # par SAVEPOINT et RELEASE
+        self.assertEqual([], errors)
+        self.assertQueryCount(8, statements)
+
+    def test_import_projects_nonexistent_creator(self) -> None:
+        """Test de l'import par un créateur inexistant
+
+        Returns:
+            None
+        """
+        with self.assertRaises(ProjectDBException):
+            self.project_repository.import_projects([self._row(0)], uuid4())
@@ -0,0 +1,200 @@
+from uuid import UUID, uuid4
+
+from sqlmodel import select
+
+from common.tests.repositories.test_base_repo import TestBaseRepository
+from projects.domain.entities.project_entity import ProjectEntity, ProjectMemberRole
+from projects.domain.entities.project_members_batch_entity import (
+    ProjectMemberChangeEntity,
+    ProjectMembersBatchEntity,
+)
+from projects.domain.exceptions.project_exceptions import (
+    ProjectDBException,
+    ProjectMembersBatchException,
+)
+from projects.infra.data.models.project_sqlmodel import (
+    ProjectAndUserJonctionTableSQLModel,
+)
+from projects.infra.data.repositories.project_sqlrepo import ProjectSQLRepository
+from users.domain.entities.user_entity import UserEntity
+from users.infra.data.models.user_sqlmodel import UserSQLModel
+from users.infra.data.repositories.user_sqlrepo import UserSQLRepository
+
+
+class TestUpdateProjectMembersSQLRepository(TestBaseRepository):
+    """Test de la modification en lot des membres d'un projet
+
+    Args:
+        BaseRepositoryTest (BaseRepositoryTest): Testeur de base pour les tests des répositories
+    """
+
+    def setUp(self) -> None:
+        """Initialise le testeur de modification en lot des membres d'un projet
+
+        Returns:
+            None
+        """
+        super().setUp()
+        self.project_repository = ProjectSQLRepository(unit_of_work=self.uow)
+        self.user_repository = UserSQLRepository(
+            unit_of_work=self.uow, password_hasher=self.password_hasher
+        )
+
+        # Créer le propriétaire et cinquante utilisateurs à ajouter
+        self.owner = self.user_repository.sign_up_user(
+            UserEntity(email="owner@example.com", password="Password_1234!")
+        )
+        self.users = [
+            UserEntity(email=f"user{index:02d}@example.com", password="Password_1234!")
+            for index in range(50)
+        ]
+        for user in self.users:
+            self.session.add(UserSQLModel(**user.model_dump(exclude={"projects"})))
+        self.session.commit()
+        self.project = self.project_repository.create_project(
+            schema=ProjectEntity(
+                project_number="PRJ-001",
+                name="Test Project",
+                description="A test project",
+            ),
+            creator_id=self.owner.id,
+        )
+
+    def _roles(self) -> dict[UUID, str]:
+        with self.uow as uow:
+            links = uow.session.exec(
+                select(ProjectAndUserJonctionTableSQLModel).where(
+                    ProjectAndUserJonctionTableSQLModel.project_id == self.project.id
+                )
+            ).all()
+            return {link.user_id: link.role for link in links}
+
+    def test_update_project_members_success(self) -> None:
+        """Test de l'ajout, du retrait et du changement de rôle en un appel
+
+        Returns:
+            None
+        """
+        self.project_repository.update_project_members(
+            ProjectMembersBatchEntity(
+                project_id=self.project.id,
+                add=[
+                    ProjectMemberChangeEntity(user_id=self.users[0].id),
+                    ProjectMemberChangeEntity(
+                        user_id=self.users[1].id, role=ProjectMemberRole.ADMIN
+                    ),
+                    ProjectMemberChangeEntity(user_id=self.users[2].id),
+                ],
+            )
+        )
+
+        self.project_repository.update_project_members(
+            ProjectMembersBatchEntity(
+                project_id=self.project.id,
+                add=[ProjectMemberChangeEntity(user_id=self.users[3].id)],
+                remove=[self.users[0].id],
+                change_role=[
+                    ProjectMemberChangeEntity(
+                        user_id=self.users[1].id, role=ProjectMemberRole.MEMBER
+                    ),
+                    ProjectMemberChangeEntity(
+                        user_id=self.users[2].id, role=ProjectMemberRole.ADMIN
+                    ),
+                ],
+            )
+        )
+
+        self.assertEqual(
+            {
+                self.owner.id: "ADMIN",
+                self.users[1].id: "MEMBER",
+                self.users[2].id: "ADMIN",
+                self.users[3].id: "MEMBER",
+            },
+            self._roles(),
+        )
+
+    def test_update_project_members_rejects_whole_batch(self) -> None:
+        """Test du refus de tout le lot si une modification est invalide
+
+        Returns:
+            None
+        """
+        unknown_id = uuid4()
+        with self.assertRaises(ProjectMembersBatchException) as context:
+            self.project_repository.update_project_members(
+                ProjectMembersBatchEntity(
+                    project_id=self.project.id,
+                    add=[
+                        ProjectMemberChangeEntity(user_id=self.users[0].id),
+                        ProjectMemberChangeEntity(user_id=unknown_id),
+                        ProjectMemberChangeEntity(user_id=self.owner.id),
+                    ],
+                    remove=[self.users[1].id],
+                    change_role=[ProjectMemberChangeEntity(user_id=self.users[2].id)],
+                )
+            )
+
+        self.assertEqual(
+            ["add.1.user_id", "add.2.user_id", "remove.0", "change_role.0.user_id"],
+            [error["field"] for error in context.exception.errors],
+        )
+        self.assertIn(str(unknown_id), context.exception.errors[0]["message"])
+        self.assertEqual({self.owner.id: "ADMIN"}, self._roles())
+
+    def test_update_project_members_nonexistent_project(self) -> None:
+        """Test de la modification des membres d'un projet inexistant
+
+        Returns:
+            None
+        """
+        wrong_id = uuid4()
+        with self.assertRaises(ProjectDBException) as context:
+            self.project_repository.update_project_members(
+                ProjectMembersBatchEntity(project_id=wrong_id, remove=[self.owner.id])
+            )
+        self.assertEqual(
+            f"Le projet avec l'id '{wrong_id}' n'existe pas.", context.exception.message
+        )
+
+    def test_update_project_members_query_count(self) -> None:
+        """Test du nombre de requêtes pour intégrer une équipe de cinquante personnes
+
+        Returns:
+            None
+        """
+        with self.count_queries() as statements:
+            self.project_repository.update_project_members(
+                ProjectMembersBatchEntity(
+                    project_id=self.project.id,
+                    add=[
+                        ProjectMemberChangeEntity(user_id=user.id)
+                        for user in self.users
+                    ],
+                )
+            )
+
+        # Projet, utilisateurs, membres actuels, puis un INSERT par lot
+        self.assertQueryCount(4, statements)
+        self.assertEqual(51, len(self._roles()))
+
+        with self.count_queries() as statements:
+            self.project_repository.update_project_members(
+                ProjectMembersBatchEntity(
+                    project_id=self.project.id,
+                    remove=[user.id for user in self.users[:25]],
+                    change_role=[
+                        ProjectMemberChangeEntity(
+                            user_id=user.id,
+                            role=ProjectMemberRole.ADMIN
+                            if index % 2
+                            else ProjectMemberRole.MEMBER,
+                        )
+                        for index, user in enumerate(self.users[25:])
+                    ],
+                )
+            )
+
+        # Projet, membres actuels, un DELETE et un UPDATE par rôle cible
+        self.assertQueryCount(5, statements)
+        self.assertEqual(26, len(self._roles()))
@@ -193,3 +193,42 @@ class TestUpdateProjectSQLRepository(TestBaseRepository):
         self.assertEqual(same_values_project.project_number, result.project_number)
         self.assertEqual(same_values_project.name, result.name)
         self.assertEqual(same_values_project.description, result.description)
+
+    def test_update_project_duplicate_name_message(self) -> None:
+        """Test du message d'erreur quand le nom est utilisé par un autre projet
+
+        Returns:
+            None
+        """
+        updated_project = ProjectEntity(
+            id=self.second_project.id,
+            project_number=self.second_project.project_number,
+            name=self.project.name,  # Nom déjà utilisé par le premier projet
+            description="Updated description",
+        )
+
+        with self.assertRaises(ProjectDBException) as context:
+            self.project_repository.update_project(updated_project)
+
+        self.assertIn(
+            f"Un projet avec le nom '{self.project.name}'", str(context.exception)
+        )
+
+    def test_update_project_query_count(self) -> None:
+        """Test du nombre de requêtes de la mise à jour d'un projet
+
+        Returns:
+            None
+        """
+        updated_project = ProjectEntity(
+            id=self.project.id,
+            project_number="PRJ-003",
+            name="Renamed Project",
+            description="Updated description",
+        )
+
+        with self.count_queries() as statements:
+            self.project_repository.update_project(updated_project)
+
+        # Lecture, vérifications, mise à jour, lecture des membres
+        self.assertQueryCount(4, statements)
@@ -0,0 +1,151 @@
+import io
+from http import HTTPStatus
+
+from sqlalchemy import text
+
+from common.tests.routes.test_base_api import TestBaseAPI
+
+
+class TestImportProjectsRoute(TestBaseAPI):
+    """Test de l'import de projets en masse
+
+    Args:
+        BaseAPITest (BaseAPITest): Testeur de base pour les tests des routes
+    """
+
+    def setUp(self) -> None:
+        """Initialise le testeur d'import de projets
+
+        Returns:
+            None
+        """
+        super().setUp()
+        # Créer un administrateur et un membre
+        self.admin_data = {"email": "admin@example.com", "password": "SecurePass123!"}
+        self.client.post("/v1/auth/sign_up", json=self.admin_data)
+        self.session.execute(
+            text("UPDATE users SET role='ADMIN' WHERE email='admin@example.com'")
+        )
+        self.session.commit()
+        self.member_data = {"email": "member@example.com", "password": "SecurePass123!"}
+        self.client.post("/v1/auth/sign_up", json=self.member_data)
+
+        login_response = self.client.post("/v1/auth/login", json=self.admin_data)
+        self.headers = {
+            "Authorization": f"Bearer {login_response.get_json()['access_token']}"
+        }
+
+    def test_import_projects_json_reports_row_errors(self) -> None:
+        """Test de l'import JSON avec une ligne invalide
+
+        Returns:
+            None
+        """
+        response = self.client.post(
+            "/v1/projects/import_projects",
+            json={
+                "projects": [
+                    {
+                        "project_number": "PRJ-001",
+                        "name": "Projet 1",
+                        "description": "Premier projet",
+                        "site_pressure": 95000,
+                        "members": [{"email": "member@example.com"}],
+                    },
+                    {
+                        "project_number": "PRJ-002",
+                        "name": "Projet 2",
+                        "description": "Membre inconnu",
+                        "members": [{"email": "unknown@example.com", "role": "ADMIN"}],
+                    },
+                ]
+            },
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        report = response.get_json()
+        self.assertEqual(2, report["total"])
+        self.assertEqual(1, report["created"])
+        self.assertEqual(
+            [{"index": 1, "field": "members.0.email"}],
+            [
+                {"index": error["index"], "field": error["field"]}
+                for error in report["errors"]
+            ],
+        )
+
+        # Vérifier le projet créé et ses membres
+        projects = self.client.get(
+            "/v1/projects/get_all_projects", headers=self.headers
+        ).get_json()["projects"]
+        self.assertEqual(["Projet 1"], [project["name"] for project in projects])
+        members = self.client.get(
+            f"/v1/projects/{projects[0]['id']}/members", headers=self.headers
+        ).get_json()["members"]
+        self.assertEqual(
+            {"admin@example.com", "member@example.com"},
+            {member["email"] for member in members},
+        )
+
+    def test_import_projects_csv(self) -> None:
+        """Test de l'import d'un fichier CSV
+
+        Returns:
+            None
+        """
+        content = (
+            "project_number,name,description,site_pressure,members\n"
+            "PRJ-001,Projet 1,Premier projet,,member@example.com:admin\n"
+            "PRJ-002,Projet 2,Pression invalide,abc,\n"
+            "PRJ-003,Projet 1,Nom en double,,\n"
+        )
+
+        response = self.client.post(
+            "/v1/projects/import_projects_csv",
+            data={"file": (io.BytesIO(content.encode()), "projects.csv")},
+            content_type="multipart/form-data",
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        report = response.get_json()
+        self.assertEqual(3, report["total"])
+        self.assertEqual(1, report["created"])
+        self.assertEqual(
+            [(1, "site_pressure"), (2, "name")],
+            [(error["index"], error["field"]) for error in report["errors"]],
+        )
+
+    def test_import_projects_csv_missing_columns(self) -> None:
+        """Test de l'import d'un fichier CSV sans colonne obligatoire
+
+        Returns:
+            None
+        """
+        response = self.client.post(
+            "/v1/projects/import_projects_csv",
+            data={"file": (io.BytesIO(b"name\nProjet 1\n"), "projects.csv")},
+            content_type="multipart/form-data",
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+        self.assertIn("project_number, description", response.get_json()["message"])
+
+    def test_import_projects_requires_admin(self) -> None:
+        """Test de l'import par un utilisateur non administrateur
+
+        Returns:
+            None
+        """
+        login_response = self.client.post("/v1/auth/login", json=self.member_data)
+        token = login_response.get_json()["access_token"]
+
+        response = self.client.post(
+            "/v1/projects/import_projects",
+            json={"projects": []},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
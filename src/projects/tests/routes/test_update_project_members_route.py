@@ -0,0 +1,133 @@
+from http import HTTPStatus
+from uuid import uuid4
+
+from sqlmodel import col, select
+
+from common.tests.routes.test_base_api import TestBaseAPI
+from projects.infra.data.models.project_sqlmodel import ProjectSQLModel
+from users.infra.data.models.user_sqlmodel import UserSQLModel
+
+
+class TestUpdateProjectMembersRoute(TestBaseAPI):
+    """Test de la modification en lot des membres d'un projet
+
+    Args:
+        BaseAPITest (BaseAPITest): Testeur de base pour les tests des routes
+    """
+
+    def setUp(self) -> None:
+        """Initialise le testeur de modification en lot des membres d'un projet
+
+        Returns:
+            None
+        """
+        super().setUp()
+        owner_data = {"email": "owner@example.com", "password": "SecurePass123!"}
+        self.client.post("/v1/auth/sign_up", json=owner_data)
+        for index in range(3):
+            self.client.post(
+                "/v1/auth/sign_up",
+                json={
+                    "email": f"user{index}@example.com",
+                    "password": "SecurePass123!",
+                },
+            )
+        self.user_ids = [
+            str(user_id)
+            for user_id in self.session.exec(
+                select(UserSQLModel.id)
+                .where(UserSQLModel.email != owner_data["email"])
+                .order_by(col(UserSQLModel.email))
+            ).all()
+        ]
+
+        login_response = self.client.post("/v1/auth/login", json=owner_data)
+        self.headers = {
+            "Authorization": f"Bearer {login_response.get_json()['access_token']}"
+        }
+        self.client.post(
+            "/v1/projects/create_project",
+            json={
+                "project_number": "PRJ-001",
+                "name": "Test Project",
+                "description": "A test project",
+            },
+            headers=self.headers,
+        )
+        self.project_id = self.session.exec(select(ProjectSQLModel.id)).one()
+
+    def _member_emails(self) -> list[str]:
+        members = self.client.get(
+            f"/v1/projects/{self.project_id}/members", headers=self.headers
+        ).get_json()["members"]
+        return sorted(member["email"] for member in members)
+
+    def test_update_project_members_success(self) -> None:
+        """Test de l'ajout puis du retrait de membres en lot
+
+        Returns:
+            None
+        """
+        response = self.client.patch(
+            f"/v1/projects/{self.project_id}/members",
+            json={
+                "add": [
+                    {"user_id": self.user_ids[0]},
+                    {"user_id": self.user_ids[1], "role": "ADMIN"},
+                ]
+            },
+            headers=self.headers,
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        response = self.client.patch(
+            f"/v1/projects/{self.project_id}/members",
+            json={
+                "add": [{"user_id": self.user_ids[2]}],
+                "remove": [self.user_ids[0]],
+                "change_role": [{"user_id": self.user_ids[1], "role": "MEMBER"}],
+            },
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn("1 ajoutés, 1 retirés, 1 rôles", response.get_json()["message"])
+        self.assertEqual(
+            ["owner@example.com", "user1@example.com", "user2@example.com"],
+            self._member_emails(),
+        )
+
+    def test_update_project_members_invalid_batch(self) -> None:
+        """Test du refus de tout le lot
+
+        Returns:
+            None
+        """
+        response = self.client.patch(
+            f"/v1/projects/{self.project_id}/members",
+            json={
+                "add": [{"user_id": self.user_ids[0]}],
+                "remove": [self.user_ids[1]],
+            },
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
+        self.assertEqual(
+            ["remove.0"], [error["field"] for error in response.get_json()["message"]]
+        )
+        self.assertEqual(["owner@example.com"], self._member_emails())
+
+    def test_update_project_members_nonexistent_project(self) -> None:
+        """Test de la modification des membres d'un projet inexistant
+
+        Returns:
+            None
+        """
+        response = self.client.patch(
+            f"/v1/projects/{uuid4()}/members",
+            json={"remove": [self.user_ids[0]]},
+            headers=self.headers,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
@@ -6,6 +6,7 @@ from uuid import uuid4
 from projects.app.repositories.project_interface import ProjectRepositoryInterface
 from projects.app.usecases.get_all_projects import GetAllProjectsUseCase
 from projects.domain.entities.project_entity import ProjectEntity
+from utils.keyset_cursor import decode_cursor, encode_cursor
 
 
 class TestGetAllProjectsUseCase(unittest.TestCase):
@@ -58,7 +59,73 @@ class TestGetAllProjectsUseCase(unittest.TestCase):
         result = self.use_case.execute(limit)
 
         # Assert
-        self.assertEqual(result, expected_projects)
+        self.assertEqual(result.projects, expected_projects)
+        self.assertIsNone(result.next_cursor)
         cast(
             MagicMock, self.mock_project_repository.get_all_projects_with_limit
-        ).assert_called_once_with(limit)
+        ).assert_called_once_with(limit + 1, None)
+
+    def test_get_all_projects_returns_next_cursor_when_more_projects_exist(
+        self,
+    ) -> None:
+        """Test du curseur de page suivante quand la page est pleine
+
+        Returns:
+            None
+        """
+        # Arrange
+        projects = [
+            ProjectEntity(
+                project_number=f"PROJ-00{i}",
+                name=f"Test Project {i}",
+                description="Test Description",
+            )
+            for i in range(3)
+        ]
+        cast(
+            MagicMock, self.mock_project_repository.get_all_projects_with_limit
+        ).return_value = projects
+
+        # Act
+        result = self.use_case.execute(limit=2)
+
+        # Assert
+        self.assertEqual(result.projects, projects[:2])
+        assert result.next_cursor is not None
+        self.assertEqual(
+            decode_cursor(result.next_cursor), (projects[1].name, projects[1].id)
+        )
+
+    def test_get_all_projects_resumes_after_cursor(self) -> None:
+        """Test de la reprise après le dernier projet de la page précédente
+
+        Returns:
+            None
+        """
+        # Arrange
+        project_id = uuid4()
+        cast(
+            MagicMock, self.mock_project_repository.get_all_projects_with_limit
+        ).return_value = []
+
+        # Act
+        self.use_case.execute(
+            limit=10, cursor=encode_cursor("Test Project", project_id)
+        )
+
+        # Assert
+        cast(
+            MagicMock, self.mock_project_repository.get_all_projects_with_limit
+        ).assert_called_once_with(11, ("Test Project", project_id))
+
+    def test_get_all_projects_invalid_cursor(self) -> None:
+        """Test d'un curseur invalide
+
+        Returns:
+            None
+        """
+        with self.assertRaises(ValueError):
+            self.use_case.execute(limit=10, cursor="invalid")
+        cast(
+            MagicMock, self.mock_project_repository.get_all_projects_with_limit
+        ).assert_not_called()
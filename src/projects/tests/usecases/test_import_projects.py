@@ -0,0 +1,151 @@
+import unittest
+from typing import cast
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from projects.app.repositories.project_interface import ProjectRepositoryInterface
+from projects.app.schemas.project_schema import (
+    ProjectImportMemberSchema,
+    ProjectImportRowSchema,
+    ProjectImportSchema,
+)
+from projects.app.usecases.import_projects import ImportProjectsUseCase
+from projects.domain.entities.project_import_entity import (
+    ProjectImportErrorEntity,
+    ProjectImportRowEntity,
+)
+from projects.domain.settings.project_settings import ProjectSettings
+
+
+class TestImportProjectsUseCase(unittest.TestCase):
+    """Tests du cas d'utilisation d'import de projets
+
+    Args:
+        unittest (unittest.TestCase): Testeur de base pour les tests des usecases
+    """
+
+    def setUp(self) -> None:
+        """Initialise le testeur d'import de projets
+
+        Returns:
+            None
+        """
+        self.mock_project_repository: MagicMock = MagicMock(
+            spec=ProjectRepositoryInterface
+        )
+        self.mock_project_repository.import_projects.return_value = []
+        self.use_case = ImportProjectsUseCase(repository=self.mock_project_repository)
+        self.creator_id = uuid4()
+
+    def _row(self, index: int, **fields: object) -> ProjectImportRowSchema:
+        values: dict[str, object] = {
+            "project_number": f"PRJ-{index:03d}",
+            "name": f"Projet {index}",
+            "description": "Projet importé",
+            **fields,
+        }
+        return ProjectImportRowSchema.model_validate(values)
+
+    def _imported_rows(self) -> list[ProjectImportRowEntity]:
+        return [
+            row
+            for call in self.mock_project_repository.import_projects.call_args_list
+            for row in call.args[0]
+        ]
+
+    def test_import_projects_validates_every_row(self) -> None:
+        """Test de la validation de toutes les lignes en une passe
+
+        Returns:
+            None
+        """
+        schema = ProjectImportSchema(
+            projects=[
+                self._row(0, site_pressure="95000"),
+                self._row(1, name="N" * 251),
+                self._row(2, site_pressure="abc"),
+                self._row(
+                    3, members=[ProjectImportMemberSchema(email="a@b.c", role="BOSS")]
+                ),
+                self._row(4, members=[ProjectImportMemberSchema(email="invalid")]),
+            ]
+        )
+
+        report = self.use_case.execute(schema, self.creator_id)
+
+        self.assertEqual(5, report.total)
+        self.assertEqual(
+            [
+                (1, "name"),
+                (2, "site_pressure"),
+                (3, "members.0.role"),
+                (4, "members.0.email"),
+            ],
+            [(error.index, error.field) for error in report.errors],
+        )
+        rows = self._imported_rows()
+        self.assertEqual([0], [row.index for row in rows])
+        self.assertEqual(95000, rows[0].project.site_pressure)
+        self.assertEqual([rows[0].project.id], report.created)
+
+    def test_import_projects_rejects_duplicates_within_import(self) -> None:
+        """Test des noms et numéros en double dans l'import
+
+        Returns:
+            None
+        """
+        schema = ProjectImportSchema(
+            projects=[
+                self._row(0),
+                self._row(1, name="Projet 0"),
+                self._row(2, project_number="PRJ-000"),
+            ]
+        )
+
+        report = self.use_case.execute(schema, self.creator_id)
+
+        self.assertEqual(
+            [(1, "name"), (2, "project_number")],
+            [(error.index, error.field) for error in report.errors],
+        )
+        self.assertIn("ligne 0", report.errors[0].message)
+        self.assertEqual([0], [row.index for row in self._imported_rows()])
+
+    def test_import_projects_writes_in_chunks(self) -> None:
+        """Test de l'écriture par tranches et des erreurs du repository
+
+        Returns:
+            None
+        """
+        schema = ProjectImportSchema(projects=[self._row(index) for index in range(5)])
+        self.mock_project_repository.import_projects.side_effect = lambda rows, _: [
+            ProjectImportErrorEntity(index=row.index, field="name", message="pris")
+            for row in rows
+            if row.index == 3
+        ]
+
+        with patch.object(ProjectSettings, "import_chunk_size", 2):
+            report = self.use_case.execute(schema, self.creator_id)
+
+        calls = self.mock_project_repository.import_projects.call_args_list
+        self.assertEqual(
+            [[0, 1], [2, 3], [4]], [[row.index for row in c.args[0]] for c in calls]
+        )
+        self.assertTrue(all(c.args[1] == self.creator_id for c in calls))
+        self.assertEqual([3], [error.index for error in report.errors])
+        self.assertEqual(4, len(report.created))
+
+    def test_import_projects_too_many_rows(self) -> None:
+        """Test du nombre maximal de lignes
+
+        Returns:
+            None
+        """
+        schema = ProjectImportSchema(projects=[self._row(index) for index in range(3)])
+
+        with patch.object(ProjectSettings, "import_max_rows", 2):
+            with self.assertRaises(ValueError):
+                self.use_case.execute(schema, self.creator_id)
+        cast(
+            MagicMock, self.mock_project_repository.import_projects
+        ).assert_not_called()
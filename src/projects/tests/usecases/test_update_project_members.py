@@ -0,0 +1,116 @@
+import unittest
+from typing import cast
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from projects.app.repositories.project_interface import ProjectRepositoryInterface
+from projects.app.schemas.project_schema import (
+    ProjectMemberChangeSchema,
+    ProjectMembersBatchSchema,
+)
+from projects.app.usecases.update_project_members import UpdateProjectMembersUseCase
+from projects.domain.entities.project_entity import ProjectMemberRole
+from projects.domain.exceptions.project_exceptions import (
+    ProjectDBException,
+    ProjectMembersBatchException,
+)
+
+
+class TestUpdateProjectMembersUseCase(unittest.TestCase):
+    """Test de la modification en lot des membres d'un projet
+
+    Args:
+        unittest (unittest.TestCase): Testeur de base pour les tests des usecases
+    """
+
+    def setUp(self) -> None:
+        """Initialise le testeur de modification en lot des membres d'un projet
+
+        Returns:
+            None
+        """
+        self.mock_project_repository: MagicMock = MagicMock(
+            spec=ProjectRepositoryInterface
+        )
+        self.use_case = UpdateProjectMembersUseCase(
+            repository=self.mock_project_repository
+        )
+        self.project_id = uuid4()
+
+    def test_update_project_members_success(self) -> None:
+        """Test de la transmission du lot au repository
+
+        Returns:
+            None
+        """
+        added, removed, changed = uuid4(), uuid4(), uuid4()
+        schema = ProjectMembersBatchSchema(
+            project_id=self.project_id,
+            add=[ProjectMemberChangeSchema(user_id=added)],
+            remove=[removed],
+            change_role=[
+                ProjectMemberChangeSchema(user_id=changed, role=ProjectMemberRole.ADMIN)
+            ],
+        )
+
+        batch = self.use_case.execute(schema)
+
+        cast(
+            MagicMock, self.mock_project_repository.update_project_members
+        ).assert_called_once_with(batch)
+        self.assertEqual(self.project_id, batch.project_id)
+        self.assertEqual(ProjectMemberRole.MEMBER, batch.add[0].role)
+        self.assertEqual([removed], batch.remove)
+        self.assertEqual(ProjectMemberRole.ADMIN, batch.change_role[0].role)
+
+    def test_update_project_members_rejects_repeated_user(self) -> None:
+        """Test d'un utilisateur présent dans plusieurs modifications
+
+        Returns:
+            None
+        """
+        user_id = uuid4()
+        schema = ProjectMembersBatchSchema(
+            project_id=self.project_id,
+            add=[ProjectMemberChangeSchema(user_id=user_id)],
+            remove=[uuid4(), user_id],
+            change_role=[ProjectMemberChangeSchema(user_id=user_id)],
+        )
+
+        with self.assertRaises(ProjectMembersBatchException) as context:
+            self.use_case.execute(schema)
+
+        self.assertEqual(
+            ["remove.1", "change_role.0.user_id"],
+            [error["field"] for error in context.exception.errors],
+        )
+        cast(
+            MagicMock, self.mock_project_repository.update_project_members
+        ).assert_not_called()
+
+    def test_update_project_members_empty_batch(self) -> None:
+        """Test d'un lot vide, sans accès au repository
+
+        Returns:
+            None
+        """
+        self.use_case.execute(ProjectMembersBatchSchema(project_id=self.project_id))
+
+        cast(
+            MagicMock, self.mock_project_repository.update_project_members
+        ).assert_not_called()
+
+    def test_update_project_members_nonexistent_project(self) -> None:
+        """Test de la propagation de l'erreur d'un projet inexistant
+
+        Returns:
+            None
+        """
+        self.mock_project_repository.update_project_members.side_effect = (
+            ProjectDBException("Le projet n'existe pas.")
+        )
+
+        with self.assertRaises(ProjectDBException):
+            self.use_case.execute(
+                ProjectMembersBatchSchema(project_id=self.project_id, remove=[uuid4()])
+            )
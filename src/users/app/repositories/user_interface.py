@@ -55,11 +55,15 @@ class UserRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def get_all_users_with_limit(self, limit: int) -> list[UserEntity]:
-        """Récupère tous les utilisateurs avec une limite
+    def get_all_users_with_limit(
+        self, limit: int, after: tuple[str, UUID] | None = None
+    ) -> list[UserEntity]:
+        """Récupère tous les utilisateurs avec une limite, triés par email puis identifiant
 
         Args:
             limit (int): Limite de récupération
+            after (tuple[str, UUID] | None, optional): Email et identifiant du dernier
+                utilisateur de la page précédente. Defaults to None.
 
         Returns:
             list[UserEntity]: Liste des utilisateurs récupérés
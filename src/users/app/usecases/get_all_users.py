@@ -1,12 +1,15 @@
 from users.app.repositories.user_interface import UserRepositoryInterface
-from users.domain.entities.user_entity import UserEntity
+from users.domain.entities.user_entity import UserPageEntity
+from utils.keyset_cursor import decode_cursor, encode_cursor
 
 
 class GetAllUsersUsecase:
-    """Cas d'utilisation pour récupérer tous les utilisateurs avec une limite
+    """Cas d'utilisation pour récupérer tous les utilisateurs page par page
 
     Cette classe implémente la logique métier nécessaire pour récupérer
-    tous les utilisateurs de la base de données avec une limite spécifiée.
+    une page d'utilisateurs de la base de données. La pagination par clé
+    (email puis identifiant) reprend après le dernier utilisateur de la page
+    précédente : une page lointaine coûte autant que la première.
     """
 
     def __init__(self, repository: UserRepositoryInterface):
@@ -17,13 +20,26 @@ class GetAllUsersUsecase:
         """
         self.repository = repository
 
-    def execute(self, limit: int) -> list[UserEntity]:
-        """Exécute la récupération de tous les utilisateurs avec une limite
+    def execute(self, limit: int, cursor: str | None = None) -> UserPageEntity:
+        """Exécute la récupération d'une page d'utilisateurs
 
         Args:
             limit (int): Limite de récupération
+            cursor (str | None, optional): Curseur de la page à récupérer, première
+                page par défaut. Defaults to None.
+
+        Raises:
+            ValueError: Le curseur est invalide
 
         Returns:
-            list[UserEntity]: Liste des utilisateurs récupérés
+            UserPageEntity: Utilisateurs de la page et curseur de la page suivante
         """
-        return self.repository.get_all_users_with_limit(limit)
+        after = decode_cursor(cursor) if cursor is not None else None
+        # Un utilisateur de plus indique l'existence d'une page suivante
+        users = self.repository.get_all_users_with_limit(limit + 1, after)
+        if len(users) <= limit:
+            return UserPageEntity(users=users)
+        last = users[limit - 1]
+        return UserPageEntity(
+            users=users[:limit], next_cursor=encode_cursor(last.email, last.id)
+        )
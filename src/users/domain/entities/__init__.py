@@ -1,13 +1,20 @@
-from users.domain.entities.user_entity import UserEntity
+from users.domain.entities.user_entity import UserEntity, UserPageEntity
 
 
 # Mise à jour du schéma de modèle après l'importation de tous les modules
 # pour résoudre les références avancées
 def update_forward_refs() -> None:
-    from projects.domain.entities.project_entity import ProjectEntity
+    from projects.domain.entities.project_entity import (
+        ProjectEntity,
+        ProjectPageEntity,
+    )
+    from projects.domain.entities.project_import_entity import ProjectImportRowEntity
 
     UserEntity.model_rebuild()
     ProjectEntity.model_rebuild()
+    UserPageEntity.model_rebuild()
+    ProjectPageEntity.model_rebuild()
+    ProjectImportRowEntity.model_rebuild()
 
 
 update_forward_refs()
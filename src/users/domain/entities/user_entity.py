@@ -55,3 +55,15 @@ class UserEntity(BaseModel):
     created_at: datetime = Field(default=datetime.now(timezone.utc))
     updated_at: datetime = Field(default=datetime.now(timezone.utc))
     projects: list[ProjectEntityRef] = Field(default_factory=list)  # type: ignore
+
+
+class UserPageEntity(BaseModel):
+    """Page d'utilisateurs d'une pagination par curseur
+
+    Attributs:
+        users (list[UserEntity]): Utilisateurs de la page, triés par email
+        next_cursor (str | None): Curseur de la page suivante, None sur la dernière page
+    """
+
+    users: list[UserEntity]
+    next_cursor: str | None = None
@@ -30,5 +30,14 @@ class UserSettings:
     limit_description: str = "Nombre maximum d'utilisateurs à récupérer"
     limit_default: int = 100
     limit_gt: int = 0
+    limit_le: int = 1000
+    # cursor
+    cursor_description: str = (
+        "Curseur opaque de la page à récupérer, renvoyé dans next_cursor par la "
+        "page précédente"
+    )
+    next_cursor_description: str = (
+        "Curseur de la page suivante, absent sur la dernière page"
+    )
     # users
     users_description: str = "Liste des utilisateurs"
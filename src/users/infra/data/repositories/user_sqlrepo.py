@@ -1,6 +1,7 @@
 from uuid import UUID
 
-from sqlmodel import asc, select
+from sqlalchemy.orm import selectinload
+from sqlmodel import and_, asc, or_, select
 
 from common.infra.data.sql_unit_of_work import SQLUnitOfWork
 from users.app.repositories.user_interface import UserRepositoryInterface
@@ -131,7 +132,12 @@ class UserSQLRepository(UserRepositoryInterface):
             UserEntity: Utilisateur récupéré
         """
         with self.unit_of_work as uow:
-            user = uow.session.get(UserSQLModel, user_id)
+            query = (
+                select(UserSQLModel)
+                .where(UserSQLModel.id == user_id)
+                .options(selectinload(UserSQLModel.projects))  # type: ignore[arg-type]
+            )
+            user = uow.session.exec(query).first()
             if not user:
                 raise UserDBException(
                     message=f"L'utilisateur avec l'id '{user_id}' n'existe pas."
@@ -139,16 +145,38 @@ class UserSQLRepository(UserRepositoryInterface):
 
             return user.to_entity()
 
-    def get_all_users_with_limit(self, limit: int) -> list[UserEntity]:
-        """Récupère tous les utilisateurs avec une limite
+    def get_all_users_with_limit(
+        self, limit: int, after: tuple[str, UUID] | None = None
+    ) -> list[UserEntity]:
+        """Récupère tous les utilisateurs avec une limite, triés par email puis identifiant
 
         Args:
             limit (int): Limite de récupération
+            after (tuple[str, UUID] | None, optional): Email et identifiant du dernier
+                utilisateur de la page précédente. Defaults to None.
 
         Returns:
             list[UserEntity]: Liste des utilisateurs récupérés
         """
         with self.unit_of_work as uow:
-            query = select(UserSQLModel).order_by(asc(UserSQLModel.email)).limit(limit)
+            # Charger les projets en une requête pour tous les utilisateurs (évite N+1)
+            query = (
+                select(UserSQLModel)
+                .order_by(asc(UserSQLModel.email), asc(UserSQLModel.id))
+                .limit(limit)
+                .options(selectinload(UserSQLModel.projects))  # type: ignore[arg-type]
+            )
+            # Reprendre après la page précédente (pagination par clé)
+            if after is not None:
+                email, user_id = after
+                query = query.where(
+                    or_(
+                        UserSQLModel.email > email,
+                        and_(
+                            UserSQLModel.email == email,
+                            UserSQLModel.id > user_id,
+                        ),
+                    )
+                )
             users = uow.session.exec(query).all()
             return [user.to_entity() for user in users]
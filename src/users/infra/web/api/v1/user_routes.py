@@ -198,11 +198,12 @@ def get_user_profile(
 
 @router.get(
     "get_all_users",
-    description="Récupère la liste de tous les utilisateurs",
+    description="Récupère la liste de tous les utilisateurs, page par page",
     security=security,
     responses={
         HTTPStatus.OK: GetAllUsersResponse,
         HTTPStatus.FORBIDDEN: ErrorResponse,
+        HTTPStatus.UNPROCESSABLE_ENTITY: ErrorResponse,
     },
 )
 @cast("Callable[..., Response]", jwt_required())
@@ -223,6 +224,15 @@ def get_all_users(
     Returns:
         Response: Réponse de succès ou d'erreur
     """
-    users = use_case.execute(limit=query.limit)
-    users_to = [GetUserResponse.model_validate(user.model_dump()) for user in users]
-    return GetAllUsersResponse(users=users_to).to_response()
+    try:
+        page = use_case.execute(limit=query.limit, cursor=query.cursor)
+    except ValueError as e:
+        return ErrorResponse(
+            code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(e)
+        ).to_response()
+    users_to = [
+        GetUserResponse.model_validate(user.model_dump()) for user in page.users
+    ]
+    return GetAllUsersResponse(
+        users=users_to, next_cursor=page.next_cursor
+    ).to_response()
@@ -51,8 +51,12 @@ class GetAllUsersQueryParams(BaseModel):
     limit: int = Field(
         default=UserSettings.limit_default,
         gt=UserSettings.limit_gt,
+        le=UserSettings.limit_le,
         description=UserSettings.limit_description,
     )
+    cursor: str | None = Field(
+        default=None, description=UserSettings.cursor_description
+    )
 
 
 class UserPath(BaseModel):
@@ -117,6 +121,9 @@ class GetAllUsersResponse(BaseModel):
     users: list[GetUserResponse] = Field(
         ..., description=UserSettings.users_description
     )
+    next_cursor: str | None = Field(
+        default=None, description=UserSettings.next_cursor_description
+    )
 
     def to_response(self) -> Response:
         return make_response(jsonify(self.model_dump()), HTTPStatus.OK)
@@ -1,5 +1,11 @@
 from common.tests.repositories.test_base_repo import TestBaseRepository
+from projects.domain.entities.project_entity import ProjectEntity, ProjectMemberRole
+from projects.infra.data.models.project_sqlmodel import (
+    ProjectAndUserJonctionTableSQLModel,
+    ProjectSQLModel,
+)
 from users.domain.entities.user_entity import UserEntity
+from users.infra.data.models.user_sqlmodel import UserSQLModel
 from users.infra.data.repositories.user_sqlrepo import UserSQLRepository
 
 
@@ -37,3 +43,57 @@ class TestGetAllUsersSQLRepository(TestBaseRepository):
 
         retrieved_users = self.user_repository.get_all_users_with_limit(limit=100)
         self.assertEqual(len(self.users_to_add), len(retrieved_users))
+
+    def test_get_all_users_with_limit_after(self) -> None:
+        """Test de la reprise après un utilisateur (pagination par clé)
+
+        Returns:
+            None
+        """
+        for user in self.users_to_add:
+            self.user_repository.sign_up_user(user)
+
+        first_page = self.user_repository.get_all_users_with_limit(limit=1)
+        second_page = self.user_repository.get_all_users_with_limit(
+            limit=1, after=(first_page[0].email, first_page[0].id)
+        )
+        last_page = self.user_repository.get_all_users_with_limit(
+            limit=1, after=(second_page[0].email, second_page[0].id)
+        )
+
+        self.assertEqual("user2@example.com", first_page[0].email)
+        self.assertEqual("user@example.com", second_page[0].email)
+        self.assertEqual([], last_page)
+
+    def test_get_all_users_constant_query_count(self) -> None:
+        """Test du nombre de requêtes indépendant du nombre d'utilisateurs récupérés
+
+        Returns:
+            None
+        """
+        # Ajouter directement 200 utilisateurs membres d'un projet commun
+        project = ProjectEntity(
+            project_number="PRJ-001", name="Test Project", description="A test project"
+        )
+        self.session.add(ProjectSQLModel(**project.model_dump(exclude={"members"})))
+        for i in range(200):
+            user = UserEntity(
+                email=f"user{i:03d}@example.com", password="Password_1234!"
+            )
+            self.session.add(UserSQLModel(**user.model_dump(exclude={"projects"})))
+            self.session.add(
+                ProjectAndUserJonctionTableSQLModel(
+                    project_id=project.id,
+                    user_id=user.id,
+                    role=ProjectMemberRole.MEMBER.value,
+                )
+            )
+        self.session.commit()
+
+        with self.count_queries() as statements:
+            retrieved_users = self.user_repository.get_all_users_with_limit(limit=200)
+
+        # Utilisateurs puis projets de tous les utilisateurs
+        self.assertEqual(200, len(retrieved_users))
+        self.assertTrue(all(len(user.projects) == 1 for user in retrieved_users))
+        self.assertQueryCount(2, statements)
@@ -54,3 +54,51 @@ class TestGetAllUsersRoute(TestBaseAPI):
         response_data = response.get_json()
         self.assertIn("users", response_data)
         self.assertEqual(len(response_data["users"]), 3)
+
+    def test_get_all_users_follows_next_cursor(self) -> None:
+        """Test du parcours des utilisateurs page par page
+
+        Returns:
+            None
+        """
+        login_response = self.client.post("/v1/auth/login", json=self.admin_data)
+        token = login_response.get_json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        for i in range(2):
+            self.client.post(
+                "/v1/auth/sign_up",
+                json={"email": f"user{i}@example.com", "password": "SecurePass123!"},
+            )
+
+        emails: list[str] = []
+        url = "/v1/auth/get_all_users?limit=2"
+        while True:
+            response = self.client.get(url, headers=headers)
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            response_data = response.get_json()
+            emails.extend(user["email"] for user in response_data["users"])
+            if response_data["next_cursor"] is None:
+                break
+            url = (
+                f"/v1/auth/get_all_users?limit=2&cursor={response_data['next_cursor']}"
+            )
+
+        self.assertEqual(
+            ["admin@example.com", "user0@example.com", "user1@example.com"], emails
+        )
+
+    def test_get_all_users_invalid_cursor(self) -> None:
+        """Test de la récupération des utilisateurs avec un curseur invalide
+
+        Returns:
+            None
+        """
+        login_response = self.client.post("/v1/auth/login", json=self.admin_data)
+        token = login_response.get_json()["access_token"]
+
+        response = self.client.get(
+            "/v1/auth/get_all_users?cursor=invalid",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
@@ -4,7 +4,8 @@ from unittest.mock import MagicMock
 
 from users.app.repositories.user_interface import UserRepositoryInterface
 from users.app.usecases.get_all_users import GetAllUsersUsecase
-from users.domain.entities.user_entity import UserEntity
+from users.domain.entities.user_entity import UserEntity, UserPageEntity
+from utils.keyset_cursor import decode_cursor, encode_cursor
 
 
 class TestGetAllUsersUsecase(unittest.TestCase):
@@ -35,9 +36,10 @@ class TestGetAllUsersUsecase(unittest.TestCase):
             MagicMock, self.mock_user_repository.get_all_users_with_limit
         ).return_value = []
 
-        result: list[UserEntity] = self.use_case.execute(limit=100)
+        result: UserPageEntity = self.use_case.execute(limit=100)
 
-        self.assertEqual(result, [])
+        self.assertEqual(result.users, [])
+        self.assertIsNone(result.next_cursor)
         cast(
             MagicMock, self.mock_user_repository.get_all_users_with_limit
         ).assert_called_once()
@@ -61,5 +63,61 @@ class TestGetAllUsersUsecase(unittest.TestCase):
         cast(
             MagicMock, self.mock_user_repository.get_all_users_with_limit
         ).return_value = users
-        result: list[UserEntity] = self.use_case.execute(limit=100)
-        self.assertEqual(len(result), len(users))
+        result: UserPageEntity = self.use_case.execute(limit=100)
+        self.assertEqual(len(result.users), len(users))
+        self.assertIsNone(result.next_cursor)
+
+    def test_get_all_users_returns_next_cursor_when_more_users_exist(self) -> None:
+        """Test du curseur de page suivante quand la page est pleine
+
+        Returns:
+            None
+        """
+        users: list[UserEntity] = [
+            UserEntity(email=f"user{i}@example.com", password="Password_1234!")
+            for i in range(3)
+        ]
+        cast(
+            MagicMock, self.mock_user_repository.get_all_users_with_limit
+        ).return_value = users
+
+        result = self.use_case.execute(limit=2)
+
+        # Un utilisateur de plus est demandé pour détecter la page suivante
+        cast(
+            MagicMock, self.mock_user_repository.get_all_users_with_limit
+        ).assert_called_once_with(3, None)
+        self.assertEqual(result.users, users[:2])
+        assert result.next_cursor is not None
+        self.assertEqual(
+            decode_cursor(result.next_cursor), (users[1].email, users[1].id)
+        )
+
+    def test_get_all_users_resumes_after_cursor(self) -> None:
+        """Test de la reprise après le dernier utilisateur de la page précédente
+
+        Returns:
+            None
+        """
+        user = UserEntity(email="user@example.com", password="Password_1234!")
+        cast(
+            MagicMock, self.mock_user_repository.get_all_users_with_limit
+        ).return_value = []
+
+        self.use_case.execute(limit=10, cursor=encode_cursor(user.email, user.id))
+
+        cast(
+            MagicMock, self.mock_user_repository.get_all_users_with_limit
+        ).assert_called_once_with(11, (user.email, user.id))
+
+    def test_get_all_users_invalid_cursor(self) -> None:
+        """Test d'un curseur invalide
+
+        Returns:
+            None
+        """
+        with self.assertRaises(ValueError):
+            self.use_case.execute(limit=10, cursor="invalid")
+        cast(
+            MagicMock, self.mock_user_repository.get_all_users_with_limit
+        ).assert_not_called()
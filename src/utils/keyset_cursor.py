@@ -0,0 +1,42 @@
+import base64
+import binascii
+import json
+from uuid import UUID
+
+INVALID_CURSOR_MESSAGE = "Curseur de pagination invalide."
+
+
+def encode_cursor(key: str, id: UUID) -> str:
+    """Encode la position d'une pagination par clé en un curseur opaque
+
+    Args:
+        key (str): Valeur de la clé de tri du dernier élément de la page
+        id (UUID): Identifiant du dernier élément, départage les clés égales
+
+    Returns:
+        str: Curseur opaque, sûr dans une URL
+    """
+    payload = json.dumps([key, str(id)], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, UUID]:
+    """Décode un curseur produit par encode_cursor
+
+    Args:
+        cursor (str): Curseur opaque
+
+    Raises:
+        ValueError: Le curseur n'a pas été produit par encode_cursor
+
+    Returns:
+        tuple[str, UUID]: Clé de tri et identifiant du dernier élément de la page
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(key, str):
+            raise ValueError(INVALID_CURSOR_MESSAGE)
+        return key, UUID(id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError(INVALID_CURSOR_MESSAGE) from e
@@ -0,0 +1,138 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCacheStatistics(BaseModel):
+    """Compteurs d'utilisation d'un cache LRU
+
+    Attributs:
+        hits (int): Nombre de lectures trouvées dans le cache
+        misses (int): Nombre de lectures absentes ou expirées
+        evictions (int): Nombre d'entrées retirées pour libérer de la place
+        size (int): Nombre d'entrées présentes
+        max_size (int): Nombre maximal d'entrées
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class LRUCache(Generic[K, V]):
+    """Cache borné, thread-safe, avec éviction LRU et durée de vie optionnelle
+
+    Args:
+        max_size (int): Nombre maximal d'entrées (0 désactive le cache)
+        ttl (float | None): Durée de vie d'une entrée en secondes (None = illimitée)
+        clock (Callable[[], float], optional): Horloge monotone en secondes
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise le cache
+
+        Args:
+            max_size (int): Nombre maximal d'entrées (0 désactive le cache)
+            ttl (float | None): Durée de vie d'une entrée en secondes (None = illimitée)
+            clock (Callable[[], float], optional): Horloge monotone en secondes
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> V | None:
+        """Lit une entrée et la marque comme la plus récemment utilisée
+
+        Args:
+            key (K): Clé de l'entrée
+
+        Returns:
+            V | None: Valeur en cache, None si absente ou expirée
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry[0]):
+                self._entries.pop(key, None)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        """Ajoute ou remplace une entrée, en évinçant la moins récemment utilisée
+
+        Args:
+            key (K): Clé de l'entrée
+            value (V): Valeur à mettre en cache
+        """
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self.clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_compute(self, key: K, compute: Callable[[], V]) -> V:
+        """Lit une entrée ou la calcule et la met en cache
+
+        Le calcul est fait hors du verrou : deux fils peuvent calculer la même
+        entrée en parallèle, la dernière écriture l'emporte.
+
+        Args:
+            key (K): Clé de l'entrée
+            compute (Callable[[], V]): Fonction de calcul en cas d'absence
+
+        Returns:
+            V: Valeur en cache ou calculée
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Vide le cache sans remettre les compteurs à zéro"""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def statistics(self) -> LRUCacheStatistics:
+        """Compteurs d'utilisation du cache
+
+        Returns:
+            LRUCacheStatistics: Compteurs d'utilisation
+        """
+        with self._lock:
+            return LRUCacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and self.clock() - stored_at > self.ttl
@@ -0,0 +1,33 @@
+import base64
+import unittest
+from uuid import uuid4
+
+from utils.keyset_cursor import INVALID_CURSOR_MESSAGE, decode_cursor, encode_cursor
+
+
+class TestKeysetCursor(unittest.TestCase):
+    def test_round_trip_returns_key_and_id(self) -> None:
+        id = uuid4()
+        cursor = encode_cursor("Projet été / 2025", id)
+        self.assertNotIn("=", cursor)
+        self.assertEqual(decode_cursor(cursor), ("Projet été / 2025", id))
+
+    def test_invalid_cursors_raise_value_error(self) -> None:
+        valid = encode_cursor("key", uuid4())
+        for cursor in (
+            "",
+            "%%%",
+            "bm90IGpzb24",
+            valid[:-4],
+            encode_cursor("k", uuid4())[:5],
+        ):
+            with self.subTest(cursor=cursor):
+                with self.assertRaisesRegex(ValueError, INVALID_CURSOR_MESSAGE):
+                    decode_cursor(cursor)
+
+    def test_wrong_payload_shape_raises_value_error(self) -> None:
+        for payload in (b"[1,2]", b'["a","not-a-uuid"]', b'{"a":1}', b'["a"]'):
+            cursor = base64.urlsafe_b64encode(payload).decode()
+            with self.subTest(payload=payload):
+                with self.assertRaisesRegex(ValueError, INVALID_CURSOR_MESSAGE):
+                    decode_cursor(cursor)
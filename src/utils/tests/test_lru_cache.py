@@ -0,0 +1,63 @@
+import unittest
+
+from utils.lru_cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.cache: LRUCache[str, int] = LRUCache(max_size=2, ttl=10, clock=self.clock)
+
+    def test_get_returns_cached_value_and_counts_hit(self) -> None:
+        self.cache.set("a", 1)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIsNone(self.cache.get("b"))
+        statistics = self.cache.statistics
+        self.assertEqual(statistics.hits, 1)
+        self.assertEqual(statistics.misses, 1)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.statistics.evictions, 1)
+        self.assertEqual(self.cache.statistics.size, 2)
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        self.cache.set("a", 1)
+        self.clock.now = 11
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.statistics.size, 0)
+
+    def test_get_or_compute_computes_once(self) -> None:
+        calls: list[str] = []
+
+        def compute() -> int:
+            calls.append("a")
+            return 1
+
+        self.assertEqual(self.cache.get_or_compute("a", compute), 1)
+        self.assertEqual(self.cache.get_or_compute("a", compute), 1)
+        self.assertEqual(calls, ["a"])
+
+    def test_zero_size_disables_cache(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(max_size=0)
+        cache.set("a", 1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.statistics.size, 0)
+
+    def test_clear_removes_entries(self) -> None:
+        self.cache.set("a", 1)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("a"))